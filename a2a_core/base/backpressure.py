@@ -0,0 +1,66 @@
+"""
+백프레셔 (부하 차단 / Retry-After 준수)
+
+- 수신 측: 큐가 고수위(high water)를 넘으면 429/503 + Retry-After로 거절
+- 송신 측: 429/503 응답의 Retry-After만큼 기다렸다가 재전송, 그래도 거절되면 BackpressureError
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+
+# 백프레셔 응답 상태 코드
+STATUS_TOO_MANY_REQUESTS = 429
+STATUS_SERVICE_UNAVAILABLE = 503
+BACKPRESSURE_STATUS_CODES = (STATUS_TOO_MANY_REQUESTS, STATUS_SERVICE_UNAVAILABLE)
+
+
+class QueueFullError(Exception):
+    """수신 큐가 가득 차서 메시지를 받을 수 없음 (수신 측)"""
+
+    def __init__(self, status_code: int, retry_after: float, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class BackpressureError(ConnectionError):
+    """수신자가 Retry-After 후에도 계속 거절함 (송신 측)"""
+
+    def __init__(self, endpoint: str, retry_after: Optional[float]):
+        super().__init__(f"수신자 과부하: {endpoint} (Retry-After: {retry_after})")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+def retry_after_from(response: httpx.Response, default: float = 1.0) -> Optional[float]:
+    """백프레셔 응답이면 대기 시간(초), 아니면 None"""
+    if response.status_code not in BACKPRESSURE_STATUS_CODES:
+        return None
+    value = response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else default
+    except ValueError:
+        return default
+
+
+async def send_honoring_retry_after(
+    send: Callable[[], Awaitable[httpx.Response]],
+    endpoint: str,
+    max_retries: int = 2,
+    max_delay: float = 10.0
+) -> httpx.Response:
+    """Retry-After를 지키며 전송 (재시도를 다 쓰면 BackpressureError)"""
+    attempt = 0
+    while True:
+        response = await send()
+        delay = retry_after_from(response)
+        if delay is None:
+            return response
+        if attempt >= max_retries or delay > max_delay:
+            raise BackpressureError(endpoint, delay)
+        attempt += 1
+        await asyncio.sleep(delay)
@@ -5,17 +5,46 @@
 """
 
 import asyncio
+import heapq
+import itertools
+import math
+import os
+import socket
+import time
 import httpx
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Any
+from datetime import datetime, timedelta
 import uuid
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from contextlib import asynccontextmanager
 import uvicorn
 
 from ..protocols.message import A2AMessage, MessageType, Priority
+from ..protocols.codec import (
+    WIRE_JSON, CONTENT_TYPES, MessageEnvelope, supported_wire_formats,
+    wire_format_for_content_type, encode_message, decode_message, decode_message_dict
+)
 from ..registry.service_registry import AgentInfo
+from .message_queue import PriorityMessageQueue, PRIORITY_RANK, priority_rank
+from .backpressure import QueueFullError, BackpressureError, send_honoring_retry_after
+from .retry import TRANSIENT_ERRORS, DedupWindow, check_delivery, backoff_delay
+from .context import RequestCancelledError, current_request, earliest_deadline, request_scope
+from .coalescer import MessageCoalescer
+from .local_bus import LocalMessageBus, matches_receiver
+from .discovery_cache import DiscoveryCache
+from .load_balancer import LoadBalancer
+from .uds_transport import LocalRoutingTransport, EmbeddedUDSServer, uds_path_for, local_uds_path
+from .http_pool import http_pool
+
+
+def _load_a2a_setting(key: str, default: Any) -> Any:
+    """설정 파일의 a2a 섹션 값 조회 (설정 모듈이 없으면 기본값)"""
+    try:
+        from utils.config_manager import config
+        return config.get(f"a2a.{key}", default)
+    except Exception:
+        return default
 
 
 class BaseAgent(ABC):
@@ -26,13 +55,17 @@ class BaseAgent(ABC):
         name: str,
         description: str,
         port: int,
-        registry_url: str = "http://localhost:8001"
+        registry_url: str = "http://localhost:8001",
+        message_workers: Optional[int] = None,
+        action_concurrency: Optional[Dict[str, int]] = None
     ):
         self.agent_id = str(uuid.uuid4())
         self.name = name
         self.description = description
         self.port = port
-        self.registry_url = registry_url
+        # 레지스트리 목록 (복제본이 여럿이면 장애 시 다음 URL로 전환)
+        self.registry_urls = self._configured_registry_urls(registry_url)
+        self.registry_index = 0
         self.endpoint = f"http://localhost:{port}"
         
         # Lifespan 컨텍스트 매니저 정의
@@ -50,14 +83,94 @@ class BaseAgent(ABC):
         # 능력 목록
         self.capabilities = []
         
-        # 메시지 큐
-        self.message_queue = asyncio.Queue()
+        # 메시지 큐 (우선순위 순, 같은 우선순위는 FIFO)
+        self.message_queue = PriorityMessageQueue()
+        
+        # 메시지 처리 워커 풀 설정
+        if message_workers is None:
+            message_workers = _load_a2a_setting("message_workers", 4)
+        self.message_workers = max(1, int(message_workers))
+        if action_concurrency is None:
+            action_concurrency = _load_a2a_setting("action_concurrency", {}) or {}
+        self.action_concurrency: Dict[str, int] = dict(action_concurrency)
+        self._action_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # 동시 실행 상한이 찬 액션의 대기 메시지 (워커를 붙잡지 않도록 큐 밖에서 대기, 큐 수위에는 포함)
+        # 액션별 (우선순위, 도착 순번, 메시지) 힙 - 수신 큐와 같은 순서로 꺼냄
+        self.parked_messages: Dict[str, List[Tuple[int, int, A2AMessage]]] = {}
+        self._park_counter = itertools.count()
+        self.worker_tasks: List[asyncio.Task] = []
+        self.inflight_handlers = 0
+        self.handler_latency_ms: Optional[float] = None  # 핸들러 처리 시간 EWMA (하트비트로 보고)
+        
+        # 백프레셔 설정 (고수위를 넘으면 부하 차단, 최대치에서 거절)
+        backpressure_config = _load_a2a_setting("backpressure", {}) or {}
+        self.max_queue = int(backpressure_config.get("max_queue", 1000))
+        self.queue_high_water = int(backpressure_config.get("high_water", 800))
+        self.retry_after = float(backpressure_config.get("retry_after", 1))
+        self.send_retries = int(backpressure_config.get("send_retries", 2))
+        self.max_retry_delay = float(backpressure_config.get("max_retry_delay", 10))
+        self.shed_counts = {"expired": 0, "low_priority": 0, "evicted": 0, "rejected": 0}
+        
+        # 재시도/중복 제거 설정 (재전송은 같은 message_id를 사용)
+        retry_config = _load_a2a_setting("retry", {}) or {}
+        self.retry_base_delay = float(retry_config.get("base_delay", 0.2))
+        self.retry_max_delay = float(retry_config.get("max_delay", 5))
+        self.dedup = DedupWindow(
+            max_size=int(retry_config.get("dedup_size", 10000)),
+            ttl=float(retry_config.get("dedup_ttl", 600))
+        )
+        
+        # request()로 응답을 기다리는 요청 (message_id -> Future)
+        self.pending_requests: Dict[str, asyncio.Future] = {}
         
-        # 다른 에이전트 캐시
-        self.known_agents: Dict[str, AgentInfo] = {}
+        # 처리 중인 요청 태스크와 그 하위 요청 (CANCEL 전파용)
+        self.inflight_tasks: Dict[str, asyncio.Task] = {}
+        self.child_requests: Dict[str, List[tuple]] = {}
+        self.cancelled_requests = DedupWindow(max_size=10000, ttl=600)
         
-        # HTTP 클라이언트
+        # 다른 에이전트 캐시 (TTL + 부정 캐시, 레지스트리 watch로 갱신)
+        discovery_config = _load_a2a_setting("discovery", {}) or {}
+        self.known_agents = DiscoveryCache(
+            ttl=discovery_config.get("ttl", 60),
+            negative_ttl=discovery_config.get("negative_ttl", 5)
+        )
+        self.registry_watch_enabled = bool(discovery_config.get("watch", True))
+        self.registry_watch_timeout = discovery_config.get("watch_timeout", 30)
+        self.registry_watch_task = None
+        
+        # 같은 이름의 여러 인스턴스 간 부하 분산
+        # (부하는 하트비트와 별도로 report_interval마다, 바뀌었을 때만 레지스트리 /load로 보고)
+        balancing_config = _load_a2a_setting("load_balancing", {}) or {}
+        self.balancer = LoadBalancer(strategy=balancing_config.get("strategy", "p2c"))
+        self.load_report_interval = balancing_config.get("report_interval", 10)
+        self.load_report_task = None
+        
+        # HTTP 클라이언트 (로컬 피어는 UDS로 라우팅)
         self.http_client = None
+        self.transport: Optional[LocalRoutingTransport] = None
+        
+        # UDS 수신 설정 (활성화 시 TCP 포트와 함께 소켓에서도 서비스)
+        uds_config = _load_a2a_setting("uds", {}) or {}
+        self.uds_path: Optional[str] = None
+        if uds_config.get("enabled", False):
+            self.uds_path = uds_path_for(port, uds_config.get("dir", "/tmp/a2a"))
+        self.uds_server: Optional[EmbeddedUDSServer] = None
+        
+        # 인프로세스 메시지 버스 (단일 프로세스 런처에서 연결)
+        self.local_bus: Optional[LocalMessageBus] = None
+        
+        # 메시지 병합 전송 설정 (window 0이면 비활성)
+        coalesce_config = _load_a2a_setting("coalesce", {}) or {}
+        self.coalesce_window_ms = coalesce_config.get("window_ms", 0)
+        self.coalesce_max_batch = coalesce_config.get("max_batch", 64)
+        self.coalescer: Optional[MessageCoalescer] = None
+        
+        # 와이어 포맷 설정 (상대가 지원하면 바이너리 포맷 사용)
+        wire_config = _load_a2a_setting("wire", {}) or {}
+        self.wire_format = wire_config.get("format", WIRE_JSON)
+        if self.wire_format not in supported_wire_formats():
+            self.wire_format = WIRE_JSON
+        self.trusted_decoding = bool(wire_config.get("trusted_decoding", False))
         
         # 하트비트 태스크
         self.heartbeat_task = None
@@ -68,6 +181,53 @@ class BaseAgent(ABC):
         # 기본 라우트 설정
         self._setup_routes()
         
+    @staticmethod
+    def _configured_registry_urls(registry_url: str) -> List[str]:
+        """A2A_REGISTRY_URLS(콤마 구분) 또는 설정의 registry.urls, 없으면 registry_url 하나"""
+        urls = os.environ.get("A2A_REGISTRY_URLS")
+        if urls:
+            configured = urls.split(",")
+        else:
+            try:
+                from utils.config_manager import config
+                configured = config.get("registry.urls", []) or []
+            except Exception:
+                configured = []
+        configured = [url.strip().rstrip("/") for url in configured if url and url.strip()]
+        return configured or [registry_url]
+        
+    @property
+    def registry_url(self) -> str:
+        """현재 사용 중인 레지스트리 URL"""
+        return self.registry_urls[self.registry_index]
+        
+    @registry_url.setter
+    def registry_url(self, url: str):
+        self.registry_urls = [url]
+        self.registry_index = 0
+        
+    async def _registry_request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """레지스트리 호출 (연결 실패/5xx면 다음 복제본으로 전환해 재시도)"""
+        last_error: Optional[Exception] = None
+        response = None
+        for offset in range(len(self.registry_urls)):
+            index = (self.registry_index + offset) % len(self.registry_urls)
+            url = self.registry_urls[index]
+            try:
+                response = await getattr(self.http_client, method)(f"{url}{path}", **kwargs)
+            except httpx.TransportError as e:
+                last_error = e
+                continue
+            if response.status_code >= 500 and offset < len(self.registry_urls) - 1:
+                continue
+            if index != self.registry_index:
+                print(f"🔀 레지스트리 전환: {self.registry_url} -> {url}")
+                self.registry_index = index
+            return response
+        if response is not None:
+            return response
+        raise last_error
+        
     def _setup_routes(self):
         """기본 라우트 설정"""
         
@@ -78,25 +238,58 @@ class BaseAgent(ABC):
                 "status": "healthy",
                 "agent_id": self.agent_id,
                 "name": self.name,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now().isoformat(),
+                "queue": self.get_queue_stats()
             }
             
+        @self.app.get("/http_pool")
+        async def http_pool_stats():
+            """프로세스 공용 HTTP 클라이언트 풀 통계"""
+            return http_pool.get_stats()
+            
         @self.app.post("/message")
-        async def receive_message(message: Dict):
-            """메시지 수신 엔드포인트"""
+        async def receive_message(request: Request):
+            """메시지 수신 엔드포인트 (Content-Type으로 와이어 포맷 협상)"""
             try:
-                a2a_message = A2AMessage(**message)
-                await self.message_queue.put(a2a_message)
-                
-                # ACK 필요한 경우
-                if a2a_message.metadata.require_ack:
-                    return {"status": "received", "message_id": a2a_message.header.message_id}
-                    
-                return {"status": "accepted"}
+                wire_format = wire_format_for_content_type(request.headers.get("content-type"))
+                a2a_message = decode_message(
+                    await request.body(),
+                    wire_format,
+                    trusted=self.trusted_decoding
+                )
+                return await self._accept_message(a2a_message)
                 
+            except QueueFullError as e:
+                raise HTTPException(
+                    status_code=e.status_code,
+                    detail=e.reason,
+                    headers={"Retry-After": str(math.ceil(e.retry_after))}
+                )
             except Exception as e:
                 raise HTTPException(status_code=400, detail=str(e))
                 
+        @self.app.post("/messages")
+        async def receive_messages(messages: List[Dict]):
+            """배치 메시지 수신 엔드포인트 (메시지별 결과 반환)"""
+            results = []
+            for message in messages:
+                try:
+                    a2a_message = decode_message_dict(message, trusted=self.trusted_decoding)
+                    result = await self._accept_message(a2a_message)
+                    results.append({"message_id": a2a_message.header.message_id, **result})
+                except QueueFullError as e:
+                    results.append({
+                        "message_id": a2a_message.header.message_id,
+                        "status": "rejected",
+                        "detail": e.reason,
+                        "retry_after": e.retry_after
+                    })
+                except Exception as e:
+                    message_id = message.get("header", {}).get("message_id") if isinstance(message, dict) else None
+                    results.append({"message_id": message_id, "status": "error", "detail": str(e)})
+                    
+            return {"status": "accepted", "count": len(results), "results": results}
+                
         @self.app.get("/capabilities")
         async def get_capabilities():
             """에이전트 능력 조회"""
@@ -119,20 +312,43 @@ class BaseAgent(ABC):
         """에이전트 시작"""
         print(f"🚀 {self.name} 에이전트 시작중...")
         
-        # HTTP 클라이언트 초기화
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # HTTP 클라이언트 초기화 (외부 호출은 프로세스 공용 풀 사용)
+        http_pool.retain()
+        self.transport = LocalRoutingTransport()
+        self.http_client = httpx.AsyncClient(timeout=30.0, transport=self.transport)
+        if self.coalesce_window_ms and self.coalesce_window_ms > 0:
+            self.coalescer = MessageCoalescer(
+                self.http_client,
+                window=self.coalesce_window_ms / 1000,
+                max_batch=self.coalesce_max_batch,
+                max_retries=self.send_retries,
+                max_retry_delay=self.max_retry_delay
+            )
         
         # 초기화 수행 (capabilities 등록 포함)
         await self.on_start()
         
+        # UDS 수신 시작 (레지스트리에 광고하기 전에 소켓이 준비되어야 함)
+        if self.uds_path:
+            await self._start_uds_server()
+        
         # 레지스트리에 등록 (on_start 이후에 실행하여 capabilities가 포함되도록)
         await self._register_to_registry()
         
         # 하트비트 시작
         self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        if self.load_report_interval:
+            self.load_report_task = asyncio.create_task(self._load_report_loop())
         
-        # 메시지 처리 루프 시작
-        asyncio.create_task(self._message_processing_loop())
+        # 레지스트리 변경 감시 시작
+        if self.registry_watch_enabled:
+            self.registry_watch_task = asyncio.create_task(self._registry_watch_loop())
+        
+        # 메시지 처리 워커 시작
+        self.worker_tasks = [
+            asyncio.create_task(self._message_processing_loop(worker_id))
+            for worker_id in range(self.message_workers)
+        ]
         
         print(f"✅ {self.name} 에이전트 시작 완료 (ID: {self.agent_id})")
         
@@ -146,13 +362,50 @@ class BaseAgent(ABC):
         # 하트비트 중지
         if self.heartbeat_task:
             self.heartbeat_task.cancel()
+        if self.load_report_task:
+            self.load_report_task.cancel()
+            
+        # 레지스트리 감시 중지
+        if self.registry_watch_task:
+            self.registry_watch_task.cancel()
+            
+        # 메시지 처리 워커 중지
+        for task in self.worker_tasks:
+            task.cancel()
+        self.worker_tasks = []
+        
+        # 대기 목록의 메시지는 처리하지 않고 버림 (큐 join이 끝나도록 task_done)
+        dropped = 0
+        for parked in self.parked_messages.values():
+            for _ in parked:
+                self.message_queue.task_done()
+            dropped += len(parked)
+        self.parked_messages.clear()
+        if dropped:
+            print(f"⚠️ 처리하지 못한 대기 메시지 {dropped}개 버림")
+        
+        # 응답 대기 중인 요청 취소
+        for future in self.pending_requests.values():
+            if not future.done():
+                future.cancel()
+        self.pending_requests.clear()
             
         # 레지스트리에서 등록 해제
         await self._deregister_from_registry()
         
+        # 병합 대기 중인 메시지 전송
+        if self.coalescer:
+            await self.coalescer.flush()
+            
+        # UDS 수신 종료
+        if self.uds_server:
+            await self.uds_server.stop()
+            self.uds_server = None
+            
         # HTTP 클라이언트 종료
         if self.http_client:
             await self.http_client.aclose()
+        await http_pool.release()
             
         print(f"✅ {self.name} 에이전트 종료 완료")
         
@@ -165,13 +418,11 @@ class BaseAgent(ABC):
                 "description": self.description,
                 "endpoint": self.endpoint,
                 "capabilities": self.capabilities,
-                "status": "active"
+                "status": "active",
+                "metadata": self._registry_metadata()
             }
             
-            response = await self.http_client.post(
-                f"{self.registry_url}/register",
-                json=agent_info
-            )
+            response = await self._registry_request("post", "/register", json=agent_info)
             
             if response.status_code == 200:
                 print(f"✅ 레지스트리 등록 성공: {self.name}")
@@ -182,11 +433,38 @@ class BaseAgent(ABC):
         except Exception as e:
             print(f"❌ 레지스트리 연결 실패: {e}")
             
+    def _registry_metadata(self) -> Dict:
+        """레지스트리에 광고할 전송 관련 메타데이터"""
+        metadata = {"wire_formats": supported_wire_formats()}
+        if self.uds_server:
+            metadata["uds_path"] = self.uds_path
+            metadata["host"] = socket.gethostname()
+        return metadata
+        
+    async def _start_uds_server(self):
+        """UDS 소켓에서 같은 앱 서비스 시작 (실패하면 TCP만 사용)"""
+        try:
+            self.uds_server = EmbeddedUDSServer(self.app, self.uds_path)
+            await self.uds_server.start()
+            print(f"🔌 UDS 수신 시작: {self.uds_path}")
+        except Exception as e:
+            print(f"⚠️ UDS 수신 시작 실패, TCP만 사용: {e}")
+            self.uds_server = None
+            
+    def _learn_transport(self, agent_info: AgentInfo):
+        """같은 호스트 피어가 UDS를 광고하면 해당 엔드포인트를 UDS로 라우팅"""
+        if not self.transport:
+            return
+        uds_path = local_uds_path(agent_info.metadata)
+        if uds_path:
+            self.transport.add_route(agent_info.endpoint, uds_path)
+            
     async def _update_capabilities_in_registry(self):
         """레지스트리에 능력 업데이트"""
         try:
-            response = await self.http_client.put(
-                f"{self.registry_url}/agents/{self.agent_id}/capabilities",
+            response = await self._registry_request(
+                "put",
+                f"/agents/{self.agent_id}/capabilities",
                 json={"capabilities": self.capabilities}
             )
             
@@ -201,9 +479,7 @@ class BaseAgent(ABC):
     async def _deregister_from_registry(self):
         """서비스 레지스트리에서 등록 해제"""
         try:
-            response = await self.http_client.delete(
-                f"{self.registry_url}/register/{self.agent_id}"
-            )
+            response = await self._registry_request("delete", f"/register/{self.agent_id}")
             
             if response.status_code == 200:
                 print(f"✅ 레지스트리 등록 해제 성공: {self.name}")
@@ -228,11 +504,17 @@ class BaseAgent(ABC):
                 await asyncio.sleep(heartbeat_interval)
                 heartbeat_count += 1
                 
-                response = await self.http_client.put(
-                    f"{self.registry_url}/heartbeat/{self.agent_id}"
+                response = await self._registry_request(
+                    "put",
+                    f"/heartbeat/{self.agent_id}",
+                    json={"load": self.get_load_report()}
                 )
                 
-                if response.status_code != 200:
+                if response.status_code == 404:
+                    # 전환한 레지스트리가 이 에이전트를 모르면 다시 등록
+                    print(f"⚠️ 레지스트리에 등록 정보 없음, 재등록: {self.registry_url}")
+                    await self._register_to_registry()
+                elif response.status_code != 200:
                     print(f"⚠️ 하트비트 실패: {response.text}")
                 else:
                     # 10회에 1번만 로그 출력 (100분에 1번)
@@ -244,38 +526,246 @@ class BaseAgent(ABC):
             except Exception as e:
                 print(f"⚠️ 하트비트 오류: {e}")
                 
-    async def _message_processing_loop(self):
-        """메시지 처리 루프"""
+    async def _load_report_loop(self):
+        """부하 보고 루프 (하트비트 주기와 별개, 부하가 바뀌었을 때만 전송)
+        
+        /load는 부하만 갱신하므로 레지스트리의 생존 확인/복제 시계/토폴로지 버전은 바뀌지 않는다.
+        레지스트리가 이 에이전트를 모르면(404) 재등록은 하트비트 루프에 맡긴다.
+        """
+        last_report = None
+        while True:
+            try:
+                await asyncio.sleep(self.load_report_interval)
+                report = self.get_load_report()
+                if report == last_report:
+                    continue
+                    
+                response = await self._registry_request(
+                    "put",
+                    f"/load/{self.agent_id}",
+                    json={"load": report}
+                )
+                if response.status_code == 200:
+                    last_report = report
+                    
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"⚠️ 부하 보고 오류: {e}")
+                
+    async def _registry_watch_loop(self):
+        """레지스트리 변경을 long-poll로 받아 발견 캐시 동기화"""
+        version = -1
+        while True:
+            try:
+                started_at = time.monotonic()
+                # 다른 복제본으로 전환되면 버전이 맞지 않아 전체 목록을 바로 받음
+                response = await self._registry_request(
+                    "get",
+                    "/watch",
+                    params={"version": version, "timeout": self.registry_watch_timeout},
+                    timeout=self.registry_watch_timeout + 10
+                )
+                
+                if response.status_code == 404:
+                    print("⚠️ 레지스트리가 watch를 지원하지 않음 - TTL 캐시만 사용")
+                    break
+                    
+                changed = False
+                if response.status_code == 200:
+                    data = response.json()
+                    version = data.get("version", version)
+                    if data.get("changed"):
+                        changed = True
+                        agents = [AgentInfo(**agent) for agent in data.get("agents", [])]
+                        self.known_agents.replace_all(agents)
+                        for agent in agents:
+                            self._learn_transport(agent)
+                            
+                # 대기 없이 돌아온 응답이 반복되면 레지스트리를 두드리지 않도록 쉼
+                if not changed and time.monotonic() - started_at < 1.0:
+                    await asyncio.sleep(5 if response.status_code != 200 else 1)
+                    
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"⚠️ 레지스트리 감시 오류: {e}")
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    break
+                    
+    async def _message_processing_loop(self, worker_id: int = 0):
+        """메시지 처리 루프 (워커 하나당 하나씩 실행)
+        
+        동시 실행 상한이 찬 액션의 메시지는 액션별 대기 목록에 두고 워커는 바로 다음 메시지로 넘어간다
+        (상한 액션 메시지가 모든 워커를 붙잡아 다른 액션이 밀리지 않도록).
+        상한 자리를 가진 워커는 처리를 마치면 자리를 놓지 않고 같은 액션의 대기 메시지를 이어서 처리한다.
+        """
         while True:
             try:
-                # 메시지 대기
+                # 메시지 대기 (우선순위가 높은 메시지부터)
                 message = await self.message_queue.get()
+            except asyncio.CancelledError:
+                break
                 
+            try:
                 # 만료된 메시지 무시
                 if message.is_expired():
                     print(f"⏰ 만료된 메시지 무시: {message.header.message_id}")
+                    self.message_queue.task_done()
                     continue
                     
-                # 메시지 처리
-                await self.handle_message(message)
-                
+                # body 디코딩을 미룬 메시지는 처리 직전에 디코딩
+                if isinstance(message, MessageEnvelope):
+                    message = message.to_message()
             except Exception as e:
-                print(f"❌ 메시지 처리 오류: {e}")
+                print(f"❌ 메시지 디코딩 오류 (worker {worker_id}): {e}")
+                self.message_queue.task_done()
+                continue
+                
+            try:
+                # 메시지 처리 (액션별 동시 실행 제한 적용)
+                action = message.body.get("action")
+                semaphore = self._get_action_semaphore(action)
+                if semaphore is None:
+                    await self._process_queued(message, worker_id)
+                elif semaphore.locked():
+                    heapq.heappush(
+                        self.parked_messages.setdefault(action, []),
+                        (priority_rank(message), next(self._park_counter), message)
+                    )
+                else:
+                    async with semaphore:
+                        await self._process_queued(message, worker_id)
+                        parked = self.parked_messages.get(action)
+                        while parked:
+                            await self._process_queued(heapq.heappop(parked)[2], worker_id)
+            except asyncio.CancelledError:
+                break
+                
+    async def _process_queued(self, message: A2AMessage, worker_id: int):
+        """큐에서 꺼낸 메시지 하나 처리 (오류는 기록만, 끝나면 task_done)"""
+        try:
+            if message.is_expired():
+                # 대기 목록에 있는 동안 만료된 메시지
+                print(f"⏰ 만료된 메시지 무시: {message.header.message_id}")
+                return
+            await self._dispatch_message(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 메시지 처리 오류 (worker {worker_id}): {e}")
+        finally:
+            self.message_queue.task_done()
+                
+    async def _dispatch_message(self, message: A2AMessage):
+        """핸들러 호출 (처리 중인 메시지 수 추적, 마감/취소 적용)"""
+        message_id = message.header.message_id
+        if self.cancelled_requests.seen(message_id):
+            print(f"🚫 취소된 메시지 무시: {message_id}")
+            return
+            
+        self.inflight_handlers += 1
+        started = time.perf_counter()
+        try:
+            await self._run_tracked(message_id, message.header.deadline, self.handle_message(message))
+        finally:
+            self.inflight_handlers -= 1
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if self.handler_latency_ms is None:
+                self.handler_latency_ms = elapsed_ms
+            else:
+                self.handler_latency_ms += 0.2 * (elapsed_ms - self.handler_latency_ms)
+            
+    async def _run_tracked(self, request_id: str, deadline: Optional[datetime], coro) -> tuple:
+        """요청 컨텍스트 안에서 작업 실행 → (완료 여부, 결과)
+        
+        CANCEL 메시지나 마감 초과로 중단되면 (False, None)을 반환한다.
+        작업 안에서 보내는 하위 요청은 이 요청의 마감을 물려받는다.
+        """
+        with request_scope(request_id, deadline):
+            task = asyncio.create_task(coro)
+        self.inflight_tasks[request_id] = task
+        try:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, (deadline - datetime.now()).total_seconds())
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            
+            if not done:
+                print(f"⏰ 마감 초과로 처리 중단: {request_id}")
+                task.cancel()
+                await asyncio.wait({task})
+                return False, None
+            if task.cancelled():
+                print(f"🚫 요청 처리 취소됨: {request_id}")
+                return False, None
+            return True, task.result()
+            
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            self.inflight_tasks.pop(request_id, None)
+            self.child_requests.pop(request_id, None)
+            
+    async def run_cancellable(self, request_id: str, coro, deadline: Optional[datetime] = None):
+        """HTTP 엔드포인트 작업을 CANCEL/마감 대상으로 실행 (중단 시 RequestCancelledError)"""
+        done, result = await self._run_tracked(request_id, deadline, coro)
+        if not done:
+            raise RequestCancelledError(request_id)
+        return result
+        
+    async def _cancel_request(self, request_id: str, reason: str = "") -> bool:
+        """처리 중인 요청 중단 (아직 큐에 있으면 꺼낼 때 버림), 하위 요청에도 CANCEL 전파"""
+        task = self.inflight_tasks.get(request_id)
+        if task:
+            task.cancel()
+        else:
+            self.cancelled_requests.add(request_id)
+            
+        for receiver, child_id in self.child_requests.pop(request_id, []):
+            await self._send_cancel(receiver, child_id, reason)
+            
+        return task is not None
+            
+    def _get_action_semaphore(self, action: Optional[str]) -> Optional[asyncio.Semaphore]:
+        """액션별 동시 실행 제한 세마포어 조회"""
+        if not action or action not in self.action_concurrency:
+            return None
+        if action not in self._action_semaphores:
+            limit = max(1, int(self.action_concurrency[action]))
+            self._action_semaphores[action] = asyncio.Semaphore(limit)
+        return self._action_semaphores[action]
                 
     async def discover_agents(self, capability: Optional[str] = None) -> List[AgentInfo]:
         """다른 에이전트 발견"""
+        # 캐시된 목록이 있으면 레지스트리 조회 생략 (변경은 watch로 반영됨)
+        cached = self.known_agents.get_listing(capability)
+        if cached is not None:
+            return cached
+            
         try:
             print(f"🔍 에이전트 검색 시작 - capability: {capability}")
             print(f"📡 Registry URL: {self.registry_url}")
             
-            response = await self.http_client.get(
-                f"{self.registry_url}/discover",
-                params={"capability": capability} if capability else {}
+            # 만료된 목록이 있으면 ETag로 재검증 (변경이 없으면 304로 본문 없이 응답)
+            validator = self.known_agents.get_validator(capability)
+            response = await self._registry_request(
+                "get",
+                "/discover",
+                params={"capability": capability} if capability else {},
+                headers={"If-None-Match": validator[0]} if validator else {}
             )
             
             print(f"📨 Registry 응답 상태: {response.status_code}")
             
-            if response.status_code == 200:
+            if response.status_code == 304 and validator:
+                etag, agents = validator
+                self.known_agents.put_listing(capability, agents, etag=etag)
+                return agents
+            elif response.status_code == 200:
                 data = response.json()
                 print(f"📊 Registry 응답 데이터: {data}")
                 
@@ -283,8 +773,9 @@ class BaseAgent(ABC):
                 print(f"✅ 발견된 에이전트 수: {len(agents)}")
                 
                 # 캐시 업데이트
+                self.known_agents.put_listing(capability, agents, etag=response.headers.get("etag"))
                 for agent in agents:
-                    self.known_agents[agent.agent_id] = agent
+                    self._learn_transport(agent)
                     print(f"   - {agent.name} (ID: {agent.agent_id})")
                     
                 return agents
@@ -298,6 +789,257 @@ class BaseAgent(ABC):
             traceback.print_exc()
             return []
             
+    async def _accept_message(self, a2a_message) -> Dict:
+        """수신 메시지 처리 (단건/배치 엔드포인트 공통)"""
+        message_id = a2a_message.header.message_id
+        
+        # 재전송된 메시지는 다시 처리하지 않음
+        if self.dedup.seen(message_id):
+            return {"status": "duplicate", "message_id": message_id}
+            
+        # 취소 요청은 큐를 거치지 않고 즉시 처리
+        if a2a_message.header.message_type == MessageType.CANCEL:
+            self.dedup.add(message_id)
+            if isinstance(a2a_message, MessageEnvelope):
+                a2a_message = a2a_message.to_message()
+            cancelled = await self._cancel_request(
+                a2a_message.header.correlation_id,
+                a2a_message.body.get("reason", "")
+            )
+            return {"status": "cancelled" if cancelled else "accepted"}
+            
+        # 응답이 오면 보낸 인스턴스의 대기 요청 수 감소 (응답 지연 기록)
+        if a2a_message.header.message_type in (MessageType.RESPONSE, MessageType.ERROR):
+            self.balancer.finish(a2a_message.header.correlation_id)
+            
+        # request()가 기다리는 응답은 큐를 거치지 않고 바로 전달
+        if self._resolve_pending_request(a2a_message):
+            self.dedup.add(message_id)
+            return {"status": "accepted"}
+            
+        self._admit_message(a2a_message)
+        await self.message_queue.put(a2a_message)
+        self.dedup.add(message_id)
+        
+        # ACK 필요한 경우
+        if a2a_message.metadata.require_ack:
+            return {"status": "received", "message_id": a2a_message.header.message_id}
+            
+        return {"status": "accepted"}
+        
+    def _admit_message(self, message):
+        """큐 수위에 따라 수락 여부 결정 (거절 시 QueueFullError)
+        
+        고수위를 넘으면 만료 메시지를 먼저 버리고, 그래도 넘치면 LOW 메시지를 429로 거절한다.
+        큐가 가득 차면 더 낮은 우선순위 메시지를 밀어내고, 밀어낼 것이 없으면 503으로 거절한다.
+        """
+        if self._backlog() < self.queue_high_water:
+            return
+            
+        self.shed_counts["expired"] += len(self.message_queue.shed_expired())
+        depth = self._backlog()
+        if depth < self.queue_high_water:
+            return
+            
+        rank = priority_rank(message)
+        if rank >= PRIORITY_RANK[Priority.LOW]:
+            self.shed_counts["low_priority"] += 1
+            raise QueueFullError(429, self.retry_after, "메시지 큐 고수위 초과 (LOW 우선순위 차단)")
+            
+        if depth < self.max_queue:
+            return
+            
+        evicted = self.message_queue.evict_lower_than(rank)
+        if evicted is not None:
+            self.shed_counts["evicted"] += 1
+            print(f"🧹 낮은 우선순위 메시지 제거: {evicted.header.message_id}")
+            return
+            
+        self.shed_counts["rejected"] += 1
+        raise QueueFullError(503, self.retry_after, "메시지 큐 가득 참")
+        
+    def _backlog(self) -> int:
+        """처리 대기 메시지 수 (큐 + 상한 대기 목록)"""
+        return self.message_queue.qsize() + sum(len(parked) for parked in self.parked_messages.values())
+        
+    def get_load_report(self) -> Dict:
+        """레지스트리에 보고할 부하 (발신 측 인스턴스 선택에 사용)"""
+        return {
+            "queue_depth": self._backlog(),
+            "inflight": self.inflight_handlers,
+            "latency_ms": round(self.handler_latency_ms, 1) if self.handler_latency_ms is not None else None
+        }
+        
+    def get_queue_stats(self) -> Dict:
+        """메시지 큐 상태 (/health 노출용)"""
+        return {
+            "depth": self.message_queue.qsize(),
+            "by_priority": self.message_queue.depth_by_priority(),
+            "high_water": self.queue_high_water,
+            "max": self.max_queue,
+            "inflight": self.inflight_handlers,
+            "parked": {action: len(parked) for action, parked in self.parked_messages.items() if parked},
+            "shed": dict(self.shed_counts),
+            "duplicates": self.dedup.duplicates
+        }
+        
+    async def _resolve_receiver(self, receiver_id: str) -> Optional[AgentInfo]:
+        """수신자 정보 조회 (캐시 → 레지스트리 순, 인스턴스가 여럿이면 부하 분산)"""
+        instances = self.known_agents.get_instances(receiver_id)
+        if instances:
+            return self.balancer.pick(instances)
+        # TTL 확인은 한 번만 (in 확인 뒤 [] 조회 사이에 만료되면 KeyError)
+        cached = self.known_agents.get(receiver_id)
+        if cached is not None:
+            return cached
+            
+        # 같은 프로세스의 에이전트는 레지스트리 조회 없이 바로 연결
+        if self.local_bus:
+            local_agent = self.local_bus.find(receiver_id)
+            if local_agent:
+                agent_info = self._local_agent_info(local_agent)
+                self.known_agents[receiver_id] = agent_info
+                return agent_info
+            
+        # 최근에 찾지 못한 수신자는 레지스트리를 다시 조회하지 않음
+        if self.known_agents.is_negative(receiver_id):
+            print(f"❌ 수신자를 찾을 수 없음 (부정 캐시): {receiver_id}")
+            return None
+            
+        agents = self.known_agents.get_listing(None)
+        if agents is None:
+            print(f"   - {receiver_id}가 캐시에 없음, 레지스트리 조회 시작")
+            # 캐시에 없으면 레지스트리에서 조회
+            # 먼저 전체 에이전트 목록에서 이름으로 검색
+            print(f"   - Registry URL: {self.registry_url}/discover")
+            response = await self._registry_request("get", "/discover")
+            print(f"   - Registry 응답 상태: {response.status_code}")
+            
+            if response.status_code != 200:
+                print(f"❌ 레지스트리 조회 실패: {response.status_code}")
+                return None
+                
+            agents_data = response.json()
+            agents = [AgentInfo(**agent_data) for agent_data in agents_data.get("agents", [])]
+            
+            # 한 번 받은 전체 목록으로 다른 수신자 조회도 캐시에서 처리
+            self.known_agents.put_listing(None, agents)
+        
+        # 이름 또는 ID로 매칭되는 에이전트 찾기 (여러 형식으로 매칭 시도)
+        matches = [
+            agent_info for agent_info in agents
+            if matches_receiver(agent_info.name, agent_info.agent_id, receiver_id)
+        ]
+        for agent_info in matches:
+            self._learn_transport(agent_info)
+        if len(matches) > 1:
+            # 같은 이름의 인스턴스가 여럿이면 요청마다 부하 분산
+            self.known_agents.put_instances(receiver_id, matches)
+            return self.balancer.pick(matches)
+        if matches:
+            self.known_agents[receiver_id] = matches[0]
+            return matches[0]
+                
+        print(f"❌ 수신자를 찾을 수 없음: {receiver_id}")
+        self.known_agents.put_negative(receiver_id)
+        return None
+        
+    @staticmethod
+    def _local_agent_info(agent: "BaseAgent") -> AgentInfo:
+        """같은 프로세스 에이전트의 AgentInfo 생성"""
+        return AgentInfo(
+            agent_id=agent.agent_id,
+            name=agent.name,
+            description=agent.description,
+            endpoint=agent.endpoint,
+            capabilities=agent.capabilities,
+            metadata={"wire_formats": supported_wire_formats()}
+        )
+        
+    def _select_wire_format(self, receiver: AgentInfo) -> str:
+        """수신자가 지원하는 포맷 중 설정된 포맷 선택"""
+        peer_formats = (receiver.metadata or {}).get("wire_formats", [WIRE_JSON])
+        if self.wire_format != WIRE_JSON and self.wire_format in peer_formats:
+            return self.wire_format
+        return WIRE_JSON
+        
+    async def _post_message(self, receiver: AgentInfo, message: A2AMessage) -> bool:
+        """메시지를 수신자에게 전송
+        
+        일시적 실패(연결 오류, 타임아웃, 5xx)는 metadata.max_retries까지 같은 message_id로
+        지수 백오프 재전송한다. 수신 측이 message_id로 중복을 제거하므로 재전송은 멱등하다.
+        """
+        action = message.body.get("action") or message.body.get("event_type")
+        while True:
+            error = None
+            try:
+                delivered = await self._deliver_once(receiver, message)
+            except BackpressureError as e:
+                # 과부하는 주소 문제가 아니므로 캐시는 유지
+                print(f"⏳ 수신자 과부하로 전송 보류: {action} -> {receiver.name} ({e})")
+                return False
+            except TRANSIENT_ERRORS as e:
+                delivered, error = False, e
+            except Exception:
+                # 재시작 등으로 주소가 바뀌었을 수 있으므로 다음 전송 때 다시 조회
+                self.known_agents.invalidate(agent_id=receiver.agent_id, endpoint=receiver.endpoint)
+                raise
+                
+            if delivered:
+                print(f"📤 메시지 전송 성공: {action} -> {receiver.name}")
+                return True
+                
+            if error is None or not message.should_retry() or message.is_expired():
+                break
+                
+            delay = backoff_delay(message.metadata.retry_count, self.retry_base_delay, self.retry_max_delay)
+            message.increment_retry()
+            print(f"🔁 전송 재시도 {message.metadata.retry_count}/{message.metadata.max_retries} "
+                  f"({delay:.2f}초 후): {action} -> {receiver.name} ({error})")
+            await asyncio.sleep(delay)
+            
+        print(f"❌ 메시지 전송 실패: {action} -> {receiver.name}" + (f" ({error})" if error else ""))
+        self.known_agents.invalidate(agent_id=receiver.agent_id, endpoint=receiver.endpoint)
+        return False
+        
+    async def _deliver_once(self, receiver: AgentInfo, message: A2AMessage) -> bool:
+        """한 번 전송 (같은 프로세스면 버스로 직접 전달)"""
+        if self.local_bus and self.local_bus.is_local(receiver.endpoint):
+            return await self.local_bus.deliver(receiver.endpoint, message)
+            
+        wire_format = self._select_wire_format(receiver)
+        if wire_format != WIRE_JSON:
+            return await self._post_encoded(receiver.endpoint, message, wire_format)
+        return await self._post_payload(receiver.endpoint, message.to_dict())
+        
+    async def _post_encoded(self, endpoint: str, message: A2AMessage, wire_format: str) -> bool:
+        """바이너리 와이어 포맷으로 전송"""
+        content = encode_message(message, wire_format)
+        response = await send_honoring_retry_after(
+            lambda: self.http_client.post(
+                f"{endpoint}/message",
+                content=content,
+                headers={"Content-Type": CONTENT_TYPES[wire_format]}
+            ),
+            endpoint,
+            max_retries=self.send_retries,
+            max_delay=self.max_retry_delay
+        )
+        return check_delivery(response, endpoint)
+        
+    async def _post_payload(self, endpoint: str, payload: Dict) -> bool:
+        """직렬화된 메시지 전송 (병합 전송이 켜져 있으면 배치로 묶음)"""
+        if self.coalescer:
+            return await self.coalescer.submit(endpoint, payload)
+            
+        response = await send_honoring_retry_after(
+            lambda: self.http_client.post(f"{endpoint}/message", json=payload),
+            endpoint,
+            max_retries=self.send_retries,
+            max_delay=self.max_retry_delay
+        )
+        return check_delivery(response, endpoint)
+        
     async def send_message(
         self,
         receiver_id: str,
@@ -313,45 +1055,9 @@ class BaseAgent(ABC):
         print(f"   - payload: {payload}")
         try:
             # 수신자 정보 확인
-            if receiver_id not in self.known_agents:
-                print(f"   - {receiver_id}가 캐시에 없음, 레지스트리 조회 시작")
-                # 캐시에 없으면 레지스트리에서 조회
-                # 먼저 전체 에이전트 목록에서 이름으로 검색
-                print(f"   - Registry URL: {self.registry_url}/discover")
-                response = await self.http_client.get(f"{self.registry_url}/discover")
-                print(f"   - Registry 응답 상태: {response.status_code}")
-                
-                if response.status_code == 200:
-                    agents_data = response.json()
-                    agents = agents_data.get("agents", [])
-                    
-                    # 이름 또는 ID로 매칭되는 에이전트 찾기
-                    # receiver_id를 소문자로 변환하고 공백을 하이픈으로 치환하여 비교
-                    receiver_id_normalized = receiver_id.lower().replace("-", " ")
-                    found_agent = None
-                    for agent_data in agents:
-                        agent_name = agent_data.get("name", "").lower()
-                        agent_id = agent_data.get("agent_id", "")
-                        
-                        # 여러 형식으로 매칭 시도
-                        if (agent_data.get("name") == receiver_id or 
-                            agent_data.get("agent_id") == receiver_id or
-                            agent_name.replace(" ", "-") == receiver_id or
-                            agent_name == receiver_id_normalized):
-                            found_agent = agent_data
-                            break
-                    
-                    if found_agent:
-                        agent_info = AgentInfo(**found_agent)
-                        self.known_agents[receiver_id] = agent_info
-                    else:
-                        print(f"❌ 수신자를 찾을 수 없음: {receiver_id}")
-                        return None
-                else:
-                    print(f"❌ 레지스트리 조회 실패: {response.status_code}")
-                    return None
-                    
-            receiver = self.known_agents[receiver_id]
+            receiver = await self._resolve_receiver(receiver_id)
+            if not receiver:
+                return None
             
             # 메시지 생성
             message = A2AMessage.create_request(
@@ -363,19 +1069,14 @@ class BaseAgent(ABC):
             
             message.metadata.priority = priority
             message.metadata.require_ack = require_ack
+            self._apply_request_context(message, receiver)
             
-            # 메시지 전송
-            response = await self.http_client.post(
-                f"{receiver.endpoint}/message",
-                json=message.to_dict()
-            )
-            
-            if response.status_code == 200:
-                print(f"📤 메시지 전송 성공: {action} -> {receiver.name}")
+            # 메시지 전송 (응답이 올 때까지 수신 인스턴스의 대기 요청으로 집계)
+            self.balancer.start(message.header.message_id, receiver.agent_id)
+            if await self._post_message(receiver, message):
                 return message
-            else:
-                print(f"❌ 메시지 전송 실패: {response.text}")
-                return None
+            self.balancer.finish(message.header.message_id, failed=True)
+            return None
                 
         except Exception as e:
             print(f"❌ 메시지 전송 오류: {e}")
@@ -383,6 +1084,105 @@ class BaseAgent(ABC):
             traceback.print_exc()
             return None
             
+    async def request(
+        self,
+        receiver_id: str,
+        action: str,
+        payload: Dict[str, Any],
+        timeout: float = 30.0,
+        priority: Priority = Priority.NORMAL
+    ) -> A2AMessage:
+        """요청을 보내고 응답 메시지를 기다림
+        
+        응답(RESPONSE/ERROR)은 correlation_id로 매칭되어 메시지 큐를 거치지 않고
+        바로 반환된다. 타임아웃 시 대기 중인 future를 취소하고 asyncio.TimeoutError를 발생시킨다.
+        """
+        receiver = await self._resolve_receiver(receiver_id)
+        if not receiver:
+            raise LookupError(f"수신자를 찾을 수 없음: {receiver_id}")
+            
+        message = A2AMessage.create_request(
+            sender_id=self.agent_id,
+            receiver_id=receiver_id,
+            action=action,
+            payload=payload
+        )
+        message.metadata.priority = priority
+        # 응답을 기다리지 않게 된 요청은 수신자가 버릴 수 있도록 TTL과 마감 설정
+        message.metadata.ttl = max(1, math.ceil(timeout))
+        message.header.deadline = datetime.now() + timedelta(seconds=timeout)
+        self._apply_request_context(message, receiver)
+        
+        # 응답이 전송 완료보다 먼저 도착할 수 있으므로 future를 먼저 등록
+        message_id = message.header.message_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending_requests[message_id] = future
+        self.balancer.start(message_id, receiver.agent_id)
+        
+        try:
+            if not await self._post_message(receiver, message):
+                raise ConnectionError(f"메시지 전송 실패: {action} -> {receiver.name}")
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self.balancer.finish(message_id, failed=not future.done() or future.cancelled())
+            self.pending_requests.pop(message_id, None)
+            if not future.done():
+                future.cancel()
+                
+    def _apply_request_context(self, message: A2AMessage, receiver: AgentInfo):
+        """핸들러 안에서 보내는 하위 요청: 상위 마감 상속, 취소 전파 대상으로 기록"""
+        context = current_request()
+        if context is None:
+            return
+        message.header.deadline = earliest_deadline(message.header.deadline, context.deadline)
+        if context.message_id in self.inflight_tasks:
+            self.child_requests.setdefault(context.message_id, []).append(
+                (receiver, message.header.message_id)
+            )
+            
+    async def cancel(self, receiver_id: str, message_id: str, reason: str = "") -> bool:
+        """보낸 요청의 처리 중단 요청 (CANCEL 메시지 전송)
+        
+        request()로 응답을 기다리는 중이면 RequestCancelledError로 끝난다.
+        """
+        future = self.pending_requests.pop(message_id, None)
+        if future and not future.done():
+            future.set_exception(RequestCancelledError(message_id, reason))
+            
+        receiver = await self._resolve_receiver(receiver_id)
+        if not receiver:
+            return False
+        return await self._send_cancel(receiver, message_id, reason)
+        
+    async def _send_cancel(self, receiver: AgentInfo, message_id: str, reason: str) -> bool:
+        """CANCEL 메시지 전송"""
+        cancel_message = A2AMessage.create_cancel(
+            sender_id=self.agent_id,
+            receiver_id=receiver.agent_id,
+            correlation_id=message_id,
+            reason=reason
+        )
+        try:
+            return await self._post_message(receiver, cancel_message)
+        except Exception as e:
+            print(f"⚠️ 취소 메시지 전송 실패: {receiver.name} ({e})")
+            return False
+            
+    def _resolve_pending_request(self, message) -> bool:
+        """대기 중인 request()의 응답이면 future를 완료시킴"""
+        if message.header.message_type not in (MessageType.RESPONSE, MessageType.ERROR):
+            return False
+            
+        future = self.pending_requests.pop(message.header.correlation_id, None)
+        if future is None:
+            return False
+            
+        if isinstance(message, MessageEnvelope):
+            message = message.to_message()
+        if not future.done():
+            future.set_result(message)
+        return True
+            
     async def broadcast_event(
         self,
         event_type: str,
@@ -399,20 +1199,30 @@ class BaseAgent(ABC):
             event_data=event_data
         )
         
-        # 모든 에이전트에게 전송
+        # 모든 에이전트에게 전송 (같은 프로세스 에이전트는 직렬화 없이 버스로 전달)
+        payload = None
         tasks = []
+        targets = []
         for agent in agents:
-            if agent.agent_id != self.agent_id:  # 자기 자신 제외
-                task = self.http_client.post(
-                    f"{agent.endpoint}/message",
-                    json=message.to_dict()
-                )
-                tasks.append(task)
+            if agent.agent_id == self.agent_id:  # 자기 자신 제외
+                continue
+            targets.append(agent)
+            if self.local_bus and self.local_bus.is_local(agent.endpoint):
+                tasks.append(self.local_bus.deliver(agent.endpoint, message))
+            else:
+                if payload is None:
+                    payload = message.to_dict()
+                tasks.append(self._post_payload(agent.endpoint, payload))
                 
         # 병렬 전송
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        success_count = sum(1 for r in results if not isinstance(r, Exception))
+        # 전송 실패한 에이전트는 캐시에서 제거 (다음 브로드캐스트 때 다시 조회)
+        for agent, result in zip(targets, results):
+            if result is not True and not isinstance(result, BackpressureError):
+                self.known_agents.invalidate(agent_id=agent.agent_id, endpoint=agent.endpoint)
+                
+        success_count = sum(1 for r in results if r is True)
         print(f"📢 이벤트 브로드캐스트 완료: {event_type} ({success_count}/{len(tasks)} 성공)")
         
     async def reply_to_message(
@@ -430,17 +1240,39 @@ class BaseAgent(ABC):
             result=result,
             success=success
         )
+        await self._deliver_reply(original_message, response)
+        
+    async def send_partial(self, original_message: A2AMessage, result: Any, sequence: int = 0) -> bool:
+        """요청자에게 중간 결과 전송 (최종 응답은 reply_to_message로 따로 보냄)
+        
+        중간 결과는 최선 노력 전달이다. 전달에 실패해도 최종 응답에 전체 결과가 담기므로 예외를 올리지 않는다.
+        """
+        partial = A2AMessage.create_partial(
+            original_message=original_message,
+            sender_id=self.agent_id,
+            result=result,
+            sequence=sequence
+        )
+        try:
+            await self._deliver_reply(original_message, partial)
+            return True
+        except Exception as e:
+            print(f"⚠️ 중간 결과 전송 실패: {e}")
+            return False
         
-        # 응답 전송
+    async def _deliver_reply(self, original_message: A2AMessage, response: A2AMessage):
+        """요청을 보낸 에이전트에게 응답/중간 결과 전달"""
         receiver = self.known_agents.get(original_message.header.sender_id)
+        if not receiver and self.local_bus:
+            local_agent = self.local_bus.agents_by_id.get(original_message.header.sender_id)
+            if local_agent:
+                receiver = self._local_agent_info(local_agent)
+                self.known_agents[receiver.agent_id] = receiver
         if receiver:
             print(f"📍 캐시에서 수신자 발견: {receiver.name} at {receiver.endpoint}")
             try:
-                resp = await self.http_client.post(
-                    f"{receiver.endpoint}/message",
-                    json=response.to_dict()
-                )
-                print(f"✅ 응답 전송 완료 - status: {resp.status_code}")
+                delivered = await self._post_message(receiver, response)
+                print(f"✅ 응답 전송 완료 - delivered: {delivered}")
             except Exception as e:
                 print(f"❌ 응답 전송 실패: {e}")
                 raise
@@ -448,16 +1280,14 @@ class BaseAgent(ABC):
             # known_agents에 없으면 레지스트리에서 조회
             print(f"⚠️ 수신자 {original_message.header.sender_id}를 캐시에서 찾을 수 없음. 레지스트리 조회 시도...")
             try:
-                response_r = await self.http_client.get(
-                    f"{self.registry_url}/agents/{original_message.header.sender_id}"
+                response_r = await self._registry_request(
+                    "get", f"/agents/{original_message.header.sender_id}"
                 )
                 if response_r.status_code == 200:
                     agent_info = AgentInfo(**response_r.json())
                     self.known_agents[agent_info.agent_id] = agent_info
-                    await self.http_client.post(
-                        f"{agent_info.endpoint}/message",
-                        json=response.to_dict()
-                    )
+                    self._learn_transport(agent_info)
+                    await self._post_message(agent_info, response)
                     print(f"✅ 응답 전송 성공: {agent_info.name}")
                 else:
                     print(f"❌ 레지스트리에서 수신자 정보를 찾을 수 없음: {original_message.header.sender_id}")
@@ -0,0 +1,140 @@
+"""
+메시지 병합 전송기 (sender-side coalescing)
+
+같은 엔드포인트로 짧은 시간 안에 쌓인 메시지를 하나의 /messages 배치 요청으로 묶어
+HTTP 요청당 오버헤드(라우팅, 파싱, TCP write)를 줄인다.
+"""
+
+import asyncio
+from typing import Dict, List, Set, Tuple
+
+import httpx
+
+from .backpressure import send_honoring_retry_after
+from .retry import TransientDeliveryError, check_delivery
+
+
+class MessageCoalescer:
+    """엔드포인트별 메시지 병합 전송기
+
+    window 초 동안 또는 max_batch개가 모일 때까지 메시지를 모았다가 한 번에 전송한다.
+    배치 엔드포인트를 지원하지 않는 수신자(404)에는 개별 전송으로 폴백한다.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        window: float = 0.002,
+        max_batch: int = 64,
+        max_retries: int = 2,
+        max_retry_delay: float = 10.0
+    ):
+        self.http_client = http_client
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self.max_retries = max_retries
+        self.max_retry_delay = max_retry_delay
+
+        self._pending: Dict[str, List[Tuple[Dict, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        # 통계
+        self.batches_sent = 0
+        self.messages_sent = 0
+
+    async def submit(self, endpoint: str, payload: Dict) -> bool:
+        """메시지를 병합 대기열에 추가하고 전송 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(endpoint, [])
+        batch.append((payload, future))
+
+        if len(batch) >= self.max_batch:
+            self._flush_endpoint(endpoint)
+        elif endpoint not in self._timers:
+            self._timers[endpoint] = loop.call_later(self.window, self._flush_endpoint, endpoint)
+
+        return await future
+
+    def _flush_endpoint(self, endpoint: str):
+        """해당 엔드포인트의 대기 메시지를 전송 태스크로 넘김"""
+        timer = self._timers.pop(endpoint, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(endpoint, [])
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._send_batch(endpoint, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, endpoint: str, batch: List[Tuple[Dict, asyncio.Future]]):
+        """배치 전송 후 각 메시지의 future에 결과 기록"""
+        try:
+            if len(batch) == 1:
+                results = [await self._send_single(endpoint, batch[0][0])]
+            else:
+                payloads = [payload for payload, _ in batch]
+                response = await self._post(f"{endpoint}/messages", payloads, endpoint)
+                if response.status_code == 404:
+                    # 배치 엔드포인트가 없는 수신자 → 개별 전송
+                    results = await asyncio.gather(
+                        *(self._send_single(endpoint, payload) for payload, _ in batch)
+                    )
+                elif response.status_code == 200:
+                    items = response.json().get("results", [])
+                    results = [
+                        i < len(items) and items[i].get("status") in ("accepted", "received", "duplicate", "cancelled")
+                        for i in range(len(batch))
+                    ]
+                elif response.status_code >= 500:
+                    raise TransientDeliveryError(endpoint, response.status_code)
+                else:
+                    results = [False] * len(batch)
+
+            self.batches_sent += 1
+            self.messages_sent += len(batch)
+
+            for (_, future), ok in zip(batch, results):
+                if not future.done():
+                    future.set_result(bool(ok))
+
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _send_single(self, endpoint: str, payload: Dict) -> bool:
+        """단일 메시지 전송"""
+        response = await self._post(f"{endpoint}/message", payload, endpoint)
+        return check_delivery(response, endpoint)
+        
+    async def _post(self, url: str, body, endpoint: str) -> httpx.Response:
+        """Retry-After를 지키며 전송"""
+        return await send_honoring_retry_after(
+            lambda: self.http_client.post(url, json=body),
+            endpoint,
+            max_retries=self.max_retries,
+            max_delay=self.max_retry_delay
+        )
+
+    async def flush(self):
+        """대기 중인 모든 메시지 즉시 전송"""
+        for endpoint in list(self._pending.keys()):
+            self._flush_endpoint(endpoint)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        return {
+            "batches_sent": self.batches_sent,
+            "messages_sent": self.messages_sent,
+            "pending": sum(len(batch) for batch in self._pending.values()),
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch
+        }
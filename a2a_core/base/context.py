@@ -0,0 +1,97 @@
+"""
+요청 컨텍스트 (마감 시각 전파 / 협력적 취소)
+
+핸들러가 실행되는 동안 처리 중인 요청의 message_id와 마감 시각을 contextvar로 노출한다.
+- 핸들러 안에서 보내는 하위 요청은 마감 시각을 자동으로 물려받는다
+- 긴 작업은 deadline_exceeded()로 중간에 멈출 수 있다
+- HTTP 엔드포인트 호출 시에는 헤더로 같은 정보를 전달한다
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+
+# HTTP 홉에서 마감 시각/요청 ID를 전달하는 헤더
+DEADLINE_HEADER = "X-A2A-Deadline"
+REQUEST_ID_HEADER = "X-A2A-Request-Id"
+
+
+class RequestCancelledError(Exception):
+    """CANCEL 메시지 또는 마감 초과로 요청 처리가 중단됨"""
+
+    def __init__(self, request_id: str, reason: str = ""):
+        super().__init__(f"요청 취소됨: {request_id}" + (f" ({reason})" if reason else ""))
+        self.request_id = request_id
+        self.reason = reason
+
+
+@dataclass
+class RequestContext:
+    """처리 중인 요청 정보"""
+    message_id: str
+    deadline: Optional[datetime] = None
+
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar("a2a_current_request", default=None)
+
+
+def current_request() -> Optional[RequestContext]:
+    """현재 처리 중인 요청 (핸들러 밖이면 None)"""
+    return _current_request.get()
+
+
+def current_deadline() -> Optional[datetime]:
+    """현재 요청의 마감 시각"""
+    context = _current_request.get()
+    return context.deadline if context else None
+
+
+def time_remaining() -> Optional[float]:
+    """마감까지 남은 시간 (초, 마감이 없으면 None)"""
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    return (deadline - datetime.now()).total_seconds()
+
+
+def deadline_exceeded() -> bool:
+    """마감이 지났는지 확인 (긴 작업 중간에 확인해 일찍 멈추는 용도)"""
+    remaining = time_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def earliest_deadline(*deadlines: Optional[datetime]) -> Optional[datetime]:
+    """주어진 마감 중 가장 이른 것"""
+    present = [deadline for deadline in deadlines if deadline is not None]
+    return min(present) if present else None
+
+
+@contextmanager
+def request_scope(message_id: str, deadline: Optional[datetime] = None):
+    """요청 컨텍스트 설정 (블록을 벗어나면 복원)"""
+    token = _current_request.set(RequestContext(message_id=message_id, deadline=deadline))
+    try:
+        yield
+    finally:
+        _current_request.reset(token)
+
+
+def deadline_headers(request_id: str, deadline: Optional[datetime]) -> Dict[str, str]:
+    """HTTP 호출에 붙일 요청 ID/마감 헤더"""
+    headers = {REQUEST_ID_HEADER: request_id}
+    if deadline is not None:
+        headers[DEADLINE_HEADER] = deadline.isoformat()
+    return headers
+
+
+def parse_deadline(value: Optional[str]) -> Optional[datetime]:
+    """마감 헤더 값 파싱 (잘못된 값은 무시)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
@@ -0,0 +1,158 @@
+"""
+클라이언트 측 에이전트 발견 캐시
+
+- 수신자 조회 결과를 TTL 동안 보관 (known_agents 딕셔너리와 같은 사용법)
+- 존재하지 않는 수신자는 짧은 TTL로 부정 캐시
+- /discover 목록도 capability별로 캐시해 브로드캐스트마다 레지스트리를 부르지 않음
+- 전송 실패나 레지스트리 watch 변경 시 무효화
+"""
+
+import time
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..registry.service_registry import AgentInfo
+
+
+class DiscoveryCache(MutableMapping):
+    """TTL/부정 캐시를 지원하는 에이전트 정보 캐시 (키: 수신자 ID 또는 이름)"""
+
+    def __init__(self, ttl: float = 60.0, negative_ttl: float = 5.0):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+        self._entries: Dict[str, Tuple[AgentInfo, float]] = {}
+        self._negative: Dict[str, float] = {}
+        self._listings: Dict[Optional[str], Tuple[List[AgentInfo], float]] = {}
+        # 같은 이름으로 여러 인스턴스가 등록된 수신자 (키 -> 인스턴스 목록)
+        self._instances: Dict[str, Tuple[List[AgentInfo], float]] = {}
+        # TTL이 지난 뒤 If-None-Match 재검증에 쓰는 마지막 목록과 ETag
+        self._validators: Dict[Optional[str], Tuple[str, List[AgentInfo]]] = {}
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    def __getitem__(self, key: str) -> AgentInfo:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            raise KeyError(key)
+        self.hits += 1
+        return entry[0]
+
+    def __setitem__(self, key: str, agent_info: AgentInfo):
+        self._entries[key] = (agent_info, time.monotonic() + self.ttl)
+        self._negative.pop(key, None)
+
+    def __delitem__(self, key: str):
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        now = time.monotonic()
+        return iter([key for key, (_, expires_at) in self._entries.items() if expires_at > now])
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def is_negative(self, key: str) -> bool:
+        """최근에 찾지 못한 수신자인지 확인"""
+        expires_at = self._negative.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._negative[key]
+            return False
+        return True
+
+    def put_negative(self, key: str):
+        """찾지 못한 수신자를 부정 캐시에 기록"""
+        if self.negative_ttl > 0:
+            self._negative[key] = time.monotonic() + self.negative_ttl
+
+    def get_listing(self, capability: Optional[str] = None) -> Optional[List[AgentInfo]]:
+        """캐시된 발견 목록 (없거나 만료되면 None)"""
+        listing = self._listings.get(capability)
+        if listing is None or listing[1] <= time.monotonic():
+            self._listings.pop(capability, None)
+            return None
+        return list(listing[0])
+
+    def put_listing(self, capability: Optional[str], agents: List[AgentInfo], etag: Optional[str] = None):
+        """발견 목록 캐시 (각 에이전트도 agent_id로 캐시)"""
+        self._listings[capability] = (list(agents), time.monotonic() + self.ttl)
+        if etag:
+            self._validators[capability] = (etag, list(agents))
+        for agent in agents:
+            self[agent.agent_id] = agent
+
+    def get_instances(self, key: str) -> Optional[List[AgentInfo]]:
+        """수신자 키에 해당하는 인스턴스 목록 (없거나 만료되면 None)"""
+        entry = self._instances.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            self._instances.pop(key, None)
+            return None
+        return list(entry[0])
+
+    def put_instances(self, key: str, agents: List[AgentInfo]):
+        """수신자 키의 인스턴스 목록 캐시 (각 인스턴스도 agent_id로 캐시)"""
+        self._instances[key] = (list(agents), time.monotonic() + self.ttl)
+        for agent in agents:
+            self[agent.agent_id] = agent
+
+    def get_validator(self, capability: Optional[str] = None) -> Optional[Tuple[str, List[AgentInfo]]]:
+        """만료된 목록의 (ETag, 목록) - 레지스트리가 304를 주면 그대로 다시 사용"""
+        validator = self._validators.get(capability)
+        if validator is None:
+            return None
+        return validator[0], list(validator[1])
+
+    def invalidate(self, agent_id: Optional[str] = None, endpoint: Optional[str] = None):
+        """해당 에이전트를 가리키는 모든 항목과 발견 목록 제거"""
+        for key, (info, _) in list(self._entries.items()):
+            if (agent_id and info.agent_id == agent_id) or (endpoint and info.endpoint == endpoint):
+                del self._entries[key]
+        # 실패한 인스턴스만 빼고 나머지 인스턴스는 계속 사용
+        for key, (instances, expires_at) in list(self._instances.items()):
+            remaining = [
+                info for info in instances
+                if not ((agent_id and info.agent_id == agent_id) or (endpoint and info.endpoint == endpoint))
+            ]
+            if remaining:
+                self._instances[key] = (remaining, expires_at)
+            else:
+                del self._instances[key]
+        self._listings.clear()
+        self._validators.clear()
+
+    def replace_all(self, agents: List[AgentInfo]):
+        """레지스트리 전체 목록으로 동기화 (watch 변경 통지)
+
+        사라진 에이전트(재시작으로 agent_id가 바뀐 경우 포함)를 가리키는 항목은 제거하고,
+        남은 항목은 최신 정보로 갱신한다.
+        """
+        current = {agent.agent_id: agent for agent in agents}
+        for key, (info, _) in list(self._entries.items()):
+            if info.agent_id in current:
+                self[key] = current[info.agent_id]
+            else:
+                del self._entries[key]
+        self._negative.clear()
+        self._instances.clear()
+        self._listings.clear()
+        self._validators.clear()
+        self.put_listing(None, agents)
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        return {
+            "entries": len(self),
+            "negative_entries": len(self._negative),
+            "multi_instance_receivers": len(self._instances),
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl": self.ttl,
+            "negative_ttl": self.negative_ttl
+        }
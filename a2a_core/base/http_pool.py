@@ -0,0 +1,145 @@
+"""
+프로세스 공용 HTTP 클라이언트 풀
+
+외부 호출마다 httpx.AsyncClient를 만들고 닫으면 매번 TCP 연결과 TLS 핸드셰이크를 새로 한다.
+(origin, 타임아웃 프로필)마다 클라이언트 하나를 만들어 프로세스 전체가 공유하고,
+keep-alive 연결을 재사용한다.
+- origin별 클라이언트이므로 연결 상한(max_connections)이 곧 호스트별 상한
+- h2 패키지가 설치되어 있으면 HTTP/2 사용 (https origin만)
+- BaseAgent start/stop이 retain/release를 호출하고, 마지막 에이전트가 멈추면 모두 닫는다
+"""
+
+import contextlib
+import importlib.util
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 타임아웃 프로필 (요청별 timeout 인자는 그대로 우선)
+TIMEOUT_PROFILES: Dict[str, httpx.Timeout] = {
+    "default": httpx.Timeout(30.0, connect=10.0),
+    "fast": httpx.Timeout(5.0),
+    "report": httpx.Timeout(90.0, connect=10.0),
+    "llm": httpx.Timeout(120.0, connect=10.0),
+}
+
+PoolKey = Tuple[str, str]  # (origin, 프로필)
+
+
+def _load_pool_setting(key: str, default):
+    """설정 파일의 a2a.http_pool 값 조회 (설정 모듈이 없으면 기본값)"""
+    try:
+        from utils.config_manager import config
+        return config.get(f"a2a.http_pool.{key}", default)
+    except Exception:
+        return default
+
+
+def origin_of(url: str) -> str:
+    """scheme://host:port"""
+    parsed = httpx.URL(url)
+    port = f":{parsed.port}" if parsed.port else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
+class HTTPClientPool:
+    """(origin, 타임아웃 프로필)별 공유 AsyncClient"""
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 20,
+        max_keepalive_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: Optional[bool] = None
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.max_keepalive_per_host = max_keepalive_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+
+        self.clients: Dict[PoolKey, httpx.AsyncClient] = {}
+        self.users = 0
+
+        # 통계
+        self.created = 0
+        self.requests: Dict[PoolKey, int] = {}
+
+    def get(self, url: str, profile: str = "default") -> httpx.AsyncClient:
+        """url의 origin에 대한 공유 클라이언트 (없거나 닫혔으면 생성)"""
+        key = (origin_of(url), profile)
+        client = self.clients.get(key)
+        if client is None or client.is_closed:
+            client = self._create(key)
+            self.clients[key] = client
+        self.requests[key] = self.requests.get(key, 0) + 1
+        return client
+
+    def _create(self, key: PoolKey) -> httpx.AsyncClient:
+        origin, profile = key
+        self.created += 1
+        return httpx.AsyncClient(
+            timeout=TIMEOUT_PROFILES.get(profile, TIMEOUT_PROFILES["default"]),
+            limits=httpx.Limits(
+                max_connections=self.max_connections_per_host,
+                max_keepalive_connections=self.max_keepalive_per_host,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            http2=self.http2 and origin.startswith("https://")
+        )
+
+    @contextlib.asynccontextmanager
+    async def client(self, url: str, profile: str = "default") -> AsyncIterator[httpx.AsyncClient]:
+        """`async with httpx.AsyncClient() as client:` 대신 쓰는 형태 (블록이 끝나도 닫지 않음)"""
+        yield self.get(url, profile)
+
+    def retain(self):
+        """풀 사용 시작 (BaseAgent.start)"""
+        self.users += 1
+
+    async def release(self):
+        """풀 사용 종료 (BaseAgent.stop) - 마지막 사용자면 모든 연결 닫기"""
+        self.users = max(0, self.users - 1)
+        if self.users == 0:
+            await self.close()
+
+    async def close(self):
+        """모든 클라이언트 닫기"""
+        clients, self.clients = self.clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    @staticmethod
+    def _connection_counts(client: httpx.AsyncClient) -> Dict[str, int]:
+        """연결 풀 상태 (httpx 내부 구조를 쓸 수 없으면 빈 값)"""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return {}
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {"connections": len(connections), "idle": idle}
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        return {
+            "http2": self.http2,
+            "clients_created": self.created,
+            "pools": {
+                f"{origin} [{profile}]": {
+                    "requests": self.requests.get((origin, profile), 0),
+                    **self._connection_counts(client)
+                }
+                for (origin, profile), client in self.clients.items()
+            }
+        }
+
+
+# 프로세스 공용 인스턴스
+http_pool = HTTPClientPool(
+    max_connections_per_host=_load_pool_setting("max_connections_per_host", 20),
+    max_keepalive_per_host=_load_pool_setting("max_keepalive_per_host", 10),
+    keepalive_expiry=_load_pool_setting("keepalive_expiry", 30.0),
+    http2=_load_pool_setting("http2", None)
+)
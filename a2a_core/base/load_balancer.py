@@ -0,0 +1,122 @@
+"""
+클라이언트 측 부하 분산 (같은 에이전트의 여러 인스턴스 중 선택)
+
+- 비용 = (보낸 뒤 응답을 기다리는 요청 수 + 하트비트로 보고된 큐 길이/처리 중 핸들러 수 + 1) × 지연
+- p2c: 무작위로 두 인스턴스를 뽑아 비용이 낮은 쪽 (power of two choices)
+- least_outstanding: 전체 중 비용이 가장 낮은 인스턴스
+- first: 첫 번째 인스턴스 (기존 동작)
+"""
+
+import random
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..registry.service_registry import AgentInfo
+
+
+STRATEGY_P2C = "p2c"
+STRATEGY_LEAST_OUTSTANDING = "least_outstanding"
+STRATEGY_FIRST = "first"
+
+# 후보에서 제외할 레지스트리 상태
+UNHEALTHY_STATUSES = {"inactive", "unhealthy", "unreachable"}
+
+
+class LoadBalancer:
+    """인스턴스 선택기 (응답 대기 수와 응답 지연을 직접 관측)"""
+
+    def __init__(
+        self,
+        strategy: str = STRATEGY_P2C,
+        latency_alpha: float = 0.3,
+        outstanding_ttl: float = 120.0,
+        max_tracked: int = 10000
+    ):
+        self.strategy = strategy
+        self.latency_alpha = latency_alpha
+        self.outstanding_ttl = outstanding_ttl
+        self.max_tracked = max_tracked
+
+        self.outstanding: Dict[str, int] = {}    # agent_id -> 응답 대기 요청 수
+        self.latency_ms: Dict[str, float] = {}   # agent_id -> 관측 응답 지연 EWMA
+        self._tracked: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # message_id -> (agent_id, 시작)
+
+        # 통계
+        self.picks: Dict[str, int] = {}
+
+    def healthy(self, instances: List[AgentInfo]) -> List[AgentInfo]:
+        """정상 인스턴스 (모두 비정상이면 전체를 후보로)"""
+        candidates = [agent for agent in instances if agent.status not in UNHEALTHY_STATUSES]
+        return candidates or list(instances)
+
+    def cost(self, agent: AgentInfo) -> float:
+        """인스턴스 선택 비용 (낮을수록 우선)"""
+        load = agent.load or {}
+        pending = (
+            self.outstanding.get(agent.agent_id, 0)
+            + load.get("queue_depth", 0)
+            + load.get("inflight", 0)
+        )
+        latency = self.latency_ms.get(agent.agent_id) or load.get("latency_ms") or agent.latency_ms or 1.0
+        return (pending + 1) * max(latency, 1.0)
+
+    def pick(self, instances: List[AgentInfo]) -> Optional[AgentInfo]:
+        """전략에 따라 인스턴스 하나 선택"""
+        candidates = self.healthy(instances)
+        if not candidates:
+            return None
+        if len(candidates) == 1 or self.strategy == STRATEGY_FIRST:
+            chosen = candidates[0]
+        elif self.strategy == STRATEGY_LEAST_OUTSTANDING:
+            chosen = min(candidates, key=self.cost)
+        else:
+            first, second = random.sample(candidates, 2)
+            chosen = first if self.cost(first) <= self.cost(second) else second
+        self.picks[chosen.agent_id] = self.picks.get(chosen.agent_id, 0) + 1
+        return chosen
+
+    def start(self, message_id: str, agent_id: str):
+        """요청 전송 기록 (응답이 오면 finish)"""
+        self._expire()
+        self._tracked[message_id] = (agent_id, time.monotonic())
+        self.outstanding[agent_id] = self.outstanding.get(agent_id, 0) + 1
+
+    def finish(self, message_id: str, failed: bool = False):
+        """응답 도착/전송 실패 기록 (추적 중이 아니면 무시)"""
+        tracked = self._tracked.pop(message_id, None)
+        if tracked is None:
+            return
+        agent_id, started = tracked
+        self._release(agent_id)
+        if failed:
+            return
+        latency_ms = (time.monotonic() - started) * 1000
+        previous = self.latency_ms.get(agent_id)
+        self.latency_ms[agent_id] = latency_ms if previous is None else previous + self.latency_alpha * (latency_ms - previous)
+
+    def _release(self, agent_id: str):
+        count = self.outstanding.get(agent_id, 0) - 1
+        if count > 0:
+            self.outstanding[agent_id] = count
+        else:
+            self.outstanding.pop(agent_id, None)
+
+    def _expire(self):
+        """응답이 오지 않은 오래된 추적 항목 정리"""
+        now = time.monotonic()
+        while self._tracked:
+            message_id, (agent_id, started) = next(iter(self._tracked.items()))
+            if len(self._tracked) < self.max_tracked and now - started <= self.outstanding_ttl:
+                break
+            del self._tracked[message_id]
+            self._release(agent_id)
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        return {
+            "strategy": self.strategy,
+            "outstanding": dict(self.outstanding),
+            "latency_ms": {agent_id: round(value, 1) for agent_id, value in self.latency_ms.items()},
+            "picks": dict(self.picks)
+        }
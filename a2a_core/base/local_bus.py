@@ -0,0 +1,92 @@
+"""
+인프로세스 메시지 버스
+
+한 프로세스(이벤트 루프)에서 여러 에이전트를 함께 실행할 때
+에이전트 간 A2A 메시지를 HTTP/직렬화 없이 메모리 큐로 직접 전달한다.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from ..protocols.message import A2AMessage
+from .backpressure import QueueFullError, BackpressureError
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent
+
+
+def matches_receiver(agent_name: str, agent_id: str, receiver_id: str) -> bool:
+    """수신자 식별자가 에이전트 이름/ID와 일치하는지 확인
+
+    "NLU Agent V2", 에이전트 UUID, "nlu-agent-v2" 형식을 모두 허용한다.
+    """
+    name_lower = (agent_name or "").lower()
+    receiver_id_normalized = receiver_id.lower().replace("-", " ")
+    return (
+        agent_name == receiver_id or
+        agent_id == receiver_id or
+        name_lower.replace(" ", "-") == receiver_id or
+        name_lower == receiver_id_normalized
+    )
+
+
+class LocalMessageBus:
+    """같은 프로세스 안의 에이전트 간 메시지 전달"""
+
+    def __init__(self):
+        self.agents_by_endpoint: Dict[str, "BaseAgent"] = {}
+        self.agents_by_id: Dict[str, "BaseAgent"] = {}
+
+        # 통계
+        self.delivered_count = 0
+
+    def attach(self, agent: "BaseAgent"):
+        """에이전트를 버스에 연결"""
+        self.agents_by_endpoint[agent.endpoint] = agent
+        self.agents_by_id[agent.agent_id] = agent
+        agent.local_bus = self
+
+    def detach(self, agent: "BaseAgent"):
+        """에이전트를 버스에서 분리"""
+        self.agents_by_endpoint.pop(agent.endpoint, None)
+        self.agents_by_id.pop(agent.agent_id, None)
+        if agent.local_bus is self:
+            agent.local_bus = None
+
+    @property
+    def agents(self) -> List["BaseAgent"]:
+        return list(self.agents_by_id.values())
+
+    def find(self, receiver_id: str) -> Optional["BaseAgent"]:
+        """이름 또는 ID로 로컬 에이전트 검색"""
+        if receiver_id in self.agents_by_id:
+            return self.agents_by_id[receiver_id]
+        for agent in self.agents_by_id.values():
+            if matches_receiver(agent.name, agent.agent_id, receiver_id):
+                return agent
+        return None
+
+    def is_local(self, endpoint: str) -> bool:
+        """엔드포인트가 같은 프로세스의 에이전트인지 확인"""
+        return endpoint in self.agents_by_endpoint
+
+    async def deliver(self, endpoint: str, message: A2AMessage, max_retries: int = 2) -> bool:
+        """메시지 객체를 수신 에이전트에 직접 전달 (직렬화 없음)
+
+        수신 큐가 가득 차 있으면 HTTP 경로와 같이 retry_after만큼 기다렸다가 다시 시도한다.
+        """
+        agent = self.agents_by_endpoint.get(endpoint)
+        if agent is None:
+            return False
+        attempt = 0
+        while True:
+            try:
+                await agent._accept_message(message)
+                break
+            except QueueFullError as e:
+                if attempt >= max_retries:
+                    raise BackpressureError(endpoint, e.retry_after)
+                attempt += 1
+                await asyncio.sleep(e.retry_after)
+        self.delivered_count += 1
+        return True
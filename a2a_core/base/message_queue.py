@@ -0,0 +1,87 @@
+"""
+우선순위 메시지 큐
+
+MessageMetadata.priority를 존중하는 asyncio 큐 구현
+(URGENT > HIGH > NORMAL > LOW, 같은 우선순위 안에서는 FIFO)
+"""
+
+import asyncio
+import heapq
+import itertools
+from typing import Any, Optional
+
+from ..protocols.message import Priority
+
+
+# 우선순위별 정렬 키 (작을수록 먼저 처리)
+PRIORITY_RANK = {
+    Priority.URGENT: 0,
+    Priority.HIGH: 1,
+    Priority.NORMAL: 2,
+    Priority.LOW: 3,
+}
+
+
+def priority_rank(message: Any) -> int:
+    """메시지의 정렬 키 계산 (메타데이터가 없으면 NORMAL 취급)
+
+    A2AMessage와 body 디코딩 전의 MessageEnvelope 모두 metadata를 가진다.
+    """
+    metadata = getattr(message, "metadata", None)
+    if metadata is None:
+        return PRIORITY_RANK[Priority.NORMAL]
+    return PRIORITY_RANK.get(metadata.priority, PRIORITY_RANK[Priority.NORMAL])
+
+
+class PriorityMessageQueue(asyncio.Queue):
+    """우선순위 메시지 큐
+
+    asyncio.Queue와 동일한 put/get 인터페이스를 유지하면서
+    내부 저장소만 (우선순위, 도착 순번) 힙으로 교체한다.
+    """
+
+    def _init(self, maxsize):
+        self._queue = []
+        self._counter = itertools.count()
+
+    def _put(self, item):
+        heapq.heappush(self._queue, (priority_rank(item), next(self._counter), item))
+
+    def _get(self):
+        return heapq.heappop(self._queue)[2]
+
+    def shed_expired(self) -> list:
+        """만료된 메시지를 큐에서 제거하고 반환"""
+        # 만료 판정은 항목마다 한 번만 (두 번 판정하면 그 사이 만료된 항목이 task_done 없이 사라짐)
+        expired, alive = [], []
+        for entry in self._queue:
+            (expired if entry[2].is_expired() else alive).append(entry)
+        if expired:
+            self._queue = alive
+            heapq.heapify(self._queue)
+            for _ in expired:
+                self.task_done()
+        return [entry[2] for entry in expired]
+
+    def evict_lower_than(self, rank: int) -> Optional[Any]:
+        """rank보다 우선순위가 낮은 메시지 중 가장 낮고 가장 최근 것을 제거하고 반환"""
+        victim = None
+        for index, entry in enumerate(self._queue):
+            if entry[0] > rank and (victim is None or entry[:2] > self._queue[victim][:2]):
+                victim = index
+        if victim is None:
+            return None
+        entry = self._queue.pop(victim)
+        heapq.heapify(self._queue)
+        self.task_done()
+        return entry[2]
+
+    def depth_by_priority(self) -> dict:
+        """우선순위별 대기 메시지 수"""
+        counts = {priority.value: 0 for priority in PRIORITY_RANK}
+        for rank, _, _ in self._queue:
+            for priority, priority_value in PRIORITY_RANK.items():
+                if priority_value == rank:
+                    counts[priority.value] += 1
+                    break
+        return counts
@@ -0,0 +1,151 @@
+"""
+의존성 그래프 기반 파이프라인 실행기
+
+분석 단계를 입력/출력 키로 선언하고, 입력이 모두 준비된 단계를 곧바로 시작한다.
+고정된 순서로 한 단계씩 진행하지 않으므로 서로 의존하지 않는 단계(예: 정량 분석과
+데이터 수집)가 겹쳐서 실행된다.
+
+- 단계가 끝나면(성공/실패 무관) 출력 키가 준비된 것으로 보고 다음 단계를 시작한다
+  (기존 흐름과 같이 한 단계가 실패해도 나머지 단계는 가진 데이터로 진행)
+- 그래프 밖에서 채워지는 키(sources)는 provide()로 직접 알린다 (예: A2A 응답으로 완료되는 수집)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class Stage:
+    """파이프라인 단계 (inputs가 모두 준비되면 run(context) 실행, 끝나면 outputs 준비)"""
+    name: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    run: Callable[[Any], Awaitable[Any]]
+
+
+class StageGraph:
+    """단계 의존성 그래프 (생성 시 누락된 입력, 중복 출력, 순환을 검사)"""
+
+    def __init__(self, stages: Iterable[Stage], sources: Iterable[str] = ()):
+        self.stages: Dict[str, Stage] = {}
+        self.sources: Set[str] = set(sources)
+        self.producers: Dict[str, str] = {}           # 출력 키 -> 단계 이름
+        self.consumers: Dict[str, List[Stage]] = {}   # 입력 키 -> 단계 목록
+
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"중복된 단계 이름: {stage.name}")
+            self.stages[stage.name] = stage
+            for key in stage.outputs:
+                if key in self.producers or key in self.sources:
+                    raise ValueError(f"출력 키 {key}를 여러 곳에서 생성함")
+                self.producers[key] = stage.name
+            for key in set(stage.inputs):
+                self.consumers.setdefault(key, []).append(stage)
+
+        for stage in self.stages.values():
+            missing = [key for key in stage.inputs if key not in self.producers and key not in self.sources]
+            if missing:
+                raise ValueError(f"{stage.name} 단계의 입력을 생성하는 곳이 없음: {missing}")
+        self.order()
+
+    def order(self) -> List[str]:
+        """위상 정렬된 단계 이름 (순환이 있으면 ValueError)"""
+        remaining = {
+            name: {self.producers[key] for key in stage.inputs if key in self.producers}
+            for name, stage in self.stages.items()
+        }
+        ordered: List[str] = []
+        while remaining:
+            ready = sorted(name for name, deps in remaining.items() if not deps)
+            if not ready:
+                raise ValueError(f"단계 의존성에 순환이 있음: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+                ordered.append(name)
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return ordered
+
+
+class PipelineRun:
+    """그래프 한 번 실행 (세션마다 하나)"""
+
+    def __init__(
+        self,
+        graph: StageGraph,
+        context: Any,
+        on_complete: Optional[Callable[["PipelineRun"], Any]] = None
+    ):
+        self.graph = graph
+        self.context = context
+        self.on_complete = on_complete
+
+        self.ready: Set[str] = set()
+        self.waiting: Dict[str, int] = {name: len(set(stage.inputs)) for name, stage in graph.stages.items()}
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.done: Set[str] = set()
+        self.failed: Dict[str, BaseException] = {}
+        self.timings: Dict[str, Tuple[float, float]] = {}  # 단계 이름 -> (시작, 종료) monotonic
+
+    def start(self):
+        """입력이 없는 단계 시작"""
+        for name, count in self.waiting.items():
+            if count == 0 and name not in self.tasks:
+                self._launch(self.graph.stages[name])
+
+    def provide(self, *keys: str):
+        """키가 준비되었음을 알리고, 입력이 모두 준비된 단계를 시작 (이미 준비된 키는 무시)"""
+        for key in keys:
+            if key in self.ready:
+                continue
+            self.ready.add(key)
+            for stage in self.graph.consumers.get(key, ()):
+                self.waiting[stage.name] -= 1
+                if self.waiting[stage.name] == 0:
+                    self._launch(stage)
+
+    def is_ready(self, key: str) -> bool:
+        return key in self.ready
+
+    def _launch(self, stage: Stage):
+        self.tasks[stage.name] = asyncio.create_task(self._run(stage))
+
+    async def _run(self, stage: Stage):
+        started = time.monotonic()
+        try:
+            await stage.run(self.context)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 파이프라인 단계 {stage.name} 실패: {e}")
+            self.failed[stage.name] = e
+        self.timings[stage.name] = (started, time.monotonic())
+        self.done.add(stage.name)
+        self.provide(*stage.outputs)
+        if self.finished and self.on_complete:
+            self.on_complete(self)
+
+    @property
+    def finished(self) -> bool:
+        return len(self.done) == len(self.graph.stages)
+
+    def running(self) -> List[str]:
+        """실행 중인 단계 이름"""
+        return [name for name, task in self.tasks.items() if not task.done()]
+
+    async def wait(self):
+        """시작된 단계가 모두 끝날 때까지 대기 (대기 중 새로 시작된 단계 포함)"""
+        while True:
+            pending = [task for task in self.tasks.values() if not task.done()]
+            if not pending:
+                return
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def cancel(self):
+        """실행 중인 단계 모두 취소"""
+        for task in self.tasks.values():
+            if not task.done():
+                task.cancel()
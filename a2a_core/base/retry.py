@@ -0,0 +1,74 @@
+"""
+멱등 전송 (재시도 / 중복 제거)
+
+- 송신 측: 일시적 실패(연결 오류, 타임아웃, 5xx)는 같은 message_id로 지수 백오프(+지터) 재전송
+- 수신 측: 최근 message_id를 LRU 창에 기록해 재전송된 메시지를 한 번만 처리
+"""
+
+import asyncio
+import random
+import time
+from collections import OrderedDict
+
+import httpx
+
+
+class TransientDeliveryError(ConnectionError):
+    """재시도하면 성공할 수 있는 전송 실패 (5xx 등)"""
+
+    def __init__(self, endpoint: str, status_code: int):
+        super().__init__(f"일시적 전송 실패: {endpoint} (HTTP {status_code})")
+        self.endpoint = endpoint
+        self.status_code = status_code
+
+
+# 재시도 대상 예외
+TRANSIENT_ERRORS = (httpx.TransportError, TransientDeliveryError, asyncio.TimeoutError)
+
+
+def check_delivery(response: httpx.Response, endpoint: str) -> bool:
+    """전송 응답 판정 (200이면 True, 5xx는 TransientDeliveryError, 그 외 False)"""
+    if response.status_code == 200:
+        return True
+    if response.status_code >= 500:
+        raise TransientDeliveryError(endpoint, response.status_code)
+    return False
+
+
+def backoff_delay(attempt: int, base_delay: float = 0.2, max_delay: float = 5.0) -> float:
+    """지수 백오프 대기 시간 (full jitter)"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class DedupWindow:
+    """최근 처리한 message_id의 LRU 창 (크기와 보관 시간 제한)"""
+
+    def __init__(self, max_size: int = 10000, ttl: float = 600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+
+        # 통계
+        self.duplicates = 0
+
+    def seen(self, message_id: str) -> bool:
+        """이미 받은 message_id인지 확인 (중복이면 카운트)"""
+        recorded_at = self._seen.get(message_id)
+        if recorded_at is None:
+            return False
+        if time.monotonic() - recorded_at > self.ttl:
+            del self._seen[message_id]
+            return False
+        self._seen.move_to_end(message_id)
+        self.duplicates += 1
+        return True
+
+    def add(self, message_id: str):
+        """message_id 기록 (가장 오래된 항목부터 제거)"""
+        self._seen[message_id] = time.monotonic()
+        self._seen.move_to_end(message_id)
+        while len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._seen)
@@ -0,0 +1,118 @@
+"""
+Unix 도메인 소켓(UDS) 전송
+
+같은 호스트의 에이전트끼리는 TCP 루프백 대신 UDS로 통신한다.
+- 수신 측: TCP 포트와 별도로 UDS 소켓에서도 같은 FastAPI 앱을 서비스하고 레지스트리 metadata로 광고
+- 송신 측: 라우팅 트랜스포트가 로컬 피어의 엔드포인트 요청을 UDS로 보냄 (연결 실패 시 TCP 폴백)
+"""
+
+import asyncio
+import contextlib
+import os
+import socket
+from typing import Dict, Optional, Tuple
+
+import httpx
+import uvicorn
+
+
+def uds_path_for(port: int, directory: str) -> str:
+    """포트별 소켓 파일 경로"""
+    return os.path.join(directory, f"a2a-{port}.sock")
+
+
+def local_uds_path(metadata: Optional[Dict]) -> Optional[str]:
+    """같은 호스트에서 접근 가능한 피어의 UDS 경로 (아니면 None)"""
+    metadata = metadata or {}
+    uds_path = metadata.get("uds_path")
+    if not uds_path or metadata.get("host") != socket.gethostname():
+        return None
+    return uds_path if os.path.exists(uds_path) else None
+
+
+def _origin(url) -> Tuple[str, Optional[int]]:
+    url = httpx.URL(url)
+    return url.host, url.port
+
+
+class LocalRoutingTransport(httpx.AsyncBaseTransport):
+    """엔드포인트별로 UDS/TCP 트랜스포트를 골라 쓰는 httpx 트랜스포트
+
+    URL은 기존 http://localhost:{port} 형식을 그대로 쓰고, 연결 방식만 바뀐다.
+    """
+
+    def __init__(self):
+        self._default = httpx.AsyncHTTPTransport()
+        self._routes: Dict[Tuple[str, Optional[int]], Tuple[str, httpx.AsyncHTTPTransport]] = {}
+
+    def add_route(self, endpoint: str, uds_path: str):
+        """엔드포인트 요청을 UDS로 보내도록 등록"""
+        key = _origin(endpoint)
+        current = self._routes.get(key)
+        if current and current[0] == uds_path:
+            return
+        self._routes[key] = (uds_path, httpx.AsyncHTTPTransport(uds=uds_path))
+
+    def remove_route(self, endpoint: str):
+        """UDS 경로 제거 (이후 TCP 사용)"""
+        self._routes.pop(_origin(endpoint), None)
+
+    def has_route(self, endpoint: str) -> bool:
+        return _origin(endpoint) in self._routes
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        route = self._routes.get((request.url.host, request.url.port))
+        if route:
+            try:
+                return await route[1].handle_async_request(request)
+            except httpx.ConnectError:
+                # 피어가 UDS 없이 재시작한 경우 → TCP로 폴백
+                if self._routes.get((request.url.host, request.url.port)) is route:
+                    del self._routes[(request.url.host, request.url.port)]
+                    await route[1].aclose()
+        return await self._default.handle_async_request(request)
+
+    async def aclose(self):
+        for _, transport in list(self._routes.values()):
+            await transport.aclose()
+        self._routes.clear()
+        await self._default.aclose()
+
+
+class EmbeddedUDSServer(uvicorn.Server):
+    """기존 이벤트 루프 안에서 UDS로 앱을 서비스하는 보조 서버
+
+    메인 uvicorn 서버의 시그널 처리와 lifespan을 건드리지 않는다.
+    """
+
+    def __init__(self, app, uds_path: str):
+        super().__init__(uvicorn.Config(app, uds=uds_path, lifespan="off", log_level="error"))
+        self.uds_path = uds_path
+        self._task: Optional[asyncio.Task] = None
+
+    @contextlib.contextmanager
+    def capture_signals(self):
+        yield
+
+    def install_signal_handlers(self):
+        pass
+
+    async def start(self):
+        """소켓 바인딩 후 서비스 시작"""
+        os.makedirs(os.path.dirname(self.uds_path), exist_ok=True)
+        if os.path.exists(self.uds_path):
+            os.unlink(self.uds_path)
+        self._task = asyncio.create_task(self.serve())
+        while not self.started and not self._task.done():
+            await asyncio.sleep(0.01)
+        if self._task.done():
+            self._task.result()
+
+    async def stop(self):
+        """서비스 종료 및 소켓 파일 정리"""
+        self.should_exit = True
+        if self._task:
+            await self._task
+            self._task = None
+        if os.path.exists(self.uds_path):
+            os.unlink(self.uds_path)
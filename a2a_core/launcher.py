@@ -0,0 +1,105 @@
+"""
+단일 프로세스 런처
+
+여러 BaseAgent를 한 프로세스/이벤트 루프에서 함께 실행한다.
+에이전트 간 send_message / reply_to_message / broadcast_event는 LocalMessageBus를 통해
+직렬화 없이 전달되고, 각 에이전트의 FastAPI 엔드포인트는 외부 클라이언트를 위해 그대로 열려 있다.
+
+사용법:
+    python -m a2a_core.launcher                       # start_stable.sh와 같은 구성
+    python -m a2a_core.launcher agents.nlu_agent_v2:agent main_orchestrator_v2:orchestrator
+"""
+
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+from typing import List, Optional
+
+import uvicorn
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from .base.base_agent import BaseAgent
+from .base.local_bus import LocalMessageBus
+
+
+REGISTRY_APP = "a2a_core.registry.registry_server:app"
+
+# start_stable.sh와 같은 에이전트 구성
+DEFAULT_AGENTS = [
+    "main_orchestrator_v2:orchestrator",
+    "agents.nlu_agent_v2:agent",
+    "agents.news_agent_v2_pure:agent",
+    "agents.twitter_agent_v2_pure:agent",
+    "agents.sec_agent_v2_pure:agent",
+    "agents.mcp_data_agent:agent",
+    "agents.dart_agent_v2:agent",
+    "agents.sentiment_analysis_agent_v2:agent",
+    "agents.quantitative_agent_v2:agent",
+    "agents.score_calculation_agent_v2:agent",
+    "agents.risk_analysis_agent_v2:agent",
+    "agents.report_generation_agent_v2:agent",
+]
+
+
+def load_agent(spec: str) -> BaseAgent:
+    """'모듈:속성' 형식의 지정자로 에이전트 인스턴스 로드"""
+    module_name, _, attr = spec.partition(":")
+    module = importlib.import_module(module_name)
+    agent = getattr(module, attr or "agent")
+    if not isinstance(agent, BaseAgent):
+        raise TypeError(f"{spec}는 BaseAgent 인스턴스가 아닙니다")
+    return agent
+
+
+class AgentLauncher:
+    """한 이벤트 루프에서 여러 에이전트 서버 실행"""
+
+    def __init__(self, agents: List[BaseAgent], host: str = "0.0.0.0", log_level: str = "error"):
+        self.agents = agents
+        self.host = host
+        self.log_level = log_level
+        self.bus = LocalMessageBus()
+        for agent in agents:
+            self.bus.attach(agent)
+
+    def _server(self, app, port: int) -> uvicorn.Server:
+        return uvicorn.Server(uvicorn.Config(app, host=self.host, port=port, log_level=self.log_level))
+
+    async def serve(self, registry_port: Optional[int] = None):
+        """(선택) 레지스트리를 먼저 띄운 뒤 모든 에이전트 서버 실행"""
+        servers = []
+
+        if registry_port:
+            # 에이전트가 시작하면서 등록하므로 레지스트리가 먼저 떠 있어야 함
+            registry = self._server(REGISTRY_APP, registry_port)
+            servers.append(asyncio.create_task(registry.serve()))
+            while not registry.started:
+                await asyncio.sleep(0.05)
+            print(f"✅ Registry Server 시작 완료 (port {registry_port})")
+
+        for agent in self.agents:
+            servers.append(asyncio.create_task(self._server(agent.app, agent.port).serve()))
+
+        print(f"🚀 단일 프로세스 모드: 에이전트 {len(self.agents)}개 (인프로세스 메시지 버스)")
+        await asyncio.gather(*servers)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="여러 A2A 에이전트를 한 프로세스에서 실행")
+    parser.add_argument("agents", nargs="*", help="'모듈:속성' 형식의 에이전트 지정자")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--registry-port", type=int, default=8001,
+                        help="함께 실행할 레지스트리 포트 (0이면 외부 레지스트리 사용)")
+    parser.add_argument("--log-level", default="error")
+    args = parser.parse_args(argv)
+
+    agents = [load_agent(spec) for spec in (args.agents or DEFAULT_AGENTS)]
+    launcher = AgentLauncher(agents, host=args.host, log_level=args.log_level)
+    asyncio.run(launcher.serve(registry_port=args.registry_port or None))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+A2A 메시지 와이어 포맷 (인코딩/디코딩)
+
+- json: 기존 to_dict() 형식 (application/json)
+- msgpack: 헤더/메타데이터와 body를 분리한 바이너리 봉투 (application/vnd.a2a+msgpack)
+
+msgpack 봉투는 body를 별도의 바이트열로 담기 때문에 수신 측은 헤더만 먼저 풀어
+라우팅/만료/우선순위 판단을 하고, body는 실제로 처리할 때 디코딩한다.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from .message import A2AMessage, MessageHeader, MessageMetadata
+
+# 선택적 의존성: 설치되어 있으면 더 빠른 경로 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+WIRE_JSON = "json"
+WIRE_MSGPACK = "msgpack"
+
+CONTENT_TYPES = {
+    WIRE_JSON: "application/json",
+    WIRE_MSGPACK: "application/vnd.a2a+msgpack",
+}
+
+
+def supported_wire_formats() -> List[str]:
+    """현재 환경에서 사용 가능한 와이어 포맷 목록"""
+    formats = [WIRE_JSON]
+    if msgpack is not None:
+        formats.append(WIRE_MSGPACK)
+    return formats
+
+
+def wire_format_for_content_type(content_type: Optional[str]) -> str:
+    """Content-Type 헤더에서 와이어 포맷 판별 (모르면 json)"""
+    if content_type:
+        media_type = content_type.split(";")[0].strip().lower()
+        for wire_format, known in CONTENT_TYPES.items():
+            if media_type == known:
+                return wire_format
+    return WIRE_JSON
+
+
+def dumps_json(data: Any) -> bytes:
+    """JSON 직렬화 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(raw: bytes) -> Any:
+    """JSON 역직렬화 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class MessageEnvelope:
+    """body 디코딩을 미룬 수신 메시지
+
+    헤더와 메타데이터는 즉시 사용할 수 있고, body는 to_message() 호출 시 한 번만 디코딩한다.
+    trusted가 아니면 body도 디코딩할 때 pydantic으로 검증한다.
+    """
+
+    def __init__(self, header: MessageHeader, metadata: MessageMetadata, body_raw: bytes, trusted: bool = False):
+        self.header = header
+        self.metadata = metadata
+        self.trusted = trusted
+        self._body_raw = body_raw
+        self._message: Optional[A2AMessage] = None
+
+    @property
+    def body_size(self) -> int:
+        """인코딩된 body 크기 (bytes)"""
+        return len(self._body_raw)
+
+    def is_expired(self) -> bool:
+        """body를 풀지 않고 만료 여부 확인"""
+        return A2AMessage.model_construct(
+            header=self.header, body={}, metadata=self.metadata
+        ).is_expired()
+
+    def to_message(self) -> A2AMessage:
+        """body를 디코딩해 A2AMessage로 변환 (결과는 캐시됨)"""
+        if self._message is None:
+            body = msgpack.unpackb(self._body_raw, raw=False) if self._body_raw else {}
+            if self.trusted:
+                self._message = A2AMessage.model_construct(
+                    header=self.header, body=body, metadata=self.metadata
+                )
+            else:
+                self._message = A2AMessage.model_validate(
+                    {"header": self.header, "body": body, "metadata": self.metadata}
+                )
+            self._body_raw = b""
+        return self._message
+
+
+def encode_message(message: A2AMessage, wire_format: str = WIRE_JSON) -> bytes:
+    """메시지를 와이어 포맷 바이트열로 인코딩"""
+    data = message.to_dict()
+    if wire_format == WIRE_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("msgpack이 설치되어 있지 않습니다")
+        return msgpack.packb({
+            "header": data["header"],
+            "metadata": data["metadata"],
+            "body": msgpack.packb(data["body"], use_bin_type=True),
+        }, use_bin_type=True)
+    return dumps_json(data)
+
+
+def decode_message(raw: bytes, wire_format: str = WIRE_JSON, trusted: bool = False):
+    """바이트열을 메시지로 디코딩
+
+    json은 A2AMessage를 반환한다.
+    msgpack은 body 디코딩을 미룬 MessageEnvelope를 반환한다.
+    두 포맷 모두 trusted일 때만 검증을 생략한다 (msgpack은 헤더/메타데이터는 즉시, body는 디코딩할 때 검증).
+    """
+    if wire_format == WIRE_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("msgpack이 설치되어 있지 않습니다")
+        envelope = msgpack.unpackb(raw, raw=False)
+        if trusted:
+            shell = A2AMessage.from_trusted_dict({
+                "header": envelope["header"],
+                "metadata": envelope.get("metadata"),
+            })
+            header, metadata = shell.header, shell.metadata
+        else:
+            header = MessageHeader.model_validate(envelope["header"])
+            metadata = MessageMetadata.model_validate(envelope.get("metadata") or {})
+        return MessageEnvelope(header, metadata, envelope.get("body") or b"", trusted=trusted)
+
+    data = loads_json(raw)
+    return decode_message_dict(data, trusted=trusted)
+
+
+def decode_message_dict(data: Dict[str, Any], trusted: bool = False) -> A2AMessage:
+    """to_dict() 형식의 딕셔너리를 메시지로 변환"""
+    if trusted:
+        return A2AMessage.from_trusted_dict(data)
+    return A2AMessage(**data)
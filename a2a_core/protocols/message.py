@@ -19,6 +19,8 @@ class MessageType(str, Enum):
     ERROR = "error"
     HEARTBEAT = "heartbeat"
     BROADCAST = "broadcast"
+    CANCEL = "cancel"  # correlation_id 요청 처리 중단
+    PARTIAL = "partial"  # correlation_id 요청의 중간 결과 (여러 번 보낼 수 있고 마지막은 RESPONSE)
 
 
 class Priority(str, Enum):
@@ -39,6 +41,7 @@ class MessageHeader(BaseModel):
     protocol_version: str = "1.0"
     correlation_id: Optional[str] = None  # 요청-응답 연결용
     reply_to: Optional[str] = None  # 응답 받을 엔드포인트
+    deadline: Optional[datetime] = None  # 절대 마감 시각 (하위 요청에 전파)
     
     
 class MessageMetadata(BaseModel):
@@ -68,7 +71,8 @@ class A2AMessage(BaseModel):
                 "message_type": self.header.message_type.value,
                 "protocol_version": self.header.protocol_version,
                 "correlation_id": self.header.correlation_id,
-                "reply_to": self.header.reply_to
+                "reply_to": self.header.reply_to,
+                "deadline": self.header.deadline.isoformat() if self.header.deadline else None
             },
             "body": self.body,
             "metadata": {
@@ -81,6 +85,31 @@ class A2AMessage(BaseModel):
             }
         }
         
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "A2AMessage":
+        """신뢰할 수 있는 피어의 메시지를 검증 없이 복원
+        
+        to_dict() 형식을 그대로 받아 enum/시간 필드만 변환하고 model_construct로 생성한다.
+        body는 재검증하지 않으므로 대용량 페이로드에서 파싱 비용을 줄일 수 있다.
+        """
+        header_data = dict(data["header"])
+        timestamp = header_data.get("timestamp")
+        if isinstance(timestamp, str):
+            header_data["timestamp"] = datetime.fromisoformat(timestamp)
+        elif timestamp is None:
+            header_data["timestamp"] = datetime.now()
+        header_data["message_type"] = MessageType(header_data["message_type"])
+        if isinstance(header_data.get("deadline"), str):
+            header_data["deadline"] = datetime.fromisoformat(header_data["deadline"])
+        header = MessageHeader.model_construct(**header_data)
+        
+        metadata_data = dict(data.get("metadata") or {})
+        if "priority" in metadata_data:
+            metadata_data["priority"] = Priority(metadata_data["priority"])
+        metadata = MessageMetadata.model_construct(**metadata_data)
+        
+        return cls.model_construct(header=header, body=data.get("body") or {}, metadata=metadata)
+        
     @classmethod
     def create_request(
         cls,
@@ -131,6 +160,32 @@ class A2AMessage(BaseModel):
         
         return cls(header=header, body=body)
         
+    @classmethod
+    def create_partial(
+        cls,
+        original_message: "A2AMessage",
+        sender_id: str,
+        result: Any,
+        sequence: int = 0,
+        **kwargs
+    ) -> "A2AMessage":
+        """중간 결과 메시지 생성 헬퍼 (최종 RESPONSE 전에 일부 결과를 먼저 전달)"""
+        header = MessageHeader(
+            sender_id=sender_id,
+            receiver_id=original_message.header.sender_id,
+            message_type=MessageType.PARTIAL,
+            correlation_id=original_message.header.message_id,
+            **kwargs
+        )
+        
+        body = {
+            "result": result,
+            "sequence": sequence,
+            "original_action": original_message.body.get("action")
+        }
+        
+        return cls(header=header, body=body)
+        
     @classmethod
     def create_error(
         cls,
@@ -182,14 +237,50 @@ class A2AMessage(BaseModel):
         
         return cls(header=header, body=body)
         
+    @classmethod
+    def create_cancel(
+        cls,
+        sender_id: str,
+        receiver_id: str,
+        correlation_id: str,
+        reason: str = "",
+        **kwargs
+    ) -> "A2AMessage":
+        """취소 메시지 생성 헬퍼 (correlation_id 요청의 처리를 중단시킴)"""
+        header = MessageHeader(
+            sender_id=sender_id,
+            receiver_id=receiver_id,
+            message_type=MessageType.CANCEL,
+            correlation_id=correlation_id,
+            **kwargs
+        )
+        
+        body = {
+            "reason": reason,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        message = cls(header=header, body=body)
+        message.metadata.priority = Priority.URGENT
+        return message
+        
     def is_expired(self) -> bool:
-        """메시지 만료 여부 확인"""
+        """메시지 만료 여부 확인 (절대 마감 시각 또는 TTL)"""
+        if self.header.deadline is not None and datetime.now() > self.header.deadline:
+            return True
+            
         if self.metadata.ttl is None:
             return False
             
         age = (datetime.now() - self.header.timestamp).total_seconds()
         return age > self.metadata.ttl
         
+    def time_remaining(self) -> Optional[float]:
+        """마감까지 남은 시간 (초, 마감이 없으면 None)"""
+        if self.header.deadline is None:
+            return None
+        return (self.header.deadline - datetime.now()).total_seconds()
+        
     def should_retry(self) -> bool:
         """재시도 가능 여부 확인"""
         return self.metadata.retry_count < self.metadata.max_retries
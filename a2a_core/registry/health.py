@@ -0,0 +1,102 @@
+"""
+에이전트 헬스체크 스케줄
+
+에이전트별로 다음 확인 시각과 확인 간격을 관리한다.
+- 정상 응답이 이어지면 간격을 늘리고 (최대 max_interval)
+- 실패하면 바로 min_interval로 줄여 의심 에이전트를 자주 확인한다
+- 다음 확인 시각에 지터를 더해 모든 에이전트가 한꺼번에 확인되지 않게 한다
+- 응답 지연은 지수 이동 평균으로 기록해 발견 결과 정렬에 사용한다
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass
+class ProbeState:
+    """에이전트 하나의 헬스체크 상태"""
+    interval: float
+    next_due: float = 0.0
+    failures: int = 0
+    latency_ms: Optional[float] = None
+    probing: bool = False
+
+
+class HealthCheckSchedule:
+    """에이전트별 적응형 헬스체크 스케줄"""
+
+    def __init__(
+        self,
+        min_interval: float = 10.0,
+        max_interval: float = 120.0,
+        jitter: float = 0.2,
+        latency_alpha: float = 0.3
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.latency_alpha = latency_alpha
+        self.states: Dict[str, ProbeState] = {}
+
+    def _state(self, agent_id: str) -> ProbeState:
+        state = self.states.get(agent_id)
+        if state is None:
+            state = ProbeState(interval=self.min_interval)
+            self.states[agent_id] = state
+        return state
+
+    def _schedule(self, state: ProbeState):
+        spread = state.interval * self.jitter
+        state.next_due = time.monotonic() + state.interval + random.uniform(-spread, spread)
+
+    def due(self, agent_ids: List[str], force: bool = False) -> List[str]:
+        """확인할 차례인 에이전트 (이미 확인 중인 에이전트는 제외)"""
+        now = time.monotonic()
+        selected = []
+        for agent_id in agent_ids:
+            state = self._state(agent_id)
+            if not state.probing and (force or state.next_due <= now):
+                selected.append(agent_id)
+        return selected
+
+    def begin(self, agent_id: str):
+        """확인 시작 (겹치는 스윕에서 같은 에이전트를 다시 확인하지 않도록 표시)"""
+        self._state(agent_id).probing = True
+
+    def record_success(self, agent_id: str, latency_ms: float):
+        """정상 응답: 지연 기록, 간격을 두 배로 (최대 max_interval)"""
+        state = self._state(agent_id)
+        state.probing = False
+        state.failures = 0
+        if state.latency_ms is None:
+            state.latency_ms = latency_ms
+        else:
+            state.latency_ms += self.latency_alpha * (latency_ms - state.latency_ms)
+        state.interval = min(self.max_interval, state.interval * 2)
+        self._schedule(state)
+
+    def record_failure(self, agent_id: str):
+        """실패: 간격을 min_interval로 되돌림"""
+        state = self._state(agent_id)
+        state.probing = False
+        state.failures += 1
+        state.interval = self.min_interval
+        self._schedule(state)
+
+    def latency(self, agent_id: str) -> Optional[float]:
+        """평균 응답 지연 (ms, 확인 전이면 None)"""
+        state = self.states.get(agent_id)
+        return state.latency_ms if state else None
+
+    def forget(self, agent_id: str):
+        """등록 해제된 에이전트 상태 제거"""
+        self.states.pop(agent_id, None)
+
+    def next_wakeup(self) -> float:
+        """다음 확인까지 남은 시간 (초, 최대 min_interval)"""
+        if not self.states:
+            return self.min_interval
+        earliest = min(state.next_due for state in self.states.values())
+        return max(0.0, min(self.min_interval, earliest - time.monotonic()))
@@ -8,22 +8,47 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from fastapi import FastAPI, HTTPException
-from typing import Dict, List, Optional
+import asyncio
+import heapq
+import httpx
+import time
+import uuid
+from collections import OrderedDict
+from fastapi import Body, FastAPI, HTTPException, Request, Response
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
+from a2a_core.registry.health import HealthCheckSchedule
+from a2a_core.registry.replication import ReplicaState, anti_entropy_round, liveness_round, to_clock
+from a2a_core.registry.store import RegistryStore
+from a2a_core.registry.watch import RegistryWatch
+
+
+def _load_registry_setting(key: str, default: Any) -> Any:
+    """설정 파일의 registry 섹션 값 조회 (설정 모듈이 없으면 기본값)"""
+    try:
+        from utils.config_manager import config
+        return config.get(f"registry.{key}", default)
+    except Exception:
+        return default
+
+
 # AgentInfo를 직접 정의
 class AgentInfo:
     """에이전트 정보"""
     def __init__(self, agent_id: str, name: str, description: str, 
-                 endpoint: str, capabilities: List[Dict], metadata: Optional[Dict] = None):
+                 endpoint: str, capabilities: List[Dict], metadata: Optional[Dict] = None,
+                 status: str = "active"):
         self.agent_id = agent_id
         self.name = name
         self.description = description
         self.endpoint = endpoint
         self.capabilities = capabilities
         self.metadata = metadata or {}
+        self.status = status  # 재시작 후 복원된 항목은 확인 전까지 "unverified"
+        self.load: Dict = {}  # 하트비트로 보고된 부하 (저장하지 않음)
+        self.latency_ms: Optional[float] = None  # 헬스체크 평균 응답 지연 (복제본마다 따로 측정)
         
     def to_dict(self) -> Dict:
         """딕셔너리로 변환"""
@@ -33,7 +58,10 @@ class AgentInfo:
             "description": self.description,
             "endpoint": self.endpoint,
             "capabilities": self.capabilities,
-            "metadata": self.metadata
+            "metadata": self.metadata,
+            "status": self.status,
+            "load": self.load,
+            "latency_ms": self.latency_ms
         }
 
 
@@ -48,17 +76,145 @@ class RegisterRequest(BaseModel):
 
 
 class DiscoverResponse(BaseModel):
-    """에이전트 발견 응답"""
+    """에이전트 발견 응답 (delta면 version 이후 바뀐 에이전트와 removed만)"""
     agents: List[Dict]
+    count: int = 0
+    version: int = 0
+    delta: bool = False
+    removed: List[str] = []
+
+
+# 발견 결과에 포함하는 상태 (헬스체크에 실패한 에이전트는 하트비트나 다음 확인 성공까지 제외)
+DISCOVERABLE_STATUSES = ("active", "unverified")
 
 
 class Registry:
     """에이전트 레지스트리"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        store: Optional[RegistryStore] = None,
+        replica_id: Optional[str] = None,
+        health_check_concurrency: int = 16,
+        health_check_timeout: float = 5.0,
+        health_check_min_interval: float = 10.0,
+        health_check_max_interval: float = 120.0
+    ):
         self.agents: Dict[str, AgentInfo] = {}
         self.last_heartbeat: Dict[str, datetime] = {}
         self.timeout_seconds = 120  # 2분
+        self.watch = RegistryWatch()  # 토폴로지 변경 감시
+        self.replica = ReplicaState(replica_id)  # 복제본 간 anti-entropy용 항목별 시계
+        
+        # 증분 발견 인덱스
+        # - agent_index: capability(None이면 전체) -> agent_id (등록 순서 유지)
+        # - expiry_heap: (하트비트 만료 시각, agent_id), 하트비트마다 새 항목을 넣고 만료 시 재확인
+        # - changes: agent_id -> 마지막 변경 버전 (최근 변경이 뒤), ?since= 델타 응답에 사용
+        # 버전은 재시작 전 버전과 겹치지 않도록 시작 시각(ms)에서 출발하고,
+        # ETag에는 프로세스별 instance를 붙여 다른 복제본/재시작 전 ETag와 구분한다
+        self.agent_index: Dict[Optional[str], Dict[str, None]] = {None: {}}
+        self.expiry_heap: List[Tuple[datetime, str]] = []
+        self.changes: "OrderedDict[str, int]" = OrderedDict()
+        self.max_changes = 10000
+        self.instance = uuid.uuid4().hex[:8]
+        self.watch.version = int(time.time() * 1000)
+        self.delta_floor = self.watch.version  # 이 버전 이전의 since는 전체 목록으로 응답
+        self._listing_cache: Dict[Optional[str], Tuple[int, List[AgentInfo]]] = {}
+        
+        # 하트비트/부하 전파 (복제 시계와 별도라 다이제스트/요약 해시는 바뀌지 않음)
+        # - liveness_changes: agent_id -> 마지막 하트비트/부하 변경 순번 (최근 변경이 뒤)
+        # - liveness_origin: agent_id -> 마지막 변경을 보낸 복제본 instance (그 복제본에는 되돌려 보내지 않음)
+        # - liveness_cursors: 복제본 -> (복제본 instance, 받은 순번), liveness_sent: 복제본 -> 보낸 순번
+        self.load_at: Dict[str, datetime] = {}  # 부하 보고 시각 (더 최근 보고만 반영)
+        self.load_generation = 0  # 부하가 바뀔 때마다 증가 (ETag에 포함해 304로 오래된 부하를 재사용하지 않게)
+        self.liveness_seq = 0
+        self.liveness_changes: "OrderedDict[str, int]" = OrderedDict()
+        self.liveness_origin: Dict[str, str] = {}
+        self.liveness_cursors: Dict[str, Tuple[str, int]] = {}
+        self.liveness_sent: Dict[str, int] = {}
+        
+        # 헬스체크: 동시 확인 상한, 에이전트별 적응형 간격, 재사용 HTTP 클라이언트
+        self.health_check_timeout = health_check_timeout
+        self.health_semaphore = asyncio.Semaphore(health_check_concurrency)
+        self.health_schedule = HealthCheckSchedule(
+            min_interval=health_check_min_interval,
+            max_interval=health_check_max_interval
+        )
+        # 하트비트 사이에는 확인 성공이 생존 확인을 대신하므로, 가장 긴 확인 간격
+        # (지터 + 주기 루프 대기 여유 + 확인 시간 포함)이 타임아웃을 넘지 않도록 max_interval 제한
+        slack = max(1.0, health_check_min_interval) + health_check_timeout
+        fitted = (self.timeout_seconds - slack) / (1 + self.health_schedule.jitter)
+        self.health_schedule.max_interval = max(health_check_min_interval, min(health_check_max_interval, fitted))
+        self.http_client: Optional[httpx.AsyncClient] = None
+        
+        self.store = store  # 등록/해제 영속화 (None이면 메모리만)
+        if store:
+            self._restore()
+        
+    def _restore(self):
+        """스냅샷 + 로그에서 에이전트 복원 (첫 확인 전까지 unverified로 발견 결과에 포함)"""
+        now = datetime.now()
+        for agent_id, data in self.store.load().items():
+            data = {key: value for key, value in data.items() if key not in ("status", "load", "latency_ms")}
+            self._put_agent(AgentInfo(**data, status="unverified"), now)
+            self.replica.restore(agent_id)
+        if self.agents:
+            self.watch.bump()
+            self.delta_floor = self.watch.version
+            print(f"♻️ 레지스트리 상태 복원: {len(self.agents)}개 에이전트 (확인 대기)")
+            
+    def _persist(self, op: str, agent_id: str, agent_info: Optional[AgentInfo] = None):
+        """변경을 로그에 기록, 로그가 길어지면 스냅샷으로 압축"""
+        if not self.store:
+            return
+        try:
+            record = agent_info.to_dict() if agent_info else None
+            if self.store.append(op, agent_id, record):
+                self.store.compact({aid: agent.to_dict() for aid, agent in self.agents.items()})
+        except OSError as e:
+            print(f"⚠️ 레지스트리 상태 기록 실패: {e}")
+            
+    def _mark_verified(self, agent_id: str):
+        """하트비트/헬스체크로 살아 있음이 확인됨"""
+        agent_info = self.agents.get(agent_id)
+        if agent_info:
+            self._set_status(agent_info, "active")
+            
+    def _set_status(self, agent_info: AgentInfo, status: str):
+        """상태 변경 (발견 인덱스 갱신, 발견 결과가 바뀌므로 watcher에 알림)"""
+        if agent_info.status != status:
+            self._unindex(agent_info)
+            agent_info.status = status
+            self._index(agent_info)
+            self._record_change(agent_info.agent_id)
+            
+    async def verify_restored_agents(self, timeout: float = 5.0, concurrency: int = 16):
+        """복원된 unverified 에이전트의 /health를 병렬 확인 (응답 없으면 제거)"""
+        pending = [agent_id for agent_id, agent in self.agents.items() if agent.status == "unverified"]
+        if not pending:
+            return
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def probe(client: httpx.AsyncClient, agent_id: str):
+            agent_info = self.agents.get(agent_id)
+            if agent_info is None:
+                return
+            async with semaphore:
+                try:
+                    response = await client.get(f"{agent_info.endpoint}/health", timeout=timeout)
+                    healthy = response.status_code == 200
+                except Exception:
+                    healthy = False
+            # 확인하는 동안 재등록/하트비트로 이미 확인됐으면 그대로 둠
+            if self.agents.get(agent_id) is not agent_info or agent_info.status != "unverified":
+                return
+            if healthy:
+                self._mark_verified(agent_id)
+            else:
+                self.deregister_agent(agent_id)
+                
+        async with httpx.AsyncClient() as client:
+            await asyncio.gather(*(probe(client, agent_id) for agent_id in pending))
         
     def register_agent(self, request: RegisterRequest) -> AgentInfo:
         """에이전트 등록"""
@@ -71,8 +227,10 @@ class Registry:
             metadata=request.metadata
         )
         
-        self.agents[request.agent_id] = agent_info
-        self.last_heartbeat[request.agent_id] = datetime.now()
+        self._put_agent(agent_info, datetime.now())
+        self.replica.tick(request.agent_id)
+        self._persist("register", request.agent_id, agent_info)
+        self._record_change(request.agent_id)
         
         print(f"✅ 에이전트 등록: {agent_info.name} (ID: {agent_info.agent_id})")
         print(f"   - Endpoint: {agent_info.endpoint}")
@@ -80,37 +238,95 @@ class Registry:
         
         return agent_info
         
-    def update_heartbeat(self, agent_id: str):
-        """하트비트 업데이트"""
+    def deregister_agent(self, agent_id: str):
+        """에이전트 등록 해제"""
+        if agent_id not in self.agents:
+            raise ValueError(f"Unknown agent: {agent_id}")
+        agent_info = self._remove_agent(agent_id)
+        self.health_schedule.forget(agent_id)
+        self.replica.tick(agent_id, deleted=True)
+        self._persist("deregister", agent_id)
+        self._record_change(agent_id)
+        print(f"🔴 에이전트 등록 해제: {agent_info.name} (ID: {agent_id})")
+        
+    def update_heartbeat(self, agent_id: str, load: Optional[Dict] = None):
+        """하트비트 업데이트 (부하 보고 포함 가능)
+        
+        생존/부하만 바뀌므로 복제 시계는 올리지 않고 liveness 교환으로 다른 복제본에 전파한다.
+        """
         if agent_id in self.agents:
-            self.last_heartbeat[agent_id] = datetime.now()
+            self._touch(agent_id, datetime.now())
+            if load is not None:
+                self._set_load(agent_id, load, datetime.now())
+            self._mark_verified(agent_id)
+            self._record_liveness(agent_id)
             # 하트비트 로그는 비활성화 (너무 많은 로그 방지)
             # print(f"💓 하트비트 업데이트: {agent_id}")
         else:
             raise ValueError(f"Unknown agent: {agent_id}")
             
+    def update_load(self, agent_id: str, load: Dict):
+        """부하 보고만 갱신 (생존 확인/복제 시계/토폴로지 버전은 그대로)"""
+        if agent_id not in self.agents:
+            raise ValueError(f"Unknown agent: {agent_id}")
+        self._set_load(agent_id, load, datetime.now())
+        self._record_liveness(agent_id)
+        
+    def _set_load(self, agent_id: str, load: Dict, reported_at: datetime):
+        # 부하는 자주 바뀌므로 토폴로지 버전은 올리지 않고 목록 캐시만 갱신
+        self.agents[agent_id].load = load
+        self.load_at[agent_id] = reported_at
+        self.load_generation += 1
+        self._listing_cache.clear()
+        
+    def _record_liveness(self, agent_id: str, origin: str = ""):
+        self.liveness_seq += 1
+        self.liveness_changes[agent_id] = self.liveness_seq
+        self.liveness_changes.move_to_end(agent_id)
+        self.liveness_origin[agent_id] = origin
+            
     def discover_agents(self, capability: Optional[str] = None) -> List[AgentInfo]:
-        """활성 에이전트 발견"""
+        """활성 에이전트 발견 (능력 인덱스 조회, 토폴로지 버전이 같으면 이전 결과 재사용)"""
         # 타임아웃된 에이전트 제거
-        self._cleanup_inactive_agents()
+        version = self.topology_version()
+        cached = self._listing_cache.get(capability)
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+            
+        agents = [self.agents[agent_id] for agent_id in self.agent_index.get(capability, {})]
         
-        active_agents = []
-        for agent_id, agent_info in self.agents.items():
-            if capability:
-                # 특정 능력을 가진 에이전트만 필터링
-                has_capability = any(
-                    cap.get("name") == capability 
-                    for cap in agent_info.capabilities
-                )
-                if has_capability:
-                    active_agents.append(agent_info)
+        # 응답이 빠른 에이전트 우선 (아직 확인되지 않은 에이전트는 뒤로, 등록 순서 유지)
+        agents.sort(key=lambda agent: (agent.latency_ms is None, agent.latency_ms or 0.0))
+        self._listing_cache[capability] = (version, agents)
+        return list(agents)
+        
+    def discover_changes(self, since: int, capability: Optional[str] = None) -> Optional[Dict]:
+        """since 버전 이후 바뀐 에이전트만 반환 (변경 기록이 남아 있지 않으면 None)"""
+        version = self.topology_version()
+        if since < self.delta_floor or since > version:
+            return None
+            
+        indexed = self.agent_index.get(capability, {})
+        upserted: List[AgentInfo] = []
+        removed: List[str] = []
+        for agent_id, changed_at in reversed(self.changes.items()):
+            if changed_at <= since:
+                break
+            if agent_id in indexed:
+                upserted.append(self.agents[agent_id])
             else:
-                active_agents.append(agent_info)
+                removed.append(agent_id)
                 
-        print(f"🔍 에이전트 검색 - capability: {capability}")
-        print(f"   - 활성 에이전트 수: {len(active_agents)}")
+        return {"version": version, "agents": upserted, "removed": removed}
         
-        return active_agents
+    def topology_version(self) -> int:
+        """하트비트 만료를 반영한 현재 토폴로지 버전"""
+        self._cleanup_inactive_agents()
+        return self.watch.version
+        
+    def etag(self) -> str:
+        """발견 응답의 ETag (프로세스 instance + 토폴로지 버전 + 부하 세대)"""
+        return f'"{self.instance}-{self.topology_version()}-{self.load_generation}"'
         
     def get_agent(self, agent_id: str) -> Optional[AgentInfo]:
         """특정 에이전트 조회"""
@@ -118,25 +334,309 @@ class Registry:
         return self.agents.get(agent_id)
         
     def _cleanup_inactive_agents(self):
-        """비활성 에이전트 정리"""
+        """만료 시각이 지난 항목만 꺼내 비활성 에이전트 정리 (이후 하트비트가 온 에이전트는 건너뜀)"""
         now = datetime.now()
-        timeout_threshold = now - timedelta(seconds=self.timeout_seconds)
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            _, agent_id = heapq.heappop(self.expiry_heap)
+            last_seen = self.last_heartbeat.get(agent_id)
+            # 꺼낸 항목이 마지막 하트비트의 것이면 만료 (그 뒤 하트비트가 왔으면 더 늦은 항목이 힙에 있음)
+            if last_seen is None or (now - last_seen).total_seconds() < self.timeout_seconds:
+                continue
+            agent_info = self._remove_agent(agent_id)
+            self.health_schedule.forget(agent_id)
+            self.replica.tick(agent_id, deleted=True)
+            self._persist("deregister", agent_id)
+            self._record_change(agent_id)
+            print(f"🔴 비활성 에이전트 제거: {agent_info.name} (ID: {agent_id})")
+            
+    def _index_keys(self, agent_info: AgentInfo) -> List[Optional[str]]:
+        return [None] + [cap.get("name") for cap in agent_info.capabilities if cap.get("name")]
+        
+    def _put_agent(self, agent_info: AgentInfo, heartbeat: datetime):
+        """에이전트 저장 + 인덱스 갱신 (같은 ID면 이전 능력 인덱스 정리)"""
+        previous = self.agents.get(agent_info.agent_id)
+        if previous is not None:
+            self._unindex(previous)
+        self.agents[agent_info.agent_id] = agent_info
+        self._index(agent_info)
+        self._touch(agent_info.agent_id, heartbeat)
+        
+    def _remove_agent(self, agent_id: str) -> Optional[AgentInfo]:
+        """에이전트와 인덱스 항목 제거 (만료 힙의 남은 항목은 꺼낼 때 건너뜀)"""
+        agent_info = self.agents.pop(agent_id, None)
+        if agent_info is not None:
+            self._unindex(agent_info)
+            self.last_heartbeat.pop(agent_id, None)
+            self.load_at.pop(agent_id, None)
+            self.liveness_changes.pop(agent_id, None)
+            self.liveness_origin.pop(agent_id, None)
+        return agent_info
+        
+    def _index(self, agent_info: AgentInfo):
+        """발견 대상 상태면 능력 인덱스에 추가"""
+        if agent_info.status in DISCOVERABLE_STATUSES:
+            for key in self._index_keys(agent_info):
+                self.agent_index.setdefault(key, {})[agent_info.agent_id] = None
+                
+    def _unindex(self, agent_info: AgentInfo):
+        for key in self._index_keys(agent_info):
+            indexed = self.agent_index.get(key)
+            if indexed is not None:
+                indexed.pop(agent_info.agent_id, None)
+                if not indexed and key is not None:
+                    del self.agent_index[key]
+                    
+    def _touch(self, agent_id: str, heartbeat: datetime):
+        """하트비트 시각 갱신 + 만료 힙에 새 만료 시각 추가"""
+        self.last_heartbeat[agent_id] = heartbeat
+        heapq.heappush(self.expiry_heap, (heartbeat + timedelta(seconds=self.timeout_seconds), agent_id))
+        
+    def _record_change(self, agent_id: str):
+        """토폴로지 버전을 올리고 변경 기록 (오래된 기록은 잘라내고 delta_floor 갱신)"""
+        self.watch.bump()
+        self.changes[agent_id] = self.watch.version
+        self.changes.move_to_end(agent_id)
+        while len(self.changes) > self.max_changes:
+            _, self.delta_floor = self.changes.popitem(last=False)
+
+
+    def export_records(self, agent_ids: List[str]) -> List[Dict]:
+        """복제용 항목 (시계 + 에이전트 정보 또는 삭제 표시)"""
+        records = []
+        for agent_id in agent_ids:
+            clock = self.replica.clocks.get(agent_id)
+            if clock is None:
+                continue
+            record = {"agent_id": agent_id, "clock": list(clock), "deleted": self.replica.is_deleted(agent_id)}
+            agent_info = self.agents.get(agent_id)
+            if not record["deleted"] and agent_info is not None:
+                record["agent"] = agent_info.to_dict()
+                record["last_heartbeat"] = self.last_heartbeat[agent_id].isoformat()
+            records.append(record)
+        return records
         
-        inactive_agents = []
-        for agent_id, last_seen in self.last_heartbeat.items():
-            if last_seen < timeout_threshold:
-                inactive_agents.append(agent_id)
+    def merge_records(self, records: List[Dict]) -> int:
+        """다른 복제본의 항목 병합 (시계가 더 최신인 항목만 반영, 반영 수 반환)"""
+        applied = 0
+        for record in records:
+            agent_id = record["agent_id"]
+            if not self.replica.accept(agent_id, to_clock(record["clock"]), record.get("deleted", False)):
+                continue
+            applied += 1
+            
+            if record.get("deleted"):
+                if self._remove_agent(agent_id) is not None:
+                    self._persist("deregister", agent_id)
+                    self._record_change(agent_id)
+                continue
                 
-        for agent_id in inactive_agents:
-            agent_name = self.agents[agent_id].name
-            del self.agents[agent_id]
-            del self.last_heartbeat[agent_id]
-            print(f"🔴 비활성 에이전트 제거: {agent_name} (ID: {agent_id})")
+            data = dict(record["agent"])
+            load = data.pop("load", {}) or {}
+            data.pop("latency_ms", None)
+            existing = self.agents.get(agent_id)
+            if existing is not None and existing.status == "active":
+                data["status"] = "active"
+            agent_info = AgentInfo(**data)
+            agent_info.load = load
+            if existing is not None:
+                # 부하는 liveness 교환으로 따로 맞추므로 이미 받은 보고를 유지
+                agent_info.latency_ms = existing.latency_ms
+                if agent_id in self.load_at:
+                    agent_info.load = existing.load
+            if existing is None or agent_info.load != existing.load:
+                self.load_generation += 1
+            
+            remote_heartbeat = datetime.fromisoformat(record["last_heartbeat"])
+            local_heartbeat = self.last_heartbeat.get(agent_id)
+            self._put_agent(agent_info, max(remote_heartbeat, local_heartbeat) if local_heartbeat else remote_heartbeat)
+            
+            # 하트비트/부하만 바뀐 경우는 토폴로지 변경이 아님
+            if existing is None or {**existing.to_dict(), "load": None} != {**agent_info.to_dict(), "load": None}:
+                self._persist("register", agent_id, agent_info)
+                self._record_change(agent_id)
+            
+        return applied
+        
+    def export_liveness(self, since: int, exclude_origin: Optional[str] = None) -> Dict:
+        """since 순번 이후 하트비트/부하가 바뀐 에이전트 (exclude_origin에게서 받은 변경은 제외)"""
+        entries = []
+        for agent_id, seq in reversed(self.liveness_changes.items()):
+            if seq <= since:
+                break
+            if exclude_origin and self.liveness_origin.get(agent_id) == exclude_origin:
+                continue
+            load_at = self.load_at.get(agent_id)
+            entries.append({
+                "agent_id": agent_id,
+                "last_heartbeat": self.last_heartbeat[agent_id].isoformat(),
+                "load": self.agents[agent_id].load,
+                "load_at": load_at.isoformat() if load_at else None
+            })
+        return {"instance": self.instance, "seq": self.liveness_seq, "entries": entries}
+        
+    def merge_liveness(self, entries: List[Dict], origin: str = "") -> int:
+        """다른 복제본(origin instance)의 하트비트/부하 반영 (더 최근 것만, 반영 수 반환)"""
+        applied = 0
+        for entry in entries:
+            agent_id = entry["agent_id"]
+            if agent_id not in self.agents:
+                continue
+            changed = False
+            heartbeat = datetime.fromisoformat(entry["last_heartbeat"])
+            if heartbeat > self.last_heartbeat[agent_id]:
+                self._touch(agent_id, heartbeat)
+                changed = True
+            if entry.get("load_at"):
+                load_at = datetime.fromisoformat(entry["load_at"])
+                if load_at > self.load_at.get(agent_id, datetime.min):
+                    self._set_load(agent_id, entry.get("load") or {}, load_at)
+                    changed = True
+            if changed:
+                self._record_liveness(agent_id, origin)
+                applied += 1
+        return applied
+        
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """헬스체크용 HTTP 클라이언트 (연결 풀 재사용)"""
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                timeout=self.health_check_timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self.http_client
+        
+    async def close(self):
+        """HTTP 클라이언트 종료"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+            
+    async def health_check_agents(self, due_only: bool = False):
+        """에이전트 상태 확인 (동시 확인 수 제한, due_only면 확인할 차례인 에이전트만)"""
+        agent_ids = self.health_schedule.due(list(self.agents), force=not due_only)
+        if not agent_ids:
+            return
+        for agent_id in agent_ids:
+            self.health_schedule.begin(agent_id)
+        await asyncio.gather(*(self._probe_agent(agent_id) for agent_id in agent_ids))
+        
+    async def _probe_agent(self, agent_id: str):
+        """에이전트 하나의 health endpoint 확인 (성공하면 하트비트로 간주)"""
+        agent_info = self.agents.get(agent_id)
+        if agent_info is None:
+            self.health_schedule.forget(agent_id)
+            return
+            
+        async with self.health_semaphore:
+            started = time.perf_counter()
+            try:
+                response = await self._get_http_client().get(
+                    f"{agent_info.endpoint}/health", timeout=self.health_check_timeout
+                )
+                healthy = response.status_code == 200
+                status = "unhealthy"
+            except Exception as e:
+                healthy = False
+                status = "unreachable"
+                print(f"⚠️ 에이전트 {agent_info.name} 상태 확인 실패: {e}")
+            latency_ms = (time.perf_counter() - started) * 1000
+            
+        # 확인하는 동안 해제/재등록된 에이전트는 건너뜀
+        if self.agents.get(agent_id) is not agent_info:
+            self.health_schedule.forget(agent_id)
+            return
+        if healthy:
+            self.health_schedule.record_success(agent_id, latency_ms)
+            agent_info.latency_ms = self.health_schedule.latency(agent_id)
+            self._listing_cache.clear()  # 정렬 순서만 바뀜 (버전은 유지)
+            self._touch(agent_id, datetime.now())
+            self._set_status(agent_info, "active")
+        else:
+            self.health_schedule.record_failure(agent_id)
+            self._set_status(agent_info, status)
+            
+    async def anti_entropy_loop(self, peers: List[str], interval: float = 5.0):
+        """주기적으로 다른 복제본들과 상태, 하트비트/부하 맞추기 (죽은 복제본은 건너뜀)"""
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            while True:
+                await asyncio.sleep(interval)
+                self.replica.purge_tombstones()
+                for peer_url in peers:
+                    try:
+                        exchanged = await anti_entropy_round(self, client, peer_url)
+                        if exchanged:
+                            print(f"🔄 복제본 동기화: {peer_url} ({exchanged}개 항목)")
+                        await liveness_round(self, client, peer_url)
+                    except Exception as e:
+                        print(f"⚠️ 복제본 동기화 실패: {peer_url} ({e})")
+
+
+def _create_store() -> Optional[RegistryStore]:
+    """설정의 registry.state_dir에 상태 저장 (비어 있으면 메모리만)"""
+    state_dir = os.environ.get("A2A_REGISTRY_STATE_DIR", _load_registry_setting("state_dir", ""))
+    if not state_dir:
+        return None
+    return RegistryStore(
+        state_dir,
+        compact_every=_load_registry_setting("compact_every", 1000),
+        fsync=_load_registry_setting("fsync", False)
+    )
+
+
+def _replica_peers() -> List[str]:
+    """다른 복제본 URL (A2A_REGISTRY_PEERS=콤마 구분 또는 설정의 registry.peers)"""
+    peers = os.environ.get("A2A_REGISTRY_PEERS")
+    if peers is not None:
+        return [peer.strip().rstrip("/") for peer in peers.split(",") if peer.strip()]
+    return [peer.rstrip("/") for peer in _load_registry_setting("peers", []) or []]
+
+
+def _create_registry() -> Registry:
+    """설정의 registry.health_check로 헬스체크 동시성/간격 지정"""
+    health_config = _load_registry_setting("health_check", {}) or {}
+    return Registry(
+        store=_create_store(),
+        replica_id=os.environ.get("A2A_REGISTRY_REPLICA_ID"),
+        health_check_concurrency=health_config.get("concurrency", 16),
+        health_check_timeout=health_config.get("timeout", 5.0),
+        health_check_min_interval=health_config.get("min_interval", 10.0),
+        health_check_max_interval=health_config.get("max_interval", 120.0)
+    )
 
 
 # FastAPI 앱 생성
 app = FastAPI(title="A2A Registry Server")
-registry = Registry()
+registry = _create_registry()
+
+
+async def periodic_health_check():
+    """확인할 차례가 된 에이전트만 주기적으로 확인 (간격은 에이전트별로 적응)"""
+    while True:
+        await asyncio.sleep(max(1.0, registry.health_schedule.next_wakeup()))
+        try:
+            await registry.health_check_agents(due_only=True)
+        except Exception as e:
+            print(f"⚠️ 헬스체크 실패: {e}")
+
+
+@app.on_event("startup")
+async def startup_event():
+    """복원된 에이전트 상태 확인 (서비스는 바로 시작하고 백그라운드에서 확인), 헬스체크/복제본 동기화 시작"""
+    asyncio.create_task(registry.verify_restored_agents())
+    asyncio.create_task(periodic_health_check())
+    peers = _replica_peers()
+    if peers:
+        interval = _load_registry_setting("anti_entropy_interval", 5)
+        asyncio.create_task(registry.anti_entropy_loop(peers, interval))
+        print(f"🔄 복제본 동기화 시작: {peers} ({interval}초 간격)")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """종료 시 스냅샷 저장, 헬스체크 HTTP 클라이언트 정리"""
+    if registry.store:
+        registry.store.compact({agent_id: agent.to_dict() for agent_id, agent in registry.agents.items()})
+    await registry.close()
 
 
 @app.get("/")
@@ -159,25 +659,126 @@ async def register_agent(request: RegisterRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.delete("/register/{agent_id}")
+async def deregister_agent(agent_id: str):
+    """에이전트 등록 해제"""
+    try:
+        registry.deregister_agent(agent_id)
+        return {"status": "deregistered"}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @app.put("/heartbeat/{agent_id}")
-async def update_heartbeat(agent_id: str):
-    """하트비트 업데이트"""
+async def update_heartbeat(agent_id: str, body: Optional[Dict] = Body(default=None)):
+    """하트비트 업데이트 (본문의 load는 발견 결과에 노출)"""
     try:
-        registry.update_heartbeat(agent_id)
+        registry.update_heartbeat(agent_id, (body or {}).get("load"))
+        return {"status": "ok"}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@app.put("/load/{agent_id}")
+async def update_load(agent_id: str, body: Dict = Body(...)):
+    """부하 보고 (하트비트와 별도, 생존 확인으로 치지 않음)"""
+    try:
+        registry.update_load(agent_id, body.get("load") or {})
         return {"status": "ok"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @app.get("/discover", response_model=DiscoverResponse)
-async def discover_agents(capability: Optional[str] = None):
-    """에이전트 발견"""
+async def discover_agents(
+    request: Request,
+    response: Response,
+    capability: Optional[str] = None,
+    since: Optional[int] = None
+):
+    """에이전트 발견
+
+    - ETag는 instance + 토폴로지 버전 + 부하 세대이며 If-None-Match가 같으면 304 (본문 없음)
+    - since가 주어지면 그 버전 이후 바뀐 에이전트만 반환 (agents + removed, delta=true)
+    """
+    etag = registry.etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    if since is not None:
+        delta = registry.discover_changes(since, capability)
+        if delta is not None:
+            return DiscoverResponse(
+                agents=[agent.to_dict() for agent in delta["agents"]],
+                count=len(delta["agents"]),
+                version=delta["version"],
+                delta=True,
+                removed=delta["removed"]
+            )
+            
     agents = registry.discover_agents(capability)
     return DiscoverResponse(
-        agents=[agent.to_dict() for agent in agents]
+        agents=[agent.to_dict() for agent in agents],
+        count=len(agents),
+        version=registry.watch.version
     )
 
 
+@app.get("/watch")
+async def watch_agents(version: int = -1, timeout: float = 30.0):
+    """토폴로지 변경 감시 (long-poll, 변경이 없으면 timeout 후 changed=false)"""
+    registry._cleanup_inactive_agents()
+    changed = await registry.watch.wait_for_change(version, min(max(timeout, 0.0), 60.0))
+    if not changed:
+        return {"version": registry.watch.version, "changed": False}
+    return {
+        "version": registry.watch.version,
+        "changed": True,
+        "agents": [agent.to_dict() for agent in registry.discover_agents()]
+    }
+
+
+@app.get("/replication/summary")
+async def replication_summary():
+    """복제 상태 요약 해시 (같으면 anti-entropy 교환 생략)"""
+    return {
+        "replica_id": registry.replica.replica_id,
+        "hash": registry.replica.summary(),
+        "entries": len(registry.replica.clocks)
+    }
+
+
+@app.get("/replication/digest")
+async def replication_digest():
+    """항목별 시계 (agent_id -> [counter, replica_id], 삭제 표시 포함)"""
+    return {"entries": {agent_id: list(clock) for agent_id, clock in registry.replica.digest().items()}}
+
+
+@app.post("/replication/pull")
+async def replication_pull(body: Dict = Body(...)):
+    """요청한 항목 반환"""
+    return {"records": registry.export_records(body.get("agent_ids", []))}
+
+
+@app.post("/replication/push")
+async def replication_push(body: Dict = Body(...)):
+    """다른 복제본이 보낸 항목 병합"""
+    return {"applied": registry.merge_records(body.get("records", []))}
+
+
+@app.get("/replication/liveness")
+async def replication_liveness(since: int = 0, exclude: Optional[str] = None):
+    """since 순번 이후 바뀐 하트비트/부하 (instance가 바뀌면 받는 쪽이 0부터 다시 요청, exclude가 보낸 변경은 제외)"""
+    return registry.export_liveness(since, exclude_origin=exclude)
+
+
+@app.post("/replication/liveness")
+async def replication_liveness_push(body: Dict = Body(...)):
+    """다른 복제본이 보낸 하트비트/부하 반영"""
+    return {"applied": registry.merge_liveness(body.get("entries", []), body.get("instance", ""))}
+
+
 @app.get("/agents/{agent_id}")
 async def get_agent(agent_id: str):
     """특정 에이전트 조회"""
@@ -201,6 +802,7 @@ async def get_status():
                 "name": agent.name,
                 "endpoint": agent.endpoint,
                 "capabilities": [c["name"] for c in agent.capabilities],
+                "status": agent.status,
                 "last_heartbeat": registry.last_heartbeat.get(agent_id).isoformat()
             }
             for agent_id, agent in registry.agents.items()
@@ -0,0 +1,145 @@
+"""
+레지스트리 복제 (anti-entropy)
+
+여러 registry_server 복제본이 에이전트 테이블을 주기적으로 맞춘다.
+- 에이전트 항목마다 논리 시계 (counter, replica_id)를 두고 큰 쪽이 이긴다 (last-writer-wins)
+  counter는 벽시계(ms) 이상으로 올리므로 재시작한 복제본의 새 변경도 재시작 전 시계보다 크다
+- 등록 해제는 삭제 표시(tombstone)로 남겨 다른 복제본에 전파한 뒤 일정 시간 후 정리한다
+- 요약 해시가 같으면 교환을 생략하고, 다르면 다이제스트(agent_id -> 시계)를 비교해
+  상대가 더 최신인 항목은 가져오고 내가 더 최신인 항목은 보낸다
+- 하트비트/부하는 시계를 올리지 않고 (요약 해시가 계속 바뀌지 않도록) 변경 순번 커서로
+  바뀐 항목만 따로 주고받는다
+"""
+
+import hashlib
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+
+Clock = Tuple[int, str]
+
+# 비교용 최소 시계 (항목이 없으면 이 값으로 간주)
+ZERO_CLOCK: Clock = (-1, "")
+
+
+def to_clock(value) -> Clock:
+    """JSON 표현 [counter, replica_id]를 시계로 변환"""
+    return (int(value[0]), str(value[1]))
+
+
+class ReplicaState:
+    """복제본의 항목별 논리 시계와 삭제 표시"""
+
+    def __init__(self, replica_id: Optional[str] = None, tombstone_ttl: float = 3600.0):
+        self.replica_id = replica_id or uuid.uuid4().hex[:8]
+        self.tombstone_ttl = tombstone_ttl
+        self.counter = 0
+        self.clocks: Dict[str, Clock] = {}
+        self.tombstones: Dict[str, float] = {}  # agent_id -> 삭제 시각 (monotonic)
+        self._summary: Optional[str] = None
+
+    def tick(self, agent_id: str, deleted: bool = False) -> Clock:
+        """로컬 변경 기록 (새 시계 발급, 재시작해도 이전에 발급한 시계보다 커지도록 벽시계 ms 이상)"""
+        self.counter = max(self.counter + 1, int(time.time() * 1000))
+        clock = (self.counter, self.replica_id)
+        self._set(agent_id, clock, deleted)
+        return clock
+
+    def restore(self, agent_id: str):
+        """재시작 시 복원한 항목 (어느 복제본의 변경보다도 오래된 것으로 취급)"""
+        self._set(agent_id, (0, self.replica_id), False)
+
+    def accept(self, agent_id: str, clock: Clock, deleted: bool) -> bool:
+        """원격 변경이 더 최신이면 기록하고 True"""
+        self.counter = max(self.counter, clock[0])
+        if clock <= self.clocks.get(agent_id, ZERO_CLOCK):
+            return False
+        self._set(agent_id, clock, deleted)
+        return True
+
+    def _set(self, agent_id: str, clock: Clock, deleted: bool):
+        self.clocks[agent_id] = clock
+        if deleted:
+            self.tombstones[agent_id] = time.monotonic()
+        else:
+            self.tombstones.pop(agent_id, None)
+        self._summary = None
+
+    def is_deleted(self, agent_id: str) -> bool:
+        return agent_id in self.tombstones
+
+    def purge_tombstones(self):
+        """오래된 삭제 표시 정리"""
+        now = time.monotonic()
+        for agent_id, deleted_at in list(self.tombstones.items()):
+            if now - deleted_at > self.tombstone_ttl:
+                del self.tombstones[agent_id]
+                del self.clocks[agent_id]
+                self._summary = None
+
+    def digest(self) -> Dict[str, Clock]:
+        """agent_id -> 시계 (삭제 표시 포함)"""
+        return dict(self.clocks)
+
+    def summary(self) -> str:
+        """다이제스트 요약 해시 (같으면 두 복제본의 테이블이 같음)"""
+        if self._summary is None:
+            hasher = hashlib.sha256()
+            for agent_id in sorted(self.clocks):
+                counter, replica_id = self.clocks[agent_id]
+                hasher.update(f"{agent_id}:{counter}:{replica_id};".encode())
+            self._summary = hasher.hexdigest()
+        return self._summary
+
+
+def diff_digests(local: Dict[str, Clock], remote: Dict[str, Clock]) -> Tuple[List[str], List[str]]:
+    """(상대가 더 최신인 항목, 내가 더 최신인 항목)"""
+    pull = [agent_id for agent_id, clock in remote.items() if clock > local.get(agent_id, ZERO_CLOCK)]
+    push = [agent_id for agent_id, clock in local.items() if clock > remote.get(agent_id, ZERO_CLOCK)]
+    return pull, push
+
+
+async def anti_entropy_round(registry, client: httpx.AsyncClient, peer_url: str) -> int:
+    """복제본 하나와 상태 맞추기 (주고받은 항목 수 반환)"""
+    summary = (await client.get(f"{peer_url}/replication/summary")).json()
+    if summary.get("hash") == registry.replica.summary():
+        return 0
+
+    remote = {
+        agent_id: to_clock(clock)
+        for agent_id, clock in (await client.get(f"{peer_url}/replication/digest")).json()["entries"].items()
+    }
+    pull, push = diff_digests(registry.replica.digest(), remote)
+
+    if pull:
+        response = await client.post(f"{peer_url}/replication/pull", json={"agent_ids": pull})
+        registry.merge_records(response.json()["records"])
+    if push:
+        await client.post(f"{peer_url}/replication/push", json={"records": registry.export_records(push)})
+    return len(pull) + len(push)
+
+
+async def liveness_round(registry, client: httpx.AsyncClient, peer_url: str) -> int:
+    """복제본 하나와 하트비트/부하 교환 (지난번 이후 바뀐 항목만, 주고받은 항목 수 반환)"""
+    instance, since = registry.liveness_cursors.get(peer_url, ("", 0))
+    url = f"{peer_url}/replication/liveness"
+    remote = (await client.get(url, params={"since": since, "exclude": registry.instance})).json()
+    if since and remote.get("instance") != instance:
+        # 상대가 재시작해 순번이 새로 시작됨
+        remote = (await client.get(url, params={"since": 0, "exclude": registry.instance})).json()
+    peer_instance = remote.get("instance", "")
+    registry.liveness_cursors[peer_url] = (peer_instance, remote.get("seq", 0))
+    applied = registry.merge_liveness(remote.get("entries", []), peer_instance)
+
+    # 상대에게서 받은 변경은 되돌려 보내지 않음
+    local = registry.export_liveness(registry.liveness_sent.get(peer_url, 0), exclude_origin=peer_instance)
+    if local["entries"]:
+        await client.post(
+            f"{peer_url}/replication/liveness",
+            json={"instance": local["instance"], "entries": local["entries"]}
+        )
+    registry.liveness_sent[peer_url] = local["seq"]
+    return applied + len(local["entries"])
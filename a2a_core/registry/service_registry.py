@@ -5,14 +5,20 @@
 """
 
 import asyncio
+import heapq
 import httpx
-from typing import Dict, List, Optional, Set
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import uuid
-from fastapi import FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 import uvicorn
 
+from .health import HealthCheckSchedule
+from .watch import RegistryWatch
+
 
 class AgentInfo(BaseModel):
     """에이전트 정보 모델"""
@@ -24,16 +30,46 @@ class AgentInfo(BaseModel):
     status: str = "active"
     last_heartbeat: datetime = None
     metadata: Dict = {}
+    latency_ms: Optional[float] = None  # 헬스체크 평균 응답 지연
+    load: Dict = {}  # 하트비트로 보고된 부하 (queue_depth, inflight, latency_ms)
 
 
 class ServiceRegistry:
     """서비스 레지스트리 구현"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        health_check_concurrency: int = 16,
+        health_check_timeout: float = 5.0,
+        health_check_min_interval: float = 10.0,
+        health_check_max_interval: float = 120.0
+    ):
         self.agents: Dict[str, AgentInfo] = {}
         self.capabilities_index: Dict[str, Set[str]] = {}  # capability -> agent_ids
         self.heartbeat_interval = 30  # seconds
         self.heartbeat_timeout = 90  # seconds
+        self.watch = RegistryWatch()  # 토폴로지 변경 감시 (version이 토폴로지 버전)
+        
+        # 증분 발견 인덱스
+        # - active_index: capability(None이면 전체) -> 활성 agent_id (등록 순서 유지)
+        # - expiry_heap: (하트비트 만료 시각, agent_id), 하트비트마다 새 항목을 넣고 만료 시 재확인
+        # - changes: agent_id -> 마지막 변경 버전 (최근 변경이 뒤), ?since= 델타 응답에 사용
+        self.active_index: Dict[Optional[str], Dict[str, None]] = {None: {}}
+        self.expiry_heap: List[Tuple[datetime, str]] = []
+        self.changes: "OrderedDict[str, int]" = OrderedDict()
+        self.max_changes = 10000
+        self.delta_floor = 0  # 이 버전 이전의 since는 전체 목록으로 응답
+        self._listing_cache: Dict[Optional[str], Tuple[int, List[AgentInfo]]] = {}
+        self.load_generation = 0  # 부하가 바뀔 때마다 증가 (ETag에 포함)
+        
+        # 헬스체크: 동시 확인 상한, 에이전트별 적응형 간격, 재사용 HTTP 클라이언트
+        self.health_check_timeout = health_check_timeout
+        self.health_semaphore = asyncio.Semaphore(health_check_concurrency)
+        self.health_schedule = HealthCheckSchedule(
+            min_interval=health_check_min_interval,
+            max_interval=health_check_max_interval
+        )
+        self.http_client: Optional[httpx.AsyncClient] = None
         
     async def register_agent(self, agent_info: AgentInfo) -> Dict:
         """에이전트 등록"""
@@ -42,17 +78,17 @@ class ServiceRegistry:
             agent_id = str(uuid.uuid4())
             agent_info.agent_id = agent_id
             
+        # 같은 ID로 재등록하면 이전 능력 인덱스 정리
+        previous = self.agents.get(agent_id)
+        if previous is not None:
+            self._unindex(previous)
+            
         agent_info.last_heartbeat = datetime.now()
+        agent_info.status = "active"
         self.agents[agent_id] = agent_info
-        
-        # 능력별 인덱스 업데이트
-        for capability in agent_info.capabilities:
-            cap_name = capability.get("name")
-            if cap_name:
-                if cap_name not in self.capabilities_index:
-                    self.capabilities_index[cap_name] = set()
-                self.capabilities_index[cap_name].add(agent_id)
-                
+        self._index(agent_info)
+        self._push_expiry(agent_info)
+        self._record_change(agent_id)
         print(f"✅ 에이전트 등록 완료: {agent_info.name} ({agent_id})")
         
         return {
@@ -67,49 +103,141 @@ class ServiceRegistry:
             agent_info = self.agents[agent_id]
             
             # 능력 인덱스에서 제거
-            for capability in agent_info.capabilities:
-                cap_name = capability.get("name")
-                if cap_name and cap_name in self.capabilities_index:
-                    self.capabilities_index[cap_name].discard(agent_id)
-                    
+            self._unindex(agent_info)
             del self.agents[agent_id]
+            self.health_schedule.forget(agent_id)
+            self._record_change(agent_id)
             print(f"🔴 에이전트 등록 해제: {agent_info.name} ({agent_id})")
             
             return {"status": "deregistered", "message": f"Agent {agent_id} deregistered"}
         
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
         
-    async def update_heartbeat(self, agent_id: str) -> Dict:
-        """에이전트 상태 업데이트 (하트비트)"""
+    async def update_heartbeat(self, agent_id: str, load: Optional[Dict] = None) -> Dict:
+        """에이전트 상태 업데이트 (하트비트, 부하 보고 포함 가능)"""
         if agent_id in self.agents:
-            self.agents[agent_id].last_heartbeat = datetime.now()
+            if load is not None:
+                # 부하는 자주 바뀌므로 토폴로지 버전은 올리지 않고 목록 캐시만 갱신
+                self.agents[agent_id].load = load
+                self.load_generation += 1
+                self._listing_cache.clear()
+            self._touch(self.agents[agent_id])
             return {"status": "ok", "timestamp": datetime.now().isoformat()}
             
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
         
+    async def update_load(self, agent_id: str, load: Dict) -> Dict:
+        """부하 보고만 갱신 (하트비트로 치지 않음, 토폴로지 버전 유지)"""
+        if agent_id in self.agents:
+            self.agents[agent_id].load = load
+            self.load_generation += 1
+            self._listing_cache.clear()
+            return {"status": "ok"}
+            
+        raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
+        
     async def discover_agents(self, capability: Optional[str] = None) -> List[AgentInfo]:
-        """에이전트 발견"""
-        active_agents = []
-        current_time = datetime.now()
-        
-        # 타임아웃된 에이전트 필터링
-        for agent_id, agent_info in list(self.agents.items()):
-            if agent_info.last_heartbeat:
-                time_diff = (current_time - agent_info.last_heartbeat).total_seconds()
-                if time_diff > self.heartbeat_timeout:
-                    agent_info.status = "inactive"
-                else:
-                    agent_info.status = "active"
-                    
+        """에이전트 발견 (토폴로지 버전이 같으면 이전 결과 재사용)"""
+        version = self.topology_version()
+        cached = self._listing_cache.get(capability)
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+            
+        active_agents = [self.agents[agent_id] for agent_id in self.active_index.get(capability, {})]
+        
+        # 응답이 빠른 에이전트 우선 (아직 확인되지 않은 에이전트는 뒤로, 등록 순서 유지)
+        active_agents.sort(key=lambda agent: (agent.latency_ms is None, agent.latency_ms or 0.0))
+        self._listing_cache[capability] = (version, active_agents)
+        return list(active_agents)
+        
+    async def discover_changes(self, since: int, capability: Optional[str] = None) -> Optional[Dict]:
+        """since 버전 이후 바뀐 에이전트만 반환 (변경 기록이 남아 있지 않으면 None)"""
+        version = self.topology_version()
+        if since < self.delta_floor or since > version:
+            return None
+            
+        active = self.active_index.get(capability, {})
+        upserted: List[AgentInfo] = []
+        removed: List[str] = []
+        for agent_id, changed_at in reversed(self.changes.items()):
+            if changed_at <= since:
+                break
+            if agent_id in active:
+                upserted.append(self.agents[agent_id])
+            else:
+                removed.append(agent_id)
+                
+        return {"version": version, "agents": upserted, "removed": removed}
+        
+    def topology_version(self) -> int:
+        """하트비트 만료를 반영한 현재 토폴로지 버전 (발견 응답의 ETag)"""
+        self._expire_heartbeats()
+        return self.watch.version
+        
+    def _touch(self, agent_info: AgentInfo):
+        """하트비트 수신: 만료 시각 갱신, 비활성이었으면 복구"""
+        agent_info.last_heartbeat = datetime.now()
+        self._push_expiry(agent_info)
+        self._set_status(agent_info, "active")
+        
+    def _push_expiry(self, agent_info: AgentInfo):
+        expires_at = agent_info.last_heartbeat + timedelta(seconds=self.heartbeat_timeout)
+        heapq.heappush(self.expiry_heap, (expires_at, agent_info.agent_id))
+        
+    def _expire_heartbeats(self):
+        """만료 시각이 지난 항목만 꺼내 비활성 처리 (이후 하트비트가 온 에이전트는 건너뜀)"""
+        now = datetime.now()
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            _, agent_id = heapq.heappop(self.expiry_heap)
+            agent_info = self.agents.get(agent_id)
+            if agent_info is None or agent_info.last_heartbeat is None:
+                continue
+            if (now - agent_info.last_heartbeat).total_seconds() >= self.heartbeat_timeout:
+                self._set_status(agent_info, "inactive")
+                
+    def _index_keys(self, agent_info: AgentInfo) -> List[Optional[str]]:
+        return [None] + [cap.get("name") for cap in agent_info.capabilities if cap.get("name")]
+        
+    def _index(self, agent_info: AgentInfo):
+        """능력 인덱스 등록, 활성 상태면 활성 인덱스에도 추가"""
+        agent_id = agent_info.agent_id
+        for key in self._index_keys(agent_info):
+            if key is not None:
+                self.capabilities_index.setdefault(key, set()).add(agent_id)
             if agent_info.status == "active":
-                if capability:
-                    # 특정 능력을 가진 에이전트만 반환
-                    if capability in self.capabilities_index and agent_id in self.capabilities_index[capability]:
-                        active_agents.append(agent_info)
-                else:
-                    active_agents.append(agent_info)
-                    
-        return active_agents
+                self.active_index.setdefault(key, {})[agent_id] = None
+                
+    def _unindex(self, agent_info: AgentInfo):
+        """능력 인덱스와 활성 인덱스에서 제거"""
+        agent_id = agent_info.agent_id
+        for key in self._index_keys(agent_info):
+            if key is not None and key in self.capabilities_index:
+                self.capabilities_index[key].discard(agent_id)
+            self.active_index.get(key, {}).pop(agent_id, None)
+            
+    def _record_change(self, agent_id: str):
+        """토폴로지 버전을 올리고 변경 기록 (오래된 기록은 잘라내고 delta_floor 갱신)"""
+        self.watch.bump()
+        self.changes[agent_id] = self.watch.version
+        self.changes.move_to_end(agent_id)
+        while len(self.changes) > self.max_changes:
+            _, self.delta_floor = self.changes.popitem(last=False)
+            
+    def _set_status(self, agent_info: AgentInfo, status: str):
+        """상태 변경 (활성 인덱스 갱신, 발견 결과가 바뀌므로 watcher에 알림)"""
+        if agent_info.status != status:
+            self._unindex(agent_info)
+            agent_info.status = status
+            self._index(agent_info)
+            self._record_change(agent_info.agent_id)
+            
+    async def watch_agents(self, version: int, timeout: float = 30.0) -> Dict:
+        """version 이후 변경이 생길 때까지 대기 후 활성 에이전트 목록 반환 (long-poll)"""
+        changed = await self.watch.wait_for_change(version, timeout)
+        if not changed:
+            return {"version": self.watch.version, "changed": False}
+        agents = await self.discover_agents()
+        return {"version": self.watch.version, "changed": True, "agents": agents}
         
     async def get_agent_info(self, agent_id: str) -> AgentInfo:
         """특정 에이전트 정보 조회"""
@@ -118,24 +246,58 @@ class ServiceRegistry:
             
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
         
-    async def health_check_agents(self):
-        """모든 에이전트 상태 확인"""
-        async with httpx.AsyncClient() as client:
-            for agent_id, agent_info in self.agents.items():
-                try:
-                    # 각 에이전트의 health endpoint 호출
-                    health_url = f"{agent_info.endpoint}/health"
-                    response = await client.get(health_url, timeout=5.0)
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """헬스체크용 HTTP 클라이언트 (연결 풀 재사용)"""
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                timeout=self.health_check_timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self.http_client
+        
+    async def close(self):
+        """HTTP 클라이언트 종료"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+            
+    async def health_check_agents(self, due_only: bool = False):
+        """에이전트 상태 확인 (동시 확인 수 제한, due_only면 확인할 차례인 에이전트만)"""
+        agent_ids = self.health_schedule.due(list(self.agents), force=not due_only)
+        if not agent_ids:
+            return
+        for agent_id in agent_ids:
+            self.health_schedule.begin(agent_id)
+        await asyncio.gather(*(self._probe_agent(agent_id) for agent_id in agent_ids))
+        
+    async def _probe_agent(self, agent_id: str):
+        """에이전트 하나의 health endpoint 확인"""
+        agent_info = self.agents.get(agent_id)
+        if agent_info is None:
+            self.health_schedule.forget(agent_id)
+            return
+            
+        async with self.health_semaphore:
+            started = time.perf_counter()
+            try:
+                # 각 에이전트의 health endpoint 호출
+                health_url = f"{agent_info.endpoint}/health"
+                response = await self._get_http_client().get(health_url, timeout=self.health_check_timeout)
+                latency_ms = (time.perf_counter() - started) * 1000
+                
+                if response.status_code == 200:
+                    self.health_schedule.record_success(agent_id, latency_ms)
+                    agent_info.latency_ms = self.health_schedule.latency(agent_id)
+                    self._listing_cache.clear()  # 정렬 순서만 바뀜 (버전은 유지)
+                    self._touch(agent_info)
+                else:
+                    self.health_schedule.record_failure(agent_id)
+                    self._set_status(agent_info, "unhealthy")
                     
-                    if response.status_code == 200:
-                        agent_info.status = "active"
-                        agent_info.last_heartbeat = datetime.now()
-                    else:
-                        agent_info.status = "unhealthy"
-                        
-                except Exception as e:
-                    agent_info.status = "unreachable"
-                    print(f"⚠️ 에이전트 {agent_info.name} 상태 확인 실패: {e}")
+            except Exception as e:
+                self.health_schedule.record_failure(agent_id)
+                self._set_status(agent_info, "unreachable")
+                print(f"⚠️ 에이전트 {agent_info.name} 상태 확인 실패: {e}")
                     
     async def update_agent_capabilities(self, agent_id: str, capabilities: List[Dict]) -> Dict:
         """에이전트 능력 업데이트"""
@@ -144,23 +306,11 @@ class ServiceRegistry:
             
         agent_info = self.agents[agent_id]
         
-        # 기존 능력 인덱스에서 제거
-        for capability in agent_info.capabilities:
-            cap_name = capability.get("name")
-            if cap_name and cap_name in self.capabilities_index:
-                self.capabilities_index[cap_name].discard(agent_id)
-                
-        # 새 능력 설정
+        # 기존 능력 인덱스에서 제거 후 새 능력으로 다시 등록
+        self._unindex(agent_info)
         agent_info.capabilities = capabilities
-        
-        # 새 능력 인덱스에 추가
-        for capability in capabilities:
-            cap_name = capability.get("name")
-            if cap_name:
-                if cap_name not in self.capabilities_index:
-                    self.capabilities_index[cap_name] = set()
-                self.capabilities_index[cap_name].add(agent_id)
-                
+        self._index(agent_info)
+        self._record_change(agent_id)
         print(f"✅ 에이전트 {agent_info.name}의 능력 업데이트: {[cap.get('name') for cap in capabilities]}")
         
         return {
@@ -188,16 +338,47 @@ async def deregister_agent(agent_id: str):
 
 
 @app.put("/heartbeat/{agent_id}")
-async def update_heartbeat(agent_id: str):
-    """하트비트 업데이트 엔드포인트"""
-    return await registry.update_heartbeat(agent_id)
+async def update_heartbeat(agent_id: str, body: Optional[Dict] = Body(default=None)):
+    """하트비트 업데이트 엔드포인트 (본문의 load는 발견 결과에 노출)"""
+    return await registry.update_heartbeat(agent_id, (body or {}).get("load"))
+
+
+@app.put("/load/{agent_id}")
+async def update_load(agent_id: str, body: Dict = Body(...)):
+    """부하 보고 엔드포인트 (하트비트와 별도)"""
+    return await registry.update_load(agent_id, body.get("load") or {})
 
 
 @app.get("/discover")
-async def discover_agents(capability: Optional[str] = None):
-    """에이전트 발견 엔드포인트"""
+async def discover_agents(
+    request: Request,
+    response: Response,
+    capability: Optional[str] = None,
+    since: Optional[int] = None
+):
+    """에이전트 발견 엔드포인트
+
+    - ETag는 토폴로지 버전 + 부하 세대이며 If-None-Match가 같으면 304 (본문 없음)
+    - since가 주어지면 그 버전 이후 바뀐 에이전트만 반환 (agents + removed, delta=true)
+    """
+    etag = f'"{registry.topology_version()}-{registry.load_generation}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    if since is not None:
+        delta = await registry.discover_changes(since, capability)
+        if delta is not None:
+            return {**delta, "count": len(delta["agents"]), "delta": True}
+            
     agents = await registry.discover_agents(capability)
-    return {"agents": agents, "count": len(agents)}
+    return {"agents": agents, "count": len(agents), "version": registry.watch.version, "delta": False}
+
+
+@app.get("/watch")
+async def watch_agents(version: int = -1, timeout: float = 30.0):
+    """토폴로지 변경 감시 엔드포인트 (long-poll, 변경이 없으면 timeout 후 changed=false)"""
+    return await registry.watch_agents(version, min(max(timeout, 0.0), 60.0))
 
 
 @app.get("/agents/{agent_id}")
@@ -225,10 +406,10 @@ async def update_agent_capabilities(agent_id: str, request_body: Dict):
 
 # 주기적인 헬스체크 태스크
 async def periodic_health_check():
-    """주기적으로 모든 에이전트 상태 확인"""
+    """확인할 차례가 된 에이전트만 주기적으로 확인 (간격은 에이전트별로 적응)"""
     while True:
-        await asyncio.sleep(30)  # 30초마다
-        await registry.health_check_agents()
+        await asyncio.sleep(max(1.0, registry.health_schedule.next_wakeup()))
+        await registry.health_check_agents(due_only=True)
 
 
 @app.on_event("startup")
@@ -237,5 +418,11 @@ async def startup_event():
     asyncio.create_task(periodic_health_check())
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """헬스체크 HTTP 클라이언트 정리"""
+    await registry.close()
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
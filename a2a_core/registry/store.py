@@ -0,0 +1,93 @@
+"""
+레지스트리 상태 영속화 (스냅샷 + 선행 기록 로그)
+
+등록/해제를 JSONL 로그에 먼저 기록해 두고, 재시작 시 스냅샷과 로그를 재생해
+에이전트 목록을 복원한다. 로그가 compact_every 건을 넘으면 현재 상태를 스냅샷으로
+쓰고 로그를 비운다. 하트비트는 기록하지 않는다 (복원된 항목은 확인 전까지 unverified).
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+
+class RegistryStore:
+    """스냅샷 파일과 JSONL 선행 기록 로그"""
+
+    def __init__(self, state_dir: str, compact_every: int = 1000, fsync: bool = False):
+        self.state_dir = state_dir
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.snapshot_path = os.path.join(state_dir, "registry.snapshot.json")
+        self.wal_path = os.path.join(state_dir, "registry.wal.jsonl")
+        self.wal_entries = 0
+        self._wal = None
+
+    def load(self) -> Dict[str, Dict]:
+        """스냅샷 + 로그 재생으로 agent_id -> 에이전트 정보 복원"""
+        agents: Dict[str, Dict] = {}
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    agents = json.load(f).get("agents", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 레지스트리 스냅샷 읽기 실패: {e}")
+
+        self.wal_entries = 0
+        if os.path.exists(self.wal_path):
+            with open(self.wal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 기록 도중 종료되어 잘린 마지막 줄
+                        break
+                    self._apply(agents, entry)
+                    self.wal_entries += 1
+        return agents
+
+    @staticmethod
+    def _apply(agents: Dict[str, Dict], entry: Dict):
+        if entry.get("op") == "register":
+            agents[entry["agent_id"]] = entry["agent"]
+        elif entry.get("op") == "deregister":
+            agents.pop(entry["agent_id"], None)
+
+    def _open_wal(self):
+        if self._wal is None:
+            os.makedirs(self.state_dir, exist_ok=True)
+            self._wal = open(self.wal_path, "a", encoding="utf-8")
+        return self._wal
+
+    def append(self, op: str, agent_id: str, agent: Optional[Dict] = None) -> bool:
+        """로그에 변경 기록 (compact_every를 넘으면 True - 호출 측이 compact 호출)"""
+        entry = {"op": op, "agent_id": agent_id}
+        if agent is not None:
+            entry["agent"] = agent
+        wal = self._open_wal()
+        wal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        wal.flush()
+        if self.fsync:
+            os.fsync(wal.fileno())
+        self.wal_entries += 1
+        return self.wal_entries >= self.compact_every
+
+    def compact(self, agents: Dict[str, Dict]):
+        """현재 상태를 스냅샷으로 저장하고 로그 비우기 (임시 파일 후 교체)"""
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"agents": agents}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        self.close()
+        open(self.wal_path, "w").close()
+        self.wal_entries = 0
+
+    def close(self):
+        """로그 파일 닫기"""
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
@@ -0,0 +1,32 @@
+"""
+레지스트리 변경 감시 (long-poll)
+
+토폴로지(등록/해제/능력/상태)가 바뀔 때마다 버전을 올리고,
+클라이언트는 GET /watch?version=N 으로 다음 변경까지 대기한다.
+"""
+
+import asyncio
+
+
+class RegistryWatch:
+    """레지스트리 버전 카운터와 변경 대기"""
+
+    def __init__(self):
+        self.version = 0
+        self._changed = asyncio.Event()
+
+    def bump(self):
+        """토폴로지 변경 기록 후 대기 중인 watcher 깨움"""
+        self.version += 1
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_for_change(self, since: int, timeout: float) -> bool:
+        """since 이후 변경이 있으면 True, timeout까지 변경이 없으면 False"""
+        if self.version != since:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.version != since
@@ -8,7 +8,6 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import httpx
 import asyncio
 import logging
 from typing import Dict, Any, List, Optional
@@ -19,6 +18,7 @@ from bs4 import BeautifulSoup
 import json
 
 from a2a_core.base.base_agent import BaseAgent
+from a2a_core.base.http_pool import http_pool
 from a2a_core.protocols.message import A2AMessage, MessageType
 from pydantic import BaseModel
 from fastapi import Depends
@@ -269,7 +269,7 @@ class DARTAgentV2(BaseAgent):
                 "page_count": self.max_filings
             }
             
-            async with httpx.AsyncClient() as client:
+            async with http_pool.client(api_url) as client:
                 response = await client.get(
                     api_url,
                     params=params,
@@ -314,7 +314,7 @@ class DARTAgentV2(BaseAgent):
             # DART RSS URL
             rss_url = "https://dart.fss.or.kr/api/todayRSS.xml"
             
-            async with httpx.AsyncClient() as client:
+            async with http_pool.client(rss_url) as client:
                 response = await client.get(
                     rss_url,
                     headers={
@@ -241,7 +241,12 @@ class NewsAgentV2(BaseAgent):
             
             # 뉴스 데이터 수집
             logger.info(f"🔄 _collect_news_data 호출 중...")
-            news_data = await self._collect_news_data(ticker)
+            
+            async def send_partial(items: List[Dict]):
+                # 먼저 모은 뉴스를 보내 감정 분석이 수집과 겹쳐 시작되도록 함
+                await self.send_partial(message, {"data": items, "source": "news", "count": len(items)})
+            
+            news_data = await self._collect_news_data(ticker, on_partial=send_partial)
             logger.info(f"✅ _collect_news_data 완료, 데이터 수: {len(news_data)}")
             
             # 데이터 수집 완료 이벤트 브로드캐스트
@@ -276,8 +281,8 @@ class NewsAgentV2(BaseAgent):
                 success=False
             )
             
-    async def _collect_news_data(self, ticker: str) -> List[Dict]:
-        """실제 뉴스 데이터 수집"""
+    async def _collect_news_data(self, ticker: str, on_partial=None) -> List[Dict]:
+        """실제 뉴스 데이터 수집 (on_partial이 있으면 보충 수집 전에 먼저 모은 뉴스를 전달)"""
         logger.info(f"🔍 _collect_news_data 시작 - ticker: {ticker}")
         # 더미 데이터 사용 모드인 경우
         if self.use_mock_data:
@@ -322,6 +327,8 @@ class NewsAgentV2(BaseAgent):
                 
             # NewsAPI 보충 사용
             if self.news_api_key and len(all_news) < 5:
+                if on_partial and all_news:
+                    await on_partial(self._remove_duplicates(all_news))
                 try:
                     newsapi_news = await self._collect_newsapi_news(ticker, company_name)
                     logger.info(f"  - NewsAPI 결과: {len(newsapi_news)}개")
@@ -9,6 +9,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from a2a_core.base.base_agent import BaseAgent
+from a2a_core.base.http_pool import http_pool
 from utils.auth import verify_api_key
 from utils.cache_manager import cache_manager
 from a2a_core.protocols.message import A2AMessage, MessageType
@@ -182,7 +183,7 @@ class NLUAgentV2(BaseAgent):
                     티커를 찾을 수 없으면 null을 반환하세요.
                     """
                     
-                    async with httpx.AsyncClient() as client:
+                    async with http_pool.client("https://generativelanguage.googleapis.com", "fast") as client:
                         response = await client.post(
                             f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={self.gemini_api_key}",
                             json={
@@ -355,7 +356,7 @@ class NLUAgentV2(BaseAgent):
                 티커를 찾을 수 없으면 null을 반환하세요.
                 """
                 
-                async with httpx.AsyncClient() as client:
+                async with http_pool.client("https://generativelanguage.googleapis.com", "fast") as client:
                     response = await client.post(
                         f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={self.gemini_api_key}",
                         json={
@@ -22,6 +22,7 @@ import pandas as pd
 from io import StringIO
 
 from a2a_core.base.base_agent import BaseAgent
+from a2a_core.base.http_pool import http_pool
 from a2a_core.protocols.message import A2AMessage, MessageType
 from pydantic import BaseModel
 from fastapi import Depends
@@ -168,10 +169,11 @@ class SECAgentV2(BaseAgent):
     async def _extract_filing_content(self, filing_url: str, form_type: str) -> Dict[str, Any]:
         """공시 문서에서 핵심 정보 추출 및 번역"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_pool.client(filing_url) as client:
                 response = await client.get(
                     filing_url,
-                    headers={"User-Agent": self.user_agent}
+                    headers={"User-Agent": self.user_agent},
+                    timeout=self.timeout
                 )
                 
                 if response.status_code != 200:
@@ -1441,8 +1443,8 @@ class SECAgentV2(BaseAgent):
             url = "https://www.sec.gov/files/company_tickers.json"
             headers = {"User-Agent": self.user_agent}
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
+            async with http_pool.client(url) as client:
+                response = await client.get(url, headers=headers, timeout=self.timeout)
                 
                 if response.status_code == 200:
                     tickers_data = response.json()
@@ -1501,8 +1503,8 @@ class SECAgentV2(BaseAgent):
                 "Accept-Encoding": "gzip, deflate"
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
+            async with http_pool.client(url) as client:
+                response = await client.get(url, headers=headers, timeout=self.timeout)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -11,7 +11,7 @@ import httpx
 import json
 import re
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -19,8 +19,13 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from a2a_core.base.base_agent import BaseAgent
+from a2a_core.base.http_pool import http_pool
 from a2a_core.protocols.message import A2AMessage, MessageType
-from fastapi import FastAPI
+from a2a_core.base.context import (
+    REQUEST_ID_HEADER, DEADLINE_HEADER, RequestCancelledError, parse_deadline, deadline_exceeded
+)
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from fastapi import Depends
 import uvicorn
@@ -42,6 +47,10 @@ class SentimentRequest(BaseModel):
     ticker: str
     data: Dict[str, List[Dict[str, Any]]]
 
+class SentimentStreamRequest(BaseModel):
+    ticker: str
+    items: List[Dict[str, Any]]  # 항목마다 source 포함
+
 class SentimentAnalysisAgentV2(BaseAgent):
     """감정 분석 A2A 에이전트"""
     
@@ -58,6 +67,7 @@ class SentimentAnalysisAgentV2(BaseAgent):
         # 타임아웃 설정
         self.timeout = agent_config.get("timeout", 120)
         self.batch_size = agent_config.get("batch_size", 10)
+        self.stream_concurrency = agent_config.get("stream_concurrency", 4)  # 스트리밍 분석 시 동시 LLM 호출 수
         
         # LLM Manager 초기화
         self.llm_manager = get_llm_manager()
@@ -85,39 +95,104 @@ class SentimentAnalysisAgentV2(BaseAgent):
     def _setup_http_endpoints(self):
         """HTTP 엔드포인트 설정"""
         @self.app.post("/analyze_sentiment", dependencies=[Depends(verify_api_key)])
-        async def analyze_sentiment(request: SentimentRequest):
-            """HTTP 엔드포인트로 감정 분석"""
-            ticker = request.ticker
-            data = request.data
-            
-            print(f"🎯 HTTP 요청으로 감정 분석: {ticker}")
+        async def analyze_sentiment(request: SentimentRequest, http_request: Request):
+            """HTTP 엔드포인트로 감정 분석
             
-            # 캐시 키 생성을 위한 데이터 해시
-            import hashlib
-            data_hash = hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()[:8]
-            cache_params = {"ticker": ticker, "data_hash": data_hash}
+            요청 ID 헤더가 있으면 CANCEL 메시지/마감 헤더로 중단할 수 있다 (중단 시 499).
+            """
+            print(f"🎯 HTTP 요청으로 감정 분석: {request.ticker}")
             
-            # 캐시 확인
-            cached_result = await cache_manager.get_async("sentiment_analysis", cache_params)
-            if cached_result:
-                print(f"💾 캐시에서 감정 분석 결과 반환")
-                return cached_result
-            
-            # 모든 데이터를 하나의 리스트로 합치기
-            all_data = []
-            for source, items in data.items():
-                for item in items:
-                    item["source"] = source
-                    all_data.append(item)
-            
-            # 감정 분석 수행
-            result = await self._perform_sentiment_analysis(ticker, data)
+            request_id = http_request.headers.get(REQUEST_ID_HEADER)
+            if not request_id:
+                return await self._analyze_with_cache(request.ticker, request.data)
+                
+            try:
+                return await self.run_cancellable(
+                    request_id,
+                    self._analyze_with_cache(request.ticker, request.data),
+                    deadline=parse_deadline(http_request.headers.get(DEADLINE_HEADER))
+                )
+            except RequestCancelledError as e:
+                raise HTTPException(status_code=499, detail=str(e))
+                
+        @self.app.post("/analyze_sentiment/stream", dependencies=[Depends(verify_api_key)])
+        async def analyze_sentiment_stream(request: SentimentStreamRequest, http_request: Request):
+            """항목별 감정 분석 결과를 끝나는 순서대로 NDJSON 한 줄씩 반환 (마지막 줄은 요약)
             
-            # 성공한 경우 캐시에 저장
-            if result.get("success_count", 0) > 0:
-                await cache_manager.set_async("sentiment_analysis", cache_params, result)
+            요청자가 연결을 끊으면 남은 LLM 호출도 취소된다. 마감 헤더가 지나면 새 항목은 분석하지 않는다.
+            """
+            print(f"🎯 스트리밍 감정 분석: {request.ticker} ({len(request.items)}개 항목)")
+            deadline = parse_deadline(http_request.headers.get(DEADLINE_HEADER))
+            return StreamingResponse(
+                self._stream_sentiment(request.items, deadline),
+                media_type="application/x-ndjson"
+            )
+                
+    async def _stream_sentiment(self, items: List[Dict], deadline: Optional[datetime]) -> AsyncIterator[str]:
+        """항목을 동시에 분석하고 끝나는 대로 한 줄씩 내보냄"""
+        if not self.gemini_api_key:
+            print("❌ GEMINI_API_KEY가 설정되지 않음")
+            yield json.dumps({
+                "type": "done", "success_count": 0, "failure_count": len(items),
+                "error": "GEMINI_API_KEY not configured"
+            }) + "\n"
+            return
             
-            return result
+        semaphore = asyncio.Semaphore(self.stream_concurrency)
+        
+        async def analyze(index: int, item: Dict):
+            async with semaphore:
+                if deadline and datetime.now() >= deadline:
+                    return index, None
+                return index, await self._analyze_item(item.get("source", "unknown"), item)
+        
+        tasks = [asyncio.create_task(analyze(index, item)) for index, item in enumerate(items)]
+        success_count = failure_count = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                if result is None:
+                    continue
+                if result.get("score") is None:
+                    failure_count += 1
+                else:
+                    success_count += 1
+                yield json.dumps({"type": "item", "index": index, "result": result}, ensure_ascii=False) + "\n"
+            yield json.dumps({
+                "type": "done", "success_count": success_count, "failure_count": failure_count
+            }) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+                
+    async def _analyze_with_cache(self, ticker: str, data: dict) -> dict:
+        """캐시를 거쳐 감정 분석 수행"""
+        # 캐시 키 생성을 위한 데이터 해시
+        import hashlib
+        data_hash = hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()[:8]
+        cache_params = {"ticker": ticker, "data_hash": data_hash}
+        
+        # 캐시 확인
+        cached_result = await cache_manager.get_async("sentiment_analysis", cache_params)
+        if cached_result:
+            print(f"💾 캐시에서 감정 분석 결과 반환")
+            return cached_result
+        
+        # 모든 데이터를 하나의 리스트로 합치기
+        all_data = []
+        for source, items in data.items():
+            for item in items:
+                item["source"] = source
+                all_data.append(item)
+        
+        # 감정 분석 수행
+        result = await self._perform_sentiment_analysis(ticker, data)
+        
+        # 성공한 경우 캐시에 저장
+        if result.get("success_count", 0) > 0:
+            await cache_manager.set_async("sentiment_analysis", cache_params, result)
+        
+        return result
         
     async def on_start(self):
         """에이전트 시작 시 초기화"""
@@ -220,45 +295,14 @@ class SentimentAnalysisAgentV2(BaseAgent):
             print(f"📊 {source} 소스 분석 중: {len(items)}개 항목")
                 
             for idx, item in enumerate(items):
+                # 요청 마감이 지났으면 더 이상 LLM을 호출하지 않음
+                if deadline_exceeded():
+                    print(f"   ⏰ 요청 마감 초과, 남은 항목 분석 중단")
+                    break
                 print(f"   📝 항목 {idx+1} 처리 중...")
-                if isinstance(item, dict):
-                    print(f"      - 항목 키: {list(item.keys())}")
-                    # 텍스트 내용 추출
-                    text_content = ""
-                    if "title" in item and item["title"]:
-                        text_content += item["title"]
-                        print(f"      - title 추가: {item['title'][:30]}...")
-                    if "content" in item and item["content"]:
-                        text_content += " " + item["content"]
-                        print(f"      - content 추가: {item['content'][:30]}...")
-                    if "text" in item and item["text"]:
-                        text_content += " " + item["text"]
-                        print(f"      - text 추가: {item['text'][:30]}...")
-                    
-                    print(f"      - 최종 텍스트 길이: {len(text_content)}")
-                    
-                    if not text_content.strip():
-                        print("      ⚠️ 텍스트가 비어있음, 건너뜀")
-                        continue
-                        
-                    try:
-                        print("      🚀 Gemini API 호출 시작...")
-                        # Gemini API 호출
-                        sentiment_result = await self._analyze_with_llm(text_content, source, item)
-                        analyzed_results.append(sentiment_result)
-                        print(f"      ✅ 분석 완료: {sentiment_result.get('summary', '')[:50]}...")
-                        print(f"      📊 점수: {sentiment_result.get('score', 'N/A')}")
-                    except Exception as e:
-                        print(f"      ❌ 항목 분석 실패: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        analyzed_results.append({
-                            "text": text_content[:100] + "..." if len(text_content) > 100 else text_content,
-                            "source": source,
-                            "summary": f"분석 실패: {str(e)}",
-                            "score": None,
-                            "error": str(e)
-                        })
+                sentiment_result = await self._analyze_item(source, item)
+                if sentiment_result is not None:
+                    analyzed_results.append(sentiment_result)
         
         success_count = sum(1 for r in analyzed_results if r.get("score") is not None)
         failure_count = len(analyzed_results) - success_count
@@ -270,6 +314,48 @@ class SentimentAnalysisAgentV2(BaseAgent):
             "log_message": f"✅ {success_count}개 항목 감정 분석 완료"
         }
         
+    async def _analyze_item(self, source: str, item: Any) -> Optional[dict]:
+        """항목 하나 감정 분석 (분석할 텍스트가 없으면 None, 실패하면 score가 None인 결과)"""
+        if not isinstance(item, dict):
+            return None
+        print(f"      - 항목 키: {list(item.keys())}")
+        # 텍스트 내용 추출
+        text_content = ""
+        if "title" in item and item["title"]:
+            text_content += item["title"]
+            print(f"      - title 추가: {item['title'][:30]}...")
+        if "content" in item and item["content"]:
+            text_content += " " + item["content"]
+            print(f"      - content 추가: {item['content'][:30]}...")
+        if "text" in item and item["text"]:
+            text_content += " " + item["text"]
+            print(f"      - text 추가: {item['text'][:30]}...")
+        
+        print(f"      - 최종 텍스트 길이: {len(text_content)}")
+        
+        if not text_content.strip():
+            print("      ⚠️ 텍스트가 비어있음, 건너뜀")
+            return None
+            
+        try:
+            print("      🚀 Gemini API 호출 시작...")
+            # Gemini API 호출
+            sentiment_result = await self._analyze_with_llm(text_content, source, item)
+            print(f"      ✅ 분석 완료: {sentiment_result.get('summary', '')[:50]}...")
+            print(f"      📊 점수: {sentiment_result.get('score', 'N/A')}")
+            return sentiment_result
+        except Exception as e:
+            print(f"      ❌ 항목 분석 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return {
+                "text": text_content[:100] + "..." if len(text_content) > 100 else text_content,
+                "source": source,
+                "summary": f"분석 실패: {str(e)}",
+                "score": None,
+                "error": str(e)
+            }
+        
     async def _analyze_with_llm(self, text: str, source: str, original_item: dict = None) -> dict:
         """설정된 LLM을 사용한 고급 금융 감정 분석"""
         # 현재 사용 가능한 프로바이더 확인
@@ -425,8 +511,8 @@ JSON만 출력하세요:
         print(f"         📤 요청 전송 중...")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(self.gemini_api_url, json=payload)
+            async with http_pool.client(self.gemini_api_url, "llm") as client:
+                response = await client.post(self.gemini_api_url, json=payload, timeout=30.0)
                 print(f"         📥 응답 수신 - Status: {response.status_code}")
                 
                 if response.status_code == 200:
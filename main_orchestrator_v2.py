@@ -9,22 +9,47 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import asyncio
+import json
 import httpx
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Tuple
+import time
+import heapq
 import uuid
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta
 
 from a2a_core.base.base_agent import BaseAgent
 from a2a_core.protocols.message import A2AMessage, MessageType, Priority
+from a2a_core.base.context import deadline_headers
+from a2a_core.base.http_pool import http_pool, origin_of
+from a2a_core.base.pipeline import PipelineRun, Stage, StageGraph
 from utils.websocket_manager import manage_websocket, broadcast_message
 from utils.cache_manager import cache_manager
+from utils.session_store import SessionStore, RedisSessionStore
+from utils.shared_analysis import SharedRunRegistry
+from utils.analysis_scheduler import FairScheduler, INTERACTIVE, BATCH
+from utils.batch_checkpoint import BatchCheckpoint, is_valid_batch_id
+from utils.collection_quorum import QuorumPolicy, QUORUM_ALL
+from utils.sentiment_feed import SentimentFeed
+from utils.sentiment_progress import SentimentProgress
+from utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+def _load_orchestrator_setting(key: str, default: Any) -> Any:
+    """설정 파일의 orchestrator 섹션 값 조회 (설정 모듈이 없으면 기본값)"""
+    try:
+        from utils.config_manager import config
+        return config.get(f"orchestrator.{key}", default)
+    except Exception:
+        return default
+
+
 class OrchestratorV2(BaseAgent):
     """A2A 오케스트레이터 V2"""
     
@@ -39,8 +64,63 @@ class OrchestratorV2(BaseAgent):
         # WebSocket 연결 관리
         self.active_websockets: List[WebSocket] = []
         
-        # 분석 세션 관리
-        self.analysis_sessions: Dict[str, Dict] = {}
+        # 분석 세션 관리 (최대 개수/유휴 TTL/메모리 예산, 완료 세션은 요약으로 압축)
+        self.analysis_sessions: SessionStore = self._create_session_store()
+        
+        # 응답 매칭 테이블 (요청 message_id -> (session_id, 단계, 에이전트 타입))
+        self.pending_correlations: Dict[str, Tuple[str, str, Optional[str]]] = {}
+        
+        # 응답 매칭 만료 (응답이 끝내 오지 않는 요청 정리, (만료 시각, message_id) 힙)
+        self.correlation_ttl = _load_orchestrator_setting("correlation_ttl", 600)
+        self.correlation_expiry: List[Tuple[float, str]] = []
+        
+        # 세션별 분석 파이프라인 실행 상태 (session_id -> PipelineRun)
+        self.session_pipelines: Dict[str, PipelineRun] = {}
+        
+        # 같은 티커/시장 분석 공유 (동시 요청은 파이프라인 한 번만 실행)
+        self.shared_runs = SharedRunRegistry(
+            freshness=_load_orchestrator_setting("shared_run_freshness", 60)
+        )
+        
+        # 전역 단계 스케줄러 (단계별 동시 실행 상한, 대화형/배치 공정 분배, 제공자별 API 예산)
+        self.scheduler = FairScheduler(
+            stage_limits=_load_orchestrator_setting("scheduler.stage_limits", {}),
+            weights=_load_orchestrator_setting("scheduler.weights", None),
+            budgets=_load_orchestrator_setting("scheduler.budgets", {}),
+            stage_providers=_load_orchestrator_setting("scheduler.stage_providers", {})
+        )
+        
+        # 세션 종료 대기 (배치 분석이 항목별 완료를 기다림, session_id -> Future)
+        self.session_waiters: Dict[str, asyncio.Future] = {}
+        
+        # 데이터 수집 정족수 정책 (가장 느린 소스 대신 정책으로 진행 시점 결정)
+        self.collection_policy = QuorumPolicy(
+            required=_load_orchestrator_setting("collection.required", ["news"]),
+            min_sources=_load_orchestrator_setting("collection.min_sources", 2),
+            source_deadlines=_load_orchestrator_setting("collection.source_deadlines", {}),
+            default_deadline=_load_orchestrator_setting("collection.default_deadline", 20),
+            max_wait=_load_orchestrator_setting("collection.max_wait", 30)
+        )
+        
+        # 수집 완료 대기 (data_collection 단계가 정족수 충족까지 스케줄러 자리를 유지, session_id -> Future)
+        self.collection_waiters: Dict[str, asyncio.Future] = {}
+        
+        # 세션에 딸린 보조 작업 (수집 기한 감시, 지연 데이터 병합 - 세션 정리 시 취소)
+        self.session_tasks: Dict[str, set] = {}
+        
+        # 세션별 감정 분석 입력 스트림 (수집 항목이 도착하는 대로 분석 시작)
+        self.sentiment_feeds: Dict[str, SentimentFeed] = {}
+        
+        # 세션별 감정 분석 진행 상황 (항목별 결과 즉시 전송 + 잠정 점수 차트 프레임 제한)
+        self.sentiment_progress: Dict[str, SentimentProgress] = {}
+        
+        # 하위 에이전트별 서킷 브레이커 (모든 세션 공유, 열려 있으면 호출 없이 바로 실패 처리)
+        self.breakers = CircuitBreakerRegistry(
+            defaults=_load_orchestrator_setting("circuit_breaker.defaults", {}),
+            overrides=_load_orchestrator_setting("circuit_breaker.agents", {}),
+            probe_factory=self._health_probe
+        )
+        self.breaker_endpoints: Dict[str, str] = {}  # 브레이커 이름 -> 상태 확인 주소 (HTTP 호출 시 기록)
         
         # API Key 설정
         self.api_key = os.getenv("A2A_API_KEY", "default-api-key-change-me")
@@ -58,6 +138,21 @@ class OrchestratorV2(BaseAgent):
         # 웹 라우트 추가
         self._setup_web_routes()
         
+    def _create_session_store(self) -> SessionStore:
+        """설정에 따라 메모리 또는 Redis 세션 저장소 생성"""
+        options = dict(
+            max_sessions=_load_orchestrator_setting("max_sessions", 100),
+            ttl=_load_orchestrator_setting("session_ttl", 1800),
+            memory_budget_mb=_load_orchestrator_setting("session_memory_mb", 256),
+            report_dir=_load_orchestrator_setting("report_dir", "data/reports"),
+            on_evict=self._on_session_evicted
+        )
+        backend = os.getenv("A2A_SESSION_BACKEND", _load_orchestrator_setting("session_backend", "memory"))
+        if backend == "redis":
+            redis_url = os.getenv("REDIS_URL", _load_orchestrator_setting("redis_url", "redis://localhost:6379"))
+            return RedisSessionStore(redis_url, **options)
+        return SessionStore(**options)
+        
     def _setup_web_routes(self):
         """웹 인터페이스 라우트 설정"""
         
@@ -84,6 +179,50 @@ class OrchestratorV2(BaseAgent):
             """시스템 시각화 페이지"""
             return FileResponse("presentation/visualization.html")
             
+        @self.app.get("/sessions/stats")
+        async def get_session_stats():
+            """세션 저장소 통계"""
+            return {
+                **self.analysis_sessions.get_stats(),
+                "shared_runs": self.shared_runs.get_stats(),
+                "scheduler": self.scheduler.get_stats(),
+                "circuit_breakers": self.breakers.get_stats()
+            }
+            
+        @self.app.post("/analyze/batch")
+        async def analyze_batch(request: Dict[str, Any]):
+            """관심 종목 일괄 분석 (결과를 끝나는 대로 NDJSON 스트림으로 반환, batch_id로 이어서 실행)"""
+            items = [{"ticker": ticker} for ticker in request.get("tickers", [])]
+            items += [{"query": query} for query in request.get("queries", [])]
+            items += request.get("items", [])
+            if not items and not request.get("batch_id"):
+                raise HTTPException(status_code=400, detail="tickers, queries, items 또는 batch_id가 필요합니다")
+            if request.get("batch_id") is not None and not is_valid_batch_id(request["batch_id"]):
+                raise HTTPException(status_code=400, detail="batch_id 형식이 올바르지 않습니다")
+            
+            async def stream():
+                async for event in self.run_batch(items, request.get("batch_id"), request.get("concurrency")):
+                    yield json.dumps(event, ensure_ascii=False) + "\n"
+            
+            return StreamingResponse(stream(), media_type="application/x-ndjson")
+            
+        @self.app.get("/sessions/{session_id}")
+        async def get_session(session_id: str):
+            """세션 상태/요약 조회 (다른 프로세스가 시작한 세션은 공유 저장소에서)"""
+            session = await self.analysis_sessions.fetch(session_id)
+            if session is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            return {key: value for key, value in session.items() if key not in ("collected_data", "final_report")}
+            
+        @self.app.get("/sessions/{session_id}/report")
+        async def get_session_report(session_id: str):
+            """완료된 세션의 저장된 리포트"""
+            session = await self.analysis_sessions.fetch(session_id)
+            report = await self.analysis_sessions.load_report(session["report_ref"]) if session and session.get("report_ref") else None
+            if report is None:
+                raise HTTPException(status_code=404, detail="Report not found")
+            return HTMLResponse(report)
+            
         @self.app.get("/cache/stats")
         async def get_cache_stats():
             """캐시 통계 조회"""
@@ -157,19 +296,241 @@ class OrchestratorV2(BaseAgent):
             print(f"❌ 메시지 처리 오류: {e}")
             await self._send_error(client_id, str(e))
     
+    def _track_request(self, session: Dict, message_id: str, stage: str, receiver_id: str,
+                       agent_type: Optional[str] = None):
+        """보낸 요청을 응답 매칭 테이블과 세션의 진행 중 요청 목록에 기록"""
+        self._expire_correlations()
+        self.pending_correlations[message_id] = (session["session_id"], stage, agent_type)
+        heapq.heappush(self.correlation_expiry, (time.monotonic() + self.correlation_ttl, message_id))
+        session.setdefault("inflight_requests", {})[message_id] = receiver_id
+
+    def _expire_correlations(self):
+        """TTL이 지난 응답 매칭 항목 제거 (응답하지 않은 소스가 테이블에 영원히 남지 않도록)"""
+        now = time.monotonic()
+        while self.correlation_expiry and self.correlation_expiry[0][0] <= now:
+            _, message_id = heapq.heappop(self.correlation_expiry)
+            entry = self.pending_correlations.pop(message_id, None)
+            if entry is None:
+                continue
+            session = self.analysis_sessions.get(entry[0])
+            if session is not None:
+                session.get("inflight_requests", {}).pop(message_id, None)
+
+    def _clear_correlations(self, session: Dict):
+        """세션의 응답 매칭 항목과 진행 중 요청 목록 정리 (이후 도착하는 늦은 응답은 버림)"""
+        for request_id in session.get("inflight_requests", {}):
+            self.pending_correlations.pop(request_id, None)
+        session["inflight_requests"] = {}
+
+    def _build_pipeline(self) -> StageGraph:
+        """분석 단계 의존성 그래프
+
+        ticker는 NLU 응답, collected_data는 마지막 수집 응답이 채운다.
+        정량 분석/트렌드는 수집·감정 분석과, 리스크는 점수 계산과 겹쳐 실행된다.
+        감정 분석은 수집 도중 항목 묶음 단위로 이미 시작되며, sentiment 단계는 남은 묶음을 마무리한다.
+        """
+        stages = [
+            Stage("data_collection", ("ticker",), (), self._collect_data),
+            Stage("quantitative", ("ticker",), ("quantitative_analysis",), self._start_quantitative_analysis),
+            Stage("trend", ("quantitative_analysis",), ("trend_analysis",), self._start_trend_analysis),
+            Stage("sentiment", ("collected_data",), ("sentiment_analysis",), self._start_sentiment_analysis),
+            Stage("score", ("sentiment_analysis",), ("score_calculation",), self._start_score_calculation),
+            Stage("risk", ("quantitative_analysis", "sentiment_analysis"), ("risk_analysis",),
+                  self._start_risk_analysis),
+            Stage("report",
+                  ("collected_data", "sentiment_analysis", "quantitative_analysis",
+                   "score_calculation", "risk_analysis", "trend_analysis"),
+                  ("final_report",), self._start_report_generation),
+        ]
+        # 감정 분석 자리는 단계가 아니라 묶음 요청마다 잡는다 (단계가 자리를 잡고 묶음을 기다리면 교착)
+        # 데이터 수집 예산은 소스 요청 수만큼 차감
+        costs = {"data_collection": lambda session: len(self._collection_agents(session.get("exchange", "US")))}
+        return StageGraph(
+            [stage if stage.name == "sentiment" else self._scheduled(stage, costs.get(stage.name))
+             for stage in stages],
+            sources=("ticker", "collected_data")
+        )
+
+    def _scheduled(self, stage: Stage, cost: Optional[Callable[[Dict], float]] = None) -> Stage:
+        """단계를 전역 스케줄러 자리 안에서 실행하도록 감쌈"""
+        async def run(session: Dict):
+            async with self.scheduler.slot(stage.name, session.get("traffic", INTERACTIVE),
+                                           cost(session) if cost else 1.0):
+                await stage.run(session)
+        return Stage(stage.name, stage.inputs, stage.outputs, run)
+
+    async def _collect_data(self, session: Dict):
+        """데이터 수집 단계 - 요청 전송 후 수집이 끝날 때까지(정족수 충족) 단계 자리를 유지
+        
+        요청 전송은 바로 끝나므로 여기서 기다리지 않으면 data_collection 동시 실행 상한이 수집을 제한하지 못한다.
+        """
+        session_id = session["session_id"]
+        done = asyncio.get_running_loop().create_future()
+        self.collection_waiters[session_id] = done
+        try:
+            await self._start_data_collection(session)
+            if not self._pipeline_ready(session, "collected_data"):
+                await done
+        finally:
+            if self.collection_waiters.get(session_id) is done:
+                del self.collection_waiters[session_id]
+
+    def _start_pipeline(self, session: Dict):
+        """세션의 분석 파이프라인 시작 (티커가 정해진 뒤 호출)"""
+        session_id = session["session_id"]
+        pipeline = PipelineRun(
+            self._build_pipeline(), session,
+            on_complete=lambda run: self._on_pipeline_finished(session_id)
+        )
+        self.session_pipelines[session_id] = pipeline
+        pipeline.provide("ticker")
+
+    def _on_pipeline_finished(self, session_id: str):
+        """파이프라인 종료 (완료되지 못한 공유 실행은 재사용하지 않음)"""
+        self.session_pipelines.pop(session_id, None)
+        feed = self.sentiment_feeds.pop(session_id, None)
+        if feed:
+            feed.cancel()
+        self._drop_sentiment_progress(session_id)
+        run = self.shared_runs.run_of(session_id)
+        if run and run.leader_id == session_id and not run.completed:
+            self.shared_runs.detach(session_id)
+            for follower_id in run.followers:
+                self._finish_session(follower_id)
+        self._finish_session(session_id)
+
+    def _finish_session(self, session_id: str):
+        """세션 종료를 기다리는 쪽(배치 분석)에 알림"""
+        waiter = self.session_waiters.pop(session_id, None)
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+    async def _begin_analysis(self, session: Dict):
+        """티커가 정해진 세션의 분석 시작 (같은 종목 분석이 진행 중이면 합류)"""
+        if not await self._join_or_lead(session):
+            print(f"✅ 티커 찾음: {session['ticker']}, 분석 파이프라인 시작")
+            # 티커만 필요한 단계(데이터 수집, 정량 분석)부터 시작
+            self._start_pipeline(session)
+        await self.analysis_sessions.checkpoint(session["session_id"])
+
+    async def _join_or_lead(self, session: Dict) -> bool:
+        """같은 티커/시장 분석이 진행 중(또는 방금 완료)이면 합류하고 True, 아니면 새 실행의 leader로 등록"""
+        key = (session["ticker"], session.get("exchange", "US"))
+        run = self.shared_runs.lookup(key)
+        if run is None or self.analysis_sessions.get(run.leader_id) is None:
+            self.shared_runs.lead(key, session["session_id"])
+            return False
+
+        self.shared_runs.attach(run, session["session_id"])
+        session["state"] = "attached"
+        session["shared_with"] = run.leader_id
+        print(f"♻️ {key[0]} 분석 공유: {session['session_id']} → {run.leader_id}")
+        await self._send_to_session(session, "log", {
+            "message": f"♻️ 진행 중인 {key[0]} 분석에 합류합니다 (같은 데이터/분석 결과 공유)"
+        })
+
+        # 지금까지의 진행 상황 재생
+        client_id = session.get("client_id")
+        for msg_type, payload in list(run.events):
+            await self._send_to_ui(client_id, msg_type, payload)
+
+        if run.completed:
+            self._copy_shared_result(self.analysis_sessions.get(run.leader_id), session)
+            self._finish_session(session["session_id"])
+        return True
+
+    def _copy_shared_result(self, leader: Optional[Dict], follower: Dict):
+        """leader의 완료 요약을 합류 세션에 복사"""
+        if not leader:
+            return
+        own = {key: follower[key] for key in ("session_id", "query", "client_id", "market_preference", "traffic") if key in follower}
+        follower.clear()
+        follower.update({**leader, **own, "shared_with": leader["session_id"]})
+
+    async def _complete_session(self, session: Dict):
+        """완료 세션 압축 (공유 실행이면 합류 세션에도 결과 반영)"""
+        session_id = session["session_id"]
+        self._clear_correlations(session)
+        await self.analysis_sessions.complete(session_id)
+        run = self.shared_runs.run_of(session_id)
+        if run and run.leader_id == session_id:
+            self.shared_runs.complete(run)
+            for follower_id in list(run.followers):
+                follower = self.analysis_sessions.get(follower_id)
+                if follower is not None:
+                    self._copy_shared_result(session, follower)
+                self._finish_session(follower_id)
+        self._finish_session(session_id)
+
+    def _provide(self, session: Dict, key: str):
+        """파이프라인에 키 준비 알림 (해당 키를 기다리던 단계 시작)"""
+        pipeline = self.session_pipelines.get(session["session_id"])
+        if pipeline:
+            pipeline.provide(key)
+        if key == "collected_data":
+            waiter = self.collection_waiters.get(session["session_id"])
+            if waiter and not waiter.done():
+                waiter.set_result(None)
+
+    def _pipeline_ready(self, session: Dict, key: str) -> bool:
+        pipeline = self.session_pipelines.get(session["session_id"])
+        return pipeline is not None and pipeline.is_ready(key)
+
     async def _handle_ws_disconnect(self, client_id: str):
         """WebSocket 연결 종료 처리"""
         print(f"🔌 WebSocket 연결 종료: {client_id}")
         
-        # 해당 클라이언트의 세션 정리
+        # 해당 클라이언트의 진행 중인 세션 정리 (완료 요약은 TTL까지 조회 가능하도록 유지)
         sessions_to_remove = []
         for session_id, session in self.analysis_sessions.items():
-            if session.get("client_id") == client_id:
+            if session.get("client_id") == client_id and not session.get("compacted"):
                 sessions_to_remove.append(session_id)
         
         for session_id in sessions_to_remove:
-            del self.analysis_sessions[session_id]
+            run = self.shared_runs.run_of(session_id)
+            if run and run.leader_id == session_id and run.followers:
+                # 합류한 세션이 결과를 기다리므로 실행은 계속 (이 클라이언트로만 전송 중단)
+                self.analysis_sessions[session_id]["client_id"] = None
+                print(f"↪️ 세션 {session_id}: 연결 종료, 합류 세션 {len(run.followers)}개를 위해 분석 계속")
+                continue
+            session = self.analysis_sessions.pop(session_id)
             print(f"🗑️ 세션 정리: {session_id}")
+            await self._release_session(session_id, session, reason="client disconnected")
+            
+    async def _release_session(self, session_id: str, session: Dict, reason: str):
+        """세션의 실행 중인 단계와 하위 요청 취소"""
+        run = self.shared_runs.detach(session_id)
+        if run and run.leader_id != session_id and not run.followers and not run.completed:
+            # 연결이 끊긴 leader가 마지막 합류 세션만을 위해 실행 중이었다면 함께 정리
+            leader = self.analysis_sessions.get(run.leader_id)
+            if leader is not None and leader.get("client_id") is None:
+                self.analysis_sessions.pop(run.leader_id, None)
+                await self._release_session(run.leader_id, leader, reason=reason)
+        pipeline = self.session_pipelines.pop(session_id, None)
+        if pipeline:
+            pipeline.cancel()
+        for task in self.session_tasks.pop(session_id, ()):
+            task.cancel()
+        feed = self.sentiment_feeds.pop(session_id, None)
+        if feed:
+            feed.cancel()
+        self._drop_sentiment_progress(session_id)
+        self._finish_session(session_id)
+
+        # 결과를 받을 사람이 없으므로 진행 중인 하위 요청 취소 (LLM 호출 등 중단)
+        for request_id, receiver_id in list(session.get("inflight_requests", {}).items()):
+            self.pending_correlations.pop(request_id, None)
+            print(f"🚫 하위 요청 취소: {receiver_id} ({request_id})")
+            await self.cancel(receiver_id, request_id, reason=reason)
+            
+    def _on_session_evicted(self, session_id: str, session: Dict):
+        """저장소 한도로 제거된 세션 정리 (진행 중이었다면 하위 작업 취소)"""
+        if session.get("compacted"):
+            return
+        try:
+            asyncio.get_running_loop().create_task(self._release_session(session_id, session, reason="session evicted"))
+        except RuntimeError:
+            pass
     
     async def _send_error(self, client_id: str, message: str):
         """에러 메시지 전송"""
@@ -203,6 +564,8 @@ class OrchestratorV2(BaseAgent):
         for ws in self.active_websockets:
             await ws.close()
             
+        self.breakers.close()
+        await self.analysis_sessions.close()
         print("🛑 Orchestrator V2 종료")
         
     async def handle_message(self, message: A2AMessage):
@@ -218,74 +581,28 @@ class OrchestratorV2(BaseAgent):
             print(f"{'*'*70}\n")
             
             if message.header.message_type == MessageType.RESPONSE:
-                # 응답 메시지 처리
+                # 응답 메시지 처리 (correlation_id로 세션/단계를 바로 조회)
+                self._expire_correlations()
                 correlation_id = message.header.correlation_id
-                print(f"🔄 응답 메시지 처리 중. Correlation ID: {correlation_id}")
-                
-                # 모든 세션 확인
-                print(f"📋 현재 활성 세션 수: {len(self.analysis_sessions)}")
-                for sid, session in self.analysis_sessions.items():
-                    print(f"   - Session {sid}: state={session.get('state')}, nlu_request_id={session.get('nlu_request_id')}")
+                entry = self.pending_correlations.pop(correlation_id, None)
+                session = self.analysis_sessions.get(entry[0]) if entry else None
                 
-                # correlation_id로 세션 찾기
-                session_found = False
-                for session_id, session in self.analysis_sessions.items():
-                    # NLU 요청 확인
-                    if session.get("nlu_request_id") == correlation_id:
-                        print(f"✅ NLU 응답 - 세션 발견: {session_id}")
-                        await self._handle_agent_response(session, message)
-                        session_found = True
-                        break
-                    # 데이터 수집 요청 확인 - 각 요청 ID 출력
-                    data_request_ids = session.get("data_request_ids", {})
-                    if data_request_ids:
-                        print(f"   📋 세션 {session_id}의 데이터 수집 요청 ID:")
-                        for agent_type, req_id in data_request_ids.items():
-                            print(f"      - {agent_type}: {req_id} {'✓' if req_id == correlation_id else ''}")
-                            if req_id == correlation_id:
-                                print(f"\n✅ 매치 발견!")
-                                print(f"   - Agent type: {agent_type}")
-                                print(f"   - Session ID: {session_id}")
-                                print(f"   - Request ID: {req_id}")
-                                print(f"   - Correlation ID: {correlation_id}")
-                                await self._handle_agent_response(session, message)
-                                session_found = True
-                                break
-                    if session_found:
-                        break
-                    # 감정 분석 요청 확인
-                    elif session.get("sentiment_request_id") == correlation_id:
-                        print(f"✅ 감정 분석 응답 - 세션 발견: {session_id}")
-                        await self._handle_agent_response(session, message)
-                        session_found = True
-                        break
-                    # 정량적 분석 요청 확인
-                    elif session.get("quantitative_request_id") == correlation_id:
-                        print(f"✅ 정량적 분석 응답 - 세션 발견: {session_id}")
-                        await self._handle_agent_response(session, message)
-                        session_found = True
-                        break
-                    # 점수 계산 요청 확인
-                    elif session.get("score_request_id") == correlation_id:
-                        print(f"✅ 점수 계산 응답 - 세션 발견: {session_id}")
-                        await self._handle_agent_response(session, message)
-                        session_found = True
-                        break
-                    # 리스크 분석 요청 확인
-                    elif session.get("risk_request_id") == correlation_id:
-                        print(f"✅ 리스크 분석 응답 - 세션 발견: {session_id}")
-                        await self._handle_agent_response(session, message)
-                        session_found = True
-                        break
-                    # 리포트 생성 요청 확인
-                    elif session.get("report_request_id") == correlation_id:
-                        print(f"✅ 리포트 생성 응답 - 세션 발견: {session_id}")
-                        await self._handle_agent_response(session, message)
-                        session_found = True
-                        break
-                        
-                if not session_found:
+                if session is None:
                     print(f"⚠️ Correlation ID {correlation_id}에 해당하는 세션을 찾을 수 없음")
+                else:
+                    session_id, stage, agent_type = entry
+                    print(f"✅ {stage} 응답 - 세션 발견: {session_id}" + (f" ({agent_type})" if agent_type else ""))
+                    await self._handle_agent_response(session, message, stage, agent_type)
+                    
+            elif message.header.message_type == MessageType.PARTIAL:
+                # 중간 결과 (최종 응답 전이므로 응답 매칭 항목은 유지)
+                entry = self.pending_correlations.get(message.header.correlation_id)
+                session = self.analysis_sessions.get(entry[0]) if entry else None
+                if entry and session is None:
+                    # 세션이 이미 없으면 이후 최종 응답도 버려지므로 항목 정리
+                    self.pending_correlations.pop(message.header.correlation_id, None)
+                elif session is not None and entry[1] == "data_collection":
+                    await self._handle_partial_data(session, entry[2], message.body.get("result", {}))
                     
             elif message.header.message_type == MessageType.EVENT:
                 # 이벤트 처리
@@ -298,25 +615,40 @@ class OrchestratorV2(BaseAgent):
             import traceback
             traceback.print_exc()
             
-    async def start_analysis_session(self, query: str, client_id: str, market_preference: str = "auto") -> str:
-        """분석 세션 시작"""
+    async def start_analysis_session(self, query: str, client_id: Optional[str], market_preference: str = "auto",
+                                     traffic: str = INTERACTIVE, ticker: Optional[str] = None,
+                                     exchange: str = "US") -> str:
+        """분석 세션 시작 (client_id가 없으면 UI 없이 실행, ticker를 알면 NLU 생략)"""
         session_id = str(uuid.uuid4())
         print(f"📝 새 세션 생성: {session_id}")
         
         # 세션 정보 저장
-        self.analysis_sessions[session_id] = {
+        session = {
+            "session_id": session_id,
             "query": query,
             "client_id": client_id,
             "market_preference": market_preference,
+            "traffic": traffic,
             "state": "started",
-            "results": {}
+            "results": {},
+            "inflight_requests": {}  # 진행 중인 하위 요청 (request_id -> 수신 에이전트, 연결 종료 시 취소)
         }
+        self.analysis_sessions[session_id] = session
+        if client_id is None:
+            # UI 없는 세션은 호출 측이 종료를 기다림 (시작 도중 끝나도 놓치지 않도록 먼저 등록)
+            self.session_waiters[session_id] = asyncio.get_running_loop().create_future()
+        await self.analysis_sessions.checkpoint(session_id)
         print(f"💾 세션 정보 저장 완료")
         
         # UI 상태 업데이트
         print("📤 UI에 상태 업데이트 전송 중...")
-        await self._send_to_ui(client_id, "status", {"agentId": "orchestrator"})
-        await self._send_to_ui(client_id, "log", {"message": f"🚀 A2A 분석 시작: {query}"})
+        await self._send_to_session(session, "status", {"agentId": "orchestrator"})
+        await self._send_to_session(session, "log", {"message": f"🚀 A2A 분석 시작: {query}"})
+        
+        if ticker:
+            session.update({"ticker": ticker, "company_name": ticker, "exchange": exchange, "state": "collecting_data"})
+            await self._begin_analysis(session)
+            return session_id
         
         # Step 1: NLU 에이전트 A2A 메시지로 호출
         print("🔎 NLU 에이전트 호출 중 (A2A 프로토콜)...")
@@ -344,9 +676,12 @@ class OrchestratorV2(BaseAgent):
                 
                 # 세션에 요청 ID 저장 (응답 매칭용)
                 self.analysis_sessions[session_id]["nlu_request_id"] = nlu_message.header.message_id
+                self._track_request(
+                    self.analysis_sessions[session_id], nlu_message.header.message_id, "nlu", "nlu-agent-v2"
+                )
                 self.analysis_sessions[session_id]["state"] = "waiting_nlu"
                 
-                await self._send_to_ui(client_id, "log", {
+                await self._send_to_session(session, "log", {
                     "message": "📡 [A2A] NLU 에이전트에 티커 추출 요청 전송"
                 })
                 
@@ -354,60 +689,122 @@ class OrchestratorV2(BaseAgent):
                 print("⏳ NLU 응답 대기 중... (비동기 처리)")
                 
             else:
-                # A2A 전송 실패 시 HTTP 폴백
-                print("⚠️ A2A 메시지 전송 실패, HTTP로 폴백")
-                await self._send_to_ui(client_id, "log", {"message": "⚠️ A2A 실패, HTTP로 재시도"})
+                # 재시도는 메시징 계층에서 처리됨 (같은 요청을 HTTP로 중복 전송하지 않음)
+                print("❌ NLU 에이전트 A2A 전송 실패 (재시도 소진)")
+                session["state"] = "error"
+                if client_id:
+                    await self._send_error(client_id, "NLU 에이전트에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.")
+                self._finish_session(session_id)
                 
-                # HTTP 폴백 코드
-                async with httpx.AsyncClient() as http_client:
-                    url = "http://localhost:8108/extract_ticker"
-                    response = await http_client.post(
-                        url,
-                        json={"query": query},
-                        headers={"X-API-Key": self.api_key},
-                        timeout=10.0
-                    )
-                    
-                    if response.status_code == 200:
-                        nlu_result = response.json()
-                        print(f"✅ NLU HTTP 응답: {nlu_result}")
-                        
-                        # 세션에 결과 저장
-                        self.analysis_sessions[session_id]["ticker"] = nlu_result.get("ticker", "")
-                        self.analysis_sessions[session_id]["company_name"] = nlu_result.get("company_name", "")
-                        self.analysis_sessions[session_id]["exchange"] = nlu_result.get("exchange", "US")
-                        
-                        await self._send_to_ui(client_id, "log", {
-                            "message": f"✅ 티커 추출 완료: {nlu_result.get('ticker', 'N/A')}"
-                        })
-                        
-                        # 다음 단계로 진행
-                        session = self.analysis_sessions[session_id]
-                        session["state"] = "collecting_data"
-                        await self._start_data_collection(session)
-                        
         except Exception as e:
             print(f"❌ NLU 에이전트 호출 실패: {e}")
-            await self._send_to_ui(client_id, "log", {"message": f"❌ NLU 에이전트 호출 실패: {str(e)}"})
+            session["state"] = "error"
+            await self._send_to_session(session, "log", {"message": f"❌ NLU 에이전트 호출 실패: {str(e)}"})
             import traceback
             traceback.print_exc()
+            self._finish_session(session_id)
             
         return session_id
         
-    async def _handle_agent_response(self, session: Dict, message: A2AMessage):
-        """에이전트 응답 처리"""
-        state = session["state"]
+    async def _analyze_item(self, item: Dict, timeout: float) -> Dict:
+        """배치 항목 하나 분석 (UI 없는 배치 트래픽 세션으로 실행하고 종료까지 대기)"""
+        ticker = item.get("ticker")
+        session_id = await self.start_analysis_session(
+            item.get("query") or ticker,
+            client_id=None,
+            market_preference=item.get("market_preference", "auto"),
+            traffic=BATCH,
+            ticker=ticker,
+            exchange=item.get("exchange", "US")
+        )
+        waiter = self.session_waiters.get(session_id)
+        try:
+            if waiter:
+                await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            session = self.analysis_sessions.pop(session_id, None)
+            if session is not None:
+                await self._release_session(session_id, session, reason="batch item timeout")
+            return {"session_id": session_id, "ticker": ticker, "state": "timeout"}
+        finally:
+            self.session_waiters.pop(session_id, None)
+        
+        session = self.analysis_sessions.get(session_id) or {}
+        result = {
+            "session_id": session_id,
+            "ticker": session.get("ticker", ticker),
+            "state": "completed" if session.get("compacted") else session.get("state", "error")
+        }
+        for key in ("company_name", "final_score", "final_label", "risk_level", "report_ref", "shared_with"):
+            if key in session:
+                result[key] = session[key]
+        return result
+        
+    async def run_batch(self, items: List[Dict], batch_id: Optional[str] = None,
+                        concurrency: Optional[int] = None) -> AsyncIterator[Dict]:
+        """관심 종목 일괄 분석 - 항목 결과를 끝나는 순서대로 내보냄
+        
+        batch_id가 기존 체크포인트를 가리키면 끝난 항목은 기록된 결과를 내보내고 나머지만 분석한다.
+        단계 실행은 전역 스케줄러가 배치 트래픽으로 조절하므로 대화형 요청이 밀리지 않는다.
+        """
+        checkpoint = BatchCheckpoint(
+            _load_orchestrator_setting("batch.checkpoint_dir", "data/batches"),
+            batch_id or uuid.uuid4().hex
+        )
+        saved_items, done = checkpoint.load()
+        if saved_items is not None:
+            items = saved_items
+        else:
+            done = {}
+            checkpoint.start(items)
+        
+        timeout = _load_orchestrator_setting("batch.item_timeout", 600)
+        limit = concurrency or _load_orchestrator_setting("batch.max_concurrent", 8)
+        semaphore = asyncio.Semaphore(max(1, int(limit)))
+        
+        yield {"type": "batch", "batch_id": checkpoint.batch_id, "total": len(items), "resumed": len(done)}
+        for index in sorted(done):
+            yield {"type": "result", "index": index, "resumed": True, **done[index]}
+        
+        async def worker(index: int, item: Dict):
+            async with semaphore:
+                try:
+                    return index, await self._analyze_item(item, timeout)
+                except Exception as e:
+                    return index, {"ticker": item.get("ticker"), "state": "error", "error": str(e)}
+        
+        pending = {
+            asyncio.create_task(worker(index, item))
+            for index, item in enumerate(items) if index not in done
+        }
+        try:
+            for next_done in asyncio.as_completed(pending):
+                index, result = await next_done
+                checkpoint.record(index, result)
+                yield {"type": "result", "index": index, **result}
+        finally:
+            # 스트림을 받던 쪽이 끊기면 남은 항목 취소 (같은 batch_id로 이어서 실행 가능)
+            for task in pending:
+                task.cancel()
+            checkpoint.close()
+        
+        yield {"type": "done", "batch_id": checkpoint.batch_id, "total": len(items)}
+        
+    async def _handle_agent_response(self, session: Dict, message: A2AMessage, stage: str,
+                                     agent_type: Optional[str] = None):
+        """에이전트 응답 처리 (stage: 요청을 보낸 단계, agent_type: 데이터 수집 응답이면 응답한 소스)"""
+        session.get("inflight_requests", {}).pop(message.header.correlation_id, None)
         
         print(f"\n{'='*60}")
         print(f"🔄 에이전트 응답 처리 시작")
-        print(f"   - Session state: {state}")
+        print(f"   - Stage: {stage} (session state: {session['state']})")
         print(f"   - Sender ID: {message.header.sender_id}")
         print(f"   - Message ID: {message.header.message_id}")
         print(f"   - Correlation ID: {message.header.correlation_id}")
         print(f"   - Message body keys: {list(message.body.keys()) if message.body else 'None'}")
         print(f"{'='*60}\n")
         
-        if state == "waiting_nlu":
+        if stage == "nlu":
             # NLU A2A 응답 처리
             print(f"📥 [A2A] NLU 응답 처리")
             
@@ -424,7 +821,7 @@ class OrchestratorV2(BaseAgent):
                 print(f"   - Exchange: {exchange}")
                 print(f"   - Full result: {result}")
                 
-                await self._send_to_ui(session.get("client_id"), "log", {
+                await self._send_to_session(session, "log", {
                     "message": f"✅ [A2A] 티커 추출 완료: {ticker} ({company_name})"
                 })
                 
@@ -435,22 +832,24 @@ class OrchestratorV2(BaseAgent):
                     session["exchange"] = exchange
                     session["state"] = "collecting_data"
                     
-                    print(f"✅ 티커 찾음: {ticker}, 데이터 수집 시작")
-                    
-                    # 데이터 수집 시작
-                    await self._start_data_collection(session)
+                    # 같은 종목 분석이 진행 중이면 합류 (중복 수집/LLM 호출 방지)
+                    await self._begin_analysis(session)
                 else:
                     print("❌ 티커를 찾을 수 없음")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 티커를 찾을 수 없습니다"})
+                    session["state"] = "error"
+                    await self._send_to_session(session, "log", {"message": "❌ 티커를 찾을 수 없습니다"})
+                    self._finish_session(session["session_id"])
             else:
                 # A2A 오류 응답
                 error_msg = message.body.get("error", "Unknown error")
                 print(f"❌ [A2A] NLU 처리 실패: {error_msg}")
-                await self._send_to_ui(session.get("client_id"), "log", {
+                session["state"] = "error"
+                await self._send_to_session(session, "log", {
                     "message": f"❌ [A2A] NLU 처리 실패: {error_msg}"
                 })
+                self._finish_session(session["session_id"])
                 
-        elif state == "collecting_data":
+        elif stage == "data_collection":
             # 데이터 수집 응답 처리
             sender_id = message.header.sender_id
             correlation_id = message.header.correlation_id
@@ -462,22 +861,14 @@ class OrchestratorV2(BaseAgent):
             print(f"   - Result keys: {list(result.keys())}")
             print(f"   - Result status: {result.get('status', 'N/A')}")
             
-            # 현재 세션의 요청 ID 목록 출력
-            print(f"\n📋 현재 세션의 데이터 수집 요청 ID:")
-            for atype, req_id in session.get("data_request_ids", {}).items():
-                print(f"   - {atype}: {req_id}")
-            
-            # 어떤 에이전트의 응답인지 확인
-            agent_type = None
-            for atype, req_id in session.get("data_request_ids", {}).items():
-                if req_id == correlation_id:
-                    agent_type = atype
-                    break
-                    
+            # 어떤 에이전트의 응답인지는 응답 매칭 테이블에서 전달됨
             if not agent_type:
                 print(f"\n⚠️ 알 수 없는 데이터 수집 응답: {correlation_id}")
                 print(f"   세션에 등록된 요청 ID와 일치하지 않습니다.")
                 return
+            if session.get("compacted"):
+                print(f"⏭️ {agent_type} 응답 무시: 이미 완료된 세션")
+                return
                 
             print(f"\n✅ {agent_type} 에이전트 응답 확인")
             
@@ -492,7 +883,27 @@ class OrchestratorV2(BaseAgent):
             if not isinstance(data, list):
                 print(f"⚠️ {agent_type} 데이터가 리스트가 아님: {type(data)}")
                 data = []
+            if agent_type in session.get("late_sources", ()):
+                # 정족수 이후 도착 → 감정 분석이 아직 진행 중이면 합류, 끝났으면 이 소스만 추가 분석해 병합
+                if agent_type not in session.get("pending_data_agents", []):
+                    return
+                session["pending_data_agents"].remove(agent_type)
+                feed = self.sentiment_feeds.get(session["session_id"])
+                if feed and not feed.closed:
+                    session["collected_data"][agent_type] = data
+                    self._feed_sentiment(session, agent_type, data)
+                    await self._send_to_session(session, "log", {
+                        "message": f"⏰ {agent_type.upper()} 데이터 지연 도착: {len(data)}개 항목, 진행 중인 감정 분석에 합류합니다"
+                    })
+                    return
+                await self._send_to_session(session, "log", {
+                    "message": f"⏰ {agent_type.upper()} 데이터 지연 도착: {len(data)}개 항목, 추가 분석으로 반영합니다"
+                })
+                self._spawn_session_task(session, self._merge_late_data(session, agent_type, data))
+                return
             session["collected_data"][agent_type] = data
+            # 정족수를 기다리지 않고 바로 감정 분석 시작
+            self._feed_sentiment(session, agent_type, data)
             
             # 로그 출력
             data_count = len(data)
@@ -511,14 +922,14 @@ class OrchestratorV2(BaseAgent):
                 from_date = to_date - timedelta(days=7)
                 date_info = f" (최근 7일: {from_date.strftime('%m/%d')}~{to_date.strftime('%m/%d')})"
             
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"✅ {agent_type.upper()} 데이터 수집 완료: {data_count}개 항목{date_info}"
             })
             
             # 각 데이터 항목의 로그 메시지 출력
             for item in result.get("data", []):
                 if "log_message" in item:
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": item["log_message"]})
+                    await self._send_to_session(session, "log", {"message": item["log_message"]})
                     
             # 응답받은 에이전트를 대기 목록에서 제거
             pending_agents = session.get("pending_data_agents", [])
@@ -532,35 +943,15 @@ class OrchestratorV2(BaseAgent):
             else:
                 print(f"   ⚠️ {agent_type}가 대기 목록에 없음 (이미 처리됨?)")
                 
-            # 모든 데이터 수집 완료 확인
+            # 정족수 확인 (충족하면 남은 소스를 기다리지 않고 진행)
             remaining_agents = session.get("pending_data_agents", [])
             collected_data = session.get("collected_data", {})
             print(f"\n📊 데이터 수집 상태 확인")
             print(f"   - 남은 에이전트 수: {len(remaining_agents)}")
             print(f"   - 수집된 데이터 소스: {list(collected_data.keys())}")
+            await self._check_collection_quorum(session)
             
-            # 모든 데이터 수집이 완료되면 진행 (대기 목록이 비어있으면)
-            if len(remaining_agents) == 0 and not session.get("sentiment_started", False):
-                print("\n🎉 모든 데이터 수집 완료!")
-                await self._send_to_ui(session.get("client_id"), "log", {"message": "🎉 모든 데이터 수집 완료!"})
-                
-                # 수집된 데이터 요약
-                total_items = 0
-                for source, items in session.get("collected_data", {}).items():
-                    count = len(items)
-                    total_items += count
-                    print(f"   - {source}: {count}개 항목")
-                print(f"   - 총 {total_items}개 항목 수집됨")
-                
-                # 다음 단계로 진행 (감정 분석)
-                print(f"\n➡️ 다음 단계로 진행: 감정 분석")
-                session["state"] = "analyzing_sentiment"
-                session["sentiment_started"] = True  # 중복 실행 방지
-                await self._start_sentiment_analysis(session)
-            else:
-                print(f"\n⏳ 아직 {len(remaining_agents)}개 에이전트 응답 대기 중: {remaining_agents}")
-            
-        elif state == "analyzing_sentiment":
+        elif stage == "sentiment":
             # 감정 분석 응답 처리
             print(f"🎯 감정 분석 응답 처리")
             result = message.body.get("result", {})
@@ -571,7 +962,7 @@ class OrchestratorV2(BaseAgent):
             
             # 로그 출력
             success_count = result.get("success_count", 0)
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"✅ 감정 분석 완료: {success_count}개 항목 분석"
             })
             
@@ -594,7 +985,7 @@ class OrchestratorV2(BaseAgent):
                     label = "neutral"
                 
                 emoji = "🟢" if label == "positive" else "🔴" if label == "negative" else "🟡"
-                await self._send_to_ui(session.get("client_id"), "log", {
+                await self._send_to_session(session, "log", {
                     "message": f"  {emoji} {source}: {label} (점수: {score:.2f})"
                 })
                 
@@ -608,17 +999,13 @@ class OrchestratorV2(BaseAgent):
             
             # 감성 분석 차트 데이터 전송
             if sentiment_chart_data:
-                await self._send_chart_update(session.get("client_id"), "sentiment_analysis", {
+                await self._send_chart_to_session(session, "sentiment_analysis", {
                     "ticker": session.get("ticker"),
                     "sentiments": sentiment_chart_data,
                     "average_score": sum(d["score"] for d in sentiment_chart_data) / len(sentiment_chart_data) if sentiment_chart_data else 0
                 })
             
-            # 다음 단계로 진행 (정량적 분석)
-            session["state"] = "quantitative_analysis"
-            await self._start_quantitative_analysis(session)
-            
-        elif state == "quantitative_analysis":
+        elif stage == "quantitative":
             # 정량적 분석 응답 처리
             print(f"📊 정량적 분석 응답 처리")
             result = message.body.get("result", {})
@@ -627,7 +1014,7 @@ class OrchestratorV2(BaseAgent):
             session["quantitative_analysis"] = result
             
             # 결과 출력
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": "✅ 정량적 데이터 분석 완료"
             })
             
@@ -639,12 +1026,12 @@ class OrchestratorV2(BaseAgent):
                 change_percent = price_data.get('change_1d_percent', 0)
                 change_amount = price_data.get('change_1d', 0)
                 
-                await self._send_to_ui(session.get("client_id"), "log", {
+                await self._send_to_session(session, "log", {
                     "message": f"  📈 현재가: ${current_price:.2f} ({change_percent:+.2f}%)"
                 })
                 
                 # 주가 차트 데이터 전송 - 전체 price_data 포함
-                await self._send_chart_update(session.get("client_id"), "price_chart", {
+                await self._send_chart_to_session(session, "price_chart", {
                     "ticker": session.get("ticker"),
                     "price_data": price_data,  # 전체 price_data 객체 전송
                     "current_price": current_price,
@@ -658,12 +1045,12 @@ class OrchestratorV2(BaseAgent):
             
             technical = result.get("technical_indicators", {})
             if technical:
-                await self._send_to_ui(session.get("client_id"), "log", {
+                await self._send_to_session(session, "log", {
                     "message": f"  📊 RSI: {technical.get('rsi', 50):.1f}, MACD: {technical.get('macd_signal', 'N/A')}"
                 })
                 
                 # 기술적 지표 차트 데이터 전송
-                await self._send_chart_update(session.get("client_id"), "technical_indicators", {
+                await self._send_chart_to_session(session, "technical_indicators", {
                     "ticker": session.get("ticker"),
                     "rsi": technical.get('rsi', 50),
                     "macd": technical.get('macd', 0),
@@ -675,11 +1062,7 @@ class OrchestratorV2(BaseAgent):
                     "bollinger_lower": technical.get('bollinger_lower', 0)
                 })
             
-            # 다음 단계로 진행 (점수 계산)
-            session["state"] = "calculating_score"
-            await self._start_score_calculation(session)
-            
-        elif state == "calculating_score":
+        elif stage == "score":
             # 점수 계산 응답 처리
             print(f"📊 점수 계산 응답 처리")
             result = message.body.get("result", {})
@@ -693,17 +1076,17 @@ class OrchestratorV2(BaseAgent):
             weighted_scores = result.get("weighted_scores", {})
             
             emoji = "🟢" if final_label == "positive" else "🔴" if final_label == "negative" else "🟡"
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"✅ 점수 계산 완료"
             })
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"{emoji} 최종 점수: {final_score:.2f} ({final_label})"
             })
             
             # 가중치 적용된 점수 출력
             score_breakdown = []
             for source, score_info in weighted_scores.items():
-                await self._send_to_ui(session.get("client_id"), "log", {
+                await self._send_to_session(session, "log", {
                     "message": f"  - {source}: {score_info.get('weighted_score', 0):.2f} (가중치: {score_info.get('weight', 0)})"
                 })
                 score_breakdown.append({
@@ -714,7 +1097,7 @@ class OrchestratorV2(BaseAgent):
                 })
             
             # 최종 점수 차트 데이터 전송
-            await self._send_chart_update(session.get("client_id"), "final_score", {
+            await self._send_chart_to_session(session, "final_score", {
                 "ticker": session.get("ticker"),
                 "final_score": final_score,
                 "final_label": final_label,
@@ -722,11 +1105,7 @@ class OrchestratorV2(BaseAgent):
                 "weighted_scores": weighted_scores
             })
             
-            # 메시지 핸들러에서는 다음 단계로 진행하지 않음 (직접 HTTP 호출 방식 사용 중)
-            # session["state"] = "risk_analysis"
-            # await self._start_risk_analysis(session)
-            
-        elif state == "risk_analysis":
+        elif stage == "risk":
             # 리스크 분석 응답 처리
             print(f"🎯 리스크 분석 응답 처리")
             result = message.body.get("result", {})
@@ -739,29 +1118,25 @@ class OrchestratorV2(BaseAgent):
             risk_level = result.get("risk_level", "medium")
             
             risk_emoji = "🟢" if risk_level in ["very_low", "low"] else "🟡" if risk_level == "medium" else "🔴"
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"✅ 리스크 분석 완료"
             })
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"{risk_emoji} 종합 리스크: {overall_risk_score:.1f}점 ({risk_level})"
             })
             
             # 주요 리스크 권고사항
             recommendations = result.get("recommendations", [])
             if recommendations:
-                await self._send_to_ui(session.get("client_id"), "log", {
+                await self._send_to_session(session, "log", {
                     "message": "  💡 주요 권고사항:"
                 })
                 for rec in recommendations[:3]:  # 상위 3개만
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"    - {rec.get('action', '')}: {rec.get('reason', '')}"
                     })
             
-            # 다음 단계로 진행 (리포트 생성)
-            session["state"] = "generating_report"
-            await self._start_report_generation(session)
-            
-        elif state == "generating_report":
+        elif stage == "report":
             # 보고서 생성 응답 처리
             print(f"📝 보고서 생성 응답 처리")
             result = message.body.get("result", {})
@@ -770,12 +1145,12 @@ class OrchestratorV2(BaseAgent):
             session["final_report"] = result.get("report", "")
             
             # UI에 최종 결과 전송
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": "✅ 분석 보고서 생성 완료!"
             })
             
             # 최종 결과 전송
-            await self._send_to_ui(session.get("client_id"), "result", {
+            await self._send_to_session(session, "result", {
                 "ticker": session.get("ticker"),
                 "final_score": session.get("score_calculation", {}).get("final_score", 0),
                 "final_label": session.get("score_calculation", {}).get("final_label", "neutral"),
@@ -791,51 +1166,30 @@ class OrchestratorV2(BaseAgent):
             
             # 분석 완료 상태
             session["state"] = "completed"
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": "🎉 전체 분석 프로세스 완료!"
             })
+            
+            # 수집 데이터/원본 결과를 버리고 요약 + 리포트 위치만 보관
+            await self._complete_session(session)
         
     async def _start_data_collection(self, session: Dict):
         """데이터 수집 시작"""
         ticker = session["ticker"]
-        session_id = None
-        
-        # 세션 ID 찾기
-        for sid, sess in self.analysis_sessions.items():
-            if sess == session:
-                session_id = sid
-                break
+        session_id = session.get("session_id")
                 
         print(f"🔄 데이터 수집 시작")
         print(f"   - Ticker: {ticker}")
         print(f"   - Session ID: {session_id}")
         
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "data-collection"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": "📊 데이터 수집 시작..."})
+        await self._send_to_session(session, "status", {"agentId": "data-collection"})
+        await self._send_to_session(session, "log", {"message": "📊 데이터 수집 시작..."})
         
         # A2A 프로토콜로 데이터 수집
         print("🔎 데이터 수집 에이전트 A2A 호출...")
         
-        # 각 에이전트의 ID 정보
-        exchange = session.get("exchange", "US")
-        
         # 거래소에 따른 에이전트 선택
-        if exchange == "KRX":
-            # 한국 기업: DART 사용
-            agent_ids = {
-                "news": "news-agent-v2",
-                "twitter": "twitter-agent-v2",
-                "dart": "dart-agent-v2",
-                "mcp": "mcp-agent"
-            }
-        else:
-            # 미국 기업: SEC 사용
-            agent_ids = {
-                "news": "news-agent-v2",
-                "twitter": "twitter-agent-v2",
-                "sec": "sec-agent-v2",
-                "mcp": "mcp-agent"
-            }
+        agent_ids = self._collection_agents(session.get("exchange", "US"))
         
         # 데이터 수집 요청 추적을 위한 딕셔너리
         session["data_request_ids"] = {}
@@ -864,6 +1218,12 @@ class OrchestratorV2(BaseAgent):
             )
             tasks.append(task)
             session["pending_data_agents"].append(agent_type)
+        
+        # 소스별 기한 감시 (느린 소스가 세션 전체를 붙잡지 않도록)
+        session["collection_started"] = time.monotonic()
+        session["late_sources"] = []
+        session["failed_sources"] = []
+        self._spawn_session_task(session, self._watch_collection_deadlines(session))
                 
         # 모든 요청 동시 전송
         print(f"\n⏳ [A2A] {len(tasks)}개의 데이터 수집 메시지 동시 전송 중...")
@@ -878,6 +1238,25 @@ class OrchestratorV2(BaseAgent):
                 
         print(f"✅ [A2A] 모든 데이터 수집 메시지 전송 완료")
         
+    @staticmethod
+    def _collection_agents(exchange: str) -> Dict[str, str]:
+        """거래소별 데이터 수집 에이전트 (소스 타입 -> 에이전트 ID)"""
+        if exchange == "KRX":
+            # 한국 기업: DART 사용
+            return {
+                "news": "news-agent-v2",
+                "twitter": "twitter-agent-v2",
+                "dart": "dart-agent-v2",
+                "mcp": "mcp-agent"
+            }
+        # 미국 기업: SEC 사용
+        return {
+            "news": "news-agent-v2",
+            "twitter": "twitter-agent-v2",
+            "sec": "sec-agent-v2",
+            "mcp": "mcp-agent"
+        }
+
     async def _send_data_collection_request_a2a(self, session_id: str, agent_type: str, 
                                                agent_id: str, ticker: str):
         """A2A 프로토콜로 개별 데이터 수집 요청 전송"""
@@ -895,240 +1274,399 @@ class OrchestratorV2(BaseAgent):
                 return None
             
             # UI 상태 업데이트
-            await self._send_to_ui(session.get("client_id"), "status", {"agentId": f"{agent_type}-agent"})
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "status", {"agentId": f"{agent_type}-agent"})
+            await self._send_to_session(session, "log", {
                 "message": f"📡 [A2A] {agent_type.upper()} 에이전트에 데이터 수집 요청..."
             })
             
+            # 서킷이 열려 있으면 전송 재시도를 기다리지 않고 바로 해당 소스 없이 진행
+            breaker = self.breakers.get(agent_id)
+            if not breaker.allow():
+                print(f"⚡ [A2A] {agent_type} 서킷 열림 → 전송 생략 ({breaker.retry_in():.0f}초 후 재확인)")
+                await self._send_to_session(session, "log", {
+                    "message": f"⚡ {agent_type.upper()} 에이전트 장애 감지, 해당 데이터 없이 진행"
+                })
+                await self._mark_data_collection_failed(session, agent_type)
+                return None
+            
             # A2A 메시지 전송
-            message = await self.send_message(
-                receiver_id=agent_id,
-                action="collect_data",
-                payload={"ticker": ticker},
-                priority=Priority.HIGH
-            )
+            started = time.monotonic()
+            try:
+                message = await self.send_message(
+                    receiver_id=agent_id,
+                    action="collect_data",
+                    payload={"ticker": ticker},
+                    priority=Priority.HIGH
+                )
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            breaker.record(message is not None, time.monotonic() - started)
             
             if message:
                 # 요청 ID 저장 (응답 매칭용)
                 session["data_request_ids"][agent_type] = message.header.message_id
+                self._track_request(session, message.header.message_id, "data_collection", agent_id, agent_type)
                 
                 print(f"✅ [A2A] {agent_type} 메시지 전송 성공")
                 print(f"   - Message ID: {message.header.message_id}")
                 
-                await self._send_to_ui(session.get("client_id"), "log", {
+                await self._send_to_session(session, "log", {
                     "message": f"✅ [A2A] {agent_type.upper()} 에이전트에 메시지 전송 완료"
                 })
                 
                 return message
             else:
-                print(f"❌ [A2A] {agent_type} 메시지 전송 실패")
-                
-                # HTTP 폴백
-                print(f"🔄 HTTP로 폴백 시도...")
-                await self._send_to_ui(session.get("client_id"), "log", {
-                    "message": f"⚠️ [A2A] {agent_type.upper()} 실패, HTTP로 재시도"
+                # 재시도는 메시징 계층에서 처리됨 → 해당 소스 없이 계속 진행
+                print(f"❌ [A2A] {agent_type} 메시지 전송 실패 (재시도 소진)")
+                await self._send_to_session(session, "log", {
+                    "message": f"⚠️ [A2A] {agent_type.upper()} 에이전트 응답 없음, 해당 데이터 없이 진행"
                 })
-                
-                # HTTP 폴백 로직 호출
-                return await self._send_data_collection_request_http(
-                    session_id, agent_type, 
-                    {"news": 8307, "twitter": 8209, "sec": 8210, "dart": 8213, "mcp": 8215}.get(agent_type, 8080),
-                    ticker
-                )
+                await self._mark_data_collection_failed(session, agent_type)
+                return None
                 
         except Exception as e:
             print(f"❌ [A2A] {agent_type} 요청 실패: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"❌ [A2A] {agent_type.upper()} 데이터 수집 실패: {str(e)}"
             })
             # 빈 데이터로 처리
-            if "collected_data" not in session:
-                session["collected_data"] = {}
-            session["collected_data"][agent_type] = []
-            if agent_type in session.get("pending_data_agents", []):
-                session["pending_data_agents"].remove(agent_type)
+            if session:
+                await self._mark_data_collection_failed(session, agent_type)
             return None
-        
-    async def _send_data_collection_request_http(self, session_id: str, agent_type: str, 
-                                               port: int, ticker: str):
-        """HTTP로 개별 데이터 수집 요청 전송"""
-        try:
-            print(f"\n{'~'*50}")
-            print(f"📤 {agent_type} 데이터 수집 HTTP 요청 시작")
-            print(f"   - Session ID: {session_id}")
-            print(f"   - Port: {port}")
-            print(f"   - Ticker: {ticker}")
             
-            # 세션 가져오기
-            session = self.analysis_sessions.get(session_id)
-            if not session:
-                print(f"❌ 세션을 찾을 수 없음: {session_id}")
-                return None
-            
-            # UI 상태 업데이트
-            await self._send_to_ui(session.get("client_id"), "status", {"agentId": f"{agent_type}-agent"})
-            await self._send_to_ui(session.get("client_id"), "log", {
-                "message": f"📡 {agent_type.upper()} 데이터 수집 요청 중..."
+    async def _mark_data_collection_failed(self, session: Dict, agent_type: str):
+        """수집 실패한 소스를 빈 데이터로 처리하고 정족수 다시 확인"""
+        if agent_type not in session.get("pending_data_agents", []):
+            return
+        session["pending_data_agents"].remove(agent_type)
+        session.setdefault("failed_sources", []).append(agent_type)
+        if agent_type in session.get("late_sources", ()):
+            return
+        session.setdefault("collected_data", {})[agent_type] = []
+        await self._check_collection_quorum(session)
+
+    async def _check_collection_quorum(self, session: Dict):
+        """정족수 정책을 만족하면 수집 완료로 보고 감정 분석 시작 (남은 소스는 지연 소스로 표시)"""
+        if self._pipeline_ready(session, "collected_data") or "collection_started" not in session:
+            return
+        pending = list(session.get("pending_data_agents", []))
+        failed = session.get("failed_sources", [])
+        arrived = [source for source in session.get("collected_data", {}) if source not in failed]
+        elapsed = time.monotonic() - session["collection_started"]
+        reason = self.collection_policy.decide(arrived, pending, elapsed)
+        if reason is None:
+            print(f"\n⏳ 아직 {len(pending)}개 에이전트 응답 대기 중: {pending}")
+            return
+        
+        session["late_sources"] = pending
+        session["collection_quorum"] = {"reason": reason, "elapsed": round(elapsed, 2), "late": pending}
+        total_items = sum(len(items) for items in session.get("collected_data", {}).values())
+        if reason != QUORUM_ALL:
+            print(f"\n⏱️ 정족수 충족({reason}, {elapsed:.1f}초) → 남은 소스 {pending} 없이 진행")
+            await self._send_to_session(session, "log", {
+                "message": f"⏱️ 데이터 수집 {elapsed:.1f}초: {', '.join(source.upper() for source in pending)} 없이 먼저 분석합니다 (도착하면 추가 반영)"
             })
-            
-            # HTTP 요청 - 직접 엔드포인트 호출
-            async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=30.0)) as http_client:
-                # DART는 다른 엔드포인트 사용
-                if agent_type == "dart":
-                    endpoint = f"http://localhost:{port}/collect_dart"
-                else:
-                    endpoint = f"http://localhost:{port}/collect_{agent_type}_data"
-                print(f"   - Endpoint: {endpoint}")
-                
+        elif failed:
+            print("🎉 모든 데이터 수집 시도 완료 (일부 실패)")
+            await self._send_to_session(session, "log", {"message": "⚠️ 일부 데이터 수집 실패, 계속 진행합니다"})
+        else:
+            print("\n🎉 모든 데이터 수집 완료!")
+            await self._send_to_session(session, "log", {"message": "🎉 모든 데이터 수집 완료!"})
+        print(f"   - 총 {total_items}개 항목 수집됨")
+        
+        # 수집 데이터가 필요한 단계(감정 분석) 시작
+        session["state"] = "analyzing"
+        self._provide(session, "collected_data")
+
+    async def _watch_collection_deadlines(self, session: Dict):
+        """소스별 기한마다 정족수 다시 확인 (응답이 없어도 기한이 지나면 진행)"""
+        while True:
+            await self._check_collection_quorum(session)
+            if self._pipeline_ready(session, "collected_data"):
+                return
+            elapsed = time.monotonic() - session["collection_started"]
+            delay = self.collection_policy.next_check(session.get("pending_data_agents", []), elapsed)
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+
+    async def _handle_partial_data(self, session: Dict, agent_type: Optional[str], result: Dict):
+        """수집 에이전트 중간 결과 - 소스는 아직 대기 중으로 두고 항목만 먼저 감정 분석에 넘김"""
+        data = result.get("data", [])
+        if not agent_type or session.get("compacted") or not isinstance(data, list):
+            return
+        added = self._feed_sentiment(session, agent_type, data)
+        if added:
+            print(f"📥 {agent_type} 중간 결과: {added}개 항목 → 감정 분석 시작")
+            await self._send_to_session(session, "log", {
+                "message": f"📥 {agent_type.upper()} 일부 도착: {added}개 항목 먼저 분석합니다"
+            })
+
+    def _sentiment_feed(self, session: Dict) -> SentimentFeed:
+        """세션의 감정 분석 입력 스트림 (없으면 생성)"""
+        session_id = session["session_id"]
+        feed = self.sentiment_feeds.get(session_id)
+        if feed is None:
+            feed = SentimentFeed(
+                analyze=lambda batch: self._stream_sentiment(session, batch),
+                on_result=lambda result: self._on_sentiment_item(session, result),
+                batch_size=_load_orchestrator_setting("sentiment_stream.batch_size", 4),
+                linger=_load_orchestrator_setting("sentiment_stream.linger", 0.2)
+            )
+            self.sentiment_feeds[session_id] = feed
+        return feed
+
+    def _feed_sentiment(self, session: Dict, source: str, data: Any) -> int:
+        """수집 항목을 감정 분석 스트림에 추가 (리스트가 아닌 소스는 감정 분석 대상 아님) - 새 항목 수 반환"""
+        if not isinstance(data, list):
+            return 0
+        feed = self._sentiment_feed(session)
+        if feed.closed:
+            return 0
+        return feed.feed({**item, "source": source} for item in data if isinstance(item, dict))
+
+    async def _stream_sentiment(self, session: Dict, items: List[Dict]) -> AsyncIterator[Dict]:
+        """항목 묶음을 감정 분석 에이전트 스트리밍 엔드포인트로 보내고 결과를 끝나는 대로 내보냄
+        
+        시간 초과 시 아직 결과가 없는 항목은 기본 점수로 채운다 (기존 일괄 분석과 같은 처리).
+        """
+        ticker = session["ticker"]
+        returned = set()
+        try:
+            # 감정 분석 인스턴스가 여럿이면 부하가 적은 인스턴스 선택 (발견 실패 시 기본 포트)
+            try:
+                sentiment_agent = await self._resolve_receiver("sentiment-analysis-agent-v2")
+            except Exception as e:
+                print(f"⚠️ 감정 분석 에이전트 발견 실패, 기본 주소 사용: {e}")
+                sentiment_agent = None
+            sentiment_endpoint = sentiment_agent.endpoint if sentiment_agent else "http://localhost:8202"
+            sentiment_target = sentiment_agent.agent_id if sentiment_agent else "sentiment-analysis-agent-v2"
+            # 브레이커는 논리 에이전트 이름 기준 (인스턴스 ID는 재시작마다 바뀌고 설정 덮어쓰기와 맞지 않음)
+            breaker = self.breakers.get("sentiment-analysis-agent-v2")
+            self.breaker_endpoints["sentiment-analysis-agent-v2"] = sentiment_endpoint
+            breaker.check()
+            
+            async with AsyncExitStack() as stack:
+                # 요청을 보내기 전(자리 대기 중 취소 등)에 빠져나가면 시험 호출 자리 반환
                 try:
-                    response = await http_client.post(
-                        endpoint,
-                        json={"ticker": ticker},
-                        headers={"X-API-Key": self.api_key},
-                        timeout=60.0
+                    await stack.enter_async_context(
+                        self.scheduler.slot("sentiment", session.get("traffic", INTERACTIVE), len(items))
                     )
-                except httpx.ConnectError as e:
-                    print(f"❌ {agent_type} 연결 실패: {e}")
-                    # 재시도 한 번
-                    print(f"🔄 {agent_type} 재시도 중...")
-                    await asyncio.sleep(1)
-                    try:
-                        response = await http_client.post(
-                            endpoint,
-                            json={"ticker": ticker},
-                            headers={"X-API-Key": self.api_key},
-                            timeout=60.0
-                        )
-                    except Exception as retry_error:
-                        print(f"❌ {agent_type} 재시도도 실패: {retry_error}")
-                        await self._send_to_ui(session.get("client_id"), "log", {
-                            "message": f"❌ {agent_type.upper()} 데이터 수집 실패 (연결 오류)"
-                        })
-                        # 빈 데이터로 처리
-                        if "collected_data" not in session:
-                            session["collected_data"] = {}
-                        session["collected_data"][agent_type] = []
-                        if agent_type in session.get("pending_data_agents", []):
-                            session["pending_data_agents"].remove(agent_type)
-                        return None
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    print(f"✅ {agent_type} 요청 성공")
-                    print(f"   - Response keys: {list(result.keys())}")
-                    
-                    # HTTP 직접 응답에서 데이터 추출
-                    data = result.get("data", [])
-                    # 데이터가 리스트인지 확인
-                    if not isinstance(data, list):
-                        print(f"⚠️ {agent_type} 데이터가 리스트가 아님: {type(data)}")
-                        data = []
-                    print(f"   - Data count: {len(data)}")
-                    
-                    # 세션에 데이터 저장
-                    session = self.analysis_sessions.get(session_id)
-                    if session:
-                        if "collected_data" not in session:
-                            session["collected_data"] = {}
-                        session["collected_data"][agent_type] = data
-                        
-                        # 대기 목록에서 제거
-                        if agent_type in session.get("pending_data_agents", []):
-                            session["pending_data_agents"].remove(agent_type)
-                        
-                        # UI 업데이트
-                        await self._send_to_ui(session.get("client_id"), "log", {
-                            "message": f"✅ {agent_type.upper()} 데이터 수집 완료: {len(data)}개 항목"
-                        })
-                        
-                        # 모든 데이터 수집 완료 확인
-                        if not session.get("pending_data_agents"):
-                            print("🎉 모든 데이터 수집 완료!")
-                            await self._send_to_ui(session.get("client_id"), "log", {"message": "🎉 모든 데이터 수집 완료!"})
-                            session["state"] = "analyzing_sentiment"
-                            await self._start_sentiment_analysis(session)
-                    
-                    print(f"{'~'*50}\n")
-                    return result
-                else:
-                    print(f"❌ {agent_type} 요청 실패: HTTP {response.status_code}")
-                    error_text = response.text[:200] if response.text else "No error message"
-                    print(f"   - Error: {error_text}")
-                    
-                    # 오류 응답에서도 데이터를 확인 (빈 데이터일 수 있음)
-                    try:
-                        error_result = response.json()
-                        if "data" in error_result:
-                            # 데이터가 있으면 저장
-                            data = error_result.get("data", [])
-                            # 데이터가 리스트인지 확인
-                            if not isinstance(data, list):
-                                print(f"⚠️ {agent_type} 오류 응답 데이터가 리스트가 아님: {type(data)}")
-                                data = []
-                            if "collected_data" not in session:
-                                session["collected_data"] = {}
-                            session["collected_data"][agent_type] = data
-                            
-                            # 에러 메시지와 함께 표시
-                            error_msg = error_result.get("error", f"HTTP {response.status_code}")
-                            await self._send_to_ui(session.get("client_id"), "log", {
-                                "message": f"⚠️ {agent_type.upper()}: {error_msg} ({len(data)}개 데이터)"
-                            })
-                        else:
-                            await self._send_to_ui(session.get("client_id"), "log", {
-                                "message": f"❌ {agent_type.upper()} 데이터 수집 실패"
-                            })
-                    except:
-                        await self._send_to_ui(session.get("client_id"), "log", {
-                            "message": f"❌ {agent_type.upper()} 데이터 수집 실패"
-                        })
-                    
-                    # 대기 목록에서 제거
-                    if agent_type in session.get("pending_data_agents", []):
-                        session["pending_data_agents"].remove(agent_type)
-                    
-        except Exception as e:
-            print(f"❌ {agent_type} 요청 중 오류: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {
-                "message": f"❌ {agent_type.upper()} 데이터 수집 오류: {str(e)}"
+                    http_client = await stack.enter_async_context(http_pool.client(sentiment_endpoint, "llm"))
+                except BaseException:
+                    breaker.release()
+                    raise
+                # 연결이 끊기면 취소할 수 있도록 요청 ID와 마감 시각 전달
+                request_id = str(uuid.uuid4())
+                deadline = datetime.now() + timedelta(seconds=120)
+                session.setdefault("inflight_requests", {})[request_id] = sentiment_target
+                self.balancer.start(request_id, sentiment_target)
+                failed = True
+                healthy = None  # 브레이커에 기록할 결과 (취소되면 None)
+                started = time.monotonic()
+                try:
+                    async with http_client.stream(
+                        "POST",
+                        f"{sentiment_endpoint}/analyze_sentiment/stream",
+                        json={"ticker": ticker, "items": items},
+                        headers={"X-API-Key": self.api_key, **deadline_headers(request_id, deadline)}
+                    ) as response:
+                        if response.status_code != 200:
+                            healthy = response.status_code < 500
+                            error_detail = (await response.aread()).decode(errors="replace")
+                            print(f"❌ 감정 분석 오류: HTTP {response.status_code}")
+                            await self._send_to_session(session, "log", {"message": f"❌ 감정 분석 오류: {error_detail}"})
+                            return
+                        async for line in response.aiter_lines():
+                            if not line.strip():
+                                continue
+                            event = json.loads(line)
+                            if event.get("type") == "item":
+                                returned.add(event["index"])
+                                yield event["result"]
+                            elif event.get("error"):
+                                await self._send_to_session(session, "log", {"message": f"❌ 감정 분석 오류: {event['error']}"})
+                        failed = False
+                        healthy = True
+                except Exception:
+                    healthy = False
+                    if sentiment_agent:
+                        self.known_agents.invalidate(agent_id=sentiment_agent.agent_id)
+                    raise
+                finally:
+                    session["inflight_requests"].pop(request_id, None)
+                    self.balancer.finish(request_id, failed=failed)
+                    if healthy is None:
+                        breaker.release()
+                    else:
+                        breaker.record(healthy, time.monotonic() - started)
+                    
+        except CircuitOpenError as e:
+            print(f"⚡ 감정 분석 서킷 열림: {e}")
+            await self._send_to_session(session, "log", {"message": "⚡ 감정 분석 에이전트 장애 감지, 분석 생략"})
+        except httpx.TimeoutException as e:
+            print(f"❌ 감정 분석 타임아웃: {e}")
+            await self._send_to_session(session, "log", {"message": "❌ 감정 분석 시간 초과 (AI 분석에 시간이 많이 소요됨)"})
+            # 타임아웃이어도 기본 점수로 진행
+            for index, item in enumerate(items):
+                if index not in returned:
+                    yield {
+                        "ticker": ticker,
+                        "source": item.get("source", "unknown"),
+                        "title": item.get("title", ""),
+                        "content": item.get("content", ""),
+                        "score": -0.3 if item.get("source") == "sec" else -0.5,  # 기본 부정적 점수
+                        "summary": "AI 분석 시간 초과로 기본값 사용"
+                    }
+        except httpx.ConnectError as e:
+            print(f"❌ 감정 분석 연결 실패: {e}")
+            await self._send_to_session(session, "log", {"message": "❌ 감정 분석 에이전트 연결 실패"})
+
+    async def _on_sentiment_item(self, session: Dict, result: Dict):
+        """감정 분석 결과 한 건 도착 - 항목은 바로 전송하고, 잠정 점수/분포 차트는 간격을 두고 갱신"""
+        entry = self._sentiment_chart_entry(result)
+        progress = self._sentiment_progress(session)
+        progress.add(entry, failed=result.get("score") is None)
+        if len(progress.entries) == 1:
+            print(f"⚡ 첫 감정 분석 결과: {progress.first_result_after:.1f}초")
+        
+        emoji = "🟢" if entry["label"] == "positive" else "🔴" if entry["label"] == "negative" else "🟡"
+        await self._send_to_session(session, "sentiment_item", {
+            "item": entry,
+            "message": f"  {emoji} {entry['source']}: {entry['label']} (점수: {entry['score']:.2f})",
+            "progress": progress.snapshot()
+        })
+
+    def _sentiment_progress(self, session: Dict) -> SentimentProgress:
+        """세션의 감정 분석 진행 상황 (없으면 생성)"""
+        session_id = session["session_id"]
+        progress = self.sentiment_progress.get(session_id)
+        if progress is None:
+            progress = SentimentProgress(
+                send_frame=lambda: self._send_sentiment_progress(session),
+                interval=_load_orchestrator_setting("ui_stream.chart_interval", 0.5)
+            )
+            self.sentiment_progress[session_id] = progress
+        return progress
+
+    async def _send_sentiment_progress(self, session: Dict):
+        """잠정 감정 분석 차트/점수 프레임 전송 (최종 결과는 감정 분석/점수 계산 단계가 따로 보냄)"""
+        progress = self.sentiment_progress.get(session["session_id"])
+        if progress is None:
+            return
+        snapshot = progress.snapshot()
+        score = snapshot["average_score"]
+        await self._send_chart_to_session(session, "sentiment_analysis", {
+            "ticker": session["ticker"],
+            "sentiments": list(progress.entries),
+            "provisional": True,
+            **snapshot
+        })
+        await self._send_chart_to_session(session, "final_score", {
+            "ticker": session["ticker"],
+            "final_score": score,
+            "final_label": "positive" if score > 0.1 else "negative" if score < -0.1 else "neutral",
+            "analyzed": snapshot["analyzed"],
+            "provisional": True
+        })
+
+    def _drop_sentiment_progress(self, session_id: str):
+        """진행 상황 정리 (예약된 잠정 프레임 취소)"""
+        progress = self.sentiment_progress.pop(session_id, None)
+        if progress:
+            progress.throttle.cancel()
+
+    def _spawn_session_task(self, session: Dict, coro) -> asyncio.Task:
+        """세션 정리 시 함께 취소되는 보조 작업 시작"""
+        session_id = session["session_id"]
+        task = asyncio.create_task(coro)
+        tasks = self.session_tasks.setdefault(session_id, set())
+        tasks.add(task)
+
+        def forget(done: asyncio.Task):
+            tasks.discard(done)
+            if not tasks and self.session_tasks.get(session_id) is tasks:
+                del self.session_tasks[session_id]
+        task.add_done_callback(forget)
+        return task
+
+    async def _merge_late_data(self, session: Dict, source: str, data: List[Dict]):
+        """정족수 이후 도착한 소스를 감정 분석해 기존 결과에 추가 (본 감정 분석이 끝난 뒤 병합)"""
+        items = [{**item, "source": source} for item in data if isinstance(item, dict)]
+        analyzed = [result async for result in self._stream_sentiment(session, items)] if items else []
+        
+        # 본 감정 분석 결과를 덮어쓰지 않도록 완료를 기다린 뒤 병합
+        pipeline = self.session_pipelines.get(session["session_id"])
+        main_sentiment = pipeline.tasks.get("sentiment") if pipeline else None
+        if main_sentiment and not main_sentiment.done():
+            await asyncio.wait({main_sentiment})
+            pipeline = self.session_pipelines.get(session["session_id"])
+        if session.get("compacted"):
+            await self._send_to_session(session, "log", {
+                "message": f"ℹ️ {source.upper()} 지연 데이터는 분석이 끝난 뒤 도착해 반영하지 못했습니다"
             })
-            import traceback
-            traceback.print_exc()
-            
-            # 오류가 나도 빈 데이터로 처리하고 계속 진행
-            if session:
-                if "collected_data" not in session:
-                    session["collected_data"] = {}
-                session["collected_data"][agent_type] = []
-                
-                # 대기 목록에서 제거
-                if agent_type in session.get("pending_data_agents", []):
-                    session["pending_data_agents"].remove(agent_type)
-                
-                # 모든 데이터 수집 완료 확인
-                if not session.get("pending_data_agents"):
-                    print("🎉 모든 데이터 수집 시도 완료 (일부 실패)")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": "⚠️ 일부 데이터 수집 실패, 계속 진행합니다"})
-                    session["state"] = "analyzing_sentiment"
-                    await self._start_sentiment_analysis(session)
-            
-        print(f"{'~'*50}\n")
-        return None
+            return
+        
+        session.setdefault("collected_data", {})[source] = data
+        session["sentiment_analysis"] = list(session.get("sentiment_analysis") or []) + analyzed
+        scored = pipeline is None or pipeline.is_ready("score_calculation")
+        await self._send_to_session(session, "log", {
+            "message": f"➕ {source.upper()} 지연 데이터 {len(analyzed)}개 감정 분석 추가"
+                       + (" (최종 점수 계산 이후 도착, 점수에는 미반영)" if scored else "")
+        })
+        await self._send_sentiment_chart(session)
         
+    async def _guarded_post(self, http_client: httpx.AsyncClient, agent_name: str, url: str, **kwargs) -> httpx.Response:
+        """서킷 브레이커를 거친 HTTP POST
+        
+        서킷이 열려 있으면 요청 없이 CircuitOpenError (각 단계의 기존 실패 처리로 진행),
+        연결 오류/타임아웃/5xx는 실패로, 소요 시간은 느린 호출 판단에 기록한다.
+        """
+        breaker = self.breakers.get(agent_name)
+        self.breaker_endpoints.setdefault(agent_name, origin_of(url))
+        breaker.check()
+        started = time.monotonic()
+        try:
+            response = await http_client.post(url, **kwargs)
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record(False, time.monotonic() - started)
+            raise
+        breaker.record(response.status_code < 500, time.monotonic() - started)
+        return response
+
+    def _health_probe(self, name: str):
+        """브레이커가 열려 있는 동안 쓸 상태 확인 (/health 응답이 200이면 복구로 판단)"""
+        async def probe() -> bool:
+            endpoint = self.breaker_endpoints.get(name)
+            if endpoint is None:
+                receiver = await self._resolve_receiver(name)
+                endpoint = receiver.endpoint if receiver else None
+            if not endpoint:
+                return False
+            async with http_pool.client(endpoint, "fast") as http_client:
+                response = await http_client.get(f"{endpoint}/health")
+            return response.status_code == 200
+        return probe
+
     async def _start_quantitative_analysis(self, session: Dict):
         """정량적 분석 시작"""
         print("📊 정량적 분석 단계 시작")
         ticker = session["ticker"]
         
         # UI 업데이트
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "quantitative-agent"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": f"📊 {ticker} 기술적 지표 분석 중..."})
+        await self._send_to_session(session, "status", {"agentId": "quantitative-agent"})
+        await self._send_to_session(session, "log", {"message": f"📊 {ticker} 기술적 지표 분석 중..."})
         
         try:
             # 정량적 분석 HTTP 호출
-            async with httpx.AsyncClient() as http_client:
+            async with http_pool.client("http://localhost:8211") as http_client:
                 print(f"📤 정량적 분석 HTTP 요청 전송 중...")
-                response = await http_client.post(
+                response = await self._guarded_post(
+                    http_client, "quantitative-agent",
                     "http://localhost:8211/quantitative_analysis",
                     json={"ticker": ticker},
                     headers={"X-API-Key": self.api_key},
@@ -1144,12 +1682,12 @@ class OrchestratorV2(BaseAgent):
                     session["quantitative_analysis"] = analysis
                     
                     # UI 업데이트
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"✅ 기술적 지표 분석 완료"
                     })
                     
                     # 정량적 분석 결과를 직접 UI로 전송
-                    await self._send_to_ui(session.get("client_id"), "agent_result", {
+                    await self._send_to_session(session, "agent_result", {
                         "agent_name": "quantitative_analysis",
                         "result": analysis
                     })
@@ -1158,7 +1696,7 @@ class OrchestratorV2(BaseAgent):
                     price_data = analysis.get("price_data", {})
                     if price_data:
                         # 전체 price_data를 포함하여 전송
-                        await self._send_chart_update(session.get("client_id"), "price_chart", {
+                        await self._send_chart_to_session(session, "price_chart", {
                             "ticker": ticker,
                             "price_data": price_data,  # 전체 데이터 전송
                             "current_price": price_data.get('current', 0),
@@ -1173,7 +1711,7 @@ class OrchestratorV2(BaseAgent):
                     # 기술적 지표 차트 데이터 전송
                     technical = analysis.get("technical_indicators", {})
                     if technical:
-                        await self._send_chart_update(session.get("client_id"), "technical_indicators", {
+                        await self._send_chart_to_session(session, "technical_indicators", {
                             "ticker": ticker,
                             "rsi": technical.get('rsi', 50),
                             "macd": technical.get('macd', 0),
@@ -1185,25 +1723,15 @@ class OrchestratorV2(BaseAgent):
                             "bollinger_lower": technical.get('bollinger_lower', 0)
                         })
                     
-                    # 다음 단계로 (점수 계산)
-                    session["state"] = "calculating_score"
-                    await self._start_score_calculation(session)
-                    
                 else:
                     print(f"❌ 정량적 분석 에이전트 오류: HTTP {response.status_code}")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 정량적 분석 실패"})
-                    # 실패해도 리포트 생성으로 진행
-                    session["state"] = "generating_report"
-                    await self._start_report_generation(session)
+                    await self._send_to_session(session, "log", {"message": "❌ 정량적 분석 실패"})
                     
         except Exception as e:
             print(f"❌ 정량적 분석 요청 중 오류: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"❌ 정량적 분석 오류: {str(e)}"
             })
-            # 오류가 나도 다음 단계로 진행
-            session["state"] = "generating_report"
-            await self._start_report_generation(session)
     
     async def _start_risk_analysis(self, session: Dict):
         """리스크 분석 시작"""
@@ -1211,8 +1739,8 @@ class OrchestratorV2(BaseAgent):
         ticker = session["ticker"]
         
         # UI 업데이트
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "risk-agent"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": f"⚠️ {ticker} 투자 리스크 분석 중..."})
+        await self._send_to_session(session, "status", {"agentId": "risk-agent"})
+        await self._send_to_session(session, "log", {"message": f"⚠️ {ticker} 투자 리스크 분석 중..."})
         
         try:
             # 리스크 분석을 위한 데이터 준비
@@ -1223,9 +1751,10 @@ class OrchestratorV2(BaseAgent):
             }
             
             # 리스크 분석 HTTP 호출
-            async with httpx.AsyncClient() as http_client:
+            async with http_pool.client("http://localhost:8212") as http_client:
                 print(f"📤 리스크 분석 HTTP 요청 전송 중...")
-                response = await http_client.post(
+                response = await self._guarded_post(
+                    http_client, "risk-agent",
                     "http://localhost:8212/risk_analysis",
                     json=request_data,
                     headers={"X-API-Key": self.api_key},
@@ -1244,208 +1773,89 @@ class OrchestratorV2(BaseAgent):
                     overall_score = session["risk_analysis"].get("overall_risk_score", 0)
                     
                     risk_emoji = "🟢" if risk_level == "Low" else "🟡" if risk_level == "Medium" else "🔴"
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"✅ 리스크 분석 완료: {risk_emoji} {risk_level} (점수: {overall_score:.2f})"
                     })
                     
-                    # 다음 단계로 (리포트 생성)
-                    session["state"] = "generating_report"
-                    await self._start_report_generation(session)
-                    
                 else:
                     print(f"❌ 리스크 분석 에이전트 오류: HTTP {response.status_code}")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 리스크 분석 실패"})
-                    # 실패해도 다음 단계로 진행
-                    session["state"] = "generating_report"
-                    await self._start_report_generation(session)
+                    await self._send_to_session(session, "log", {"message": "❌ 리스크 분석 실패"})
                     
         except Exception as e:
             print(f"❌ 리스크 분석 요청 중 오류: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {
+            await self._send_to_session(session, "log", {
                 "message": f"❌ 리스크 분석 오류: {str(e)}"
             })
-            # 오류가 나도 다음 단계로 진행
-            session["state"] = "generating_report"
-            await self._start_report_generation(session)
     
     async def _start_sentiment_analysis(self, session: Dict):
-        """감정 분석 시작"""
+        """감정 분석 마무리 (수집 도중 시작된 묶음 분석을 모두 기다려 결과 확정)"""
         print("🎯 감정 분석 단계 시작")
-        ticker = session["ticker"]
-        collected_data = session.get("collected_data", {})
+        session_id = session["session_id"]
+        feed = self._sentiment_feed(session)
         
-        # 세션 ID 찾기
-        session_id = None
-        for sid, sess in self.analysis_sessions.items():
-            if sess == session:
-                session_id = sid
-                break
-                
-        # 수집된 모든 데이터를 하나로 합치기
-        all_data = []
-        for source, data_list in collected_data.items():
-            if source == "mcp":
-                # MCP 데이터는 특별 처리
-                if isinstance(data_list, dict) and "data" in data_list:
-                    mcp_data = data_list["data"]
-                    # analyst_reports 처리
-                    if "analyst_reports" in mcp_data and "reports" in mcp_data["analyst_reports"]:
-                        for report in mcp_data["analyst_reports"]["reports"]:
-                            report["source"] = "mcp_analyst"
-                            all_data.append(report)
-                    # broker_recommendations를 텍스트로 변환
-                    if "broker_recommendations" in mcp_data:
-                        rec = mcp_data["broker_recommendations"]
-                        all_data.append({
-                            "source": "mcp_broker",
-                            "title": "Broker Recommendations",
-                            "text": f"추천 점수: {rec.get('recommendation_score', 0)}/5, Strong Buy: {rec.get('recommendations', {}).get('strong_buy', 0)}, Buy: {rec.get('recommendations', {}).get('buy', 0)}"
-                        })
-                    # insider_sentiment를 텍스트로 변환
-                    if "insider_sentiment" in mcp_data:
-                        sentiment = mcp_data["insider_sentiment"]
-                        all_data.append({
-                            "source": "mcp_insider",
-                            "title": "Insider Trading Sentiment",
-                            "text": f"내부자 순매수: ${sentiment.get('insider_trading', {}).get('net_buying', 0):,}, 기관 순매수: ${sentiment.get('institutional_flows', {}).get('net_flow', 0):,}"
-                        })
-            else:
-                # 일반 데이터 처리
-                for item in data_list:
-                    item["source"] = source  # 소스 정보 추가
-                    all_data.append(item)
+        # 아직 넘기지 않은 항목을 마저 넘김 (이미 넘긴 항목은 무시됨, 정족수 시점에 오지 않은 소스는 도착 시 합류)
+        late_sources = session.get("late_sources", ())
+        for source, data_list in session.get("collected_data", {}).items():
+            if source not in late_sources:
+                self._feed_sentiment(session, source, data_list)
                 
-        print(f"📊 분석할 데이터:")
-        print(f"   - 총 {len(all_data)}개 항목")
-        for source in collected_data:
-            if source == "mcp":
-                count = self._count_mcp_data(collected_data[source])
-                print(f"   - {source}: {count}개")
-            else:
-                print(f"   - {source}: {len(collected_data[source])}개")
-            
-        if not all_data:
+        print(f"📊 분석할 데이터: 총 {feed.fed}개 항목 (수집 중 시작된 묶음 {feed.batches}개)")
+        if not feed.fed:
             print("⚠️ 분석할 데이터가 없습니다")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": "⚠️ 분석할 데이터가 없습니다"})
+            await self._send_to_session(session, "log", {"message": "⚠️ 분석할 데이터가 없습니다"})
+            self.sentiment_feeds.pop(session_id, None)
+            feed.cancel()
             return
             
-        # 감정 분석 직접 HTTP 호출
-        print("🔎 감정 분석 에이전트 직접 호출...")
-        
         # UI 업데이트
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "sentiment-agent"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": f"🎯 감정 분석 시작: {len(all_data)}개 항목"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": "⏳ AI 감성 분석 중입니다. 시간이 소요될 수 있습니다..."})
+        await self._send_to_session(session, "status", {"agentId": "sentiment-agent"})
+        await self._send_to_session(session, "log", {"message": f"🎯 감정 분석 진행 중: {feed.fed}개 항목 (분석이 끝나는 대로 표시)"})
         
-        try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=10.0)) as http_client:
-                print(f"📤 감정 분석 HTTP 요청 전송 중...")
-                print(f"   - URL: http://localhost:8202/analyze_sentiment")
-                print(f"   - Ticker: {ticker}")
-                print(f"   - Data sources: {list(collected_data.keys())}")
-                print(f"   - API Key: {self.api_key[:10]}...") # 디버깅용
-                
-                response = await http_client.post(
-                    "http://localhost:8202/analyze_sentiment",
-                    json={
-                        "ticker": ticker,
-                        "data": collected_data  # 딕셔너리 형태로 전송
-                    },
-                    headers={"X-API-Key": self.api_key}
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    print(f"✅ 감정 분석 응답 받음")
-                    
-                    # 감정 분석 결과 저장
-                    session["sentiment_analysis"] = result.get("analyzed_results", [])
-                    
-                    # UI 업데이트
-                    success_count = result.get("success_count", 0)
-                    await self._send_to_ui(session.get("client_id"), "log", {
-                        "message": f"✅ 감정 분석 완료: {success_count}개 항목 분석"
-                    })
-                    
-                    # 각 분석 결과의 요약 출력
-                    sentiment_chart_data = []
-                    for ticker_data in session["sentiment_analysis"]:
-                        source = ticker_data.get("source", "unknown")
-                        score = ticker_data.get("score", 0)
-                        # None 값 처리
-                        if score is None:
-                            score = 0
-                        
-                        # 점수를 기반으로 레이블 결정
-                        if score > 0.1:
-                            label = "positive"
-                        elif score < -0.1:
-                            label = "negative"
-                        else:
-                            label = "neutral"
-                        
-                        emoji = "🟢" if label == "positive" else "🔴" if label == "negative" else "🟡"
-                        await self._send_to_ui(session.get("client_id"), "log", {
-                            "message": f"  {emoji} {source}: {label} (점수: {score:.2f})"
-                        })
-                        
-                        # 차트용 데이터 수집
-                        sentiment_chart_data.append({
-                            "source": source,
-                            "score": score,
-                            "label": label,
-                            "summary": ticker_data.get("summary", "")[:100]  # 요약은 100자로 제한
-                        })
-                    
-                    # 감성 분석 차트 데이터 전송
-                    if sentiment_chart_data:
-                        await self._send_chart_update(session.get("client_id"), "sentiment_analysis", {
-                            "ticker": ticker,
-                            "sentiments": sentiment_chart_data,
-                            "average_score": sum(d["score"] for d in sentiment_chart_data) / len(sentiment_chart_data) if sentiment_chart_data else 0
-                        })
-                    
-                    # 다음 단계로 진행 (정량적 분석)
-                    session["state"] = "quantitative_analysis"
-                    await self._start_quantitative_analysis(session)
-                    
-                else:
-                    error_detail = response.text
-                    print(f"❌ 감정 분석 오류: HTTP {response.status_code}")
-                    print(f"   - 오류 상세: {error_detail}")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": f"❌ 감정 분석 오류: {error_detail}"})
-                    
-        except httpx.TimeoutException as e:
-            print(f"❌ 감정 분석 타임아웃: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 감정 분석 시간 초과 (AI 분석에 시간이 많이 소요됨)"})
-            # 타임아웃이어도 기본 점수로 진행
-            # 수집된 데이터를 기본 점수로 변환
-            default_sentiments = []
-            for source, items in collected_data.items():
-                for item in items:
-                    default_sentiments.append({
-                        "ticker": ticker,
-                        "source": source,
-                        "title": item.get("title", ""),
-                        "content": item.get("content", ""),
-                        "score": -0.3 if source == "sec" else -0.5,  # 기본 부정적 점수
-                        "summary": "AI 분석 시간 초과로 기본값 사용"
-                    })
-            session["sentiment_analysis"] = default_sentiments
-            # 다음 단계로 진행
-            session["state"] = "quantitative_analysis"
-            await self._start_quantitative_analysis(session)
-        except httpx.ConnectError as e:
-            print(f"❌ 감정 분석 연결 실패: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 감정 분석 에이전트 연결 실패"})
-            # 연결 실패해도 다음 단계로 진행
-            session["state"] = "quantitative_analysis"
-            await self._start_quantitative_analysis(session)
-        except Exception as e:
-            print(f"❌ 감정 분석 예외 발생: {e}")
-            import traceback
-            traceback.print_exc()
-            await self._send_to_ui(session.get("client_id"), "log", {"message": f"❌ 감정 분석 오류: {str(e)}"})
+        results = await feed.close()
+        if self.sentiment_feeds.get(session_id) is feed:
+            del self.sentiment_feeds[session_id]
+        # 잠정 프레임이 최종 차트 뒤에 도착하지 않도록 먼저 정리
+        self._drop_sentiment_progress(session_id)
+        session["sentiment_analysis"] = results
+        
+        success_count = sum(1 for result in results if result.get("score") is not None)
+        print(f"✅ 감정 분석 완료: {success_count}/{len(results)}")
+        await self._send_to_session(session, "log", {
+            "message": f"✅ 감정 분석 완료: {success_count}개 항목 분석"
+        })
+        
+        # 감성 분석 차트 데이터 전송
+        await self._send_sentiment_chart(session)
+            
+    @staticmethod
+    def _sentiment_chart_entry(ticker_data: Dict) -> Dict:
+        """감정 분석 결과 한 건 → 차트 항목 (점수로 레이블 결정)"""
+        score = ticker_data.get("score", 0)
+        # None 값 처리
+        if score is None:
+            score = 0
+        if score > 0.1:
+            label = "positive"
+        elif score < -0.1:
+            label = "negative"
+        else:
+            label = "neutral"
+        return {
+            "source": ticker_data.get("source", "unknown"),
+            "score": score,
+            "label": label,
+            "summary": (ticker_data.get("summary") or "")[:100]  # 요약은 100자로 제한
+        }
+        
+    async def _send_sentiment_chart(self, session: Dict):
+        """지금까지의 감정 분석 결과로 차트 갱신"""
+        sentiment_chart_data = [self._sentiment_chart_entry(item) for item in session.get("sentiment_analysis") or []]
+        if sentiment_chart_data:
+            await self._send_chart_to_session(session, "sentiment_analysis", {
+                "ticker": session["ticker"],
+                "sentiments": sentiment_chart_data,
+                "average_score": sum(d["score"] for d in sentiment_chart_data) / len(sentiment_chart_data)
+            })
             
     async def _start_score_calculation(self, session: Dict):
         """점수 계산 시작"""
@@ -1454,30 +1864,27 @@ class OrchestratorV2(BaseAgent):
         sentiment_analysis = session.get("sentiment_analysis", [])
         
         # 세션 ID 찾기
-        session_id = None
-        for sid, sess in self.analysis_sessions.items():
-            if sess == session:
-                session_id = sid
-                break
+        session_id = session.get("session_id")
                 
         if not sentiment_analysis:
             print("⚠️ 점수 계산할 감정 분석 데이터가 없습니다")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": "⚠️ 점수 계산할 데이터가 없습니다"})
+            await self._send_to_session(session, "log", {"message": "⚠️ 점수 계산할 데이터가 없습니다"})
             return
             
         # 점수 계산 직접 HTTP 호출
         print("🔎 점수 계산 에이전트 직접 호출...")
         
         # UI 업데이트
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "score-agent"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": f"📊 가중치 기반 점수 계산 시작"})
+        await self._send_to_session(session, "status", {"agentId": "score-agent"})
+        await self._send_to_session(session, "log", {"message": f"📊 가중치 기반 점수 계산 시작"})
         
         try:
-            async with httpx.AsyncClient() as http_client:
+            async with http_pool.client("http://localhost:8203") as http_client:
                 print(f"📤 점수 계산 HTTP 요청 전송 중...")
                 print(f"📊 전송할 감정 분석 데이터: {len(sentiment_analysis)}개 항목")
                 
-                response = await http_client.post(
+                response = await self._guarded_post(
+                    http_client, "score-agent",
                     "http://localhost:8203/calculate_score",
                     json={
                         "ticker": ticker,
@@ -1500,17 +1907,17 @@ class OrchestratorV2(BaseAgent):
                     weighted_scores = result.get("weighted_scores", {})
                     
                     emoji = "🟢" if final_label == "positive" else "🔴" if final_label == "negative" else "🟡"
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"✅ 점수 계산 완료"
                     })
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"{emoji} 최종 점수: {final_score:.2f} ({final_label})"
                     })
                     
                     # 가중치 적용된 점수 출력
                     score_breakdown = []
                     for source, score_info in weighted_scores.items():
-                        await self._send_to_ui(session.get("client_id"), "log", {
+                        await self._send_to_session(session, "log", {
                             "message": f"  - {source}: {score_info.get('weighted_score', 0):.2f} (가중치: {score_info.get('weight', 0)})"
                         })
                         score_breakdown.append({
@@ -1521,7 +1928,7 @@ class OrchestratorV2(BaseAgent):
                         })
                     
                     # 최종 점수 차트 데이터 전송
-                    await self._send_chart_update(session.get("client_id"), "final_score", {
+                    await self._send_chart_to_session(session, "final_score", {
                         "ticker": ticker,
                         "final_score": final_score,
                         "final_label": final_label,
@@ -1529,17 +1936,13 @@ class OrchestratorV2(BaseAgent):
                         "weighted_scores": weighted_scores
                     })
                     
-                    # 다음 단계로 진행 (리스크 분석)
-                    session["state"] = "risk_analysis"
-                    await self._start_risk_analysis(session)
-                    
                 else:
                     print(f"❌ 점수 계산 오류: HTTP {response.status_code}")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 점수 계산 오류"})
+                    await self._send_to_session(session, "log", {"message": "❌ 점수 계산 오류"})
                     
         except Exception as e:
             print(f"❌ 점수 계산 연결 실패: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": f"❌ 점수 계산 연결 실패: {str(e)}"})
+            await self._send_to_session(session, "log", {"message": f"❌ 점수 계산 연결 실패: {str(e)}"})
             
     async def _start_risk_analysis(self, session: Dict):
         """리스크 분석 시작"""
@@ -1547,8 +1950,8 @@ class OrchestratorV2(BaseAgent):
         ticker = session["ticker"]
         
         # UI 업데이트
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "risk-agent"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": f"⚠️ 리스크 분석 시작"})
+        await self._send_to_session(session, "status", {"agentId": "risk-agent"})
+        await self._send_to_session(session, "log", {"message": f"⚠️ 리스크 분석 시작"})
         
         # 리스크 분석에 필요한 데이터 준비
         quantitative_data = session.get("quantitative_analysis", {})
@@ -1559,10 +1962,11 @@ class OrchestratorV2(BaseAgent):
         print(f"   - Sentiment data count: {len(sentiment_data) if sentiment_data else 0}")
         
         try:
-            async with httpx.AsyncClient() as http_client:
+            async with http_pool.client("http://localhost:8212") as http_client:
                 print(f"📤 리스크 분석 HTTP 요청 전송 중...")
                 
-                response = await http_client.post(
+                response = await self._guarded_post(
+                    http_client, "risk-agent",
                     "http://localhost:8212/risk_analysis",
                     json={
                         "ticker": ticker,
@@ -1594,10 +1998,10 @@ class OrchestratorV2(BaseAgent):
                         "very_high": "🔴"
                     }.get(risk_level, "🟡")
                     
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"✅ 리스크 분석 완료"
                     })
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"{risk_emoji} 종합 리스크 점수: {overall_score:.1f}/100 ({risk_level})"
                     })
                     
@@ -1607,33 +2011,33 @@ class OrchestratorV2(BaseAgent):
                     sentiment_risk = risk_analysis.get("sentiment_risk", {})
                     liquidity_risk = risk_analysis.get("liquidity_risk", {})
                     
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"  - 시장 리스크: {market_risk.get('score', 0):.1f}/100"
                     })
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"  - 기업 리스크: {company_risk.get('score', 0):.1f}/100"
                     })
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"  - 감성 리스크: {sentiment_risk.get('score', 0):.1f}/100"
                     })
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"  - 유동성 리스크: {liquidity_risk.get('score', 0):.1f}/100"
                     })
                     
                     # 권고사항 출력
                     recommendations = risk_analysis.get("recommendations", [])
                     if recommendations:
-                        await self._send_to_ui(session.get("client_id"), "log", {
+                        await self._send_to_session(session, "log", {
                             "message": "📋 리스크 권고사항:"
                         })
                         for rec in recommendations[:3]:  # 상위 3개만
                             priority_emoji = "🔴" if rec.get("priority") == "high" else "🟡" if rec.get("priority") == "medium" else "🟢"
-                            await self._send_to_ui(session.get("client_id"), "log", {
+                            await self._send_to_session(session, "log", {
                                 "message": f"  {priority_emoji} {rec.get('action', '')}: {rec.get('reason', '')}"
                             })
                     
                     # 리스크 분석 차트 데이터 전송
-                    await self._send_chart_update(session.get("client_id"), "risk_analysis", {
+                    await self._send_chart_to_session(session, "risk_analysis", {
                         "ticker": ticker,
                         "overall_risk_score": overall_score,
                         "risk_level": risk_level,
@@ -1646,25 +2050,15 @@ class OrchestratorV2(BaseAgent):
                         "recommendations": recommendations[:3]  # 상위 3개만
                     })
                     
-                    # 다음 단계로 진행 (트렌드 분석)
-                    session["state"] = "trend_analysis"
-                    await self._start_trend_analysis(session)
-                    
                 else:
                     print(f"❌ 리스크 분석 오류: HTTP {response.status_code}")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 리스크 분석 오류"})
-                    # 오류가 있어도 트렌드 분석으로 진행
-                    session["state"] = "trend_analysis"
-                    await self._start_trend_analysis(session)
+                    await self._send_to_session(session, "log", {"message": "❌ 리스크 분석 오류"})
                     
         except Exception as e:
             print(f"❌ 리스크 분석 연결 실패: {e}")
             import traceback
             traceback.print_exc()
-            await self._send_to_ui(session.get("client_id"), "log", {"message": f"❌ 리스크 분석 연결 실패: {str(e)}"})
-            # 오류가 있어도 트렌드 분석으로 진행
-            session["state"] = "trend_analysis"
-            await self._start_trend_analysis(session)
+            await self._send_to_session(session, "log", {"message": f"❌ 리스크 분석 연결 실패: {str(e)}"})
     
     async def _start_trend_analysis(self, session: Dict):
         """트렌드 분석 시작"""
@@ -1672,8 +2066,8 @@ class OrchestratorV2(BaseAgent):
         ticker = session["ticker"]
         
         # UI 업데이트
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "trend-agent"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": f"📈 과거 데이터 기반 트렌드 분석 시작"})
+        await self._send_to_session(session, "status", {"agentId": "trend-agent"})
+        await self._send_to_session(session, "log", {"message": f"📈 과거 데이터 기반 트렌드 분석 시작"})
         
         # 트렌드 분석에 필요한 과거 데이터 준비 (실제로는 다른 소스에서 가져와야 함)
         # 여기서는 예시로 빈 데이터를 사용
@@ -1692,10 +2086,11 @@ class OrchestratorV2(BaseAgent):
             historical_data["technical_indicators"] = quant_data.get("technical_indicators", {})
         
         try:
-            async with httpx.AsyncClient() as http_client:
+            async with http_pool.client("http://localhost:8214") as http_client:
                 print(f"📤 트렌드 분석 HTTP 요청 전송 중...")
                 
-                response = await http_client.post(
+                response = await self._guarded_post(
+                    http_client, "trend-agent",
                     "http://localhost:8214/analyze_trend",
                     json={
                         "ticker": ticker,
@@ -1722,55 +2117,45 @@ class OrchestratorV2(BaseAgent):
                     # 트렌드 방향 이모지
                     trend_emoji = "📈" if price_trend.get("trend") == "상승" else "📉" if price_trend.get("trend") == "하락" else "➡️"
                     
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"✅ 트렌드 분석 완료"
                     })
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"{trend_emoji} 가격 트렌드: {price_trend.get('trend', '알 수 없음')} (강도: {price_trend.get('strength', 0):.2f})"
                     })
                     
                     # 변동성 정보
                     vol_level = volatility.get("volatility_level", "알 수 없음")
                     vol_emoji = "🟢" if vol_level == "낮음" else "🟡" if vol_level == "보통" else "🔴"
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"{vol_emoji} 변동성: {vol_level} (연환산 {volatility.get('annual_volatility', 0):.1f}%)"
                     })
                     
                     # 종합 전망
                     overall_trend = summary.get("overall_trend", "중립적")
                     trend_emoji = "🟢" if overall_trend == "긍정적" else "🔴" if overall_trend == "부정적" else "🟡"
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": f"{trend_emoji} 종합 전망: {overall_trend}"
                     })
                     
                     # 주요 인사이트
                     insights = summary.get("key_insights", [])
                     if insights:
-                        await self._send_to_ui(session.get("client_id"), "log", {
+                        await self._send_to_session(session, "log", {
                             "message": "💡 주요 인사이트:"
                         })
                         for insight in insights[:3]:  # 상위 3개만
-                            await self._send_to_ui(session.get("client_id"), "log", {
+                            await self._send_to_session(session, "log", {
                                 "message": f"  - {insight}"
                             })
                     
-                    # 다음 단계로 진행 (리포트 생성)
-                    session["state"] = "generating_report"
-                    await self._start_report_generation(session)
-                    
                 else:
                     print(f"❌ 트렌드 분석 오류: HTTP {response.status_code}")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 트렌드 분석 오류"})
-                    # 오류가 있어도 리포트 생성으로 진행
-                    session["state"] = "generating_report"
-                    await self._start_report_generation(session)
+                    await self._send_to_session(session, "log", {"message": "❌ 트렌드 분석 오류"})
                     
         except Exception as e:
             print(f"❌ 트렌드 분석 연결 실패: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": f"❌ 트렌드 분석 연결 실패: {str(e)}"})
-            # 오류가 있어도 리포트 생성으로 진행
-            session["state"] = "generating_report"
-            await self._start_report_generation(session)
+            await self._send_to_session(session, "log", {"message": f"❌ 트렌드 분석 연결 실패: {str(e)}"})
     
     async def _start_report_generation(self, session: Dict):
         """리포트 생성 시작"""
@@ -1781,19 +2166,15 @@ class OrchestratorV2(BaseAgent):
         score_calculation = session.get("score_calculation", {})
         
         # 세션 ID 찾기
-        session_id = None
-        for sid, sess in self.analysis_sessions.items():
-            if sess == session:
-                session_id = sid
-                break
+        session_id = session.get("session_id")
                 
         # 리포트 생성 직접 HTTP 호출
         print("🔎 리포트 생성 에이전트 직접 호출...")
         
         # UI 업데이트
-        await self._send_to_ui(session.get("client_id"), "status", {"agentId": "report-agent"})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": f"📝 투자 분석 보고서 생성 중..."})
-        await self._send_to_ui(session.get("client_id"), "log", {"message": "⏳ AI가 종합 보고서를 작성 중입니다. 시간이 소요될 수 있습니다..."})
+        await self._send_to_session(session, "status", {"agentId": "report-agent"})
+        await self._send_to_session(session, "log", {"message": f"📝 투자 분석 보고서 생성 중..."})
+        await self._send_to_session(session, "log", {"message": "⏳ AI가 종합 보고서를 작성 중입니다. 시간이 소요될 수 있습니다..."})
         
         # 리포트 생성을 위한 데이터 준비
         # score_calculation에서 추가 정보 추출
@@ -1840,7 +2221,7 @@ class OrchestratorV2(BaseAgent):
         }
         
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(90.0, connect=10.0)) as http_client:
+            async with http_pool.client("http://localhost:8204", "report") as http_client:
                 print(f"📤 리포트 생성 HTTP 요청 전송 중...")
                 print(f"   - Ticker: {ticker}")
                 print(f"   - Final Score: {final_score}")
@@ -1854,7 +2235,8 @@ class OrchestratorV2(BaseAgent):
                 url = f"http://localhost:8204/{endpoint}"
                 print(f"   - URL: {url}")
                 
-                response = await http_client.post(
+                response = await self._guarded_post(
+                    http_client, "report-agent",
                     url,
                     json=report_data,
                     headers={"X-API-Key": self.api_key}
@@ -1870,12 +2252,12 @@ class OrchestratorV2(BaseAgent):
                     # PDF 경로가 있으면 저장
                     if "pdf_path" in result:
                         session["pdf_path"] = result["pdf_path"]
-                        await self._send_to_ui(session.get("client_id"), "log", {
+                        await self._send_to_session(session, "log", {
                             "message": f"📄 PDF 저장 완료: {result['pdf_path']}"
                         })
                     
                     # UI에 최종 결과 전송
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": "✅ 분석 보고서 생성 완료!"
                     })
                     
@@ -1898,30 +2280,33 @@ class OrchestratorV2(BaseAgent):
                     if "pdf_path" in session:
                         final_result["pdf_path"] = session["pdf_path"]
                     
-                    await self._send_to_ui(session.get("client_id"), "result", final_result)
+                    await self._send_to_session(session, "result", final_result)
                     
                     # 분석 완료 상태
                     session["state"] = "completed"
-                    await self._send_to_ui(session.get("client_id"), "log", {
+                    await self._send_to_session(session, "log", {
                         "message": "🎉 전체 분석 프로세스 완료!"
                     })
                     
+                    # 수집 데이터/원본 결과를 버리고 요약 + 리포트 위치만 보관
+                    await self._complete_session(session)
+                    
                 else:
                     print(f"❌ 리포트 생성 오류: HTTP {response.status_code}")
                     print(f"   - Response: {response.text[:500]}")
-                    await self._send_to_ui(session.get("client_id"), "log", {"message": f"❌ 리포트 생성 오류 (HTTP {response.status_code})"})
+                    await self._send_to_session(session, "log", {"message": f"❌ 리포트 생성 오류 (HTTP {response.status_code})"})
                     
         except httpx.TimeoutException as e:
             print(f"❌ 리포트 생성 타임아웃: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 리포트 생성 시간 초과"})
+            await self._send_to_session(session, "log", {"message": "❌ 리포트 생성 시간 초과"})
         except httpx.ConnectError as e:
             print(f"❌ 리포트 생성 연결 실패: {e}")
-            await self._send_to_ui(session.get("client_id"), "log", {"message": "❌ 리포트 생성 에이전트 연결 실패"})
+            await self._send_to_session(session, "log", {"message": "❌ 리포트 생성 에이전트 연결 실패"})
         except Exception as e:
             print(f"❌ 리포트 생성 예외 발생: {e}")
             import traceback
             traceback.print_exc()
-            await self._send_to_ui(session.get("client_id"), "log", {"message": f"❌ 리포트 생성 오류: {str(e)}"})
+            await self._send_to_session(session, "log", {"message": f"❌ 리포트 생성 오류: {str(e)}"})
             
     async def _handle_event(self, event_type: str, message: A2AMessage):
         """이벤트 처리"""
@@ -1950,12 +2335,12 @@ class OrchestratorV2(BaseAgent):
             for session_id, session in self.analysis_sessions.items():
                 if session.get("ticker") == ticker:
                     try:
-                        await self._send_to_ui(session.get("client_id"), "log", {
+                        await self._send_to_session(session, "log", {
                             "message": "🎉 전체 분석 프로세스 완료!"
                         })
                         
                         # report_generated 타입으로 최종 리포트 전송
-                        await self._send_to_ui(session.get("client_id"), "report_generated", {
+                        await self._send_to_session(session, "report_generated", {
                             "report": report,  # 이벤트에서 받은 실제 리포트 사용
                             "ticker": ticker,
                             "recommendation": recommendation,
@@ -2017,6 +2402,27 @@ class OrchestratorV2(BaseAgent):
             import traceback
             traceback.print_exc()
     
+    async def _send_to_session(self, session: Dict, msg_type: str, payload: Dict[str, Any]):
+        """세션의 UI로 메시지 전송 (공유 실행의 leader면 합류 세션에도 전송하고 재생용으로 기록)"""
+        if session.get("client_id"):
+            await self._send_to_ui(session["client_id"], msg_type, payload)
+
+        run = self.shared_runs.run_of(session.get("session_id"))
+        if run is None or run.leader_id != session.get("session_id"):
+            return
+        self.shared_runs.record(run, msg_type, payload)
+        for follower_id in list(run.followers):
+            follower = self.analysis_sessions.get(follower_id)
+            if follower and follower.get("client_id"):
+                await self._send_to_ui(follower["client_id"], msg_type, payload)
+    
+    async def _send_chart_to_session(self, session: Dict, chart_type: str, data: Dict[str, Any]):
+        """세션의 UI로 차트 업데이트 전송"""
+        await self._send_to_session(session, "chart_update", {
+            "chart_type": chart_type,
+            "data": data
+        })
+    
     async def _send_chart_update(self, client_id: str, chart_type: str, data: Dict[str, Any]):
         """차트 업데이트 데이터 전송"""
         try:
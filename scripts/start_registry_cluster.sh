@@ -0,0 +1,31 @@
+#!/bin/bash
+
+# 레지스트리 복제본 3개를 한 머신의 서로 다른 포트에서 실행
+# 에이전트는 A2A_REGISTRY_URLS로 목록을 받아 장애 시 다음 복제본으로 전환한다
+
+cd "$(dirname "$0")/.."
+
+PORTS=(8001 8011 8021)
+
+echo "🚀 레지스트리 클러스터 시작: ${PORTS[*]}"
+for PORT in "${PORTS[@]}"; do
+    PEERS=""
+    for PEER in "${PORTS[@]}"; do
+        if [ "$PEER" != "$PORT" ]; then
+            PEERS="${PEERS:+$PEERS,}http://localhost:$PEER"
+        fi
+    done
+    A2A_REGISTRY_REPLICA_ID="registry-$PORT" \
+    A2A_REGISTRY_PEERS="$PEERS" \
+    A2A_REGISTRY_STATE_DIR="data/registry/$PORT" \
+        uvicorn a2a_core.registry.registry_server:app --port "$PORT" --log-level error > /dev/null 2>&1 &
+    echo "   - registry-$PORT (PID $!, peers: $PEERS)"
+done
+
+URLS=""
+for PORT in "${PORTS[@]}"; do
+    URLS="${URLS:+$URLS,}http://localhost:$PORT"
+done
+echo ""
+echo "에이전트 실행 전에 설정하세요:"
+echo "   export A2A_REGISTRY_URLS=$URLS"
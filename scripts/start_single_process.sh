@@ -0,0 +1,7 @@
+#!/bin/bash
+
+echo "🚀 A2A Sentiment Analysis System 단일 프로세스 모드 시작..."
+echo "   (레지스트리 + 전체 에이전트를 한 이벤트 루프에서 실행, 에이전트 간 메시지는 인프로세스 버스로 전달)"
+
+cd "$(dirname "$0")/.."
+python -m a2a_core.launcher "$@"
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+A2A 메시지 인코딩/디코딩 벤치마크
+기존 경로(to_dict + json + pydantic 검증)와 신뢰 디코딩/msgpack 봉투 경로 비교
+
+사용법: python test_scripts/bench_message_codec.py [반복 횟수]
+"""
+
+import os
+import sys
+import json
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from a2a_core.protocols.message import A2AMessage
+from a2a_core.protocols.codec import (
+    WIRE_JSON, WIRE_MSGPACK, supported_wire_formats,
+    encode_message, decode_message
+)
+
+# 대표 메시지 크기: 제어 메시지 ~ SEC/뉴스 대용량 페이로드
+BODY_SIZES = [("1KB", 1), ("10KB", 10), ("100KB", 100), ("500KB", 500)]
+
+
+def make_message(kb: int) -> A2AMessage:
+    """약 kb 킬로바이트 크기의 body를 가진 메시지 생성"""
+    items = [
+        {"title": f"filing {i}", "content": "가" * 300, "score": 0.1 * (i % 10)}
+        for i in range(kb)
+    ]
+    return A2AMessage.create_request(
+        sender_id="sec-agent-v2",
+        receiver_id="orchestrator",
+        action="collect_data",
+        payload={"ticker": "AAPL", "data": items}
+    )
+
+
+def timeit(func, iterations: int) -> float:
+    """평균 실행 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def run(iterations: int):
+    print("📊 A2A 메시지 코덱 벤치마크")
+    print(f"   - 반복 횟수: {iterations}")
+    print(f"   - 사용 가능 포맷: {supported_wire_formats()}")
+    print("=" * 96)
+    print(f"{'size':>6} | {'path':<28} | {'bytes':>9} | {'encode µs':>10} | {'decode µs':>10} | {'route µs':>9}")
+    print("-" * 96)
+
+    for label, kb in BODY_SIZES:
+        message = make_message(kb)
+
+        # 1) 기존 경로: to_dict → json.dumps / json.loads → A2AMessage(**data)
+        legacy_raw = json.dumps(message.to_dict()).encode()
+        encode_us = timeit(lambda: json.dumps(message.to_dict()).encode(), iterations)
+        decode_us = timeit(lambda: A2AMessage(**json.loads(legacy_raw)), iterations)
+        print(f"{label:>6} | {'legacy json + validate':<28} | {len(legacy_raw):>9} | {encode_us:>10.1f} | {decode_us:>10.1f} | {decode_us:>9.1f}")
+
+        # 2) JSON + 신뢰 디코딩 (검증 생략)
+        raw = encode_message(message, WIRE_JSON)
+        encode_us = timeit(lambda: encode_message(message, WIRE_JSON), iterations)
+        decode_us = timeit(lambda: decode_message(raw, WIRE_JSON, trusted=True), iterations)
+        print(f"{label:>6} | {'json (orjson) + trusted':<28} | {len(raw):>9} | {encode_us:>10.1f} | {decode_us:>10.1f} | {decode_us:>9.1f}")
+
+        # 3) msgpack 봉투: 라우팅(헤더)만 / 전체 디코딩
+        if WIRE_MSGPACK in supported_wire_formats():
+            raw = encode_message(message, WIRE_MSGPACK)
+            encode_us = timeit(lambda: encode_message(message, WIRE_MSGPACK), iterations)
+            route_us = timeit(lambda: decode_message(raw, WIRE_MSGPACK), iterations)
+            decode_us = timeit(lambda: decode_message(raw, WIRE_MSGPACK).to_message(), iterations)
+            print(f"{label:>6} | {'msgpack envelope (lazy body)':<28} | {len(raw):>9} | {encode_us:>10.1f} | {decode_us:>10.1f} | {route_us:>9.1f}")
+
+        print("-" * 96)
+
+    print("route µs: 수신 측이 헤더로 라우팅/우선순위/만료 판단을 끝내기까지의 비용")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
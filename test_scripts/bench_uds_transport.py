@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+A2A 제어 메시지 전송 지연 벤치마크
+같은 앱을 TCP 루프백과 UDS로 각각 서비스하고 작은 /message 요청의 p50/p99 비교
+
+사용법: python test_scripts/bench_uds_transport.py [요청 수]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from a2a_core.protocols.message import A2AMessage
+from a2a_core.base.uds_transport import LocalRoutingTransport, EmbeddedUDSServer, uds_path_for
+
+TCP_PORT = 18999
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/message")
+    async def receive_message(message: dict):
+        return {"status": "accepted"}
+
+    return app
+
+
+def percentile(samples, p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def measure(client: httpx.AsyncClient, payload: dict, count: int):
+    # 워밍업 (연결 수립 제외)
+    for _ in range(50):
+        await client.post(f"http://localhost:{TCP_PORT}/message", json=payload)
+
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await client.post(f"http://localhost:{TCP_PORT}/message", json=payload)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+async def run(count: int):
+    app = make_app()
+    tcp_server = uvicorn.Server(uvicorn.Config(app, port=TCP_PORT, log_level="error"))
+    tcp_task = asyncio.create_task(tcp_server.serve())
+    uds_server = EmbeddedUDSServer(app, uds_path_for(TCP_PORT, tempfile.mkdtemp(prefix="a2a-")))
+    await uds_server.start()
+    while not tcp_server.started:
+        await asyncio.sleep(0.01)
+
+    # 오케스트레이터 트래픽 대부분을 차지하는 작은 제어 메시지
+    payload = A2AMessage.create_request(
+        sender_id="orchestrator",
+        receiver_id="nlu-agent",
+        action="extract_ticker",
+        payload={"query": "애플 주가 어때?"}
+    ).to_dict()
+
+    print("📊 A2A 제어 메시지 전송 지연 (µs)")
+    print(f"   - 요청 수: {count}")
+    print("=" * 56)
+    print(f"{'transport':<12} | {'p50':>10} | {'p99':>10} | {'mean':>10}")
+    print("-" * 56)
+
+    async with httpx.AsyncClient() as client:
+        samples = await measure(client, payload, count)
+        print(f"{'tcp':<12} | {percentile(samples, 0.5):>10.1f} | {percentile(samples, 0.99):>10.1f} | {sum(samples) / len(samples):>10.1f}")
+
+    transport = LocalRoutingTransport()
+    transport.add_route(f"http://localhost:{TCP_PORT}", uds_server.uds_path)
+    async with httpx.AsyncClient(transport=transport) as client:
+        samples = await measure(client, payload, count)
+        print(f"{'uds':<12} | {percentile(samples, 0.5):>10.1f} | {percentile(samples, 0.99):>10.1f} | {sum(samples) / len(samples):>10.1f}")
+
+    await uds_server.stop()
+    tcp_server.should_exit = True
+    await tcp_task
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -3,6 +3,7 @@ pytest 설정 및 공통 fixtures
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import sys
 import os
@@ -14,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from httpx import AsyncClient
 from a2a_core.protocols.message import A2AMessage, MessageType, Priority
 from a2a_core.registry.service_registry import ServiceRegistry, AgentInfo
+from a2a_core.registry.registry_server import RegisterRequest
 
 
 @pytest.fixture(scope="session")
@@ -24,14 +26,14 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def service_registry():
     """서비스 레지스트리 fixture"""
     registry = ServiceRegistry()
     yield registry
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def http_client() -> AsyncGenerator[AsyncClient, None]:
     """HTTP 클라이언트 fixture"""
     async with AsyncClient(base_url="http://localhost:8001") as client:
@@ -57,6 +59,17 @@ def sample_agent_info():
     )
 
 
+def make_register_request(agent_id: str, port: int = 9999, capability: str = "analyze") -> RegisterRequest:
+    """레지스트리 서버 등록 요청 (registry_server 테스트 공용)"""
+    return RegisterRequest(
+        agent_id=agent_id,
+        name=f"Agent {agent_id}",
+        description="레지스트리 테스트",
+        endpoint=f"http://localhost:{port}",
+        capabilities=[{"name": capability}]
+    )
+
+
 @pytest.fixture
 def sample_message():
     """샘플 A2A 메시지"""
@@ -68,7 +81,7 @@ def sample_message():
     )
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def mock_agent_server(unused_tcp_port_factory):
     """목업 에이전트 서버"""
     from fastapi import FastAPI
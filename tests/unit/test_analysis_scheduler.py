@@ -0,0 +1,72 @@
+"""
+분석 단계 전역 스케줄러 단위 테스트
+"""
+
+import asyncio
+import pytest
+from utils.analysis_scheduler import BATCH, INTERACTIVE, FairScheduler, StageGate, TokenBucket
+
+
+class TestStageGate:
+    """단계 동시 실행 상한 + 공정 분배 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limit_and_weighted_order(self):
+        """상한을 넘지 않고, 대기 중에는 가중치 비율(3:1)대로 배분"""
+        gate = StageGate(1, {INTERACTIVE: 3.0, BATCH: 1.0})
+        await gate.acquire(BATCH)
+        order = []
+
+        async def run(traffic):
+            await gate.acquire(traffic)
+            order.append(traffic)
+            assert gate.active == 1
+            await asyncio.sleep(0)
+            gate.release()
+
+        tasks = [asyncio.create_task(run(BATCH)) for _ in range(4)]
+        tasks += [asyncio.create_task(run(INTERACTIVE)) for _ in range(6)]
+        await asyncio.sleep(0)
+        gate.release()
+        await asyncio.gather(*tasks)
+
+        assert order[:4].count(INTERACTIVE) == 3
+        assert order.count(BATCH) == 4 and gate.active == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """대기 중 취소되면 자리를 차지하지 않음"""
+        gate = StageGate(1, {INTERACTIVE: 1.0, BATCH: 1.0})
+        await gate.acquire(INTERACTIVE)
+        waiter = asyncio.create_task(gate.acquire(BATCH))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        gate.release()
+
+        assert gate.active == 0
+        assert gate.get_stats()["waiting"] == {INTERACTIVE: 0, BATCH: 0}
+
+
+class TestFairScheduler:
+    """제공자 예산 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_interactive_debits_budget_and_batch_waits(self):
+        """대화형은 예산이 모자라도 바로 실행(차감만), 배치는 예산이 찰 때까지 대기"""
+        scheduler = FairScheduler(budgets={"llm": 60}, stage_providers={"sentiment": "llm"})
+        async with scheduler.slot("sentiment", INTERACTIVE, cost=60):
+            pass
+        assert scheduler.budgets["llm"].tokens <= 0.1
+
+        batch = asyncio.create_task(scheduler.slot("sentiment", BATCH, cost=30).__aenter__())
+        await asyncio.sleep(0.05)
+        assert not batch.done()
+        batch.cancel()
+
+    @pytest.mark.asyncio
+    async def test_bucket_refills(self):
+        bucket = TokenBucket(per_minute=6000, burst=1)
+        bucket.take(1)
+        await asyncio.wait_for(bucket.acquire(1), timeout=1)
+        assert bucket.tokens < 1
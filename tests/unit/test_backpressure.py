@@ -0,0 +1,102 @@
+"""
+백프레셔 / 부하 차단 단위 테스트
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi.testclient import TestClient
+from a2a_core.base.backpressure import QueueFullError, BackpressureError, send_honoring_retry_after
+from a2a_core.protocols.message import A2AMessage, Priority
+from tests.unit.test_base_agent import TestAgent
+
+
+def make_message(priority: Priority, ttl=None) -> A2AMessage:
+    message = A2AMessage.create_request(
+        sender_id="sender-123",
+        receiver_id="receiver",
+        action="analyze",
+        payload={}
+    )
+    message.metadata.priority = priority
+    message.metadata.ttl = ttl
+    return message
+
+
+@pytest.fixture
+def small_agent():
+    """고수위 2, 최대 3인 에이전트"""
+    agent = TestAgent(name="Busy Agent", description="과부하 테스트", port=9931)
+    agent.queue_high_water = 2
+    agent.max_queue = 3
+    agent.retry_after = 2
+    return agent
+
+
+class TestBackpressure:
+    """백프레셔 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_shed_order(self, small_agent):
+        """고수위 초과 시 LOW 거절, 가득 차면 낮은 우선순위부터 밀어냄"""
+        await small_agent._accept_message(make_message(Priority.LOW))
+        await small_agent._accept_message(make_message(Priority.NORMAL))
+
+        # 고수위 초과: LOW는 429
+        with pytest.raises(QueueFullError) as exc_info:
+            await small_agent._accept_message(make_message(Priority.LOW))
+        assert exc_info.value.status_code == 429
+
+        # 고수위 초과 ~ 최대치 사이: NORMAL은 수락
+        await small_agent._accept_message(make_message(Priority.NORMAL))
+
+        # 가득 참: HIGH는 LOW를 밀어내고 수락
+        await small_agent._accept_message(make_message(Priority.HIGH))
+        assert small_agent.message_queue.depth_by_priority()["low"] == 0
+
+        # 밀어낼 것이 없는 NORMAL은 503
+        with pytest.raises(QueueFullError) as exc_info:
+            await small_agent._accept_message(make_message(Priority.NORMAL))
+        assert exc_info.value.status_code == 503
+        assert small_agent.get_queue_stats()["shed"] == {
+            "expired": 0, "low_priority": 1, "evicted": 1, "rejected": 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_expired_shed_first(self, small_agent):
+        """고수위에서는 만료된 메시지부터 정리"""
+        with patch.object(A2AMessage, "is_expired", lambda self: self.metadata.ttl == 0):
+            await small_agent._accept_message(make_message(Priority.NORMAL, ttl=0))
+            await small_agent._accept_message(make_message(Priority.NORMAL, ttl=0))
+            await small_agent._accept_message(make_message(Priority.LOW))
+
+        assert small_agent.message_queue.qsize() == 1
+        assert small_agent.shed_counts["expired"] == 2
+
+    def test_message_endpoint_retry_after(self, small_agent):
+        """/message는 429 + Retry-After, /health는 큐 상태 노출"""
+        client = TestClient(small_agent.app)
+        for _ in range(2):
+            client.post("/message", json=make_message(Priority.NORMAL).to_dict())
+
+        response = client.post("/message", json=make_message(Priority.LOW).to_dict())
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "2"
+        queue = client.get("/health").json()["queue"]
+        assert queue["depth"] == 2
+        assert queue["shed"]["low_priority"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sender_honors_retry_after(self):
+        """송신 측은 Retry-After만큼 기다렸다가 재전송, 재시도를 다 쓰면 BackpressureError"""
+        busy = Mock(status_code=503, headers={"retry-after": "0"})
+        send = AsyncMock(side_effect=[busy, Mock(status_code=200, headers={})])
+
+        response = await send_honoring_retry_after(send, "http://localhost:8202")
+        assert response.status_code == 200
+        assert send.call_count == 2
+
+        send = AsyncMock(return_value=busy)
+        with pytest.raises(BackpressureError):
+            await send_honoring_retry_after(send, "http://localhost:8202", max_retries=1)
+        assert send.call_count == 2
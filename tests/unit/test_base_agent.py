@@ -304,6 +304,251 @@ class TestBaseAgent:
             # Then: 메시지가 처리되지 않아야 함
             assert len(test_agent.handled_messages) == 0
             
+    @pytest.mark.asyncio
+    async def test_concurrent_message_workers(self):
+        """워커 풀로 여러 메시지를 동시에 처리하는지 테스트"""
+        # Given: 처리에 시간이 걸리는 핸들러와 워커 3개
+        class SlowAgent(TestAgent):
+            async def handle_message(self, message: A2AMessage):
+                await asyncio.sleep(0.2)
+                self.handled_messages.append(message)
+                
+        agent = SlowAgent(
+            name="Slow Agent",
+            description="느린 에이전트",
+            port=9998,
+            message_workers=3
+        )
+        
+        with patch('httpx.AsyncClient'):
+            await agent.start()
+            
+            # When: 메시지 3개를 넣으면
+            for i in range(3):
+                await agent.message_queue.put(A2AMessage.create_request(
+                    sender_id="sender-123",
+                    receiver_id=agent.agent_id,
+                    action=f"action_{i}",
+                    payload={}
+                ))
+            await asyncio.sleep(0.3)
+            
+            # Then: 직렬 처리(0.6초)보다 빨리 모두 처리되어야 함
+            assert len(agent.handled_messages) == 3
+            for task in agent.worker_tasks:
+                task.cancel()
+            
+    @pytest.mark.asyncio
+    async def test_action_concurrency_limit(self):
+        """액션별 동시 실행 상한 테스트"""
+        # Given: analyze 액션은 1개씩만 실행되도록 제한
+        class TrackingAgent(TestAgent):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.running = 0
+                self.max_running = 0
+                
+            async def handle_message(self, message: A2AMessage):
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+                await asyncio.sleep(0.05)
+                self.running -= 1
+                self.handled_messages.append(message)
+                
+        agent = TrackingAgent(
+            name="Tracking Agent",
+            description="동시성 추적 에이전트",
+            port=9997,
+            message_workers=4,
+            action_concurrency={"analyze": 1}
+        )
+        
+        with patch('httpx.AsyncClient'):
+            await agent.start()
+            
+            # When: 같은 액션 메시지 3개
+            for _ in range(3):
+                await agent.message_queue.put(A2AMessage.create_request(
+                    sender_id="sender-123",
+                    receiver_id=agent.agent_id,
+                    action="analyze",
+                    payload={}
+                ))
+            await asyncio.sleep(0.3)
+            
+            # Then: 동시에 하나만 실행되어야 함
+            assert len(agent.handled_messages) == 3
+            assert agent.max_running == 1
+            for task in agent.worker_tasks:
+                task.cancel()
+            
+    @pytest.mark.asyncio
+    async def test_capped_action_does_not_block_workers(self):
+        """상한이 찬 액션 메시지는 대기 목록으로 빠지고 다른 액션은 바로 처리"""
+        # Given: analyze는 1개씩, 워커는 2개
+        class SlowAnalyzeAgent(TestAgent):
+            async def handle_message(self, message: A2AMessage):
+                if message.body["action"] == "analyze":
+                    await asyncio.sleep(0.2)
+                self.handled_messages.append(message.body["action"])
+                
+        agent = SlowAnalyzeAgent(
+            name="Parking Agent",
+            description="대기 목록 에이전트",
+            port=9995,
+            message_workers=2,
+            action_concurrency={"analyze": 1}
+        )
+        
+        with patch('httpx.AsyncClient'):
+            await agent.start()
+            
+            # When: analyze 3개 뒤에 다른 액션 1개
+            for action in ("analyze", "analyze", "analyze", "other"):
+                await agent.message_queue.put(A2AMessage.create_request(
+                    sender_id="sender-123",
+                    receiver_id=agent.agent_id,
+                    action=action,
+                    payload={}
+                ))
+            await asyncio.sleep(0.05)
+            
+            # Then: other는 analyze를 기다리지 않고 처리, analyze는 순서대로 모두 처리
+            assert agent.handled_messages == ["other"]
+            assert agent.get_queue_stats()["parked"] == {"analyze": 2}
+            await asyncio.wait_for(agent.message_queue.join(), timeout=1)
+            assert agent.handled_messages == ["other", "analyze", "analyze", "analyze"]
+            for task in agent.worker_tasks:
+                task.cancel()
+            
+    @pytest.mark.asyncio
+    async def test_parked_messages_follow_priority(self):
+        """대기 목록은 우선순위 순서로 처리하고, 종료 시 남은 대기 메시지도 큐 계산에서 정리"""
+        class SlowAgent(TestAgent):
+            async def handle_message(self, message: A2AMessage):
+                await asyncio.sleep(0.05)
+                self.handled_messages.append(message.body["payload"]["label"])
+                
+        agent = SlowAgent(
+            name="Priority Parking Agent",
+            description="우선순위 대기 목록",
+            port=9996,
+            message_workers=2,
+            action_concurrency={"analyze": 1}
+        )
+        
+        def analyze(label, priority):
+            message = A2AMessage.create_request(
+                sender_id="sender-123",
+                receiver_id=agent.agent_id,
+                action="analyze",
+                payload={"label": label}
+            )
+            message.metadata.priority = priority
+            return message
+            
+        with patch('httpx.AsyncClient'):
+            await agent.start()
+            
+            # When: 처리 중인 analyze 뒤로 LOW 2개가 대기한 다음 HIGH가 도착
+            await agent.message_queue.put(analyze("first", Priority.NORMAL))
+            await asyncio.sleep(0.01)
+            for label in ("low-1", "low-2"):
+                await agent.message_queue.put(analyze(label, Priority.LOW))
+            await asyncio.sleep(0.01)
+            await agent.message_queue.put(analyze("high", Priority.HIGH))
+            await asyncio.wait_for(agent.message_queue.join(), timeout=1)
+            
+            # Then: HIGH가 먼저 도착한 LOW보다 앞
+            assert agent.handled_messages == ["first", "high", "low-1", "low-2"]
+            
+            # 종료 시 대기 목록에 남은 메시지는 task_done 처리
+            await agent.message_queue.put(analyze("running", Priority.NORMAL))
+            await asyncio.sleep(0.01)
+            await agent.message_queue.put(analyze("parked", Priority.NORMAL))
+            await asyncio.sleep(0.01)
+            assert agent.get_queue_stats()["parked"] == {"analyze": 1}
+            agent.http_client = AsyncMock()
+            await agent.stop()
+            await asyncio.sleep(0.01)  # 취소된 워커가 처리 중이던 메시지를 정리할 때까지
+            assert agent.parked_messages == {}
+            assert agent.message_queue._unfinished_tasks == 0
+            
+    @pytest.mark.asyncio
+    async def test_request_resolves_with_response(self, test_agent):
+        """request()가 correlation_id로 매칭된 응답을 반환하는지 테스트"""
+        from a2a_core.registry.service_registry import AgentInfo
+        
+        # Given: 요청을 받으면 곧바로 응답을 돌려주는 수신자
+        test_agent.known_agents["receiver-123"] = AgentInfo(
+            agent_id="receiver-123",
+            name="Receiver Agent",
+            description="수신자",
+            endpoint="http://localhost:8888",
+            capabilities=[]
+        )
+        
+        async def fake_post(url, json):
+            request_message = A2AMessage(**json)
+            response = A2AMessage.create_response(
+                original_message=request_message,
+                sender_id="receiver-123",
+                result={"answer": 42}
+            )
+            asyncio.get_running_loop().call_soon(test_agent._resolve_pending_request, response)
+            return Mock(status_code=200)
+            
+        test_agent.http_client = AsyncMock()
+        test_agent.http_client.post.side_effect = fake_post
+        
+        # When: 요청을 보내면
+        response = await test_agent.request("receiver-123", "ask", {"q": 1}, timeout=1.0)
+        
+        # Then: 응답 메시지가 반환되고, 큐를 거치지 않아야 함
+        assert response.body["result"] == {"answer": 42}
+        assert test_agent.message_queue.qsize() == 0
+        assert test_agent.pending_requests == {}
+        
+    @pytest.mark.asyncio
+    async def test_request_timeout(self, test_agent):
+        """응답이 없으면 타임아웃 후 대기 상태가 정리되는지 테스트"""
+        from a2a_core.registry.service_registry import AgentInfo
+        
+        # Given: 응답하지 않는 수신자
+        test_agent.known_agents["silent"] = AgentInfo(
+            agent_id="silent",
+            name="Silent Agent",
+            description="응답 없음",
+            endpoint="http://localhost:8887",
+            capabilities=[]
+        )
+        test_agent.http_client = AsyncMock()
+        test_agent.http_client.post.return_value = Mock(status_code=200)
+        
+        # When & Then: 타임아웃 예외 발생
+        with pytest.raises(asyncio.TimeoutError):
+            await test_agent.request("silent", "ask", {}, timeout=0.1)
+            
+        # 보낸 요청에는 TTL이 설정되고, 대기 목록은 비어 있어야 함
+        sent = test_agent.http_client.post.call_args.kwargs["json"]
+        assert sent["metadata"]["ttl"] == 1
+        assert test_agent.pending_requests == {}
+        
+    def test_unmatched_response_goes_to_queue(self, test_agent):
+        """대기 중이지 않은 응답은 일반 처리 경로로 가야 함"""
+        response = A2AMessage.create_response(
+            original_message=A2AMessage.create_request(
+                sender_id=test_agent.agent_id,
+                receiver_id="other",
+                action="ask",
+                payload={}
+            ),
+            sender_id="other",
+            result={}
+        )
+        
+        assert test_agent._resolve_pending_request(response) is False
+        
     def test_health_endpoint(self, test_agent):
         """헬스체크 엔드포인트 테스트"""
         # Given: FastAPI 테스트 클라이언트
@@ -321,6 +566,33 @@ class TestBaseAgent:
         assert data["name"] == test_agent.name
         assert "timestamp" in data
         
+    def test_batch_messages_endpoint(self, test_agent):
+        """배치 메시지 엔드포인트 테스트"""
+        from fastapi.testclient import TestClient
+        client = TestClient(test_agent.app)
+        
+        # Given: 정상 메시지 2개와 잘못된 메시지 1개
+        messages = [
+            A2AMessage.create_request(
+                sender_id="sender-123",
+                receiver_id=test_agent.agent_id,
+                action=f"action_{i}",
+                payload={}
+            ).to_dict()
+            for i in range(2)
+        ]
+        messages.append({"header": {"message_id": "broken"}})
+        
+        # When: 배치로 전송하면
+        response = client.post("/messages", json=messages)
+        
+        # Then: 메시지별 결과가 반환되고 정상 메시지만 큐에 들어가야 함
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == ["accepted", "accepted", "error"]
+        assert results[2]["message_id"] == "broken"
+        assert test_agent.message_queue.qsize() == 2
+        
     def test_capabilities_endpoint(self, test_agent):
         """능력 조회 엔드포인트 테스트"""
         # Given: 능력이 등록된 에이전트
@@ -0,0 +1,123 @@
+"""
+마감 시각 전파 / 취소 단위 테스트
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+from a2a_core.base.context import current_deadline, deadline_exceeded
+from a2a_core.protocols.message import A2AMessage, MessageType
+from a2a_core.registry.service_registry import AgentInfo
+from tests.unit.test_base_agent import TestAgent
+
+
+class BlockingAgent(TestAgent):
+    """핸들러가 오래 걸리는 에이전트"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.started_event = asyncio.Event()
+        self.finished = False
+        self.child_messages = []
+
+    async def handle_message(self, message: A2AMessage):
+        self.started_event.set()
+        if message.body.get("action") == "fan_out":
+            self.child_messages.append(await self.send_message("downstream", "collect_data", {}))
+        await asyncio.sleep(5)
+        self.finished = True
+
+
+def make_request(deadline=None) -> A2AMessage:
+    message = A2AMessage.create_request(
+        sender_id="orchestrator", receiver_id="agent", action="analyze", payload={}
+    )
+    message.header.deadline = deadline
+    return message
+
+
+@pytest.fixture
+def agent():
+    agent = BlockingAgent(name="Blocking Agent", description="취소 테스트", port=9951)
+    agent.known_agents["downstream"] = AgentInfo(
+        agent_id="downstream-id",
+        name="Downstream Agent",
+        description="하위",
+        endpoint="http://localhost:9952",
+        capabilities=[]
+    )
+    agent.http_client = AsyncMock()
+    agent.http_client.post.return_value = Mock(status_code=200, headers={})
+    return agent
+
+
+class TestCancellation:
+    """취소/마감 테스트"""
+
+    def test_deadline_expiry_and_roundtrip(self):
+        """절대 마감이 지나면 만료, to_dict로 전달됨"""
+        past = make_request(datetime.now() - timedelta(seconds=1))
+        future = make_request(datetime.now() + timedelta(seconds=60))
+
+        assert past.is_expired()
+        assert not future.is_expired()
+        assert A2AMessage(**future.to_dict()).header.deadline == future.header.deadline
+        assert A2AMessage.from_trusted_dict(future.to_dict()).header.deadline == future.header.deadline
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_inflight_handler_and_children(self, agent):
+        """CANCEL은 처리 중인 핸들러를 중단하고 하위 요청에도 전파"""
+        message = make_request(datetime.now() + timedelta(seconds=30))
+        message.body["action"] = "fan_out"
+        dispatch = asyncio.create_task(agent._dispatch_message(message))
+        await agent.started_event.wait()
+
+        # 하위 요청은 상위 마감을 물려받음
+        child = agent.child_messages[0]
+        assert child.header.deadline == message.header.deadline
+
+        cancel = A2AMessage.create_cancel("orchestrator", agent.agent_id, message.header.message_id)
+        result = await agent._accept_message(cancel)
+        await asyncio.wait_for(dispatch, timeout=1.0)
+
+        assert result["status"] == "cancelled"
+        assert not agent.finished
+        assert agent.inflight_tasks == {}
+        sent = agent.http_client.post.call_args.kwargs["json"]
+        assert sent["header"]["message_type"] == MessageType.CANCEL.value
+        assert sent["header"]["correlation_id"] == child.header.message_id
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_dispatch(self, agent):
+        """큐에 있는 동안 취소된 메시지는 처리하지 않음"""
+        message = make_request()
+        await agent._accept_message(message)
+        await agent._accept_message(
+            A2AMessage.create_cancel("orchestrator", agent.agent_id, message.header.message_id)
+        )
+
+        await agent._dispatch_message(agent.message_queue.get_nowait())
+
+        assert not agent.started_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_handler(self, agent):
+        """마감이 지나면 핸들러를 중단"""
+        message = make_request(datetime.now() + timedelta(seconds=0.1))
+
+        await asyncio.wait_for(agent._dispatch_message(message), timeout=1.0)
+
+        assert agent.started_event.is_set()
+        assert not agent.finished
+
+    @pytest.mark.asyncio
+    async def test_ambient_context(self, agent):
+        """run_cancellable 안에서는 마감 시각을 조회할 수 있음"""
+        deadline = datetime.now() + timedelta(seconds=30)
+
+        async def work():
+            return current_deadline(), deadline_exceeded()
+
+        assert await agent.run_cancellable("http-request-1", work(), deadline=deadline) == (deadline, False)
+        assert current_deadline() is None
@@ -0,0 +1,101 @@
+"""
+서킷 브레이커 테스트
+"""
+
+import asyncio
+import pytest
+
+from utils.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+)
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_opens_on_error_rate_and_fails_fast(self):
+        """창의 실패 비율이 임계값을 넘으면 열리고, 열린 동안은 호출 거부"""
+        breaker = CircuitBreaker("news", min_calls=4, error_rate=0.5)
+        for success in (True, False, True):
+            assert breaker.allow()
+            breaker.record(success)
+        assert breaker.state == CLOSED
+
+        breaker.record(False)
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        assert breaker.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_opens_on_slow_calls(self):
+        """성공이어도 느린 호출 비율이 높으면 열림"""
+        breaker = CircuitBreaker("report", min_calls=3, slow_call=1.0, slow_rate=0.6)
+        for duration in (2.0, 0.1, 3.0):
+            breaker.record(True, duration)
+        assert breaker.state == OPEN
+
+    @pytest.mark.asyncio
+    async def test_old_calls_leave_window(self):
+        """window_seconds보다 오래된 호출은 판단에서 제외"""
+        breaker = CircuitBreaker("sec", min_calls=3, window_seconds=0.05)
+        breaker.record(False)
+        breaker.record(False)
+        await asyncio.sleep(0.1)
+        breaker.record(False)
+        assert breaker.state == CLOSED
+        assert breaker.get_stats()["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_trials_close_or_reopen(self):
+        """열린 시간이 지나면 시험 호출만 허용 - 모두 성공하면 닫히고, 실패하면 다시 열림"""
+        breaker = CircuitBreaker("mcp", min_calls=1, open_duration=0.05, half_open_calls=2)
+        breaker.record(False)
+        assert not breaker.allow()
+        await asyncio.sleep(0.06)
+
+        assert breaker.allow() and breaker.state == HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # 시험 호출 자리 소진
+        breaker.record(True)
+        breaker.record(False)
+        assert breaker.state == OPEN
+        assert breaker.opened == 2
+
+        await asyncio.sleep(0.06)
+        assert breaker.allow() and breaker.allow()
+        breaker.record(True)
+        breaker.record(True)
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_background_probe_half_opens(self):
+        """probe가 있으면 열린 동안 백그라운드로 확인하고 성공해야 반열림"""
+        results = [False, True]
+        probes = []
+
+        async def probe():
+            probes.append(1)
+            return results.pop(0)
+
+        breaker = CircuitBreaker("twitter", min_calls=1, open_duration=0.02, probe_interval=0.02, probe=probe)
+        breaker.record(False)
+        await asyncio.sleep(0.03)
+        assert breaker.state == OPEN and not breaker.allow()
+
+        await asyncio.sleep(0.05)
+        assert len(probes) == 2
+        assert breaker.state == HALF_OPEN
+
+
+class TestCircuitBreakerRegistry:
+    """CircuitBreakerRegistry 테스트"""
+
+    def test_shared_breaker_with_overrides(self):
+        """같은 이름은 같은 브레이커, 에이전트별 설정이 기본값을 덮어씀"""
+        registry = CircuitBreakerRegistry(defaults={"slow_call": 10}, overrides={"report-agent": {"slow_call": 60}})
+        assert registry.get("report-agent") is registry.get("report-agent")
+        assert registry.get("report-agent").slow_call == 60
+        assert registry.get("news-agent-v2").slow_call == 10
+        assert set(registry.get_stats()) == {"report-agent", "news-agent-v2"}
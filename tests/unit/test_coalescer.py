@@ -0,0 +1,83 @@
+"""
+메시지 병합 전송기 단위 테스트
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock, AsyncMock
+from a2a_core.base.coalescer import MessageCoalescer
+
+
+def _batch_response(count: int) -> Mock:
+    return Mock(
+        status_code=200,
+        json=lambda: {"results": [{"status": "accepted"} for _ in range(count)]}
+    )
+
+
+class TestMessageCoalescer:
+    """메시지 병합 전송기 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_messages_to_same_endpoint_are_batched(self):
+        """같은 엔드포인트로 가는 메시지는 하나의 배치로 전송"""
+        # Given: 병합 전송기
+        client = AsyncMock()
+        client.post.return_value = _batch_response(3)
+        coalescer = MessageCoalescer(client, window=0.01, max_batch=64)
+        
+        # When: 동시에 메시지 3개 제출
+        results = await asyncio.gather(*(
+            coalescer.submit("http://agent-a", {"n": i}) for i in range(3)
+        ))
+        
+        # Then: /messages로 한 번만 전송
+        assert results == [True, True, True]
+        assert client.post.call_count == 1
+        url = client.post.call_args[0][0]
+        assert url == "http://agent-a/messages"
+        assert len(client.post.call_args.kwargs["json"]) == 3
+        
+    @pytest.mark.asyncio
+    async def test_max_batch_flushes_immediately(self):
+        """max_batch에 도달하면 대기 시간 없이 전송"""
+        client = AsyncMock()
+        client.post.return_value = _batch_response(2)
+        coalescer = MessageCoalescer(client, window=10.0, max_batch=2)
+        
+        results = await asyncio.wait_for(asyncio.gather(
+            coalescer.submit("http://agent-a", {"n": 1}),
+            coalescer.submit("http://agent-a", {"n": 2})
+        ), timeout=1.0)
+        
+        assert results == [True, True]
+        
+    @pytest.mark.asyncio
+    async def test_single_message_uses_message_endpoint(self):
+        """메시지가 하나뿐이면 기존 /message로 전송"""
+        client = AsyncMock()
+        client.post.return_value = Mock(status_code=200)
+        coalescer = MessageCoalescer(client, window=0.001)
+        
+        assert await coalescer.submit("http://agent-a", {"n": 1}) is True
+        assert client.post.call_args[0][0] == "http://agent-a/message"
+        
+    @pytest.mark.asyncio
+    async def test_fallback_when_batch_endpoint_missing(self):
+        """/messages가 없는 수신자(404)는 개별 전송으로 폴백"""
+        client = AsyncMock()
+        
+        async def fake_post(url, json):
+            if url.endswith("/messages"):
+                return Mock(status_code=404)
+            return Mock(status_code=200)
+            
+        client.post.side_effect = fake_post
+        coalescer = MessageCoalescer(client, window=0.005)
+        
+        results = await asyncio.gather(*(
+            coalescer.submit("http://legacy", {"n": i}) for i in range(2)
+        ))
+        
+        assert results == [True, True]
+        assert client.post.call_count == 3  # 배치 1회 + 개별 2회
@@ -0,0 +1,33 @@
+"""
+데이터 수집 정족수 정책 단위 테스트
+"""
+
+from utils.collection_quorum import QuorumPolicy, QUORUM_ALL, QUORUM_DEADLINE, QUORUM_MAX_WAIT, QUORUM_MET
+
+
+class TestQuorumPolicy:
+    """진행 시점 판단 테스트"""
+
+    def setup_method(self):
+        self.policy = QuorumPolicy(
+            required=["news"], min_sources=2,
+            source_deadlines={"twitter": 5, "sec": 20}, default_deadline=10, max_wait=30
+        )
+
+    def test_required_source_and_quorum(self):
+        """news와 다른 소스 하나가 도착하면 진행, news가 없으면 대기"""
+        assert self.policy.decide(["twitter", "sec"], ["news", "mcp"], 1) is None
+        assert self.policy.decide(["news"], ["twitter", "sec", "mcp"], 1) is None
+        assert self.policy.decide(["news", "twitter"], ["sec", "mcp"], 1) == QUORUM_MET
+        assert self.policy.decide(["news", "twitter", "sec", "mcp"], [], 1) == QUORUM_ALL
+
+    def test_deadlines(self):
+        """남은 소스가 모두 기한을 넘기거나 전체 상한에 걸리면 진행"""
+        assert self.policy.decide(["news"], ["twitter", "sec"], 6) is None
+        assert self.policy.decide(["news"], ["twitter"], 6) == QUORUM_DEADLINE
+        assert self.policy.decide([], ["news", "sec"], 30) == QUORUM_MAX_WAIT
+
+    def test_next_check(self):
+        assert self.policy.next_check(["twitter", "sec"], 1) == 4
+        assert self.policy.next_check(["sec"], 25) == 5
+        assert self.policy.next_check([], 1) is None
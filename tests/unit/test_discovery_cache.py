@@ -0,0 +1,115 @@
+"""
+에이전트 발견 캐시 단위 테스트
+"""
+
+import pytest
+import time
+from unittest.mock import AsyncMock, Mock, patch
+from a2a_core.base.discovery_cache import DiscoveryCache
+from a2a_core.registry.service_registry import AgentInfo
+from tests.unit.test_base_agent import TestAgent
+
+
+def make_info(agent_id: str, name: str, port: int) -> AgentInfo:
+    return AgentInfo(
+        agent_id=agent_id,
+        name=name,
+        description=name,
+        endpoint=f"http://localhost:{port}",
+        capabilities=[]
+    )
+
+
+class TestDiscoveryCache:
+    """발견 캐시 테스트"""
+
+    def test_ttl_expiry(self):
+        """TTL이 지난 항목은 캐시 미스"""
+        cache = DiscoveryCache(ttl=0)
+        cache["nlu"] = make_info("id-1", "NLU Agent", 8108)
+
+        assert "nlu" not in cache
+        assert cache.get("nlu") is None
+
+    def test_replace_all_drops_restarted_agent(self):
+        """watch 목록에 없는 agent_id(재시작 전 인스턴스)를 가리키는 항목은 제거"""
+        cache = DiscoveryCache()
+        cache["nlu-agent-v2"] = make_info("old-id", "NLU Agent V2", 8108)
+        cache["sentiment"] = make_info("sent-id", "Sentiment Agent", 8202)
+        cache.put_negative("report-agent")
+
+        cache.replace_all([
+            make_info("new-id", "NLU Agent V2", 8108),
+            make_info("sent-id", "Sentiment Agent", 8202),
+        ])
+
+        assert "nlu-agent-v2" not in cache
+        assert cache["new-id"].agent_id == "new-id"
+        assert cache["sentiment"].agent_id == "sent-id"
+        assert not cache.is_negative("report-agent")
+        assert len(cache.get_listing()) == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_uses_single_discover_and_negative_cache(self):
+        """한 번의 /discover로 여러 수신자를 찾고, 없는 수신자는 재조회하지 않음"""
+        agent = TestAgent(name="Test Agent", description="테스트", port=9921)
+        agent.http_client = AsyncMock()
+        agent.http_client.get.return_value = Mock(
+            status_code=200,
+            json=Mock(return_value={"agents": [
+                make_info("nlu-id", "NLU Agent", 8108).model_dump(mode="json", exclude={"last_heartbeat"}),
+                make_info("sent-id", "Sentiment Agent", 8202).model_dump(mode="json", exclude={"last_heartbeat"}),
+            ]})
+        )
+
+        assert (await agent._resolve_receiver("nlu-agent")).agent_id == "nlu-id"
+        assert (await agent._resolve_receiver("sent-id")).agent_id == "sent-id"
+        assert await agent._resolve_receiver("ghost-agent") is None
+        assert await agent._resolve_receiver("ghost-agent") is None
+        # 없는 수신자도 캐시된 발견 목록에서 판정
+        assert agent.http_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_resolve_checks_ttl_once(self):
+        """조회 도중 TTL이 지나도 KeyError 없이 한 번의 확인 결과를 사용"""
+        agent = TestAgent(name="Test Agent", description="테스트", port=9923)
+        agent.known_agents = DiscoveryCache(ttl=10)
+        agent.known_agents["nlu-agent"] = make_info("nlu-id", "NLU Agent", 8108)
+        expires_at = time.monotonic() + 10
+        # 첫 확인은 만료 직전, 그다음부터는 만료 후
+        ticks = iter([expires_at - 0.01])
+
+        with patch("a2a_core.base.discovery_cache.time.monotonic", lambda: next(ticks, expires_at + 0.01)):
+            receiver = await agent._resolve_receiver("nlu-agent")
+
+        assert receiver.agent_id == "nlu-id"
+
+    @pytest.mark.asyncio
+    async def test_send_failure_invalidates(self):
+        """전송 실패 시 해당 수신자 캐시 무효화"""
+        agent = TestAgent(name="Test Agent", description="테스트", port=9922)
+        receiver = make_info("nlu-id", "NLU Agent", 8108)
+        agent.known_agents["nlu-agent"] = receiver
+        agent.http_client = AsyncMock()
+        agent.http_client.post.return_value = Mock(status_code=500)
+
+        assert await agent.send_message("nlu-agent", "extract_ticker", {}) is None
+        assert "nlu-agent" not in agent.known_agents
+
+    @pytest.mark.asyncio
+    async def test_expired_listing_revalidated_with_etag(self):
+        """만료된 목록은 If-None-Match로 재검증하고 304면 그대로 사용"""
+        agent = TestAgent(name="Sender Agent", description="송신자", port=9924)
+        agent.known_agents = DiscoveryCache(ttl=0)
+        agent.http_client = AsyncMock()
+        listing = {"agents": [make_info("nlu-id", "NLU Agent V2", 8108).model_dump(exclude={"last_heartbeat"})]}
+        agent.http_client.get.side_effect = [
+            Mock(status_code=200, headers={"etag": '"7"'}, json=Mock(return_value=listing)),
+            Mock(status_code=304, headers={"etag": '"7"'}),
+        ]
+
+        first = await agent.discover_agents()
+        second = await agent.discover_agents()
+
+        assert [info.agent_id for info in second] == [info.agent_id for info in first] == ["nlu-id"]
+        assert agent.http_client.get.call_args.kwargs["headers"] == {"If-None-Match": '"7"'}
@@ -0,0 +1,47 @@
+"""
+공용 HTTP 클라이언트 풀 단위 테스트
+"""
+
+import pytest
+from a2a_core.base.http_pool import HTTPClientPool, origin_of
+
+
+class TestHTTPClientPool:
+    """클라이언트 풀 테스트"""
+
+    def test_origin(self):
+        assert origin_of("https://www.sec.gov/files/company_tickers.json") == "https://www.sec.gov"
+        assert origin_of("http://localhost:8211/quantitative_analysis") == "http://localhost:8211"
+
+    @pytest.mark.asyncio
+    async def test_clients_shared_per_origin_and_profile(self):
+        """같은 origin/프로필이면 같은 클라이언트, 블록이 끝나도 닫지 않음"""
+        pool = HTTPClientPool(max_connections_per_host=5, http2=False)
+
+        async with pool.client("http://localhost:8211/a") as first:
+            pass
+        async with pool.client("http://localhost:8211/b") as second:
+            pass
+        llm = pool.get("http://localhost:8211/c", "llm")
+        other = pool.get("http://localhost:8212/a")
+
+        assert first is second and not first.is_closed
+        assert llm is not first and other is not first
+        assert pool.created == 3
+        assert pool.get_stats()["pools"]["http://localhost:8211 [default]"]["requests"] == 2
+
+        await pool.close()
+        assert first.is_closed and pool.clients == {}
+
+    @pytest.mark.asyncio
+    async def test_release_closes_after_last_user(self):
+        """마지막 사용자가 release하면 모든 클라이언트 닫기"""
+        pool = HTTPClientPool(http2=False)
+        pool.retain()
+        pool.retain()
+        client = pool.get("http://localhost:8001")
+
+        await pool.release()
+        assert not client.is_closed
+        await pool.release()
+        assert client.is_closed
@@ -0,0 +1,122 @@
+"""
+인스턴스 부하 분산 단위 테스트
+"""
+
+import asyncio
+import pytest
+import random
+from unittest.mock import AsyncMock, Mock
+from a2a_core.base.load_balancer import LoadBalancer
+from a2a_core.protocols.message import A2AMessage
+from a2a_core.registry.service_registry import AgentInfo, ServiceRegistry
+from tests.unit.test_base_agent import TestAgent
+
+
+def make_instance(agent_id: str, port: int, load=None, status="active") -> AgentInfo:
+    return AgentInfo(
+        agent_id=agent_id,
+        name="Sentiment Analysis Agent V2",
+        description="감성 분석",
+        endpoint=f"http://localhost:{port}",
+        capabilities=[{"name": "sentiment_analysis"}],
+        status=status,
+        load=load or {}
+    )
+
+
+class TestLoadBalancer:
+    """부하 분산 테스트"""
+
+    def test_least_outstanding_uses_reported_and_local_load(self):
+        """보고된 큐 길이와 응답 대기 수가 적은 인스턴스 선택, 비정상 인스턴스 제외"""
+        balancer = LoadBalancer(strategy="least_outstanding")
+        busy = make_instance("busy", 8202, {"queue_depth": 5})
+        idle = make_instance("idle", 8222)
+        down = make_instance("down", 8232, status="unreachable")
+
+        assert balancer.pick([busy, idle, down]).agent_id == "idle"
+
+        for index in range(6):
+            balancer.start(f"message-{index}", "idle")
+        assert balancer.pick([busy, idle, down]).agent_id == "busy"
+
+        for index in range(6):
+            balancer.finish(f"message-{index}")
+        assert balancer.outstanding == {}
+        assert "idle" in balancer.latency_ms
+
+    def test_p2c_spreads_across_instances(self):
+        """p2c는 대기 요청이 적은 쪽을 골라 여러 인스턴스에 고르게 분산"""
+        random.seed(7)
+        balancer = LoadBalancer(strategy="p2c")
+        instances = [make_instance(f"sentiment-{index}", 8202 + index) for index in range(3)]
+
+        for index in range(60):
+            chosen = balancer.pick(instances)
+            balancer.start(f"message-{index}", chosen.agent_id)
+
+        assert set(balancer.picks) == {"sentiment-0", "sentiment-1", "sentiment-2"}
+        assert max(balancer.outstanding.values()) - min(balancer.outstanding.values()) <= 3
+
+    @pytest.mark.asyncio
+    async def test_sender_balances_and_fails_over(self):
+        """같은 이름의 인스턴스로 요청을 나누고, 실패한 인스턴스는 후보에서 제외"""
+        sender = TestAgent(name="Orchestrator", description="송신자", port=9961)
+        sender.balancer = LoadBalancer(strategy="least_outstanding")
+        sender.retry_base_delay = 0
+        listing = [make_instance("sentiment-a", 8202), make_instance("sentiment-b", 8222)]
+        sender.known_agents.put_listing(None, listing)
+        sender.http_client = AsyncMock()
+        sender.http_client.post.return_value = Mock(status_code=200, headers={})
+
+        first = await sender.send_message("sentiment-analysis-agent-v2", "analyze", {})
+        second = await sender.send_message("sentiment-analysis-agent-v2", "analyze", {})
+        endpoints = [call.args[0] for call in sender.http_client.post.call_args_list]
+        assert endpoints == ["http://localhost:8202/message", "http://localhost:8222/message"]
+
+        # 응답이 오면 대기 수 감소
+        await sender._accept_message(A2AMessage.create_response(first, "sentiment-a", {}))
+        assert sender.balancer.outstanding == {"sentiment-b": 1}
+        await sender._accept_message(A2AMessage.create_response(second, "sentiment-b", {}))
+        assert sender.balancer.outstanding == {}
+
+        sender.known_agents.invalidate(agent_id="sentiment-a")
+        assert (await sender._resolve_receiver("sentiment-analysis-agent-v2")).agent_id == "sentiment-b"
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_load_exposed_in_discovery(self):
+        """하트비트로 보고한 부하는 발견 결과에 포함"""
+        registry = ServiceRegistry()
+        await registry.register_agent(make_instance("sentiment-a", 8202))
+        version = registry.topology_version()
+
+        await registry.update_heartbeat("sentiment-a", {"queue_depth": 3, "inflight": 1, "latency_ms": 40.0})
+
+        agents = await registry.discover_agents()
+        assert agents[0].load == {"queue_depth": 3, "inflight": 1, "latency_ms": 40.0}
+        assert registry.topology_version() == version
+
+    @pytest.mark.asyncio
+    async def test_load_reported_separately_from_heartbeat(self):
+        """부하는 /load로 바뀌었을 때만 보고하고, 레지스트리 토폴로지/생존 시각은 그대로"""
+        agent = TestAgent(name="Sentiment", description="부하 보고", port=9962)
+        agent.load_report_interval = 0.01
+        agent._registry_request = AsyncMock(return_value=Mock(status_code=200))
+        task = asyncio.create_task(agent._load_report_loop())
+        await asyncio.sleep(0.05)
+        agent.inflight_handlers = 2
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        paths = [call.args[1] for call in agent._registry_request.call_args_list]
+        assert paths == [f"/load/{agent.agent_id}"] * 2
+        assert agent._registry_request.call_args.kwargs["json"]["load"]["inflight"] == 2
+
+        registry = ServiceRegistry()
+        await registry.register_agent(make_instance("sentiment-a", 8202))
+        heartbeat = registry.agents["sentiment-a"].last_heartbeat
+        version = registry.topology_version()
+        await registry.update_load("sentiment-a", {"queue_depth": 2})
+        assert registry.agents["sentiment-a"].load == {"queue_depth": 2}
+        assert registry.agents["sentiment-a"].last_heartbeat == heartbeat
+        assert registry.topology_version() == version
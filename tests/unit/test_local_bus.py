@@ -0,0 +1,69 @@
+"""
+인프로세스 메시지 버스 단위 테스트
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from a2a_core.base.local_bus import LocalMessageBus
+from a2a_core.protocols.message import A2AMessage
+from tests.unit.test_base_agent import TestAgent
+
+
+@pytest.fixture
+def bus_agents():
+    """같은 버스에 연결된 에이전트 두 개 (HTTP 클라이언트는 호출되면 안 됨)"""
+    bus = LocalMessageBus()
+    sender = TestAgent(name="Sender Agent", description="송신자", port=9911)
+    receiver = TestAgent(name="Receiver Agent", description="수신자", port=9912)
+    for agent in (sender, receiver):
+        bus.attach(agent)
+        agent.http_client = AsyncMock()
+    return bus, sender, receiver
+
+
+class TestLocalMessageBus:
+    """인프로세스 메시지 버스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_send_message_without_http(self, bus_agents):
+        """로컬 수신자에게는 HTTP/레지스트리 없이 메시지 객체를 그대로 전달"""
+        bus, sender, receiver = bus_agents
+
+        message = await sender.send_message("receiver-agent", "analyze", {"ticker": "AAPL"})
+
+        assert message is not None
+        assert receiver.message_queue.get_nowait() is message
+        sender.http_client.get.assert_not_called()
+        sender.http_client.post.assert_not_called()
+        assert bus.delivered_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reply_resolves_request(self, bus_agents):
+        """request()의 응답도 버스로 돌아와 future를 완료시켜야 함"""
+        bus, sender, receiver = bus_agents
+
+        async def answer(message: A2AMessage):
+            await receiver.reply_to_message(message, {"answer": 42})
+        receiver.handle_message = answer
+        receiver.worker_tasks = [asyncio.create_task(receiver._message_processing_loop())]
+
+        response = await sender.request(receiver.agent_id, "ask", {}, timeout=1.0)
+
+        assert response.body["result"] == {"answer": 42}
+        receiver.http_client.get.assert_not_called()
+        for task in receiver.worker_tasks:
+            task.cancel()
+
+    def test_find_by_name_formats(self, bus_agents):
+        """이름, 하이픈 이름, ID로 로컬 에이전트를 찾을 수 있어야 함"""
+        bus, _, receiver = bus_agents
+
+        assert bus.find("Receiver Agent") is receiver
+        assert bus.find("receiver-agent") is receiver
+        assert bus.find(receiver.agent_id) is receiver
+        assert bus.find("unknown-agent") is None
+
+        bus.detach(receiver)
+        assert receiver.local_bus is None
+        assert not bus.is_local(receiver.endpoint)
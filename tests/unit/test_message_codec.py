@@ -0,0 +1,107 @@
+"""
+메시지 와이어 포맷 단위 테스트
+"""
+
+import pytest
+from pydantic import ValidationError
+from a2a_core.protocols.codec import (
+    WIRE_JSON, WIRE_MSGPACK, CONTENT_TYPES, MessageEnvelope,
+    encode_message, decode_message, wire_format_for_content_type
+)
+from a2a_core.protocols.message import A2AMessage, MessageType, Priority
+
+msgpack = pytest.importorskip("msgpack")
+
+
+@pytest.fixture
+def large_message():
+    """대용량 body를 가진 메시지"""
+    message = A2AMessage.create_request(
+        sender_id="sec-agent",
+        receiver_id="orchestrator",
+        action="collect_data",
+        payload={"filings": [{"title": f"10-K {i}", "content": "x" * 1000} for i in range(50)]}
+    )
+    message.metadata.priority = Priority.HIGH
+    return message
+
+
+class TestMessageCodec:
+    """와이어 포맷 테스트"""
+    
+    def test_json_roundtrip_trusted(self, large_message):
+        """JSON 신뢰 디코딩은 검증 경로와 같은 결과를 내야 함"""
+        raw = encode_message(large_message, WIRE_JSON)
+        
+        validated = decode_message(raw, WIRE_JSON, trusted=False)
+        trusted = decode_message(raw, WIRE_JSON, trusted=True)
+        
+        assert trusted.to_dict() == validated.to_dict() == large_message.to_dict()
+        assert trusted.header.message_type == MessageType.REQUEST
+        assert trusted.metadata.priority == Priority.HIGH
+        
+    def test_msgpack_envelope_defers_body(self, large_message):
+        """msgpack 봉투는 헤더만 먼저 풀고 body는 나중에 디코딩"""
+        raw = encode_message(large_message, WIRE_MSGPACK)
+        
+        envelope = decode_message(raw, WIRE_MSGPACK)
+        
+        # 헤더/메타데이터는 바로 사용 가능
+        assert isinstance(envelope, MessageEnvelope)
+        assert envelope.header.message_id == large_message.header.message_id
+        assert envelope.metadata.priority == Priority.HIGH
+        assert envelope.body_size > 0
+        assert envelope.is_expired() is False
+        
+        # body는 to_message() 시점에 디코딩
+        message = envelope.to_message()
+        assert message.to_dict() == large_message.to_dict()
+        assert envelope.to_message() is message
+        
+    def test_msgpack_validated_unless_trusted(self, large_message):
+        """msgpack도 trusted가 아니면 헤더는 디코딩할 때, body는 to_message() 때 검증"""
+        data = large_message.to_dict()
+        bad_header = msgpack.packb({
+            "header": {**data["header"], "message_type": "bogus"},
+            "metadata": data["metadata"],
+            "body": msgpack.packb(data["body"], use_bin_type=True),
+        }, use_bin_type=True)
+        bad_body = msgpack.packb({
+            "header": data["header"],
+            "metadata": data["metadata"],
+            "body": msgpack.packb(["not", "a", "dict"], use_bin_type=True),
+        }, use_bin_type=True)
+
+        with pytest.raises(ValidationError):
+            decode_message(bad_header, WIRE_MSGPACK)
+        with pytest.raises(ValidationError):
+            decode_message(bad_body, WIRE_MSGPACK).to_message()
+
+        # 신뢰 디코딩은 검증 없이 복원
+        trusted = decode_message(encode_message(large_message, WIRE_MSGPACK), WIRE_MSGPACK, trusted=True)
+        assert trusted.to_message().to_dict() == large_message.to_dict()
+        
+    def test_content_type_negotiation(self):
+        """Content-Type으로 포맷 판별"""
+        assert wire_format_for_content_type(CONTENT_TYPES[WIRE_MSGPACK]) == WIRE_MSGPACK
+        assert wire_format_for_content_type("application/json; charset=utf-8") == WIRE_JSON
+        assert wire_format_for_content_type(None) == WIRE_JSON
+        
+    def test_agent_accepts_msgpack_message(self, large_message):
+        """에이전트 /message 엔드포인트가 msgpack 메시지를 받는지 확인"""
+        from fastapi.testclient import TestClient
+        from tests.unit.test_base_agent import TestAgent
+        
+        agent = TestAgent(name="Codec Agent", description="코덱 테스트", port=9996)
+        client = TestClient(agent.app)
+        
+        response = client.post(
+            "/message",
+            content=encode_message(large_message, WIRE_MSGPACK),
+            headers={"Content-Type": CONTENT_TYPES[WIRE_MSGPACK]}
+        )
+        
+        assert response.status_code == 200
+        queued = agent.message_queue.get_nowait()
+        assert isinstance(queued, MessageEnvelope)
+        assert queued.to_message().body["action"] == "collect_data"
@@ -60,6 +60,31 @@ class TestMessageProtocol:
         assert response.body["result"]["data"] == [1, 2, 3]
         assert response.body["original_action"] == "get_data"
         
+    def test_create_partial_message(self):
+        """중간 결과 메시지 생성 테스트"""
+        # Given: 원본 요청 메시지
+        request = A2AMessage.create_request(
+            sender_id="agent-1",
+            receiver_id="agent-2",
+            action="collect_data",
+            payload={}
+        )
+        
+        # When: 중간 결과 메시지를 생성하면
+        partial = A2AMessage.create_partial(
+            original_message=request,
+            sender_id="agent-2",
+            result={"data": [1]},
+            sequence=1
+        )
+        
+        # Then: 최종 응답과 같은 correlation_id로 요청자에게 전달되어야 함
+        assert partial.header.message_type == MessageType.PARTIAL
+        assert partial.header.receiver_id == "agent-1"
+        assert partial.header.correlation_id == request.header.message_id
+        assert partial.body["result"] == {"data": [1]}
+        assert partial.body["sequence"] == 1
+        
     def test_create_error_message(self):
         """에러 메시지 생성 테스트"""
         # When: 에러 메시지를 생성하면
@@ -0,0 +1,93 @@
+"""
+우선순위 메시지 큐 단위 테스트
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from a2a_core.base.message_queue import PriorityMessageQueue
+from a2a_core.protocols.message import A2AMessage, Priority
+
+
+def _make_message(action: str, priority: Priority) -> A2AMessage:
+    message = A2AMessage.create_request(
+        sender_id="sender",
+        receiver_id="receiver",
+        action=action,
+        payload={}
+    )
+    message.metadata.priority = priority
+    return message
+
+
+class TestPriorityMessageQueue:
+    """우선순위 메시지 큐 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_higher_priority_first(self):
+        """높은 우선순위 메시지가 먼저 나와야 함"""
+        # Given: 여러 우선순위의 메시지
+        queue = PriorityMessageQueue()
+        await queue.put(_make_message("low", Priority.LOW))
+        await queue.put(_make_message("normal", Priority.NORMAL))
+        await queue.put(_make_message("urgent", Priority.URGENT))
+        await queue.put(_make_message("high", Priority.HIGH))
+        
+        # When: 순서대로 꺼내면
+        actions = [(await queue.get()).body["action"] for _ in range(4)]
+        
+        # Then: URGENT > HIGH > NORMAL > LOW 순서
+        assert actions == ["urgent", "high", "normal", "low"]
+        
+    @pytest.mark.asyncio
+    async def test_fifo_within_same_priority(self):
+        """같은 우선순위 안에서는 FIFO"""
+        # Given: 같은 우선순위 메시지 여러 개
+        queue = PriorityMessageQueue()
+        for i in range(5):
+            await queue.put(_make_message(f"msg-{i}", Priority.NORMAL))
+            
+        # When & Then: 넣은 순서대로 나와야 함
+        actions = [(await queue.get()).body["action"] for _ in range(5)]
+        assert actions == [f"msg-{i}" for i in range(5)]
+        
+    def test_depth_by_priority(self):
+        """우선순위별 대기 수 집계"""
+        queue = PriorityMessageQueue()
+        queue.put_nowait(_make_message("a", Priority.HIGH))
+        queue.put_nowait(_make_message("b", Priority.HIGH))
+        queue.put_nowait(_make_message("c", Priority.LOW))
+        
+        depth = queue.depth_by_priority()
+        
+        assert depth["high"] == 2
+        assert depth["low"] == 1
+        assert depth["normal"] == 0
+        assert queue.qsize() == 3
+
+    @pytest.mark.asyncio
+    async def test_shed_expired_keeps_join_balanced(self):
+        """정리 도중 만료되는 메시지가 있어도 task_done이 맞게 호출되어 join이 끝남"""
+        queue = PriorityMessageQueue()
+        stale = _make_message("stale", Priority.NORMAL)
+        expiring = _make_message("expiring", Priority.NORMAL)
+        queue.put_nowait(stale)
+        queue.put_nowait(expiring)
+        queue.put_nowait(_make_message("fresh", Priority.NORMAL))
+        checks = []
+
+        def is_expired(message):
+            # expiring은 첫 판정 직후 만료되는 메시지 흉내
+            if message is expiring:
+                checks.append(1)
+                return len(checks) > 1
+            return message is stale
+
+        with patch.object(A2AMessage, "is_expired", is_expired):
+            assert [message.body["action"] for message in queue.shed_expired()] == ["stale"]
+            assert queue.qsize() == 2
+            assert [message.body["action"] for message in queue.shed_expired()] == ["expiring"]
+
+        queue.get_nowait()
+        queue.task_done()
+        await asyncio.wait_for(queue.join(), timeout=1)
@@ -0,0 +1,554 @@
+"""
+오케스트레이터 V2 응답 매칭 단위 테스트
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from a2a_core.protocols.message import A2AMessage
+from main_orchestrator_v2 import OrchestratorV2
+from utils.analysis_scheduler import INTERACTIVE
+from utils.batch_checkpoint import BatchCheckpoint
+from utils.circuit_breaker import CircuitOpenError
+from utils.collection_quorum import QuorumPolicy
+
+
+def make_response(request: A2AMessage, result) -> A2AMessage:
+    return A2AMessage.create_response(request, sender_id=request.header.receiver_id, result=result)
+
+
+HTTP_STAGES = (
+    "_start_quantitative_analysis", "_start_trend_analysis", "_start_sentiment_analysis",
+    "_start_score_calculation", "_start_risk_analysis", "_start_report_generation"
+)
+
+
+def stub_http_stages():
+    return {name: AsyncMock() for name in HTTP_STAGES}
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = OrchestratorV2()
+    orchestrator._send_to_ui = AsyncMock()
+    orchestrator.send_message = AsyncMock(side_effect=lambda receiver_id, action, payload, priority: A2AMessage.create_request(
+        sender_id=orchestrator.agent_id, receiver_id=receiver_id, action=action, payload=payload
+    ))
+    return orchestrator
+
+
+class TestCorrelationIndex:
+    """응답 매칭 테이블 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_responses_routed_by_correlation_table(self, orchestrator):
+        """NLU/데이터 수집 응답을 세션 순회 없이 해당 세션과 소스로 전달"""
+        other_id = await orchestrator.start_analysis_session("테슬라 분석", "client-2")
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        nlu_id = session["nlu_request_id"]
+        assert orchestrator.pending_correlations[nlu_id] == (session_id, "nlu", None)
+        assert session["session_id"] == session_id
+
+        nlu_message = A2AMessage.create_request(
+            sender_id=orchestrator.agent_id, receiver_id="nlu-agent-v2", action="extract_ticker", payload={}
+        )
+        nlu_message.header.message_id = nlu_id
+        stubs = stub_http_stages()
+        with patch.multiple(orchestrator, **stubs):
+            await orchestrator.handle_message(make_response(nlu_message, {"ticker": "AAPL", "exchange": "US"}))
+            await collection_sent(session)
+
+            assert nlu_id not in orchestrator.pending_correlations
+            assert session["state"] == "collecting_data"
+            assert orchestrator.analysis_sessions[other_id]["state"] == "waiting_nlu"
+
+            # 데이터 수집 응답은 테이블의 소스 타입으로 저장
+            for agent_type, request_id in list(session["data_request_ids"].items()):
+                request = A2AMessage.create_request(
+                    sender_id=orchestrator.agent_id, receiver_id=agent_type, action="collect_data", payload={}
+                )
+                request.header.message_id = request_id
+                assert orchestrator.pending_correlations[request_id] == (session_id, "data_collection", agent_type)
+                await orchestrator.handle_message(make_response(request, {"data": [{"title": agent_type}]}))
+
+            await orchestrator.session_pipelines[session_id].wait()
+            stubs["_start_sentiment_analysis"].assert_awaited_once()
+        assert session["collected_data"]["news"] == [{"title": "news"}]
+        assert all(entry[0] != session_id for entry in orchestrator.pending_correlations.values())
+
+    @pytest.mark.asyncio
+    async def test_disconnect_clears_correlations(self, orchestrator):
+        """연결이 끊기면 세션의 응답 매칭 항목도 제거"""
+        orchestrator.cancel = AsyncMock()
+        await orchestrator.start_analysis_session("애플 분석", "client-1")
+
+        await orchestrator._handle_ws_disconnect("client-1")
+
+        assert orchestrator.pending_correlations == {}
+        orchestrator.cancel.assert_awaited_once()
+
+
+    @pytest.mark.asyncio
+    async def test_completion_and_ttl_clear_unanswered_correlations(self, orchestrator):
+        """완료된 세션의 미응답 요청과 TTL이 지난 항목은 테이블에서 제거되고, 늦은 응답은 버려짐"""
+        done_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        done = orchestrator.analysis_sessions[done_id]
+        orchestrator._track_request(done, "late-request", "data_collection", "twitter-agent-v2", "twitter")
+        done["state"] = "completed"
+        await orchestrator._complete_session(done)
+        assert "late-request" not in orchestrator.pending_correlations
+
+        request = A2AMessage.create_request(
+            sender_id=orchestrator.agent_id, receiver_id="twitter-agent-v2", action="collect_data", payload={}
+        )
+        request.header.message_id = "late-request"
+        with patch.object(orchestrator, "_handle_agent_response", AsyncMock()) as handle:
+            await orchestrator.handle_message(make_response(request, {"data": []}))
+        handle.assert_not_awaited()
+
+        orchestrator.correlation_ttl = 0
+        other_id = await orchestrator.start_analysis_session("테슬라 분석", "client-2")
+        other = orchestrator.analysis_sessions[other_id]
+        orchestrator._expire_correlations()
+        assert orchestrator.pending_correlations == {}
+        assert other["inflight_requests"] == {}
+
+
+class TestAnalysisPipeline:
+    """분석 단계 의존성 그래프 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_quantitative_overlaps_collection(self, orchestrator):
+        """정량 분석은 티커만으로 시작하고, 리포트는 모든 단계가 끝난 뒤 시작"""
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        session["ticker"] = "AAPL"
+        quant_release = asyncio.Event()
+
+        async def quantitative(session):
+            await quant_release.wait()
+
+        stubs = stub_http_stages()
+        stubs["_start_quantitative_analysis"] = AsyncMock(side_effect=quantitative)
+
+        with patch.multiple(orchestrator, **stubs):
+            orchestrator._start_pipeline(session)
+            pipeline = orchestrator.session_pipelines[session_id]
+            await collection_sent(session)
+
+            # 수집 응답 대기 중에도 정량 분석은 이미 실행 중
+            assert "quantitative" in pipeline.running()
+            assert "sentiment" not in pipeline.tasks
+
+            orchestrator._provide(session, "collected_data")
+            await pipeline.tasks["sentiment"]
+            await pipeline.tasks["score"]
+            # 리스크는 정량 분석 결과를, 리포트는 모든 결과를 기다림
+            assert "risk" not in pipeline.tasks and "report" not in pipeline.tasks
+
+            quant_release.set()
+            await pipeline.wait()
+
+        stubs["_start_report_generation"].assert_awaited_once_with(session)
+        assert session_id not in orchestrator.session_pipelines
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_pipeline(self, orchestrator):
+        """연결이 끊기면 실행 중인 단계도 취소"""
+        orchestrator.cancel = AsyncMock()
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        session["ticker"] = "AAPL"
+        async def hang(session):
+            await asyncio.Event().wait()
+
+        stubs = stub_http_stages()
+        stubs["_start_quantitative_analysis"] = AsyncMock(side_effect=hang)
+
+        with patch.multiple(orchestrator, **stubs):
+            orchestrator._start_pipeline(session)
+            pipeline = orchestrator.session_pipelines[session_id]
+            await asyncio.sleep(0)
+
+            await orchestrator._handle_ws_disconnect("client-1")
+            await pipeline.wait()
+
+        assert pipeline.tasks["quantitative"].cancelled()
+        assert session_id not in orchestrator.session_pipelines
+
+
+class TestSharedAnalysis:
+    """같은 종목 분석 공유 테스트"""
+
+    async def resolve(self, orchestrator, session_id, ticker="AAPL"):
+        """NLU 응답을 흉내 내 세션의 티커 확정"""
+        session = orchestrator.analysis_sessions[session_id]
+        request = A2AMessage.create_request(
+            sender_id=orchestrator.agent_id, receiver_id="nlu-agent-v2", action="extract_ticker", payload={}
+        )
+        request.header.message_id = session["nlu_request_id"]
+        await orchestrator.handle_message(make_response(request, {"ticker": ticker, "exchange": "US"}))
+        return session
+
+    @pytest.mark.asyncio
+    async def test_same_ticker_sessions_share_one_pipeline(self, orchestrator):
+        """같은 티커 세션은 파이프라인 하나에 합류하고, 진행 메시지와 결과를 각자 받음"""
+        leader_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        follower_id = await orchestrator.start_analysis_session("AAPL 어때?", "client-2")
+        other_id = await orchestrator.start_analysis_session("테슬라 분석", "client-3")
+
+        with patch.multiple(orchestrator, _start_data_collection=AsyncMock(), **stub_http_stages()):
+            leader = await self.resolve(orchestrator, leader_id)
+            await orchestrator._send_to_session(leader, "log", {"message": "수집 중"})
+            orchestrator._send_to_ui.reset_mock()
+
+            follower = await self.resolve(orchestrator, follower_id)
+            await self.resolve(orchestrator, other_id, ticker="TSLA")
+
+            assert set(orchestrator.session_pipelines) == {leader_id, other_id}
+            assert follower["state"] == "attached"
+            # 합류 전 진행 상황 재생
+            orchestrator._send_to_ui.assert_any_await("client-2", "log", {"message": "수집 중"})
+
+            # 이후 leader 메시지는 두 클라이언트 모두에게
+            orchestrator._send_to_ui.reset_mock()
+            await orchestrator._send_to_session(leader, "result", {"ticker": "AAPL"})
+            sent_to = {call.args[0] for call in orchestrator._send_to_ui.await_args_list}
+            assert sent_to == {"client-1", "client-2"}
+
+            leader.update({"state": "completed", "score_calculation": {"final_score": 0.5}})
+            await orchestrator._complete_session(leader)
+
+        assert follower["final_score"] == 0.5 and follower["compacted"]
+        assert follower["client_id"] == "client-2" and follower["session_id"] == follower_id
+        assert orchestrator.shared_runs.get_stats()["joined"] == 1
+
+    @pytest.mark.asyncio
+    async def test_leader_disconnect_keeps_run_for_followers(self, orchestrator):
+        """leader 연결이 끊겨도 합류 세션이 있으면 실행 유지, 마지막 합류 세션이 떠나면 정리"""
+        orchestrator.cancel = AsyncMock()
+        leader_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        follower_id = await orchestrator.start_analysis_session("AAPL 어때?", "client-2")
+
+        with patch.multiple(orchestrator, _start_data_collection=AsyncMock(), **stub_http_stages()):
+            await self.resolve(orchestrator, leader_id)
+            await self.resolve(orchestrator, follower_id)
+
+            await orchestrator._handle_ws_disconnect("client-1")
+            assert leader_id in orchestrator.analysis_sessions
+            assert orchestrator.analysis_sessions[leader_id]["client_id"] is None
+
+            await orchestrator._handle_ws_disconnect("client-2")
+
+        assert leader_id not in orchestrator.analysis_sessions
+        assert orchestrator.shared_runs.runs == {}
+
+
+class TestBatchAnalysis:
+    """관심 종목 일괄 분석 테스트"""
+
+    def stub_pipeline(self, orchestrator):
+        """데이터 수집과 리포트 단계를 흉내 내 파이프라인이 끝까지 진행되도록 함"""
+        async def collect(session):
+            session["collected_data"] = {"news": [{"title": "a"}, {"title": "b"}]}
+            orchestrator._provide(session, "collected_data")
+
+        async def report(session):
+            session["state"] = "completed"
+            session["score_calculation"] = {"final_score": 0.4, "final_label": "positive"}
+            await orchestrator._complete_session(session)
+
+        return {**stub_http_stages(), "_start_data_collection": collect, "_start_report_generation": report}
+
+    @pytest.mark.asyncio
+    async def test_batch_item_runs_headless_with_batch_traffic(self, orchestrator):
+        """티커를 아는 항목은 NLU 없이 UI 없는 세션으로 분석하고, 단계는 배치 트래픽으로 스케줄링"""
+        with patch.multiple(orchestrator, **self.stub_pipeline(orchestrator)):
+            result = await orchestrator._analyze_item({"ticker": "AAPL"}, timeout=5)
+
+        assert result["state"] == "completed"
+        assert result["ticker"] == "AAPL" and result["final_score"] == 0.4
+        assert not any(call.args[1] == "extract_ticker" for call in orchestrator.send_message.await_args_list)
+        orchestrator._send_to_ui.assert_not_awaited()
+        assert orchestrator.scheduler.get_stats()["started"].get("batch", 0) >= 6
+        assert orchestrator.session_waiters == {}
+
+    def test_batch_id_must_be_server_generated(self, orchestrator, tmp_path):
+        """uuid4 hex가 아닌 batch_id는 체크포인트 경로로 쓰지 않고 400"""
+        from fastapi.testclient import TestClient
+
+        with pytest.raises(ValueError):
+            BatchCheckpoint(str(tmp_path), "../../x")
+        response = TestClient(orchestrator.app).post("/analyze/batch", json={"batch_id": "../../x"})
+        assert response.status_code == 400
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_batch_resumes_from_checkpoint(self, orchestrator, tmp_path):
+        """같은 batch_id로 다시 요청하면 끝난 항목은 기록된 결과를 쓰고 나머지만 분석"""
+        def setting(key, default):
+            return str(tmp_path) if key == "batch.checkpoint_dir" else default
+
+        async def analyze(item, timeout):
+            return {"ticker": item["ticker"], "state": "completed"}
+
+        with patch("main_orchestrator_v2._load_orchestrator_setting", side_effect=setting):
+            orchestrator._analyze_item = AsyncMock(side_effect=analyze)
+            stream = orchestrator.run_batch([{"ticker": "AAPL"}, {"ticker": "MSFT"}, {"ticker": "TSLA"}], concurrency=1)
+            header = await stream.__anext__()
+            first = await stream.__anext__()
+            await stream.aclose()  # 스트림 중단
+
+            orchestrator._analyze_item.reset_mock()
+            events = [event async for event in orchestrator.run_batch([], batch_id=header["batch_id"])]
+
+        assert events[0]["resumed"] == 1 and events[0]["total"] == 3
+        assert events[1] == {**first, "resumed": True}
+        assert sorted(event["ticker"] for event in events if event["type"] == "result") == ["AAPL", "MSFT", "TSLA"]
+        assert orchestrator._analyze_item.await_count == 2
+        assert events[-1]["type"] == "done"
+
+
+async def fake_sentiment_stream(session, items):
+    """감정 분석 에이전트 대신 항목마다 결과 하나씩 반환"""
+    for item in items:
+        await asyncio.sleep(0)
+        yield {"source": item["source"], "title": item.get("title"), "score": 0.5}
+
+
+async def collection_sent(session, sources=4):
+    """데이터 수집 요청이 모두 전송(또는 실패 처리)될 때까지 대기 (수집 단계는 정족수까지 끝나지 않음)"""
+    for _ in range(100):
+        if len(session.get("data_request_ids", {})) + len(session.get("failed_sources", [])) >= sources:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("데이터 수집 요청이 전송되지 않음")
+
+
+def collection_requests(orchestrator, session):
+    """세션의 데이터 수집 요청 (응답을 흉내 내는 용도)"""
+    requests = {}
+    for agent_type, request_id in session["data_request_ids"].items():
+        requests[agent_type] = A2AMessage.create_request(
+            sender_id=orchestrator.agent_id, receiver_id=agent_type, action="collect_data", payload={}
+        )
+        requests[agent_type].header.message_id = request_id
+    return requests
+
+
+class TestCollectionQuorum:
+    """데이터 수집 정족수/지연 데이터 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_deadline_proceeds_and_late_source_is_merged(self, orchestrator):
+        """기한이 지나면 도착한 데이터로 먼저 분석하고, 감정 분석 이후 온 소스는 추가 분석으로 병합"""
+        orchestrator.collection_policy = QuorumPolicy(required=["news"], min_sources=5, default_deadline=0.2, max_wait=5)
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        stream = MagicMock(side_effect=fake_sentiment_stream)
+
+        stubs = {name: AsyncMock() for name in HTTP_STAGES if name != "_start_sentiment_analysis"}
+        with patch.multiple(orchestrator, _stream_sentiment=stream, **stubs):
+            session.update({"ticker": "AAPL", "exchange": "US"})
+            orchestrator._start_pipeline(session)
+            await collection_sent(session)
+
+            requests = collection_requests(orchestrator, session)
+            await orchestrator.handle_message(make_response(requests["news"], {"data": [{"title": "news"}]}))
+            assert "collection_quorum" not in session
+
+            pipeline = orchestrator.session_pipelines[session_id]
+            for _ in range(50):
+                if "collection_quorum" in session:
+                    break
+                await asyncio.sleep(0.02)
+            await pipeline.wait()
+            assert session["collection_quorum"]["reason"] == "deadline"
+            assert set(session["late_sources"]) == {"twitter", "sec", "mcp"}
+            stubs["_start_score_calculation"].assert_awaited_once()
+
+            await orchestrator.handle_message(make_response(requests["twitter"], {"data": [{"title": "tweet"}]}))
+            await asyncio.gather(*orchestrator.session_tasks.get(session_id, ()))
+
+        assert stream.call_args.args[1] == [{"title": "tweet", "source": "twitter"}]
+        assert session["collected_data"]["twitter"] == [{"title": "tweet"}]
+        assert [item["source"] for item in session["sentiment_analysis"]] == ["news", "twitter"]
+
+
+    @pytest.mark.asyncio
+    async def test_collection_slot_held_until_quorum(self, orchestrator):
+        """data_collection 자리는 요청 전송이 아니라 수집이 끝날 때까지 유지되고, 예산은 소스 요청 수만큼 차감"""
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        gate = orchestrator.scheduler.gates["data_collection"]
+        budget = orchestrator.scheduler.budgets["market_data"]
+
+        with patch.multiple(orchestrator, **stub_http_stages()):
+            session.update({"ticker": "AAPL", "exchange": "US"})
+            tokens = budget.tokens
+            orchestrator._start_pipeline(session)
+            await collection_sent(session)
+            assert gate.active == 1
+            assert budget.tokens == pytest.approx(tokens - 4, abs=0.1)
+
+            requests = collection_requests(orchestrator, session)
+            for agent_type in ("news", "twitter", "sec", "mcp"):
+                await orchestrator.handle_message(make_response(requests[agent_type], {"data": []}))
+            await orchestrator.session_pipelines[session_id].wait()
+
+        assert gate.active == 0
+        assert session_id not in orchestrator.collection_waiters
+
+
+class TestSentimentStreaming:
+    """수집 → 감정 분석 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_partial_results_start_sentiment_before_collection_ends(self, orchestrator):
+        """중간 결과 항목은 수집이 끝나기 전에 분석되고, 최종 응답에서는 새 항목만 분석"""
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        stream = MagicMock(side_effect=fake_sentiment_stream)
+
+        stubs = {name: AsyncMock() for name in HTTP_STAGES if name != "_start_sentiment_analysis"}
+        with patch.multiple(orchestrator, _stream_sentiment=stream, **stubs):
+            session.update({"ticker": "AAPL", "exchange": "US"})
+            orchestrator._start_pipeline(session)
+            await collection_sent(session)
+            requests = collection_requests(orchestrator, session)
+
+            first = [{"title": "a"}, {"title": "b"}]
+            partial = A2AMessage.create_partial(requests["news"], sender_id="news-agent-v2", result={"data": first})
+            await orchestrator.handle_message(partial)
+            await asyncio.sleep(0.3)
+
+            assert stream.call_count == 1
+            assert "news" in session["pending_data_agents"]
+            assert len(orchestrator.sentiment_feeds[session_id].results) == 2
+
+            await orchestrator.handle_message(make_response(requests["news"], {"data": first + [{"title": "c"}]}))
+            for agent_type in ("twitter", "sec", "mcp"):
+                await orchestrator.handle_message(make_response(requests[agent_type], {"data": []}))
+            await orchestrator.session_pipelines[session_id].wait()
+
+        assert [call.args[1] for call in stream.call_args_list][1] == [{"title": "c", "source": "news"}]
+        assert sorted(item["title"] for item in session["sentiment_analysis"]) == ["a", "b", "c"]
+        assert session_id not in orchestrator.sentiment_feeds
+
+    @pytest.mark.asyncio
+    async def test_items_sent_immediately_and_charts_throttled(self, orchestrator):
+        """항목 결과는 도착할 때마다 전송되고 잠정 차트는 간격을 두고 최신 상태로 전송"""
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        session["ticker"] = "AAPL"
+
+        with patch.object(orchestrator, "_send_to_session", AsyncMock()) as send, \
+                patch.object(orchestrator, "_send_chart_to_session", AsyncMock()) as chart:
+            await orchestrator._on_sentiment_item(session, {"source": "news", "score": 0.5})
+            await asyncio.sleep(0.05)
+            await orchestrator._on_sentiment_item(session, {"source": "news", "score": 0.3})
+            await orchestrator._on_sentiment_item(session, {"source": "twitter", "score": -0.2})
+            await asyncio.sleep(0.6)
+
+        items = [call.args[2] for call in send.call_args_list if call.args[1] == "sentiment_item"]
+        assert len(items) == 3
+        assert items[-1]["item"]["label"] == "negative"
+
+        scores = [call.args[2] for call in chart.call_args_list if call.args[1] == "final_score"]
+        assert len(scores) == 2
+        assert scores[-1]["provisional"] is True
+        assert scores[-1]["analyzed"] == 3
+        assert scores[-1]["final_score"] == pytest.approx(0.2)
+
+        orchestrator._drop_sentiment_progress(session_id)
+        assert session_id not in orchestrator.sentiment_progress
+
+
+class TestCircuitBreakers:
+    """하위 에이전트 서킷 브레이커 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_collection_request(self, orchestrator):
+        """서킷이 열린 수집 에이전트에는 전송하지 않고 바로 실패 소스로 처리"""
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        orchestrator.breakers.get("twitter-agent-v2")._open()
+
+        with patch.multiple(orchestrator, **stub_http_stages()):
+            session.update({"ticker": "AAPL", "exchange": "US"})
+            orchestrator._start_pipeline(session)
+            await collection_sent(session)
+
+        receivers = [call.kwargs["receiver_id"] for call in orchestrator.send_message.call_args_list]
+        assert "twitter-agent-v2" not in receivers
+        assert session["failed_sources"] == ["twitter"]
+        assert "twitter" not in session["data_request_ids"]
+        assert orchestrator.breakers.get("twitter-agent-v2").rejected == 1
+        orchestrator.breakers.close()
+
+    @pytest.mark.asyncio
+    async def test_guarded_post_opens_on_server_errors(self, orchestrator):
+        """5xx가 쌓이면 서킷이 열리고 이후 호출은 요청 없이 CircuitOpenError"""
+        http_client = MagicMock()
+        http_client.post = AsyncMock(return_value=MagicMock(status_code=503))
+        breaker = orchestrator.breakers.get("quantitative-agent")
+
+        for _ in range(breaker.min_calls):
+            await orchestrator._guarded_post(http_client, "quantitative-agent", "http://localhost:8211/quantitative_analysis")
+        with pytest.raises(CircuitOpenError):
+            await orchestrator._guarded_post(http_client, "quantitative-agent", "http://localhost:8211/quantitative_analysis")
+
+        assert http_client.post.await_count == breaker.min_calls
+        assert orchestrator.breaker_endpoints["quantitative-agent"] == "http://localhost:8211"
+        assert orchestrator.breakers.get_stats()["quantitative-agent"]["state"] == "open"
+        orchestrator.breakers.close()
+
+    @pytest.mark.asyncio
+    async def test_sentiment_breaker_keyed_by_agent_name(self, orchestrator):
+        """감정 분석 브레이커는 인스턴스 ID가 아닌 에이전트 이름 기준 (에이전트별 설정 적용)"""
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        session["ticker"] = "AAPL"
+        instance = MagicMock(agent_id="3f2b9c1e-instance", endpoint="http://localhost:8202")
+        breaker = orchestrator.breakers.get("sentiment-analysis-agent-v2")
+        breaker._open()
+
+        with patch.object(orchestrator, "_resolve_receiver", AsyncMock(return_value=instance)):
+            results = [result async for result in orchestrator._stream_sentiment(session, [{"title": "a"}])]
+
+        assert results == []
+        assert breaker.rejected == 1
+        assert breaker.slow_call == 90
+        assert "3f2b9c1e-instance" not in orchestrator.breakers.breakers
+        orchestrator.breakers.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_waiting_for_slot_returns_trial_permit(self, orchestrator):
+        """반열림 상태에서 감정 분석 자리를 기다리다 취소되면 시험 호출 자리를 돌려줌"""
+        session_id = await orchestrator.start_analysis_session("애플 분석", "client-1")
+        session = orchestrator.analysis_sessions[session_id]
+        session["ticker"] = "AAPL"
+        instance = MagicMock(agent_id="sentiment-a", endpoint="http://localhost:8202")
+        breaker = orchestrator.breakers.get("sentiment-analysis-agent-v2")
+        breaker._half_open()
+        gate = orchestrator.scheduler.gates["sentiment"]
+        held = [await gate.acquire(INTERACTIVE) for _ in range(gate.limit)]
+
+        async def consume():
+            return [result async for result in orchestrator._stream_sentiment(session, [{"title": "a"}])]
+
+        with patch.object(orchestrator, "_resolve_receiver", AsyncMock(return_value=instance)):
+            tasks = [asyncio.create_task(consume()) for _ in range(breaker.half_open_calls)]
+            await asyncio.sleep(0.01)
+            assert breaker.trial_inflight == breaker.half_open_calls
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert breaker.state == "half_open"
+        assert breaker.trial_inflight == 0
+        assert breaker.allow()
+        for _ in held:
+            gate.release()
+        orchestrator.breakers.close()
@@ -0,0 +1,92 @@
+"""
+파이프라인 실행기 단위 테스트
+"""
+
+import asyncio
+import pytest
+from a2a_core.base.pipeline import PipelineRun, Stage, StageGraph
+
+
+def recorder(log, name, delay=0.0, error=None):
+    async def run(context):
+        log.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        log.append(f"{name}:end")
+        if error:
+            raise error
+    return run
+
+
+class TestStageGraph:
+    """그래프 검증 테스트"""
+
+    def test_order_and_validation(self):
+        """위상 정렬, 누락 입력과 순환 검출"""
+        noop = recorder([], "noop")
+        graph = StageGraph([
+            Stage("b", ("x",), ("y",), noop),
+            Stage("a", ("src",), ("x",), noop),
+        ], sources=("src",))
+        assert graph.order() == ["a", "b"]
+
+        with pytest.raises(ValueError):
+            StageGraph([Stage("a", ("missing",), (), noop)])
+        with pytest.raises(ValueError):
+            StageGraph([Stage("a", ("y",), ("x",), noop), Stage("b", ("x",), ("y",), noop)])
+
+
+class TestPipelineRun:
+    """실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self):
+        """입력이 준비된 단계는 앞 단계 완료를 기다리지 않고 시작"""
+        log = []
+        graph = StageGraph([
+            Stage("slow", ("src",), ("a",), recorder(log, "slow", 0.05)),
+            Stage("fast", ("src",), ("b",), recorder(log, "fast")),
+            Stage("join", ("a", "b"), ("c",), recorder(log, "join")),
+        ], sources=("src",))
+        completed = []
+        run = PipelineRun(graph, {}, on_complete=completed.append)
+
+        run.provide("src")
+        await run.wait()
+
+        assert log.index("fast:end") < log.index("slow:end")
+        assert log.index("join:start") > log.index("slow:end")
+        assert run.finished and completed == [run]
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_releases_dependents(self):
+        """실패한 단계의 출력도 준비된 것으로 보고 다음 단계 진행"""
+        log = []
+        graph = StageGraph([
+            Stage("broken", (), ("a",), recorder(log, "broken", error=RuntimeError("boom"))),
+            Stage("next", ("a",), (), recorder(log, "next")),
+        ])
+        run = PipelineRun(graph, {})
+
+        run.start()
+        await run.wait()
+
+        assert "next:end" in log
+        assert isinstance(run.failed["broken"], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_external_source_and_cancel(self):
+        """외부 키를 기다리는 단계는 provide 전까지 시작하지 않고, cancel은 실행 중 단계를 중단"""
+        log = []
+        graph = StageGraph([
+            Stage("waiting", ("external",), (), recorder(log, "waiting")),
+            Stage("long", (), (), recorder(log, "long", 10)),
+        ], sources=("external",))
+        run = PipelineRun(graph, {})
+
+        run.start()
+        await asyncio.sleep(0)
+        assert run.running() == ["long"] and "waiting" not in run.tasks
+
+        run.cancel()
+        await run.wait()
+        assert run.tasks["long"].cancelled() and not run.finished
@@ -0,0 +1,141 @@
+"""
+레지스트리 복제 / 장애 전환 단위 테스트
+"""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock
+from a2a_core.registry.registry_server import Registry
+from a2a_core.registry.replication import anti_entropy_round, liveness_round, to_clock
+from a2a_core.registry.store import RegistryStore
+from tests.conftest import make_register_request
+from tests.unit.test_base_agent import TestAgent
+
+
+class PeerClient:
+    """다른 복제본의 /replication 엔드포인트를 흉내 내는 클라이언트"""
+
+    def __init__(self, peer: Registry):
+        self.peer = peer
+
+    async def get(self, url, params=None):
+        if url.endswith("/liveness"):
+            return Mock(json=Mock(return_value=self.peer.export_liveness(params["since"], params["exclude"])))
+        if url.endswith("/summary"):
+            return Mock(json=Mock(return_value={"hash": self.peer.replica.summary()}))
+        digest = {agent_id: list(clock) for agent_id, clock in self.peer.replica.digest().items()}
+        return Mock(json=Mock(return_value={"entries": digest}))
+
+    async def post(self, url, json):
+        if url.endswith("/liveness"):
+            return Mock(json=Mock(return_value={"applied": self.peer.merge_liveness(json["entries"], json["instance"])}))
+        if url.endswith("/pull"):
+            return Mock(json=Mock(return_value={"records": self.peer.export_records(json["agent_ids"])}))
+        return Mock(json=Mock(return_value={"applied": self.peer.merge_records(json["records"])}))
+
+
+class TestRegistryReplication:
+    """복제본 동기화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_anti_entropy_converges(self):
+        """양쪽 변경을 한 번의 교환으로 맞추고, 같아지면 요약 해시만 비교"""
+        replica_a = Registry(replica_id="a")
+        replica_b = Registry(replica_id="b")
+        replica_a.register_agent(make_register_request("nlu", 8108))
+        replica_b.register_agent(make_register_request("sentiment", 8202))
+
+        exchanged = await anti_entropy_round(replica_a, PeerClient(replica_b), "http://localhost:8011")
+
+        assert exchanged == 2
+        assert set(replica_a.agents) == set(replica_b.agents) == {"nlu", "sentiment"}
+        assert replica_a.replica.summary() == replica_b.replica.summary()
+        assert await anti_entropy_round(replica_a, PeerClient(replica_b), "http://localhost:8011") == 0
+
+    @pytest.mark.asyncio
+    async def test_deregister_and_heartbeat_propagate(self):
+        """등록 해제는 삭제 표시로, 하트비트/부하는 시계와 토폴로지 변경 없이 전파"""
+        replica_a = Registry(replica_id="a")
+        replica_b = Registry(replica_id="b")
+        replica_a.register_agent(make_register_request("nlu", 8108))
+        replica_a.register_agent(make_register_request("sentiment", 8202))
+        await anti_entropy_round(replica_b, PeerClient(replica_a), "http://localhost:8001")
+
+        version = replica_b.watch.version
+        summary = replica_a.replica.summary()
+        replica_a.update_heartbeat("sentiment", {"queue_depth": 4})
+        replica_a.update_load("nlu", {"queue_depth": 1})
+        assert replica_a.replica.summary() == summary
+        assert await anti_entropy_round(replica_b, PeerClient(replica_a), "http://localhost:8001") == 0
+
+        assert await liveness_round(replica_b, PeerClient(replica_a), "http://localhost:8001") == 2
+        assert replica_b.agents["sentiment"].load == {"queue_depth": 4}
+        assert replica_b.agents["nlu"].load == {"queue_depth": 1}
+        assert replica_b.last_heartbeat["sentiment"] == replica_a.last_heartbeat["sentiment"]
+        assert replica_b.watch.version == version
+
+        # 다음 교환은 바뀐 항목만 (받은 항목은 보낸 복제본에 되돌려 보내지 않음)
+        replica_a.update_load("nlu", {"queue_depth": 2})
+        assert await liveness_round(replica_b, PeerClient(replica_a), "http://localhost:8001") == 1
+        assert replica_b.agents["nlu"].load == {"queue_depth": 2}
+
+        replica_a.deregister_agent("nlu")
+        await anti_entropy_round(replica_b, PeerClient(replica_a), "http://localhost:8001")
+        assert "nlu" not in replica_b.agents
+        assert replica_b.replica.is_deleted("nlu")
+
+    def test_last_writer_wins(self):
+        """오래된 시계의 항목은 반영하지 않음"""
+        replica = Registry(replica_id="a")
+        replica.register_agent(make_register_request("nlu", 8108))
+        stale = {"agent_id": "nlu", "clock": [0, "b"], "deleted": True}
+
+        assert replica.merge_records([stale]) == 0
+        assert "nlu" in replica.agents
+        assert to_clock(["3", "b"]) == (3, "b")
+
+    @pytest.mark.asyncio
+    async def test_writes_after_restart_beat_older_clocks(self, tmp_path):
+        """재시작한 복제본의 새 변경은 재시작 전 시계로 기록된 다른 복제본의 항목을 이김"""
+        replica_a = Registry(store=RegistryStore(str(tmp_path)), replica_id="a")
+        replica_b = Registry(replica_id="b")
+        replica_a.register_agent(make_register_request("nlu", 8108))
+        await anti_entropy_round(replica_b, PeerClient(replica_a), "http://localhost:8001")
+        before = replica_b.replica.clocks["nlu"]
+        replica_a.store.close()
+        await asyncio.sleep(0.01)  # 재시작은 마지막 기록보다 나중 (시계는 ms 단위)
+
+        restarted = Registry(store=RegistryStore(str(tmp_path)), replica_id="a")
+        restarted.register_agent(make_register_request("nlu", 8118))
+        assert restarted.replica.clocks["nlu"] > before
+
+        await anti_entropy_round(replica_b, PeerClient(restarted), "http://localhost:8001")
+        assert replica_b.agents["nlu"].endpoint == "http://localhost:8118"
+
+
+class TestRegistryFailover:
+    """에이전트 측 레지스트리 전환 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_agent_fails_over_to_next_registry(self):
+        """첫 레지스트리가 죽으면 다음 복제본으로 전환하고 이후에도 그 복제본 사용"""
+        agent = TestAgent(name="Test Agent", description="테스트", port=9971)
+        agent.registry_urls = ["http://localhost:8001", "http://localhost:8011"]
+        agent.http_client = AsyncMock()
+        agent.http_client.get.side_effect = [
+            httpx.ConnectError("refused"),
+            Mock(status_code=200, headers={}, json=Mock(return_value={"agents": []})),
+            Mock(status_code=200, headers={}, json=Mock(return_value={"agents": []})),
+        ]
+
+        await agent._registry_request("get", "/discover")
+        await agent._registry_request("get", "/discover")
+
+        urls = [call.args[0] for call in agent.http_client.get.call_args_list]
+        assert urls == [
+            "http://localhost:8001/discover",
+            "http://localhost:8011/discover",
+            "http://localhost:8011/discover",
+        ]
+        assert agent.registry_url == "http://localhost:8011"
@@ -0,0 +1,210 @@
+"""
+배포용 레지스트리 서버(registry_server.Registry) 단위 테스트
+"""
+
+import asyncio
+import httpx
+import pytest
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+from a2a_core.registry.registry_server import Registry
+from tests.conftest import make_register_request
+
+
+class TestIndexedDiscovery:
+    """인덱스/버전/델타 발견 테스트"""
+
+    def test_discovery_uses_capability_index(self):
+        """능력별 인덱스로 조회, 재등록하면 이전 능력 인덱스에서 빠짐"""
+        registry = Registry()
+        registry.register_agent(make_register_request("a"))
+        registry.register_agent(make_register_request("b", capability="report"))
+        registry.register_agent(make_register_request("a", capability="report"))
+
+        assert registry.discover_agents("analyze") == []
+        assert [agent.agent_id for agent in registry.discover_agents("report")] == ["b", "a"]
+        assert "analyze" not in registry.agent_index
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_expiry_is_incremental(self):
+        """만료 힙에서 꺼낸 에이전트만 제거, 그 사이 하트비트가 온 에이전트는 유지"""
+        registry = Registry()
+        registry.timeout_seconds = 0.05
+        registry.register_agent(make_register_request("stale"))
+        registry.register_agent(make_register_request("kept"))
+        await asyncio.sleep(0.03)
+        registry.register_agent(make_register_request("fresh"))
+        registry.update_heartbeat("kept")
+        await asyncio.sleep(0.03)
+
+        assert [agent.agent_id for agent in registry.discover_agents("analyze")] == ["kept", "fresh"]
+        assert "stale" not in registry.last_heartbeat
+
+    def test_delta_since_version(self):
+        """since 이후 바뀐 에이전트만, 해제된 에이전트는 removed로"""
+        registry = Registry()
+        registry.register_agent(make_register_request("a"))
+        registry.register_agent(make_register_request("b"))
+        since = registry.topology_version()
+
+        registry.register_agent(make_register_request("c"))
+        registry.deregister_agent("a")
+        delta = registry.discover_changes(since, "analyze")
+
+        assert [agent.agent_id for agent in delta["agents"]] == ["c"]
+        assert delta["removed"] == ["a"]
+        assert delta["version"] == since + 2
+
+        # 잘려 나간 변경 기록보다 오래된 since는 전체 목록으로
+        registry.max_changes = 1
+        registry.register_agent(make_register_request("d"))
+        assert registry.discover_changes(since, "analyze") is None
+
+    def test_discover_endpoint_etag(self, monkeypatch):
+        """If-None-Match가 현재 ETag면 304, 다른 인스턴스의 ETag는 재사용하지 않음"""
+        from fastapi.testclient import TestClient
+        from a2a_core.registry import registry_server as module
+
+        registry = Registry()
+        monkeypatch.setattr(module, "registry", registry)
+        client = TestClient(module.app)
+        client.post("/register", json=make_register_request("a").model_dump())
+
+        first = client.get("/discover")
+        etag = first.headers["etag"]
+        assert first.json()["count"] == 1
+        assert client.get("/discover", headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/register", json=make_register_request("b").model_dump())
+        assert client.get("/discover", headers={"If-None-Match": etag}).status_code == 200
+        delta = client.get("/discover", params={"since": first.json()["version"]}).json()
+        assert delta["delta"] is True
+        assert [agent["agent_id"] for agent in delta["agents"]] == ["b"]
+
+        # 같은 버전이라도 다른 복제본/재시작한 레지스트리의 ETag와는 다름
+        other = Registry()
+        other.watch.version = registry.watch.version
+        assert other.etag() != registry.etag()
+
+    def test_load_report_invalidates_etag(self, monkeypatch):
+        """부하 보고 후 재검증하면 304가 아니라 새 부하가 담긴 목록"""
+        from fastapi.testclient import TestClient
+        from a2a_core.registry import registry_server as module
+
+        registry = Registry()
+        monkeypatch.setattr(module, "registry", registry)
+        client = TestClient(module.app)
+        client.post("/register", json=make_register_request("a").model_dump())
+        first = client.get("/discover")
+        version = registry.watch.version
+
+        assert client.put("/load/a", json={"load": {"queue_depth": 50}}).status_code == 200
+        revalidated = client.get("/discover", headers={"If-None-Match": first.headers["etag"]})
+
+        assert revalidated.status_code == 200
+        assert revalidated.headers["etag"] != first.headers["etag"]
+        assert revalidated.json()["agents"][0]["load"] == {"queue_depth": 50}
+        assert registry.watch.version == version
+
+
+class TestHealthCheck:
+    """병렬 적응형 헬스체크 테스트"""
+
+    def _register(self, registry, count):
+        for index in range(count):
+            registry.register_agent(make_register_request(f"agent-{index}", port=9000 + index))
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently_with_limit(self):
+        """느린 에이전트가 있어도 동시 상한 안에서 병렬로 확인, 실패한 에이전트는 발견에서 제외"""
+        registry = Registry(health_check_concurrency=2)
+        self._register(registry, 4)
+        running = 0
+        peak = 0
+
+        async def slow_get(url, timeout=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            if url.startswith("http://localhost:9003"):
+                raise httpx.ConnectError("refused")
+            return Mock(status_code=200)
+
+        registry.http_client = Mock(is_closed=False, get=slow_get)
+        started = time.perf_counter()
+        await registry.health_check_agents()
+
+        assert peak == 2
+        assert time.perf_counter() - started < 0.15
+        assert registry.agents["agent-3"].status == "unreachable"
+        assert "agent-3" not in [agent.agent_id for agent in registry.discover_agents("analyze")]
+        assert registry.agents["agent-0"].latency_ms is not None
+
+        # 하트비트가 오면 다시 발견 대상
+        registry.update_heartbeat("agent-3")
+        assert "agent-3" in [agent.agent_id for agent in registry.discover_agents("analyze")]
+
+    @pytest.mark.asyncio
+    async def test_adaptive_interval(self):
+        """정상이면 간격이 늘고, 실패하면 최소 간격으로 돌아감"""
+        registry = Registry()
+        self._register(registry, 1)
+        registry.http_client = Mock(is_closed=False, get=AsyncMock(return_value=Mock(status_code=200)))
+        schedule = registry.health_schedule
+
+        await registry.health_check_agents()
+        await registry.health_check_agents()
+        assert schedule.states["agent-0"].interval == schedule.min_interval * 4
+
+        # 확인할 차례가 아니면 due_only 스윕에서 건너뜀
+        await registry.health_check_agents(due_only=True)
+        assert registry.http_client.get.call_count == 2
+
+        registry.http_client.get.return_value = Mock(status_code=500)
+        await registry.health_check_agents()
+        assert schedule.states["agent-0"].interval == schedule.min_interval
+        assert registry.agents["agent-0"].status == "unhealthy"
+
+    def test_discovery_prefers_responsive_agents(self):
+        """발견 결과는 응답 지연이 짧은 순서"""
+        registry = Registry()
+        self._register(registry, 3)
+        registry.agents["agent-0"].latency_ms = 80.0
+        registry.agents["agent-2"].latency_ms = 5.0
+        registry._listing_cache.clear()
+
+        assert [agent.agent_id for agent in registry.discover_agents()] == ["agent-2", "agent-0", "agent-1"]
+
+    @pytest.mark.asyncio
+    async def test_healthy_agent_never_expires_between_probes(self):
+        """하트비트 없이도 확인에 계속 성공하는 에이전트는 (지터가 최대여도) 만료되지 않음"""
+        registry = Registry()
+        self._register(registry, 1)
+        registry.http_client = Mock(is_closed=False, get=AsyncMock(return_value=Mock(status_code=200)))
+        schedule = registry.health_schedule
+        assert schedule.max_interval * (1 + schedule.jitter) + schedule.min_interval < registry.timeout_seconds
+
+        clock = {"now": time.monotonic()}
+        started = datetime.now()
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return started + timedelta(seconds=clock["now"] - clock["start"])
+
+        clock["start"] = clock["now"]
+        with patch("a2a_core.registry.health.time.monotonic", lambda: clock["now"]), \
+                patch("a2a_core.registry.health.random.uniform", lambda low, high: high), \
+                patch("a2a_core.registry.registry_server.datetime", FakeDatetime):
+            registry.update_heartbeat("agent-0")
+            # 600초 하트비트 주기 동안 주기 루프처럼 확인 (타임아웃 직전까지 확인이 늦어지는 최악의 경우)
+            while clock["now"] - clock["start"] < 600:
+                clock["now"] += max(1.0, schedule.next_wakeup()) + registry.health_check_timeout
+                registry._cleanup_inactive_agents()
+                assert "agent-0" in registry.agents
+                await registry.health_check_agents(due_only=True)
+
+        assert schedule.states["agent-0"].interval == schedule.max_interval
@@ -0,0 +1,68 @@
+"""
+레지스트리 상태 영속화 단위 테스트
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from a2a_core.registry.registry_server import Registry
+from a2a_core.registry.store import RegistryStore
+from tests.conftest import make_register_request
+
+
+class TestRegistryStore:
+    """스냅샷 + 로그 테스트"""
+
+    def test_restart_restores_unverified_agents(self, tmp_path):
+        """재시작하면 로그를 재생해 unverified 상태로 바로 발견 가능"""
+        registry = Registry(store=RegistryStore(str(tmp_path)))
+        registry.register_agent(make_register_request("a", 9001))
+        registry.register_agent(make_register_request("b", 9002))
+        registry.deregister_agent("a")
+        registry.store.close()
+
+        restarted = Registry(store=RegistryStore(str(tmp_path)))
+
+        agents = restarted.discover_agents("analyze")
+        assert [agent.agent_id for agent in agents] == ["b"]
+        assert agents[0].status == "unverified"
+
+        # 하트비트가 오면 확인됨
+        restarted.update_heartbeat("b")
+        assert restarted.agents["b"].status == "active"
+
+    def test_compaction_and_truncated_tail(self, tmp_path):
+        """로그가 길어지면 스냅샷으로 압축, 잘린 마지막 줄은 무시"""
+        store = RegistryStore(str(tmp_path), compact_every=2)
+        registry = Registry(store=store)
+        for index in range(3):
+            registry.register_agent(make_register_request(f"agent-{index}", 9000 + index))
+        assert store.wal_entries == 1
+        store.close()
+
+        with open(store.wal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "deregister", "agent_')
+
+        assert set(RegistryStore(str(tmp_path)).load()) == {"agent-0", "agent-1", "agent-2"}
+
+    @pytest.mark.asyncio
+    async def test_verify_restored_agents(self, tmp_path):
+        """첫 헬스체크에서 응답한 에이전트는 active, 응답 없는 에이전트는 제거"""
+        registry = Registry(store=RegistryStore(str(tmp_path)))
+        registry.register_agent(make_register_request("alive", 9001))
+        registry.register_agent(make_register_request("dead", 9002))
+        registry.store.close()
+        restarted = Registry(store=RegistryStore(str(tmp_path)))
+
+        async def get(url, timeout=None):
+            if "9002" in url:
+                raise ConnectionError("refused")
+            return Mock(status_code=200)
+
+        client = AsyncMock()
+        client.__aenter__.return_value = Mock(get=get)
+        with patch("a2a_core.registry.registry_server.httpx.AsyncClient", return_value=client):
+            await restarted.verify_restored_agents()
+
+        assert restarted.agents["alive"].status == "active"
+        assert "dead" not in restarted.agents
+        assert set(RegistryStore(str(tmp_path)).load()) == {"alive"}
@@ -0,0 +1,85 @@
+"""
+멱등 전송 (재시도 / 중복 제거) 단위 테스트
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock
+from a2a_core.base.retry import DedupWindow, backoff_delay
+from a2a_core.protocols.message import A2AMessage
+from a2a_core.registry.service_registry import AgentInfo
+from tests.unit.test_base_agent import TestAgent
+
+
+@pytest.fixture
+def sender():
+    agent = TestAgent(name="Sender Agent", description="송신자", port=9941)
+    agent.retry_base_delay = 0
+    agent.known_agents["receiver"] = AgentInfo(
+        agent_id="receiver-id",
+        name="Receiver Agent",
+        description="수신자",
+        endpoint="http://localhost:9942",
+        capabilities=[]
+    )
+    agent.http_client = AsyncMock()
+    return agent
+
+
+class TestRetry:
+    """재시도/중복 제거 테스트"""
+
+    def test_backoff_is_bounded(self):
+        """백오프는 0 ~ min(max_delay, base * 2^attempt) 범위"""
+        for attempt in range(10):
+            assert 0 <= backoff_delay(attempt, base_delay=0.1, max_delay=1.0) <= min(1.0, 0.1 * 2 ** attempt)
+
+    def test_dedup_window_evicts_oldest(self):
+        """창 크기를 넘으면 가장 오래된 message_id부터 잊음"""
+        window = DedupWindow(max_size=2)
+        for message_id in ("a", "b", "c"):
+            window.add(message_id)
+
+        assert not window.seen("a")
+        assert window.seen("b") and window.seen("c")
+        assert window.duplicates == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failures_with_same_id(self, sender):
+        """연결 오류/5xx는 같은 message_id로 재전송"""
+        sender.http_client.post.side_effect = [
+            httpx.ConnectError("refused"),
+            Mock(status_code=502, headers={}),
+            Mock(status_code=200, headers={}),
+        ]
+
+        message = await sender.send_message("receiver", "analyze", {})
+
+        assert message is not None
+        assert message.metadata.retry_count == 2
+        ids = {call.kwargs["json"]["header"]["message_id"] for call in sender.http_client.post.call_args_list}
+        assert ids == {message.header.message_id}
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(self, sender):
+        """4xx는 재시도하지 않음"""
+        sender.http_client.post.return_value = Mock(status_code=400, headers={})
+
+        assert await sender.send_message("receiver", "analyze", {}) is None
+        assert sender.http_client.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_receiver_drops_duplicates(self):
+        """재전송된 메시지는 한 번만 큐에 들어감"""
+        receiver = TestAgent(name="Receiver Agent", description="수신자", port=9943)
+        message = A2AMessage.create_request(
+            sender_id="sender", receiver_id="receiver", action="analyze", payload={}
+        )
+
+        first = await receiver._accept_message(message)
+        second = await receiver._accept_message(message)
+
+        assert first["status"] == "accepted"
+        assert second["status"] == "duplicate"
+        assert receiver.message_queue.qsize() == 1
+        assert receiver.get_queue_stats()["duplicates"] == 1
@@ -0,0 +1,57 @@
+"""
+감정 분석 입력 스트림 단위 테스트
+"""
+
+import asyncio
+import pytest
+from utils.sentiment_feed import SentimentFeed, item_key
+
+
+class TestSentimentFeed:
+    """묶음 전송/중복 제거 테스트"""
+
+    def make_feed(self, batch_size=2, linger=0.01):
+        self.batches = []
+        self.seen_results = []
+
+        async def analyze(batch):
+            self.batches.append([item["title"] for item in batch])
+            for item in batch:
+                await asyncio.sleep(0)
+                yield {"title": item["title"], "score": 0.1}
+
+        async def on_result(result):
+            self.seen_results.append(result["title"])
+
+        return SentimentFeed(analyze, on_result, batch_size=batch_size, linger=linger)
+
+    @pytest.mark.asyncio
+    async def test_batches_and_deduplicates(self):
+        """batch_size마다 바로 전송하고, 같은 항목은 다시 분석하지 않음"""
+        feed = self.make_feed()
+        assert feed.feed([{"source": "news", "title": "a"}, {"source": "news", "title": "b"}]) == 2
+        assert feed.feed([{"source": "news", "title": "a"}, {"source": "news", "title": "c"}]) == 1
+        await asyncio.sleep(0.05)  # linger가 지나면 남은 한 건도 전송
+
+        results = await feed.close()
+
+        assert self.batches == [["a", "b"], ["c"]]
+        assert sorted(result["title"] for result in results) == ["a", "b", "c"]
+        assert sorted(self.seen_results) == ["a", "b", "c"]
+        assert feed.feed([{"source": "news", "title": "d"}]) == 0  # 닫힌 뒤에는 받지 않음
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_and_cancel_stops(self):
+        feed = self.make_feed(batch_size=10, linger=60)
+        feed.feed([{"source": "news", "title": "a"}])
+        assert len(await feed.close()) == 1
+
+        feed = self.make_feed(batch_size=1)
+        feed.feed([{"source": "news", "title": "a"}])
+        feed.cancel()
+        await asyncio.sleep(0.01)
+        assert feed.tasks == set() and self.seen_results == []
+
+    def test_item_key(self):
+        assert item_key({"source": "news", "url": "u", "title": "t"}) == "news:u"
+        assert item_key({"source": "sec", "title": "t"}) != item_key({"source": "news", "title": "t"})
@@ -0,0 +1,72 @@
+"""
+감정 분석 진행 상황 테스트 (프레임 제한 + 잠정 점수)
+"""
+
+import asyncio
+import pytest
+
+from utils.sentiment_progress import FrameThrottle, SentimentProgress
+
+
+class TestFrameThrottle:
+    """FrameThrottle 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_requests_coalesced_and_last_state_sent(self):
+        """간격 안의 요청은 하나로 합쳐지고 마지막 요청 뒤에도 프레임이 한 번 더 전송됨"""
+        state = {"value": 0}
+        frames = []
+
+        async def send():
+            frames.append(state["value"])
+
+        throttle = FrameThrottle(send, interval=0.05)
+        for value in range(1, 6):
+            state["value"] = value
+            throttle.request()
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.1)
+
+        assert throttle.requested == 5
+        assert len(frames) == 2
+        assert frames[-1] == 5
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_pending_frame(self):
+        """취소하면 예약된 프레임은 전송되지 않음"""
+        frames = []
+
+        async def send():
+            frames.append(1)
+
+        throttle = FrameThrottle(send, interval=0.05)
+        throttle.request()
+        await asyncio.sleep(0)
+        throttle.request()
+        throttle.cancel()
+        await asyncio.sleep(0.1)
+
+        assert frames == [1]
+
+
+class TestSentimentProgress:
+    """SentimentProgress 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_tracks_average_and_distribution(self):
+        """항목이 더해질 때마다 잠정 평균 점수와 분포 갱신"""
+        async def send():
+            pass
+
+        progress = SentimentProgress(send, interval=1.0)
+        progress.add({"source": "news", "score": 0.6, "label": "positive"})
+        progress.add({"source": "twitter", "score": 0.0, "label": "neutral"}, failed=True)
+        progress.add({"source": "sec", "score": -0.3, "label": "negative"})
+        progress.throttle.cancel()
+
+        snapshot = progress.snapshot()
+        assert snapshot["analyzed"] == 3
+        assert snapshot["failed"] == 1
+        assert snapshot["average_score"] == pytest.approx(0.1)
+        assert snapshot["distribution"] == {"positive": 1, "neutral": 1, "negative": 1}
+        assert progress.first_result_after is not None
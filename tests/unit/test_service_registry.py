@@ -4,8 +4,11 @@
 TDD 방식으로 작성된 테스트
 """
 
+import httpx
 import pytest
+import time
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
 from a2a_core.registry.service_registry import ServiceRegistry, AgentInfo
 
 
@@ -214,4 +217,174 @@ class TestServiceRegistry:
         assert agent.agent_id not in service_registry.capabilities_index.get("capability_b", set())
 
 
-import asyncio
\ No newline at end of file
+import asyncio
+
+class TestRegistryWatch:
+    """레지스트리 변경 감시 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_watch_wakes_on_register(self, service_registry, sample_agent_info):
+        """대기 중인 watch는 등록 시 즉시 최신 목록을 받아야 함"""
+        # Given: 현재 버전으로 대기 중인 watcher
+        version = service_registry.watch.version
+        watcher = asyncio.create_task(service_registry.watch_agents(version, timeout=5.0))
+        await asyncio.sleep(0.01)
+        assert not watcher.done()
+        
+        # When: 에이전트가 등록되면
+        await service_registry.register_agent(sample_agent_info)
+        result = await asyncio.wait_for(watcher, timeout=1.0)
+        
+        # Then: 변경된 버전과 목록이 반환되어야 함
+        assert result["changed"] is True
+        assert result["version"] == version + 1
+        assert [agent.agent_id for agent in result["agents"]] == [sample_agent_info.agent_id]
+        
+    @pytest.mark.asyncio
+    async def test_watch_timeout_without_change(self, service_registry):
+        """변경이 없으면 timeout 후 changed=False"""
+        result = await service_registry.watch_agents(service_registry.watch.version, timeout=0.05)
+        
+        assert result == {"version": service_registry.watch.version, "changed": False}
+
+
+class TestHealthCheck:
+    """병렬 헬스체크 테스트"""
+    
+    async def _register(self, registry, count):
+        for index in range(count):
+            await registry.register_agent(AgentInfo(
+                agent_id=f"agent-{index}",
+                name=f"Agent {index}",
+                description="헬스체크 대상",
+                endpoint=f"http://localhost:{9000 + index}",
+                capabilities=[]
+            ))
+    
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently_with_limit(self):
+        """느린 에이전트가 있어도 동시 상한 안에서 병렬로 확인"""
+        registry = ServiceRegistry(health_check_concurrency=2)
+        await self._register(registry, 4)
+        running = 0
+        peak = 0
+        
+        async def slow_get(url, timeout=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            if url.startswith("http://localhost:9003"):
+                raise httpx.ConnectError("refused")
+            return Mock(status_code=200)
+        
+        registry.http_client = Mock(is_closed=False, get=slow_get)
+        started = time.perf_counter()
+        await registry.health_check_agents()
+        
+        assert peak == 2
+        assert time.perf_counter() - started < 0.15
+        assert registry.agents["agent-3"].status == "unreachable"
+        assert registry.agents["agent-0"].latency_ms is not None
+        
+    @pytest.mark.asyncio
+    async def test_adaptive_interval(self, service_registry, sample_agent_info):
+        """정상이면 간격이 늘고, 실패하면 최소 간격으로 돌아감"""
+        await service_registry.register_agent(sample_agent_info)
+        agent_id = sample_agent_info.agent_id
+        service_registry.http_client = Mock(is_closed=False, get=AsyncMock(return_value=Mock(status_code=200)))
+        schedule = service_registry.health_schedule
+        
+        await service_registry.health_check_agents()
+        await service_registry.health_check_agents()
+        assert schedule.states[agent_id].interval == schedule.min_interval * 4
+        
+        # 확인할 차례가 아니면 due_only 스윕에서 건너뜀
+        await service_registry.health_check_agents(due_only=True)
+        assert service_registry.http_client.get.call_count == 2
+        
+        service_registry.http_client.get.return_value = Mock(status_code=500)
+        await service_registry.health_check_agents()
+        assert schedule.states[agent_id].interval == schedule.min_interval
+        assert service_registry.agents[agent_id].status == "unhealthy"
+        
+    @pytest.mark.asyncio
+    async def test_discovery_prefers_responsive_agents(self, service_registry):
+        """발견 결과는 응답 지연이 짧은 순서"""
+        await self._register(service_registry, 3)
+        service_registry.agents["agent-0"].latency_ms = 80.0
+        service_registry.agents["agent-2"].latency_ms = 5.0
+        
+        agents = await service_registry.discover_agents()
+        
+        assert [agent.agent_id for agent in agents] == ["agent-2", "agent-0", "agent-1"]
+
+
+class TestIndexedDiscovery:
+    """버전/델타 발견 테스트"""
+    
+    def _agent(self, agent_id, capability="analyze"):
+        return AgentInfo(
+            agent_id=agent_id,
+            name=agent_id,
+            description="발견 대상",
+            endpoint="http://localhost:9999",
+            capabilities=[{"name": capability}]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_heartbeat_expiry_is_incremental(self, service_registry):
+        """만료 힙에서 꺼낸 에이전트만 비활성, 하트비트가 오면 복구"""
+        service_registry.heartbeat_timeout = 0.05
+        await service_registry.register_agent(self._agent("stale"))
+        await asyncio.sleep(0.03)
+        await service_registry.register_agent(self._agent("fresh"))
+        await asyncio.sleep(0.03)
+        
+        assert [agent.agent_id for agent in await service_registry.discover_agents("analyze")] == ["fresh"]
+        
+        await service_registry.update_heartbeat("stale")
+        assert {agent.agent_id for agent in await service_registry.discover_agents("analyze")} == {"stale", "fresh"}
+        
+    @pytest.mark.asyncio
+    async def test_delta_since_version(self, service_registry):
+        """since 이후 바뀐 에이전트만, 해제된 에이전트는 removed로"""
+        await service_registry.register_agent(self._agent("a"))
+        await service_registry.register_agent(self._agent("b"))
+        since = service_registry.topology_version()
+        
+        await service_registry.register_agent(self._agent("c"))
+        await service_registry.deregister_agent("a")
+        delta = await service_registry.discover_changes(since, "analyze")
+        
+        assert [agent.agent_id for agent in delta["agents"]] == ["c"]
+        assert delta["removed"] == ["a"]
+        assert delta["version"] == since + 2
+        
+        # 잘려 나간 변경 기록보다 오래된 since는 전체 목록으로
+        service_registry.max_changes = 1
+        await service_registry.register_agent(self._agent("d"))
+        assert await service_registry.discover_changes(since, "analyze") is None
+        
+    def test_discover_endpoint_etag(self, monkeypatch):
+        """If-None-Match가 현재 버전이면 304"""
+        from fastapi.testclient import TestClient
+        from a2a_core.registry import service_registry as module
+        
+        registry = ServiceRegistry()
+        monkeypatch.setattr(module, "registry", registry)
+        client = TestClient(module.app)
+        client.post("/register", json=self._agent("a").model_dump(exclude={"last_heartbeat"}))
+        
+        first = client.get("/discover")
+        etag = first.headers["etag"]
+        assert first.json()["count"] == 1
+        assert client.get("/discover", headers={"If-None-Match": etag}).status_code == 304
+        
+        client.post("/register", json=self._agent("b").model_dump(exclude={"last_heartbeat"}))
+        changed = client.get("/discover", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        delta = client.get("/discover", params={"since": first.json()["version"]}).json()
+        assert delta["delta"] is True
+        assert [agent["agent_id"] for agent in delta["agents"]] == ["b"]
@@ -0,0 +1,74 @@
+"""
+세션 저장소 단위 테스트
+"""
+
+import pytest
+from unittest.mock import Mock
+from utils.session_store import SessionStore
+
+
+def make_session(session_id, state="collecting_data", payload=""):
+    return {
+        "session_id": session_id,
+        "client_id": "client-1",
+        "ticker": "AAPL",
+        "state": state,
+        "collected_data": {"news": [{"content": payload}]}
+    }
+
+
+class TestSessionStore:
+    """세션 저장소 테스트"""
+
+    def test_max_sessions_evicts_finished_first(self):
+        """한도를 넘으면 완료된 세션부터, 그다음 오래 쓰지 않은 세션부터 제거"""
+        evicted = Mock()
+        store = SessionStore(max_sessions=2, ttl=0, memory_budget_mb=0, on_evict=evicted)
+        store["a"] = make_session("a")
+        store["b"] = make_session("b", state="completed")
+        store["c"] = make_session("c")
+        assert list(store) == ["a", "c"]
+        evicted.assert_called_once_with("b", make_session("b", state="completed"))
+
+        store.get("a")  # 최근 사용으로 갱신
+        store["d"] = make_session("d")
+        assert list(store) == ["a", "d"]
+        assert store.evictions == 2
+
+    def test_ttl_and_memory_budget(self, monkeypatch):
+        """유휴 TTL이 지난 세션과 메모리 예산을 넘긴 세션 제거"""
+        now = [1000.0]
+        monkeypatch.setattr("utils.session_store.time.monotonic", lambda: now[0])
+        store = SessionStore(max_sessions=0, ttl=60, memory_budget_mb=0.01)
+        store["old"] = make_session("old")
+        now[0] += 61
+        store["new"] = make_session("new")
+        assert list(store) == ["new"]
+
+        # 세션을 직접 키운 뒤 다음 정리 때 예산 초과로 제거
+        grown = store["new"]
+        store["other"] = make_session("other")
+        grown["collected_data"]["news"].append({"content": "x" * 20000})
+        store.enforce()
+        assert list(store) == ["other"]
+
+    @pytest.mark.asyncio
+    async def test_complete_compacts_to_summary(self, tmp_path):
+        """완료 세션은 요약과 리포트 위치만 남김"""
+        store = SessionStore(report_dir=str(tmp_path))
+        session = make_session("s1", payload="본문")
+        session.update({
+            "score_calculation": {"final_score": 0.4, "final_label": "positive"},
+            "final_report": "<html>report</html>",
+            "state": "completed"
+        })
+        store["s1"] = session
+
+        summary = await store.complete("s1")
+
+        assert summary is session
+        assert "collected_data" not in session and "final_report" not in session
+        assert session["final_score"] == 0.4 and session["data_summary"] == {"news": 1}
+        assert await store.load_report(session["report_ref"]) == "<html>report</html>"
+        assert (await store.fetch("s1"))["compacted"] is True
+        assert store.get_stats()["bytes"] < 1000
@@ -0,0 +1,56 @@
+"""
+UDS 전송 단위 테스트
+"""
+
+import socket
+import pytest
+import httpx
+from fastapi import FastAPI
+from a2a_core.base.uds_transport import (
+    LocalRoutingTransport, EmbeddedUDSServer, uds_path_for, local_uds_path
+)
+
+
+@pytest.fixture
+def ping_app():
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+class TestUDSTransport:
+    """UDS 라우팅 트랜스포트 테스트"""
+
+    def test_local_uds_path_requires_same_host(self, tmp_path):
+        """같은 호스트이고 소켓 파일이 있을 때만 UDS 사용"""
+        path = uds_path_for(8202, str(tmp_path))
+        open(path, "w").close()
+
+        assert local_uds_path({"uds_path": path, "host": socket.gethostname()}) == path
+        assert local_uds_path({"uds_path": path, "host": "other-host"}) is None
+        assert local_uds_path({"uds_path": path + ".missing", "host": socket.gethostname()}) is None
+        assert local_uds_path({}) is None
+
+    @pytest.mark.asyncio
+    async def test_routes_endpoint_over_uds(self, ping_app, tmp_path):
+        """등록된 엔드포인트는 TCP 포트가 닫혀 있어도 UDS로 전달"""
+        path = uds_path_for(9, str(tmp_path))
+        server = EmbeddedUDSServer(ping_app, path)
+        await server.start()
+
+        transport = LocalRoutingTransport()
+        transport.add_route("http://localhost:9", path)
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("http://localhost:9/health")
+            assert response.status_code == 200
+            assert response.json() == {"status": "healthy"}
+
+            # 소켓이 사라지면 경로를 지우고 TCP로 폴백
+            await server.stop()
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://localhost:9/health")
+            assert not transport.has_route("http://localhost:9")
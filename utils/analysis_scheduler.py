@@ -0,0 +1,165 @@
+"""
+분석 단계 전역 스케줄러
+
+모든 세션(대화형/배치)의 파이프라인 단계가 이 스케줄러를 거쳐 실행된다.
+- 단계별 동시 실행 상한 (예: 감정 분석은 LLM 호출이 많으므로 동시에 4개까지)
+- 자리가 모자라면 트래픽 종류(interactive/batch)별 가중치에 따라 공정하게 배분
+  (가중 공정 큐: 처리량/가중치가 가장 적은 종류부터, 한쪽만 대기 중이면 그쪽이 모두 사용)
+- 외부 API 제공자별 분당 예산 (토큰 버킷). 배치 트래픽은 예산이 남을 때까지 기다리고,
+  대화형 트래픽은 기다리지 않고 차감만 한다 (대화형 사용분만큼 배치가 늦춰짐)
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Optional
+
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+
+class StageGate:
+    """단계 하나의 동시 실행 상한 + 트래픽 종류 간 가중 공정 분배"""
+
+    def __init__(self, limit: int, weights: Dict[str, float]):
+        self.limit = max(1, limit)
+        self.weights = weights
+        self.active = 0
+        self.waiters: Dict[str, Deque[asyncio.Future]] = {traffic: deque() for traffic in weights}
+        self.virtual: Dict[str, float] = {traffic: 0.0 for traffic in weights}  # 누적 처리량 / 가중치
+
+    async def acquire(self, traffic: str):
+        """자리 확보 (상한에 걸리면 차례가 올 때까지 대기)"""
+        if traffic not in self.waiters:
+            traffic = INTERACTIVE
+        if self.active < self.limit and not any(self.waiters.values()):
+            self._grant(traffic)
+            return
+
+        # 오래 쉬던 종류가 밀린 몫을 한꺼번에 가져가지 않도록 대기 중인 종류의 최솟값에 맞춤
+        backlog = [self.virtual[other] for other, queue in self.waiters.items() if queue]
+        if backlog and not self.waiters[traffic]:
+            self.virtual[traffic] = max(self.virtual[traffic], min(backlog))
+
+        future = asyncio.get_running_loop().create_future()
+        self.waiters[traffic].append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 자리를 받은 직후 취소됨 → 반납
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self.waiters[traffic].remove(future)
+            raise
+
+    def release(self):
+        self.active -= 1
+        self._wake()
+
+    def _grant(self, traffic: str):
+        self.active += 1
+        self.virtual[traffic] += 1.0 / max(self.weights.get(traffic, 1.0), 0.001)
+
+    def _wake(self):
+        while self.active < self.limit:
+            waiting = [traffic for traffic, queue in self.waiters.items() if queue]
+            if not waiting:
+                return
+            traffic = min(waiting, key=lambda name: self.virtual[name])
+            future = self.waiters[traffic].popleft()
+            if future.done():
+                continue
+            self._grant(traffic)
+            future.set_result(None)
+
+    def get_stats(self) -> Dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": {traffic: len(queue) for traffic, queue in self.waiters.items()}
+        }
+
+
+class TokenBucket:
+    """분당 예산 토큰 버킷"""
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, cost: float):
+        """기다리지 않고 차감 (잔량이 음수가 될 수 있음)"""
+        self._refill()
+        self.tokens -= cost
+
+    async def acquire(self, cost: float):
+        """잔량이 cost 이상이 될 때까지 기다린 뒤 차감 (cost는 용량으로 제한)"""
+        cost = min(cost, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return
+            await asyncio.sleep((cost - self.tokens) / self.rate if self.rate > 0 else 1.0)
+
+
+class FairScheduler:
+    """단계별 상한, 공정 분배, 제공자 예산을 묶은 전역 스케줄러"""
+
+    def __init__(
+        self,
+        stage_limits: Optional[Dict[str, int]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        budgets: Optional[Dict[str, float]] = None,
+        stage_providers: Optional[Dict[str, str]] = None
+    ):
+        self.weights = weights or {INTERACTIVE: 3.0, BATCH: 1.0}
+        self.gates: Dict[str, StageGate] = {
+            stage: StageGate(limit, self.weights) for stage, limit in (stage_limits or {}).items()
+        }
+        self.budgets: Dict[str, TokenBucket] = {
+            provider: TokenBucket(per_minute) for provider, per_minute in (budgets or {}).items()
+        }
+        self.stage_providers = stage_providers or {}
+
+        # 통계
+        self.started: Dict[str, int] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, stage: str, traffic: str = INTERACTIVE, cost: float = 1.0) -> AsyncIterator[None]:
+        """단계 실행 자리 (예산 확인 후 동시 실행 자리 확보)"""
+        bucket = self.budgets.get(self.stage_providers.get(stage))
+        if bucket:
+            if traffic == BATCH:
+                await bucket.acquire(cost)
+            else:
+                bucket.take(cost)
+
+        gate = self.gates.get(stage)
+        if gate:
+            await gate.acquire(traffic)
+        self.started[traffic] = self.started.get(traffic, 0) + 1
+        try:
+            yield
+        finally:
+            if gate:
+                gate.release()
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        return {
+            "stages": {stage: gate.get_stats() for stage, gate in self.gates.items()},
+            "budgets": {provider: round(bucket.tokens, 1) for provider, bucket in self.budgets.items()},
+            "started": dict(self.started)
+        }
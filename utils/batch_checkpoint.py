@@ -0,0 +1,71 @@
+"""
+배치 분석 체크포인트
+
+배치마다 JSONL 파일 하나에 항목 목록과 끝난 항목의 결과를 기록한다.
+같은 batch_id로 다시 요청하면 기록된 결과는 재사용하고 남은 항목만 분석한다.
+batch_id는 서버가 만든 uuid4 hex만 허용한다 (파일 경로에 쓰이므로 클라이언트 값을 그대로 믿지 않음).
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+BATCH_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+def is_valid_batch_id(batch_id: str) -> bool:
+    """uuid4 hex 형식인지 확인"""
+    return isinstance(batch_id, str) and bool(BATCH_ID_PATTERN.match(batch_id))
+
+
+class BatchCheckpoint:
+    """배치 항목 목록 + 항목별 결과 기록"""
+
+    def __init__(self, directory: str, batch_id: str):
+        if not is_valid_batch_id(batch_id):
+            raise ValueError(f"잘못된 batch_id: {batch_id!r}")
+        self.directory = directory
+        self.batch_id = batch_id
+        self.path = os.path.join(directory, f"{batch_id}.jsonl")
+        self._file = None
+
+    def load(self) -> Tuple[Optional[List[Dict]], Dict[int, Dict]]:
+        """(저장된 항목 목록, index -> 결과) - 체크포인트가 없으면 (None, {})"""
+        items = None
+        results: Dict[int, Dict] = {}
+        if not os.path.exists(self.path):
+            return items, results
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 마지막 줄
+                    break
+                if entry.get("type") == "batch":
+                    items = entry["items"]
+                elif entry.get("type") == "result":
+                    results[entry["index"]] = entry["result"]
+        return items, results
+
+    def start(self, items: List[Dict]):
+        """새 배치의 항목 목록 기록"""
+        self._write({"type": "batch", "batch_id": self.batch_id, "items": items})
+
+    def record(self, index: int, result: Dict):
+        """항목 결과 기록"""
+        self._write({"type": "result", "index": index, "result": result})
+
+    def _write(self, entry: Dict):
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
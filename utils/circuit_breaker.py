@@ -0,0 +1,213 @@
+"""
+하위 에이전트별 서킷 브레이커
+
+에이전트 하나가 죽어도 세션마다 전송 재시도와 연결 타임아웃을 모두 기다리지 않도록,
+에이전트별 브레이커를 모든 세션이 공유한다.
+- CLOSED: 정상 호출. 최근 호출 창(window_size개, window_seconds초 이내)의 오류율이나
+  느린 호출 비율이 임계값을 넘으면 OPEN
+- OPEN: 호출하지 않고 바로 CircuitOpenError (호출하는 쪽이 기존 실패 처리로 진행)
+  백그라운드에서 probe_interval초마다 상태 확인(probe), 성공하면 HALF_OPEN
+  (probe가 없으면 open_duration초 뒤 HALF_OPEN)
+- HALF_OPEN: 시험 호출 half_open_calls개만 허용, 모두 성공하면 CLOSED, 하나라도 실패하면 다시 OPEN
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+Probe = Callable[[], Awaitable[bool]]
+
+
+class CircuitOpenError(Exception):
+    """브레이커가 열려 있어 호출하지 않음"""
+
+    def __init__(self, name: str, retry_in: float):
+        self.name = name
+        self.retry_in = retry_in
+        super().__init__(f"{name} 서킷 열림 ({retry_in:.0f}초 후 재확인)")
+
+
+class CircuitBreaker:
+    """하위 에이전트 하나의 호출 상태"""
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 20,
+        window_seconds: float = 60.0,
+        min_calls: int = 5,
+        error_rate: float = 0.5,
+        slow_call: float = 10.0,
+        slow_rate: float = 0.8,
+        open_duration: float = 15.0,
+        probe_interval: float = 5.0,
+        half_open_calls: int = 2,
+        probe: Optional[Probe] = None
+    ):
+        self.name = name
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call = slow_call
+        self.slow_rate = slow_rate
+        self.open_duration = open_duration
+        self.probe_interval = probe_interval
+        self.half_open_calls = half_open_calls
+        self.probe = probe
+
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.calls: Deque[Tuple[float, bool, float]] = deque(maxlen=window_size)  # (시각, 성공, 소요 시간)
+        self.trial_inflight = 0
+        self.trial_passed = 0
+        self._probe_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (HALF_OPEN이면 시험 호출 자리를 차지)"""
+        if self.state == OPEN and self.probe is None and time.monotonic() - self.opened_at >= self.open_duration:
+            self._half_open()
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and self.trial_inflight + self.trial_passed < self.half_open_calls:
+            self.trial_inflight += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def check(self):
+        """allow()가 False면 CircuitOpenError"""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def release(self):
+        """결과 없이 끝난 호출 (취소) - 시험 호출 자리만 반환"""
+        if self.state == HALF_OPEN:
+            self.trial_inflight = max(0, self.trial_inflight - 1)
+
+    def retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.open_duration - time.monotonic())
+
+    def record(self, success: bool, duration: float = 0.0):
+        """허용된 호출의 결과 기록"""
+        if self.state == HALF_OPEN:
+            self.trial_inflight = max(0, self.trial_inflight - 1)
+            if not success:
+                self._open()
+                return
+            self.trial_passed += 1
+            if self.trial_passed >= self.half_open_calls:
+                self._close()
+            return
+        if self.state == OPEN:
+            # 열리기 전에 출발한 호출의 늦은 결과는 무시
+            return
+
+        now = time.monotonic()
+        self.calls.append((now, success, duration))
+        while self.calls and now - self.calls[0][0] > self.window_seconds:
+            self.calls.popleft()
+        if self._should_open():
+            self._open()
+
+    def _should_open(self) -> bool:
+        total = len(self.calls)
+        if total < self.min_calls:
+            return False
+        errors = sum(1 for _, success, _ in self.calls if not success)
+        slow = sum(1 for _, _, duration in self.calls if duration >= self.slow_call)
+        return errors / total >= self.error_rate or slow / total >= self.slow_rate
+
+    def _open(self):
+        if self.state != OPEN:
+            self.opened += 1
+            print(f"🔌 서킷 열림: {self.name}")
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.trial_inflight = 0
+        self.trial_passed = 0
+        if self.probe is not None and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    def _half_open(self):
+        self.state = HALF_OPEN
+        self.trial_inflight = 0
+        self.trial_passed = 0
+        print(f"🔌 서킷 반열림: {self.name} (시험 호출 {self.half_open_calls}개 허용)")
+
+    def _close(self):
+        self.state = CLOSED
+        self.calls.clear()
+        print(f"🔌 서킷 닫힘: {self.name}")
+
+    async def _probe_loop(self):
+        """OPEN 동안 백그라운드 상태 확인 - 성공하면 HALF_OPEN"""
+        await asyncio.sleep(self.open_duration)
+        while self.state == OPEN:
+            try:
+                healthy = await self.probe()
+            except Exception:
+                healthy = False
+            if healthy:
+                self._half_open()
+                return
+            await asyncio.sleep(self.probe_interval)
+
+    def cancel(self):
+        if self._probe_task is not None and not self._probe_task.done():
+            self._probe_task.cancel()
+
+    def get_stats(self) -> Dict:
+        total = len(self.calls)
+        return {
+            "state": self.state,
+            "calls": total,
+            "errors": sum(1 for _, success, _ in self.calls if not success),
+            "slow": sum(1 for _, _, duration in self.calls if duration >= self.slow_call),
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retry_in": round(self.retry_in(), 1)
+        }
+
+
+class CircuitBreakerRegistry:
+    """에이전트 이름별 브레이커 (설정 기본값 + 에이전트별 덮어쓰기, 모든 세션 공유)"""
+
+    def __init__(
+        self,
+        defaults: Optional[Dict] = None,
+        overrides: Optional[Dict[str, Dict]] = None,
+        probe_factory: Optional[Callable[[str], Optional[Probe]]] = None
+    ):
+        self.defaults = defaults or {}
+        self.overrides = overrides or {}
+        self.probe_factory = probe_factory
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            options = {**self.defaults, **self.overrides.get(name, {})}
+            probe = self.probe_factory(name) if self.probe_factory else None
+            breaker = CircuitBreaker(name, probe=probe, **options)
+            self.breakers[name] = breaker
+        return breaker
+
+    def close(self):
+        for breaker in self.breakers.values():
+            breaker.cancel()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        return {name: breaker.get_stats() for name, breaker in self.breakers.items()}
@@ -0,0 +1,73 @@
+"""
+데이터 수집 정족수 정책
+
+수집 단계가 가장 느린 소스를 끝까지 기다리지 않도록 진행 시점을 정책으로 정한다.
+- 필수 소스(예: news)가 모두 끝나고 min_sources개 이상 도착하면 진행 (정족수)
+- 아직 오지 않은 소스가 모두 각자의 기한을 넘기면 진행
+- max_wait초가 지나면 무조건 진행
+정족수 이후 도착한 소스는 버리지 않고 별도의 추가 분석으로 병합한다 (오케스트레이터 담당).
+"""
+
+from typing import Dict, Iterable, Optional
+
+
+QUORUM_ALL = "all"            # 모든 소스 응답
+QUORUM_MET = "quorum"         # 정족수 충족
+QUORUM_DEADLINE = "deadline"  # 남은 소스가 모두 기한 초과
+QUORUM_MAX_WAIT = "max_wait"  # 전체 대기 상한 초과
+
+
+class QuorumPolicy:
+    """수집 진행 여부 판단 (경과 시간은 수집 시작 기준 초)"""
+
+    def __init__(
+        self,
+        required: Iterable[str] = ("news",),
+        min_sources: int = 2,
+        source_deadlines: Optional[Dict[str, float]] = None,
+        default_deadline: float = 20.0,
+        max_wait: float = 30.0
+    ):
+        self.required = set(required)
+        self.min_sources = min_sources
+        self.source_deadlines = source_deadlines or {}
+        self.default_deadline = default_deadline
+        self.max_wait = max_wait
+
+    def deadline_of(self, source: str) -> float:
+        return self.source_deadlines.get(source, self.default_deadline)
+
+    def decide(self, arrived: Iterable[str], pending: Iterable[str], elapsed: float) -> Optional[str]:
+        """진행 사유 (아직 기다려야 하면 None)
+
+        arrived는 데이터를 보낸 소스, pending은 아직 응답이 없는 소스 (실패한 소스는 둘 다 아님)
+        """
+        arrived, pending = set(arrived), set(pending)
+        if not pending:
+            return QUORUM_ALL
+        if elapsed >= self.max_wait:
+            return QUORUM_MAX_WAIT
+        if not (self.required & pending) and len(arrived) >= self.min_sources:
+            return QUORUM_MET
+        if all(elapsed >= self.deadline_of(source) for source in pending):
+            return QUORUM_DEADLINE
+        return None
+
+    def next_check(self, pending: Iterable[str], elapsed: float) -> Optional[float]:
+        """다음 기한까지 남은 초 (기다릴 소스가 없으면 None)"""
+        pending = set(pending)
+        if not pending:
+            return None
+        deadlines = [self.deadline_of(source) for source in pending] + [self.max_wait]
+        upcoming = [deadline - elapsed for deadline in deadlines if deadline > elapsed]
+        return min(upcoming) if upcoming else 0.0
+
+    def get_config(self) -> Dict:
+        return {
+            "required": sorted(self.required),
+            "min_sources": self.min_sources,
+            "source_deadlines": dict(self.source_deadlines),
+            "default_deadline": self.default_deadline,
+            "max_wait": self.max_wait
+        }
+
@@ -0,0 +1,109 @@
+"""
+세션별 감정 분석 입력 스트림
+
+수집 에이전트의 (중간) 응답이 도착하는 대로 항목을 받아 작은 묶음으로 감정 분석을 요청한다.
+수집이 끝나기를 기다렸다가 한 번에 보내는 대신 수집 지연과 LLM 지연이 겹치도록 한다.
+- 같은 항목(소스 + url/제목)은 한 번만 분석 (중간 결과와 최종 응답에 같은 항목이 다시 와도 무시)
+- batch_size개가 모이거나 linger초가 지나면 묶음 전송
+- 결과는 도착 순서대로 on_result로 전달하고 results에 모은다
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+
+def item_key(item: Dict) -> str:
+    """항목 식별 키 (중복 분석 방지)"""
+    identity = item.get("url") or item.get("link") or item.get("title")
+    if not identity:
+        identity = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{item.get('source', '')}:{identity}"
+
+
+class SentimentFeed:
+    """수집 항목 → 감정 분석 묶음 요청 → 항목별 결과"""
+
+    def __init__(
+        self,
+        analyze: Callable[[List[Dict]], AsyncIterator[Dict]],
+        on_result: Optional[Callable[[Dict], Awaitable[Any]]] = None,
+        batch_size: int = 4,
+        linger: float = 0.2
+    ):
+        self.analyze = analyze
+        self.on_result = on_result
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+
+        self.buffer: List[Dict] = []
+        self.seen: Set[str] = set()
+        self.results: List[Dict] = []
+        self.tasks: Set[asyncio.Task] = set()
+        self.closed = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # 통계
+        self.fed = 0
+        self.batches = 0
+
+    def feed(self, items: Iterable[Dict]) -> int:
+        """항목 추가 (이미 받은 항목은 무시) - 새로 받은 항목 수 반환"""
+        if self.closed:
+            return 0
+        added = 0
+        for item in items:
+            key = item_key(item)
+            if key in self.seen:
+                continue
+            self.seen.add(key)
+            self.buffer.append(item)
+            added += 1
+        self.fed += added
+
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+        elif self.buffer and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.linger, self.flush)
+        return added
+
+    def flush(self):
+        """모아 둔 항목을 묶음으로 나눠 분석 시작"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self.buffer:
+            batch, self.buffer = self.buffer[:self.batch_size], self.buffer[self.batch_size:]
+            self.batches += 1
+            task = asyncio.create_task(self._run(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, batch: List[Dict]):
+        try:
+            async for result in self.analyze(batch):
+                self.results.append(result)
+                if self.on_result:
+                    await self.on_result(result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ 감정 분석 묶음 처리 실패 ({len(batch)}개 항목): {e}")
+
+    async def close(self) -> List[Dict]:
+        """입력 종료 - 남은 항목을 보내고 모든 분석이 끝날 때까지 대기한 뒤 결과 반환"""
+        self.closed = True
+        self.flush()
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks), return_exceptions=True)
+        return self.results
+
+    def cancel(self):
+        """진행 중인 분석 모두 취소"""
+        self.closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.buffer.clear()
+        for task in list(self.tasks):
+            task.cancel()
@@ -0,0 +1,100 @@
+"""
+감정 분석 진행 상황 (잠정 점수/분포 + 차트 프레임 제한)
+
+항목별 감정 분석 결과가 도착할 때마다 잠정 평균 점수와 긍정/중립/부정 분포를 갱신한다.
+차트 프레임은 항목마다 보내지 않고 interval초에 한 번만 보낸다 (보낼 때 최신 상태를 사용하므로
+중간 값은 건너뛰어도 마지막 상태는 반드시 전송된다).
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class FrameThrottle:
+    """interval초에 최대 한 번 send 호출 (요청이 몰리면 하나로 합침)"""
+
+    def __init__(self, send: Callable[[], Awaitable[None]], interval: float = 0.5):
+        self.send = send
+        self.interval = interval
+        self.last_sent = 0.0
+        self.pending = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.requested = 0
+        self.sent = 0
+
+    def request(self):
+        """프레임 전송 요청 (간격이 지났으면 바로, 아니면 간격이 끝날 때 한 번)"""
+        self.requested += 1
+        self.pending = True
+        if self._timer is not None or (self._task is not None and not self._task.done()):
+            return
+        delay = self.last_sent + self.interval - time.monotonic()
+        if delay <= 0:
+            self._fire()
+        else:
+            self._timer = asyncio.get_running_loop().call_later(delay, self._fire)
+
+    def _fire(self):
+        self._timer = None
+        self._task = asyncio.create_task(self._send())
+
+    async def _send(self):
+        if not self.pending:
+            return
+        self.pending = False
+        self.last_sent = time.monotonic()
+        self.sent += 1
+        try:
+            await self.send()
+        except Exception as e:
+            print(f"⚠️ 진행 프레임 전송 실패: {e}")
+        if self.pending:
+            # 전송 중에 들어온 요청은 다음 간격에 반영
+            self._timer = asyncio.get_running_loop().call_later(self.interval, self._fire)
+
+    def cancel(self):
+        """예약된 전송 취소 (최종 결과를 따로 보낼 때)"""
+        self.pending = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+
+class SentimentProgress:
+    """도착한 감정 분석 항목으로 잠정 점수/분포 집계"""
+
+    def __init__(self, send_frame: Callable[[], Awaitable[None]], interval: float = 0.5):
+        self.entries: List[Dict] = []  # 차트 항목 (source, score, label, summary)
+        self.distribution: Dict[str, int] = {"positive": 0, "neutral": 0, "negative": 0}
+        self.failed = 0
+        self.started_at = time.monotonic()
+        self.first_result_after: Optional[float] = None
+        self.throttle = FrameThrottle(send_frame, interval)
+
+    def add(self, entry: Dict, failed: bool = False):
+        """항목 하나 반영 후 프레임 전송 요청"""
+        if self.first_result_after is None:
+            self.first_result_after = time.monotonic() - self.started_at
+        self.entries.append(entry)
+        self.distribution[entry["label"]] = self.distribution.get(entry["label"], 0) + 1
+        if failed:
+            self.failed += 1
+        self.throttle.request()
+
+    @property
+    def average_score(self) -> float:
+        return sum(entry["score"] for entry in self.entries) / len(self.entries) if self.entries else 0.0
+
+    def snapshot(self) -> Dict:
+        return {
+            "analyzed": len(self.entries),
+            "failed": self.failed,
+            "average_score": self.average_score,
+            "distribution": dict(self.distribution)
+        }
@@ -0,0 +1,300 @@
+"""
+분석 세션 저장소
+
+오케스트레이터의 세션 dict를 대신한다.
+- 최대 세션 수, 유휴 TTL, 메모리 예산을 넘으면 오래 쓰지 않은 세션부터 제거 (완료된 세션 우선)
+- 완료된 세션은 요약 + 저장된 리포트 위치로 압축 (수집 데이터/감정 분석 원본은 버림)
+- Redis를 쓰면 체크포인트와 리포트를 공유해 여러 오케스트레이터 프로세스가 세션을 조회할 수 있다
+  (실행 중인 단계는 세션을 시작한 프로세스에만 있음)
+"""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 우선 제거 대상인 종료 상태
+FINISHED_STATES = {"completed", "error"}
+
+# 압축 후에도 남기는 세션 필드
+SUMMARY_FIELDS = ("session_id", "query", "client_id", "market_preference", "traffic", "ticker", "company_name", "exchange", "state")
+
+
+def estimate_size(session: Dict) -> int:
+    """세션이 차지하는 대략적인 바이트 수 (JSON 직렬화 길이)"""
+    try:
+        return len(json.dumps(session, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+def summarize_session(session: Dict) -> Dict:
+    """완료된 세션의 요약 (결과 화면에 필요한 값만)"""
+    score = session.get("score_calculation", {}) or {}
+    collected = session.get("collected_data", {}) or {}
+    summary = {field: session[field] for field in SUMMARY_FIELDS if field in session}
+    summary.update({
+        "final_score": score.get("final_score", 0),
+        "final_label": score.get("final_label", "neutral"),
+        "weighted_scores": score.get("weighted_scores", {}),
+        "risk_level": (session.get("risk_analysis", {}) or {}).get("risk_level"),
+        "data_summary": {source: len(items) for source, items in collected.items() if isinstance(items, list)},
+        "compacted": True,
+        "completed_at": time.time()
+    })
+    if "pdf_path" in session:
+        summary["pdf_path"] = session["pdf_path"]
+    return summary
+
+
+class SessionStore(MutableMapping):
+    """메모리 세션 저장소 (LRU 순서 + 유휴 TTL + 메모리 예산)
+
+    세션 dict는 호출 측이 직접 수정하므로 정리 때마다 진행 중인 세션의 크기를 다시 잰다
+    (압축된 세션은 바뀌지 않으므로 한 번만 잰다). 정리는 세션 추가/완료 시에만 실행된다.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 100,
+        ttl: float = 1800.0,
+        memory_budget_mb: float = 256.0,
+        report_dir: str = "data/reports",
+        on_evict: Optional[Callable[[str, Dict], Any]] = None
+    ):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.report_dir = report_dir
+        self.on_evict = on_evict
+
+        self._sessions: "OrderedDict[str, Dict]" = OrderedDict()  # 오래 쓰지 않은 순
+        self._accessed: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self.total_bytes = 0
+
+        # 통계
+        self.evictions = 0
+        self.compactions = 0
+
+    # MutableMapping 구현 (조회 시 최근 사용으로 갱신)
+    def __getitem__(self, session_id: str) -> Dict:
+        session = self._sessions[session_id]
+        self._touch(session_id)
+        return session
+
+    def __setitem__(self, session_id: str, session: Dict):
+        self._sessions[session_id] = session
+        self._touch(session_id)
+        self.enforce()
+
+    def __delitem__(self, session_id: str):
+        del self._sessions[session_id]
+        self._accessed.pop(session_id, None)
+        self.total_bytes -= self._sizes.pop(session_id, 0)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._sessions))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id) -> bool:
+        return session_id in self._sessions
+
+    def items(self):
+        """(session_id, 세션) 목록 (최근 사용 순서는 바꾸지 않음)"""
+        return list(self._sessions.items())
+
+    def _touch(self, session_id: str):
+        self._sessions.move_to_end(session_id)
+        self._accessed[session_id] = time.monotonic()
+
+    def _measure(self):
+        """진행 중인 세션과 처음 보는 세션의 크기 재계산"""
+        for session_id, session in self._sessions.items():
+            if session_id in self._sizes and session.get("compacted"):
+                continue
+            size = estimate_size(session)
+            self.total_bytes += size - self._sizes.get(session_id, 0)
+            self._sizes[session_id] = size
+
+    def enforce(self) -> List[str]:
+        """TTL 만료 세션 제거 후 개수/메모리 한도를 넘으면 완료 세션부터 LRU 순으로 제거"""
+        evicted = []
+        now = time.monotonic()
+        if self.ttl > 0:
+            # 사용 순서대로 정렬되어 있으므로 만료되지 않은 세션을 만나면 중단
+            while self._sessions:
+                session_id = next(iter(self._sessions))
+                if now - self._accessed.get(session_id, now) <= self.ttl:
+                    break
+                evicted.append(self._evict(session_id, "ttl"))
+
+        self._measure()
+        for finished_only in (True, False):
+            for session_id in list(self._sessions):
+                if not self._over_limit():
+                    return evicted
+                if len(self._sessions) == 1 and not finished_only:
+                    # 방금 추가된 세션 하나는 예산을 넘어도 유지
+                    return evicted
+                if finished_only and self._sessions[session_id].get("state") not in FINISHED_STATES:
+                    continue
+                evicted.append(self._evict(session_id, "limit"))
+        return evicted
+
+    def _over_limit(self) -> bool:
+        return (
+            (self.max_sessions > 0 and len(self._sessions) > self.max_sessions)
+            or (self.memory_budget > 0 and self.total_bytes > self.memory_budget)
+        )
+
+    def _evict(self, session_id: str, reason: str) -> str:
+        session = self._sessions[session_id]
+        del self[session_id]
+        self.evictions += 1
+        logger.info(f"세션 제거 ({reason}): {session_id}")
+        if self.on_evict:
+            self.on_evict(session_id, session)
+        return session_id
+
+    async def complete(self, session_id: str) -> Optional[Dict]:
+        """완료된 세션을 요약 + 리포트 위치로 압축 (세션 dict를 제자리에서 교체)"""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        summary = summarize_session(session)
+        report = session.get("final_report")
+        if report:
+            summary["report_ref"] = await self.save_report(session_id, report)
+        session.clear()
+        session.update(summary)
+        self.total_bytes -= self._sizes.pop(session_id, 0)  # 다음 정리 때 압축된 크기로 다시 잼
+        self.compactions += 1
+        await self.checkpoint(session_id)
+        self.enforce()
+        return session
+
+    async def save_report(self, session_id: str, report: str) -> str:
+        """리포트를 파일로 저장하고 위치 반환"""
+        os.makedirs(self.report_dir, exist_ok=True)
+        path = os.path.join(self.report_dir, f"{session_id}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report)
+        return path
+
+    async def load_report(self, ref: str) -> Optional[str]:
+        """저장된 리포트 읽기"""
+        try:
+            with open(ref, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    async def checkpoint(self, session_id: str):
+        """공유 저장소에 세션 상태 기록 (메모리 저장소는 없음)"""
+
+    async def fetch(self, session_id: str) -> Optional[Dict]:
+        """세션 조회 (이 프로세스에 없으면 공유 저장소에서)"""
+        return self._sessions.get(session_id)
+
+    async def close(self):
+        """연결 정리"""
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        self._measure()
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "bytes": self.total_bytes,
+            "memory_budget": self.memory_budget,
+            "evictions": self.evictions,
+            "compactions": self.compactions
+        }
+
+
+class RedisSessionStore(SessionStore):
+    """Redis 공유 세션 저장소
+
+    진행 중인 세션은 이 프로세스 메모리에 두고(한도 정책 동일), 체크포인트와 리포트는
+    Redis에 TTL과 함께 기록한다. 다른 프로세스는 fetch/load_report로 조회한다.
+    """
+
+    def __init__(self, redis_url: str, prefix: str = "a2a:session:", **kwargs):
+        super().__init__(**kwargs)
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self._client = None
+
+    async def _redis(self):
+        if self._client is None:
+            from redis import asyncio as aioredis
+            self._client = aioredis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5
+            )
+        return self._client
+
+    def _expire_seconds(self) -> Optional[int]:
+        return int(self.ttl) if self.ttl > 0 else None
+
+    async def checkpoint(self, session_id: str):
+        session = self._sessions.get(session_id)
+        if session is None:
+            return
+        try:
+            client = await self._redis()
+            await client.set(
+                f"{self.prefix}{session_id}",
+                json.dumps(session, ensure_ascii=False, default=str),
+                ex=self._expire_seconds()
+            )
+        except Exception as e:
+            logger.error(f"세션 체크포인트 실패: {e}")
+
+    async def fetch(self, session_id: str) -> Optional[Dict]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            return session
+        try:
+            client = await self._redis()
+            data = await client.get(f"{self.prefix}{session_id}")
+        except Exception as e:
+            logger.error(f"세션 조회 실패: {e}")
+            return None
+        return json.loads(data) if data else None
+
+    async def save_report(self, session_id: str, report: str) -> str:
+        key = f"{self.prefix}report:{session_id}"
+        try:
+            client = await self._redis()
+            await client.set(key, report, ex=self._expire_seconds())
+        except Exception as e:
+            logger.error(f"리포트 저장 실패, 파일로 저장: {e}")
+            return await super().save_report(session_id, report)
+        return f"redis:{key}"
+
+    async def load_report(self, ref: str) -> Optional[str]:
+        if not ref.startswith("redis:"):
+            return await super().load_report(ref)
+        try:
+            client = await self._redis()
+            return await client.get(ref[len("redis:"):])
+        except Exception as e:
+            logger.error(f"리포트 조회 실패: {e}")
+            return None
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
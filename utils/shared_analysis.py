@@ -0,0 +1,123 @@
+"""
+같은 종목 분석 공유 (single-flight)
+
+같은 티커/시장으로 정해진 세션이 동시에(또는 freshness 초 이내에) 들어오면 파이프라인을
+한 번만 실행하고 나머지 세션은 그 실행에 합류한다.
+- 실행을 시작한 세션(leader)이 보내는 UI 메시지를 기록해 두고, 합류한 세션(follower)에는
+  지금까지의 기록을 재생한 뒤 이후 메시지를 함께 보낸다 (세션마다 자기 진행 화면 유지)
+- 완료된 실행은 freshness 초 동안 재사용하고, 실패/취소된 실행은 바로 버린다
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+RunKey = Tuple[str, str]  # (ticker, 시장)
+
+
+@dataclass
+class SharedRun:
+    """공유 분석 실행 한 건"""
+    key: RunKey
+    leader_id: str
+    followers: List[str] = field(default_factory=list)
+    events: List[Tuple[str, Dict]] = field(default_factory=list)  # (UI 메시지 타입, payload)
+    started_at: float = field(default_factory=time.monotonic)
+    completed_at: Optional[float] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.completed_at is not None
+
+
+class SharedRunRegistry:
+    """진행 중/최근 완료 공유 실행 목록"""
+
+    def __init__(self, freshness: float = 60.0, max_events: int = 500):
+        self.freshness = freshness
+        self.max_events = max_events
+        self.runs: Dict[RunKey, SharedRun] = {}
+        self.by_session: Dict[str, SharedRun] = {}  # leader/follower session_id -> 실행
+
+        # 통계
+        self.started = 0
+        self.joined = 0
+
+    def lookup(self, key: RunKey) -> Optional[SharedRun]:
+        """합류 가능한 실행 (진행 중이거나 freshness 이내에 완료)"""
+        run = self.runs.get(key)
+        if run and run.completed and time.monotonic() - run.completed_at > self.freshness:
+            self._drop(run)
+            return None
+        return run
+
+    def lead(self, key: RunKey, session_id: str) -> SharedRun:
+        """새 실행 시작 (session_id가 파이프라인을 실행)"""
+        self.purge()
+        previous = self.runs.get(key)
+        if previous:
+            self._drop(previous)
+        run = SharedRun(key=key, leader_id=session_id)
+        self.runs[key] = run
+        self.by_session[session_id] = run
+        self.started += 1
+        return run
+
+    def attach(self, run: SharedRun, session_id: str):
+        """세션을 실행에 합류"""
+        run.followers.append(session_id)
+        self.by_session[session_id] = run
+        self.joined += 1
+
+    def run_of(self, session_id: str) -> Optional[SharedRun]:
+        return self.by_session.get(session_id)
+
+    def record(self, run: SharedRun, msg_type: str, payload: Dict):
+        """leader UI 메시지 기록 (늦게 합류한 세션에 재생, 상한을 넘으면 로그부터 버림)"""
+        run.events.append((msg_type, payload))
+        if len(run.events) > self.max_events:
+            for index, (event_type, _) in enumerate(run.events):
+                if event_type == "log":
+                    del run.events[index]
+                    break
+            else:
+                del run.events[0]
+
+    def complete(self, run: SharedRun):
+        """실행 완료 (freshness 동안 재사용)"""
+        run.completed_at = time.monotonic()
+
+    def detach(self, session_id: str) -> Optional[SharedRun]:
+        """세션 분리 (완료 전에 leader가 빠지면 실행을 더 이상 재사용하지 않음)"""
+        run = self.by_session.pop(session_id, None)
+        if run is None:
+            return None
+        if session_id in run.followers:
+            run.followers.remove(session_id)
+        elif session_id == run.leader_id and not run.completed:
+            self._drop(run)
+        return run
+
+    def purge(self):
+        """freshness가 지난 완료 실행 정리"""
+        now = time.monotonic()
+        for run in list(self.runs.values()):
+            if run.completed and now - run.completed_at > self.freshness:
+                self._drop(run)
+
+    def _drop(self, run: SharedRun):
+        if self.runs.get(run.key) is run:
+            del self.runs[run.key]
+        for session_id in [run.leader_id] + run.followers:
+            if self.by_session.get(session_id) is run:
+                del self.by_session[session_id]
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        return {
+            "active_runs": sum(1 for run in self.runs.values() if not run.completed),
+            "fresh_runs": sum(1 for run in self.runs.values() if run.completed),
+            "started": self.started,
+            "joined": self.joined
+        }